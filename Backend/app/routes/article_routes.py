@@ -63,6 +63,12 @@ except ImportError as e:
     logger.error(f"❌ Failed to import scraper service: {e}")
     scraper_service = None
 
+# Shared async rate limiter (OpenAI bucket) and circuit breakers
+from app.services.rate_limiter import rate_limiters
+from app.services.circuit_breaker import circuit_breakers, is_failure_exception, CircuitOpenError
+from app.services.latency_budget import LatencyBudget
+from app.services.summary_cache import summary_cache, content_hash
+
 # Initialize router
 router = APIRouter()
 
@@ -70,6 +76,14 @@ router = APIRouter()
 SCRAPE_CACHE: Dict[str, Any] = {}
 CACHE_EXPIRY_HOURS = 24  # Cache scraping results for 24 hours
 
+# Time allowed for scraping the full article before falling back to the snippet
+SCRAPE_BUDGET_SECONDS = float(os.getenv("ARTICLE_SCRAPE_BUDGET_SECONDS", "8"))
+
+# Chat model, and the version of the enhance-summary prompt (bump it whenever the
+# prompt changes - enhanced summaries are cached by content hash, prompt version and model)
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5")
+ENHANCE_PROMPT_VERSION = "enhance-v1"
+
 # ==========================================
 # REQUEST/RESPONSE MODELS (EXACTLY AS PROVIDED)
 # ==========================================
@@ -169,7 +183,18 @@ async def call_openai_api(
     if not OPENAI_AVAILABLE:
         raise Exception("OpenAI API is not available. Check API key configuration.")
     
+    # Fail fast while OpenAI keeps failing instead of waiting on more timeouts
+    breaker = circuit_breakers.get('openai')
     try:
+        is_probe = breaker.before_call()
+    except CircuitOpenError as open_error:
+        logger.warning(f"⚡ Skipping OpenAI call: {open_error}")
+        raise Exception(f"AI processing temporarily unavailable: {open_error}")
+    
+    try:
+        # Queue fairly on the OpenAI token bucket without blocking the event loop
+        await rate_limiters.acquire('openai')
+        
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt}
@@ -180,10 +205,11 @@ async def call_openai_api(
             response = await asyncio.get_event_loop().run_in_executor(
                 None,
                 lambda: client.chat.completions.create(
-                    model="gpt-5",
+                    model=OPENAI_MODEL,
                     messages=messages,
                 )
             )
+            breaker.record_success()
             return response.choices[0].message.content
             
         else:
@@ -192,15 +218,24 @@ async def call_openai_api(
             response = await asyncio.get_event_loop().run_in_executor(
                 None,
                 lambda: openai.ChatCompletion.create(
-                    model="gpt-5",
+                    model=OPENAI_MODEL,
                     messages=messages
                 )
             )
+            breaker.record_success()
             return response.choices[0].message.content
             
     except Exception as e:
+        # Only 429/5xx/timeouts mean OpenAI is in trouble; a 400/401 is our request
+        if is_failure_exception(e):
+            breaker.record_failure()
         logger.error(f"❌ OpenAI API call failed: {str(e)}")
         raise Exception(f"AI processing failed: {str(e)}")
+    finally:
+        # A probe cancelled (client disconnect) or ended without an outcome must not
+        # block every OpenAI call until probe_timeout - let the next call probe
+        if is_probe:
+            breaker.release_probe()
 
 def create_fallback_response(
     request: ArticleEnhanceRequest, 
@@ -270,11 +305,15 @@ async def enhance_article_summary(request: ArticleEnhanceRequest):
             # Step 2: Scrape the article content
             if scraper_service and request.article_url:
                 logger.info(f"🔍 Scraping article from: {request.article_url}")
-                scrape_result = await scraper_service.scrape_article(request.article_url)
+                scrape_result = await scraper_service.scrape_article(
+                    request.article_url,
+                    budget=LatencyBudget(SCRAPE_BUDGET_SECONDS, name="enhance_summary")
+                )
                 
-                # Cache the result
-                scrape_result['timestamp'] = datetime.now().isoformat()
-                SCRAPE_CACHE[cache_key] = scrape_result
+                # Cache successful scrapes (a slow or failed fetch may succeed next time)
+                if scrape_result.get('success'):
+                    scrape_result['timestamp'] = datetime.now().isoformat()
+                    SCRAPE_CACHE[cache_key] = scrape_result
                 
                 # Clean old cache entries periodically
                 if len(SCRAPE_CACHE) > 1000:
@@ -296,7 +335,31 @@ async def enhance_article_summary(request: ArticleEnhanceRequest):
             article_content = request.article_snippet
             logger.info(f"⚠️ Using snippet fallback: {len(article_content)} characters")
         
-        # Step 3: Generate enhanced summary using AI
+        # Step 3: Reuse an enhanced summary we already generated for this exact content
+        summary_key = content_hash(request.article_title, request.category, article_content[:8000])
+        cached_summary = await summary_cache.aget('enhance', summary_key, ENHANCE_PROMPT_VERSION, OPENAI_MODEL)
+        if cached_summary:
+            logger.info(f"♻️ Using cached enhanced summary for {request.article_id}")
+            processing_time = (datetime.now() - start_time).total_seconds()
+            return ArticleEnhanceResponse(
+                success=True,
+                enhanced_summary=cached_summary['summary'],
+                key_points=cached_summary.get('key_points', []),
+                reading_time=cached_summary.get('reading_time', "3-5 min read"),
+                confidence_score=cached_summary.get('confidence_score', 75),
+                scraped_content_preview=article_content[:500] if content_source.endswith("full_article") else None,
+                metadata={
+                    "content_source": content_source,
+                    "processing_time_seconds": round(processing_time, 2),
+                    "scraped_content_length": len(article_content),
+                    "ai_model_used": OPENAI_MODEL,
+                    "cache_used": True,
+                    "summary_cache_hit": True,
+                    "timestamp": datetime.now().isoformat()
+                }
+            )
+        
+        # Step 4: Generate enhanced summary using AI
         if not OPENAI_AVAILABLE:
             logger.warning("⚠️ OpenAI not available, returning fallback response")
             return create_fallback_response(request, "AI enhancement service unavailable")
@@ -359,8 +422,10 @@ Make the summary engaging and easy to understand while capturing the main story,
             )
             
             # Parse AI response
+            ai_response_parsed = False
             try:
                 ai_response = json.loads(ai_response_text)
+                ai_response_parsed = isinstance(ai_response, dict) and bool(ai_response.get("summary"))
                 logger.info("✅ AI response parsed successfully")
             except json.JSONDecodeError as e:
                 logger.warning(f"⚠️ AI response not valid JSON: {e}")
@@ -382,13 +447,28 @@ Make the summary engaging and easy to understand while capturing the main story,
                 "content_source": content_source,
                 "processing_time_seconds": round(processing_time, 2),
                 "scraped_content_length": len(article_content),
-                "ai_model_used": "gp-5",
+                "ai_model_used": OPENAI_MODEL,
                 "cache_used": "cached" in content_source,
                 "timestamp": datetime.now().isoformat()
             }
             
             logger.info(f"✅ Enhancement completed in {processing_time:.2f}s")
             
+            # Remember well-formed results so this content is never paid for twice
+            if ai_response_parsed:
+                await summary_cache.aput(
+                    'enhance',
+                    summary_key,
+                    {
+                        'summary': ai_response["summary"],
+                        'key_points': ai_response.get("key_points", []),
+                        'reading_time': ai_response.get("reading_time", "3-5 min read"),
+                        'confidence_score': confidence_score
+                    },
+                    ENHANCE_PROMPT_VERSION,
+                    OPENAI_MODEL
+                )
+            
             return ArticleEnhanceResponse(
                 success=True,
                 enhanced_summary=ai_response.get("summary", "Summary generation failed"),
@@ -452,7 +532,10 @@ async def chat_about_article(message: ChatMessage):
             logger.info(f"♻️ Using cached content for chat context")
         elif scraper_service and message.article_url:
             logger.info(f"🔍 Scraping article for chat context: {message.article_url}")
-            scrape_result = await scraper_service.scrape_article(message.article_url)
+            scrape_result = await scraper_service.scrape_article(
+                message.article_url,
+                budget=LatencyBudget(SCRAPE_BUDGET_SECONDS, name="article_chat")
+            )
             if scrape_result.get('success') and scrape_result.get('content'):
                 article_content = scrape_result['content']
                 content_source = "scraped_full_article"
@@ -610,12 +693,22 @@ async def article_service_health():
         "ready": hasattr(scraper_service, 'scrape_article') if scraper_service else False
     }
     
+    # Check upstream rate limiter queues
+    health_status["services"]["rate_limiters"] = rate_limiters.get_stats()
+    
+    # Check upstream circuit breakers (open circuits are failing fast)
+    health_status["services"]["circuit_breakers"] = circuit_breakers.get_stats()
+    
     # Check cache status
     health_status["services"]["cache"] = {
         "entries": len(SCRAPE_CACHE),
         "memory_usage_mb": round(len(str(SCRAPE_CACHE)) / 1024 / 1024, 2)
     }
     
+    # Check the persistent summary cache (shared with the news feed) - a SQLite
+    # count, so it runs in a worker thread rather than on the event loop
+    health_status["services"]["summary_cache"] = await asyncio.to_thread(summary_cache.get_stats)
+    
     # Overall health
     all_healthy = (
         health_status["services"]["openai"]["available"] and
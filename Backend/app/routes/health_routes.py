@@ -5,6 +5,16 @@ from fastapi import APIRouter, HTTPException
 from datetime import datetime
 import asyncio
 
+from app.services.news_service import news_service
+from app.services.rate_limiter import rate_limiters
+from app.services.circuit_breaker import circuit_breakers
+from app.services.feed_materializer import feed_materializer
+from app.services.http_cache import http_cache
+from app.services.summary_cache import summary_cache
+from app.services.breaking_news_classifier import breaking_news_classifier
+from app.services.feed_delta_tracker import feed_delta_tracker
+from app.services.breaking_news_broadcaster import breaking_news_broadcaster
+
 router = APIRouter()
 
 @router.get("/health")
@@ -13,16 +23,52 @@ async def health_check():
     try:
         await asyncio.sleep(0.05)  # Simulate processing
         
+        # The quota and both caches live in SQLite (busy_timeout up to 10s) -
+        # never read them on the event loop
+        quota_stats, http_cache_stats, summary_cache_stats = await asyncio.gather(
+            asyncio.to_thread(news_service.get_quota_stats),
+            asyncio.to_thread(http_cache.get_stats),
+            asyncio.to_thread(summary_cache.get_stats)
+        )
+        
         return {
             "status": "healthy",
             "message": "TeaCup Backend is brewing smoothly! 🫖",
             "timestamp": datetime.now().isoformat(),
-            "version": "1.0.0"
+            "version": "1.0.0",
+            "upstream_connections": news_service.get_connection_stats(),
+            "search_coalescing": news_service.get_coalescing_stats(),
+            "search_cache": news_service.get_cache_stats(),
+            "near_duplicates": news_service.get_near_duplicate_stats(),
+            "query_plans": news_service.get_query_plan_stats(),
+            "incremental_processing": news_service.get_incremental_stats(),
+            "recency_index": news_service.get_recency_stats(),
+            "feed_deltas": feed_delta_tracker.get_stats(),
+            "breaking_stream": breaking_news_broadcaster.get_stats(),
+            "summaries": news_service.summarizer.get_stats(),
+            "summary_cache": summary_cache_stats,
+            "breaking_news_rules": breaking_news_classifier.get_stats(),
+            "cse_quota": quota_stats,
+            "news_provider": news_service.get_provider_stats(),
+            "circuit_breakers": circuit_breakers.get_stats(),
+            "upstream_latency": news_service.get_latency_stats(),
+            "rss_feeds": news_service.get_feed_stats(),
+            "http_cache": http_cache_stats,
+            "rate_limiters": rate_limiters.get_stats()
         }
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
+@router.get("/health/feeds")
+async def feeds_health():
+    """Background feed materializer: refresh lag and per-feed age"""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "feed_materializer": feed_materializer.get_stats()
+    }
+
 @router.get("/health/ping")
 async def ping():
     """Quick ping endpoint"""
@@ -2,7 +2,8 @@
 # ENHANCED: Updated news routes with higher article limits to support dynamic frontend requirements
 # Politics, Education, Health = 40 articles | Others = 10-15 articles
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, Dict, List, Any
 import asyncio
@@ -10,16 +11,23 @@ from datetime import datetime
 import logging
 import json
 import os
+import time
+import heapq
 
 # Import the real news service (no mock data)
 from app.services.news_service import news_service
+from app.services.quota_manager import QuotaContext, PRIORITY_USER, PRIORITY_DEBUG
+from app.services.feed_materializer import feed_materializer
+from app.services.latency_budget import LatencyBudget
+from app.services.feed_delta_tracker import feed_delta_tracker, FeedDelta
+from app.services.breaking_news_broadcaster import breaking_news_broadcaster
 
 # **CRITICAL ADDITION: Import search cache functionality for automatic cache updates**
 try:
     from app.routes.search_routes import update_articles_cache
 except ImportError:
     # Fallback if search routes not available
-    def update_articles_cache(articles):
+    def update_articles_cache(articles, category=None, country_code=None):
         pass
 
 # Import authentication helper
@@ -48,6 +56,19 @@ MAX_SEARCH_RESULTS = 50               # Keep existing limit
 # Maximum breaking news articles
 MAX_BREAKING_NEWS = 40                # Increased from 30 for better coverage
 
+# Stories older than this (by publish time) no longer count as breaking news
+BREAKING_MAX_AGE_HOURS = float(os.getenv("NEWS_BREAKING_MAX_AGE_HOURS", "48"))
+
+# Categories searched for breaking news
+BREAKING_PRIORITY_CATEGORIES = ['politics', 'health', 'business', 'local-trends']
+
+# Reconnect delay suggested to breaking news stream clients (SSE `retry:` field)
+BREAKING_STREAM_RETRY_MS = int(os.getenv("BREAKING_STREAM_RETRY_MS", "5000"))
+
+# Time each news request may spend waiting on upstreams before answering
+# with partial or cached results
+REQUEST_BUDGET_SECONDS = float(os.getenv("NEWS_REQUEST_BUDGET_SECONDS", "8"))
+
 # Valid news categories supported by the system
 VALID_CATEGORIES = [
     'politics',
@@ -132,41 +153,6 @@ def get_user_country(credentials: HTTPAuthorizationCredentials) -> str:
             detail="Authentication error. Please log in again."
         )
 
-def convert_articles_for_cache(articles: List, category: str, country: str) -> List[Dict]:
-    """
-    Convert ProcessedArticle objects to cache-friendly format
-    
-    Args:
-        articles: List of ProcessedArticle objects
-        category: Category name for metadata
-        country: Country code for metadata
-        
-    Returns:
-        List of article dictionaries ready for search cache
-    """
-    cache_articles = []
-    
-    for article in articles:
-        try:
-            # Convert ProcessedArticle to dictionary if needed
-            if hasattr(article, '__dict__'):
-                article_dict = article.__dict__.copy()
-            else:
-                article_dict = dict(article)  # Assume it's already a dict
-            
-            # Add cache metadata
-            article_dict['cached_at'] = datetime.now().isoformat()
-            article_dict['cache_category'] = category
-            article_dict['cache_country'] = country
-            
-            cache_articles.append(article_dict)
-            
-        except Exception as conv_error:
-            logger.warning(f"⚠️ Failed to convert article for cache: {conv_error}")
-            continue
-    
-    return cache_articles
-
 def update_search_cache_safely(articles: List, category: str, country: str, source: str) -> bool:
     """
     Safely update search cache with articles, handling any errors gracefully
@@ -184,83 +170,72 @@ def update_search_cache_safely(articles: List, category: str, country: str, sour
         if not articles:
             return False
         
-        cache_articles = convert_articles_for_cache(articles, category, country)
-        if cache_articles:
-            update_articles_cache(cache_articles)
-            logger.info(f"📦 Cache updated: {len(cache_articles)} articles from {source}")
-            return True
-        return False
+        # The cache keeps references to the same records we return - no copies
+        update_articles_cache(articles, category, country)
+        logger.info(f"📦 Cache updated: {len(articles)} articles from {source}")
+        return True
         
     except Exception as cache_error:
         logger.warning(f"⚠️ Cache update failed for {source}: {cache_error}")
         return False
 
-# ===== MAIN NEWS ENDPOINTS =====
-
-@router.get("/news/{category}")
-async def get_news_by_category(
-    category: str,
-    max_articles: Optional[int] = Query(18, ge=1, le=MAX_ARTICLES_PER_CATEGORY),  # 🎯 INCREASED: le=50
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-):
+def check_since_cursor(since: Optional[str]) -> None:
     """
-    Get news articles for a specific category using user's country preference
-    🎯 ENHANCED: Now supports up to 50 articles per category (increased from 18)
-    
-    Requires authentication - user must be logged in with a valid country preference.
-    News is automatically localized to the user's selected country.
-    Perfect for category-specific pages and priority content loading.
+    Reject a malformed `since` cursor before any news is fetched for it
     
     Args:
-        category: News category (politics, sports, health, etc.)
-        max_articles: Maximum articles to return (1-50, increased from 1-18)
-        credentials: Required user authentication (country extracted from user settings)
+        since: Cursor from the client's previous response (None = full response)
         
-    Returns:
-        JSON response with articles from the specified category and user's country
+    Raises:
+        HTTPException: 400 if the cursor is malformed
     """
+    if since is None:
+        return
     try:
-        # Get user's country preference dynamically (required)
-        user_country = get_user_country(credentials)
-        
-        logger.info(f"📰 API Request: {category} news for country {user_country} (max: {max_articles})")
-        
-        # Validate the requested category
-        validate_category(category)
-        
-        # Fetch real news articles using user's country preference
-        articles = await news_service.get_news_for_category(category, max_articles, user_country)
-        
-        logger.info(f"✅ Retrieved {len(articles)} real {category} articles for {user_country}")
-        
-        # **NEW: Update search cache with fetched articles**
-        cache_updated = update_search_cache_safely(articles, category, user_country, f"{category}_category")
+        feed_delta_tracker.check_cursor(since)
+    except ValueError as cursor_error:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor_error}")
+
+def delta_to_response(delta: FeedDelta) -> Dict[str, Any]:
+    """
+    Response fields for one feed's changes since a cursor
+    
+    Args:
+        delta: Changes computed by the feed delta tracker
         
-        # FastAPI automatically converts ProcessedArticle dataclass objects to JSON
-        return {
-            "success": True,
-            "articles": articles,                           # Auto-converted to JSON
-            "category": category.title(),                   # Formatted category name
-            "count": len(articles),                         # Number of articles returned
-            "country": user_country,                        # User's country preference
-            "search_cache_updated": cache_updated,          # Indicate if cache was updated
-            "timestamp": datetime.now().isoformat()        # When this response was generated
-        }
+    Returns:
+        Dictionary with reset flag, added/updated articles and removed IDs
+    """
+    return {
+        "reset": delta.reset,                           # True = cursor expired, `added` is the whole feed
+        "added": delta.added,                           # New articles, in feed order
+        "updated": delta.updated,                       # Articles whose content changed
+        "removed": delta.removed                        # IDs of articles that left the feed
+    }
+
+def encode_stream_event(event: str, payload: Dict[str, Any], stream_format: str) -> str:
+    """
+    Encode one block of a streamed response
+    
+    Args:
+        event: Block type ('category', 'summary', 'error')
+        payload: JSON-serializable block contents
+        stream_format: 'ndjson' (one JSON object per line) or 'sse' (Server-Sent Events)
         
-    except HTTPException:
-        # Re-raise HTTP exceptions (400, 401, 404, etc.) without modification
-        raise
-    except Exception as general_error:
-        # Log and convert unexpected errors to 500 responses
-        logger.error(f"❌ Unexpected error fetching {category} news: {general_error}")
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to fetch {category} news. Please try again later."
-        )
+    Returns:
+        Text to write to the stream
+    """
+    data = json.dumps({"type": event, **payload}, ensure_ascii=False, default=str)
+    if stream_format == 'sse':
+        return f"event: {event}\ndata: {data}\n\n"
+    return data + "\n"
+
+# ===== MAIN NEWS ENDPOINTS =====
 
 @router.get("/news/all")
 async def get_all_categories_news(
     max_per_category: Optional[int] = Query(6, ge=1, le=MAX_PER_CATEGORY_ALL_NEWS),  # 🎯 INCREASED: le=45
+    since: Optional[str] = Query(None, description="Cursor from a previous response - return only the changes"),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """
@@ -272,8 +247,12 @@ async def get_all_categories_news(
     Country is automatically determined from user's settings.
     This endpoint is ideal for the enhanced frontend with dynamic article limits.
     
+    Every response carries a `cursor`. Passing it back as `since` returns only
+    what changed per category (added, updated, removed) instead of every article.
+    
     Args:
         max_per_category: Number of articles per category (1-45, increased from 1-10)
+        since: Cursor from a previous response (optional)
         credentials: Required user authentication (country extracted from user settings)
         
     Returns:
@@ -282,11 +261,36 @@ async def get_all_categories_news(
     try:
         # Get user's country preference dynamically (required)
         user_country = get_user_country(credentials)
+        check_since_cursor(since)
         
         logger.info(f"📊 API Request: ALL categories for country {user_country} ({max_per_category} per category)")
         
-        # Use the news service's optimized concurrent fetching with user's country
-        news_by_category = await news_service.get_all_categories_news(max_per_category, user_country)
+        # Categories already materialized in the background are read from memory
+        news_by_category = {}
+        category_status = {}
+        for category in VALID_CATEGORIES:
+            articles = feed_materializer.get_feed(category, user_country, max_per_category)
+            if articles is not None:
+                news_by_category[category] = articles
+                category_status[category] = 'ok' if articles else 'empty'
+        
+        # The rest are fetched concurrently under a semaphore and an overall deadline
+        missing = [category for category in VALID_CATEGORIES if category not in news_by_category]
+        deadline_hit = False
+        if missing:
+            fanout = await news_service.get_all_categories_news(
+                max_per_category, user_country,
+                categories=missing,
+                quota=QuotaContext(route="news_all", priority=PRIORITY_USER),
+                budget=LatencyBudget(REQUEST_BUDGET_SECONDS, name="news_all")
+            )
+            news_by_category.update(fanout.news_by_category)
+            category_status.update(fanout.category_status)
+            deadline_hit = fanout.deadline_hit
+        
+        # Keep the dashboard's category order
+        news_by_category = {c: news_by_category[c] for c in VALID_CATEGORIES if c in news_by_category}
+        category_status = {c: category_status[c] for c in VALID_CATEGORIES}
         
         # Calculate total statistics
         total_articles = sum(len(articles) for articles in news_by_category.values())
@@ -296,30 +300,50 @@ async def get_all_categories_news(
         
         # **NEW: Bulk update search cache with all fetched articles**
         cache_updated_count = 0
-        all_cache_articles = []
+        bulk_cache_success = False
+        
+        try:
+            for category, articles in news_by_category.items():
+                if articles:  # Only process categories that have articles
+                    update_articles_cache(articles, category, user_country)
+                    cache_updated_count += len(articles)
+            bulk_cache_success = cache_updated_count > 0
+            if bulk_cache_success:
+                logger.info(f"📦 Bulk cache update: {cache_updated_count} articles from all categories")
+        except Exception as bulk_cache_error:
+            logger.warning(f"⚠️ Bulk cache update failed: {bulk_cache_error}")
         
+        # Remember what this response serves so the client can poll for changes
         for category, articles in news_by_category.items():
-            if articles:  # Only process categories that have articles
-                cache_articles = convert_articles_for_cache(articles, category, user_country)
-                all_cache_articles.extend(cache_articles)
-                cache_updated_count += len(cache_articles)
+            feed_delta_tracker.record(category, user_country, articles, max_per_category)
         
-        # Perform bulk cache update
-        bulk_cache_success = False
-        if all_cache_articles:
-            try:
-                update_articles_cache(all_cache_articles)
-                bulk_cache_success = True
-                logger.info(f"📦 Bulk cache update: {cache_updated_count} articles from all categories")
-            except Exception as bulk_cache_error:
-                logger.warning(f"⚠️ Bulk cache update failed: {bulk_cache_error}")
+        if since is not None:
+            changes_by_category = {
+                category: delta_to_response(
+                    feed_delta_tracker.changes_since(category, user_country, since, max_per_category)
+                )
+                for category in news_by_category
+            }
+            return {
+                "success": True,
+                "since": since,                                 # Cursor the changes are relative to
+                "cursor": feed_delta_tracker.cursor(),          # Pass as `since` on the next poll
+                "changes_by_category": changes_by_category,     # Per category: reset/added/updated/removed
+                "category_status": category_status,
+                "partial": deadline_hit,
+                "country": user_country,
+                "timestamp": datetime.now().isoformat()
+            }
         
         # FastAPI automatically converts ProcessedArticle objects to JSON
         return {
             "success": True,
+            "cursor": feed_delta_tracker.cursor(),          # Pass as `since` to poll for changes
             "news_by_category": news_by_category,           # Auto-converted to JSON
             "total_articles": total_articles,               # Total count across all categories
             "categories_count": successful_categories,      # Number of categories with articles
+            "category_status": category_status,             # ok / empty / error / timeout per category
+            "partial": deadline_hit,                        # True if some categories missed the deadline
             "country": user_country,                        # User's current country preference
             "search_cache_updated": bulk_cache_success,     # Indicate if bulk cache update succeeded
             "articles_cached": cache_updated_count,         # Number of articles added to cache
@@ -335,6 +359,121 @@ async def get_all_categories_news(
             detail="Failed to fetch news dashboard. Please try again later."
         )
 
+@router.get("/news/all/stream")
+async def stream_all_categories_news(
+    request: Request,
+    max_per_category: Optional[int] = Query(6, ge=1, le=MAX_PER_CATEGORY_ALL_NEWS),
+    stream_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|sse)$",
+                                         description="ndjson or sse (default: from the Accept header)"),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Streaming variant of /news/all: each category is sent the moment it is ready
+    
+    Categories already materialized in the background go out immediately; the
+    rest follow in completion order as their searches finish, so the dashboard
+    can paint its first sections long before the slowest category is done.
+    The stream ends with a summary trailer (totals, per-category status and a
+    `cursor` for /news/all?since=...).
+    
+    NDJSON: one JSON object per line, {"type": "category" | "summary", ...}
+    SSE: `event: category` / `event: summary` with the same JSON as `data`
+    
+    Args:
+        request: Incoming request (its Accept header picks the format if none is given)
+        max_per_category: Number of articles per category (1-45)
+        stream_format: 'ndjson' or 'sse'
+        credentials: Required user authentication (country extracted from user settings)
+        
+    Returns:
+        StreamingResponse of category blocks followed by the summary trailer
+    """
+    # Authentication errors are raised before the stream starts (normal 401 response)
+    user_country = get_user_country(credentials)
+    if stream_format is None:
+        stream_format = 'sse' if 'text/event-stream' in request.headers.get('accept', '') else 'ndjson'
+    
+    logger.info(f"📊 API Request: ALL categories stream ({stream_format}) for {user_country} ({max_per_category} per category)")
+    
+    async def generate():
+        started = time.time()
+        category_status: Dict[str, str] = {}
+        total_articles = 0
+        cache_updated_count = 0
+        
+        def category_block(category: str, articles: List, status: str, materialized: bool) -> str:
+            nonlocal total_articles, cache_updated_count
+            category_status[category] = status
+            total_articles += len(articles)
+            if articles:
+                try:
+                    update_articles_cache(articles, category, user_country)
+                    cache_updated_count += len(articles)
+                except Exception as cache_error:
+                    logger.warning(f"⚠️ Cache update failed for streamed {category}: {cache_error}")
+            if status in ('ok', 'empty'):
+                feed_delta_tracker.record(category, user_country, articles, max_per_category)
+            return encode_stream_event('category', {
+                "category": category,
+                "status": status,                           # ok / empty / error / timeout
+                "materialized": materialized,               # Served from the background-refreshed feed
+                "count": len(articles),
+                "articles": [article.to_dict() for article in articles],
+                "elapsed_seconds": round(time.time() - started, 3)
+            }, stream_format)
+        
+        try:
+            # Categories already materialized in the background are read from memory - send them first
+            missing = []
+            for category in VALID_CATEGORIES:
+                articles = feed_materializer.get_feed(category, user_country, max_per_category)
+                if articles is None:
+                    missing.append(category)
+                    continue
+                yield category_block(category, articles, 'ok' if articles else 'empty', True)
+            
+            # The rest stream out one by one as their fetches finish
+            if missing:
+                async for outcome in news_service.iter_categories_news(
+                    max_per_category, user_country,
+                    categories=missing,
+                    quota=QuotaContext(route="news_all_stream", priority=PRIORITY_USER),
+                    budget=LatencyBudget(REQUEST_BUDGET_SECONDS, name="news_all_stream")
+                ):
+                    yield category_block(outcome.category, outcome.articles, outcome.status, False)
+        except Exception as stream_error:
+            logger.error(f"❌ Error streaming dashboard for {user_country}: {stream_error}")
+            yield encode_stream_event('error', {"detail": "Failed to fetch some categories"}, stream_format)
+        
+        ordered_status = {c: category_status.get(c, 'error') for c in VALID_CATEGORIES}
+        successful_categories = sum(1 for status in ordered_status.values() if status == 'ok')
+        logger.info(
+            f"✅ Dashboard stream complete: {total_articles} articles across {successful_categories} "
+            f"categories for {user_country} in {time.time() - started:.2f}s"
+        )
+        yield encode_stream_event('summary', {
+            "success": True,
+            "total_articles": total_articles,
+            "categories_count": successful_categories,
+            "category_status": ordered_status,
+            "partial": any(status != 'ok' and status != 'empty' for status in ordered_status.values()),
+            "country": user_country,
+            "cursor": feed_delta_tracker.cursor(),          # Pass as `since` to /news/all to poll for changes
+            "search_cache_updated": cache_updated_count > 0,
+            "articles_cached": cache_updated_count,
+            "elapsed_seconds": round(time.time() - started, 3),
+            "timestamp": datetime.now().isoformat()
+        }, stream_format)
+    
+    return StreamingResponse(
+        generate(),
+        media_type='text/event-stream' if stream_format == 'sse' else 'application/x-ndjson',
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"       # Tell nginx-style proxies not to buffer the stream
+        }
+    )
+
 @router.get("/news/breaking")
 async def get_breaking_news(
     max_articles: Optional[int] = Query(15, ge=1, le=MAX_BREAKING_NEWS),  # 🎯 INCREASED: le=40
@@ -347,6 +486,8 @@ async def get_breaking_news(
     Requires authentication - user must be logged in with a valid country preference.
     Searches multiple categories for urgent news from the user's selected country.
     When user changes their country in settings, breaking news automatically updates.
+    Articles are ordered newest first by publish time; stories published more
+    than NEWS_BREAKING_MAX_AGE_HOURS ago are left out.
     
     Args:
         max_articles: Maximum breaking news articles to return (1-40, increased from 1-30)
@@ -362,42 +503,52 @@ async def get_breaking_news(
         logger.info(f"🚨 API Request: Breaking news for country {user_country} (max: {max_articles})")
         
         # Define priority categories for breaking news
-        priority_categories = ['politics', 'health', 'business', 'local-trends']
+        priority_categories = BREAKING_PRIORITY_CATEGORIES
+        
+        # One latency budget shared by all the category lookups
+        budget = LatencyBudget(REQUEST_BUDGET_SECONDS, name="news_breaking")
         
-        # Helper function to get breaking news from a single category
-        async def get_breaking_from_category(category: str) -> List:
+        # Helper function to refresh a single category (which updates its recency index)
+        async def refresh_category(category: str) -> int:
             try:
                 # Get a smaller number from each category to ensure variety
                 articles_per_category = min(10, max_articles // len(priority_categories))
-                articles = await news_service.get_news_for_category(category, articles_per_category, user_country)
-                
-                # Filter for articles marked as breaking
-                breaking_articles = [article for article in articles if getattr(article, 'isBreaking', False)]
-                return breaking_articles
+                articles = await news_service.get_news_for_category(
+                    category, articles_per_category, user_country,
+                    quota=QuotaContext(route="news_breaking", priority=PRIORITY_USER),
+                    budget=budget
+                )
+                return len(articles)
                 
             except Exception as cat_error:
                 logger.warning(f"⚠️ Failed to get breaking news from {category}: {cat_error}")
-                return []
-        
-        # Fetch breaking news from all priority categories concurrently
-        breaking_tasks = [get_breaking_from_category(cat) for cat in priority_categories]
-        breaking_results = await asyncio.gather(*breaking_tasks, return_exceptions=True)
+                return 0
         
-        # Combine all breaking news articles
-        all_breaking_articles = []
-        for result in breaking_results:
+        # Refresh all priority categories concurrently
+        refresh_tasks = [refresh_category(cat) for cat in priority_categories]
+        refresh_results = await asyncio.gather(*refresh_tasks, return_exceptions=True)
+        for result in refresh_results:
             if isinstance(result, Exception):
                 logger.warning(f"⚠️ Breaking news task failed: {result}")
-                continue
-            # Extend the list with articles from this category
-            all_breaking_articles.extend(result)
-        
-        # Sort by timestamp (most recent first) and limit to requested amount
-        all_breaking_articles.sort(
-            key=lambda article: getattr(article, 'timestamp', ''), 
-            reverse=True
-        )
-        final_breaking_news = all_breaking_articles[:max_articles]
+        
+        # Fresh breaking stories per category, newest published first (binary search
+        # in each category's recency index), merged across categories by publish time
+        fresh_since = int(time.time() - BREAKING_MAX_AGE_HOURS * 3600)
+        per_category = [
+            news_service.get_recent_articles(
+                category, user_country, limit=max_articles, since=fresh_since, breaking_only=True
+            )
+            for category in priority_categories
+        ]
+        final_breaking_news = []
+        seen_ids = set()
+        for _, article in heapq.merge(*per_category, key=lambda entry: entry[0], reverse=True):
+            if article.id in seen_ids:
+                continue  # Same story filed under two categories
+            seen_ids.add(article.id)
+            final_breaking_news.append(article)
+            if len(final_breaking_news) >= max_articles:
+                break
         
         logger.info(f"✅ Found {len(final_breaking_news)} breaking news articles for {user_country}")
         
@@ -423,6 +574,100 @@ async def get_breaking_news(
             detail="Failed to fetch breaking news. Please try again later."
         )
 
+@router.get("/news/breaking/stream/{country}")
+async def stream_breaking_news(
+    country: str,
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Live breaking news for one country over Server-Sent Events
+    
+    Instead of polling /news/breaking, clients keep this stream open and receive
+    each breaking story once, the moment the ingestion path (background feed
+    refreshes and on-demand category fetches) first detects it:
+    
+        id: <event id>
+        event: breaking
+        data: {article JSON, plus "country"}
+    
+    Idle streams get a `: heartbeat` comment every few seconds. A client that
+    reconnects with a Last-Event-ID header (EventSource does this automatically)
+    first receives the events it missed; if they are no longer all available an
+    `event: reset` is sent before the retained events, and the client should
+    reload /news/breaking. Readers that fall too far behind are disconnected and
+    catch up the same way.
+    
+    Args:
+        country: Country code (ZW, KE, GH, RW, CD, ZA, BI)
+        request: Incoming request (Last-Event-ID header, disconnect detection)
+        credentials: Required user authentication
+        
+    Returns:
+        StreamingResponse of text/event-stream
+    """
+    # Authentication and validation errors are raised before the stream starts
+    user = get_user_from_token(credentials.credentials)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid or expired authentication token")
+    country = country.upper()
+    if country not in VALID_COUNTRIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid country '{country}'. Valid countries: {', '.join(VALID_COUNTRIES)}"
+        )
+    
+    try:
+        subscription = breaking_news_broadcaster.subscribe(country, request.headers.get('last-event-id'))
+    except OverflowError:
+        raise HTTPException(status_code=503, detail="Too many live connections. Please try again later.")
+    
+    logger.info(f"📡 API Request: Breaking news stream for {country} ({len(subscription.replay)} events to replay)")
+    
+    def keep_feeds_refreshed() -> None:
+        # Breaking stories are detected when feeds refresh; the materializer only
+        # refreshes feeds someone asked for recently, so live readers count as asking
+        for category in BREAKING_PRIORITY_CATEGORIES:
+            feed_materializer.mark_requested(category, country)
+    
+    keep_feeds_refreshed()
+    
+    async def generate():
+        try:
+            yield f"retry: {BREAKING_STREAM_RETRY_MS}\n\n"
+            if subscription.reset:
+                yield encode_stream_event('reset', {"country": country}, 'sse')
+            for frame in subscription.replay:
+                yield frame
+            subscription.replay = []
+            
+            while True:
+                try:
+                    frame = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=breaking_news_broadcaster.heartbeat_interval
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    keep_feeds_refreshed()
+                    yield ": heartbeat\n\n"
+                    continue
+                if frame is None:
+                    break   # Dropped for falling behind - the client reconnects and resumes
+                yield frame
+        finally:
+            breaking_news_broadcaster.unsubscribe(subscription)
+            logger.debug(f"📡 Breaking news stream for {country} closed")
+    
+    return StreamingResponse(
+        generate(),
+        media_type='text/event-stream',
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"       # Tell nginx-style proxies not to buffer the stream
+        }
+    )
+
 @router.get("/news/search")
 async def search_news_articles(
     q: str = Query(..., description="Search query - minimum 2 characters"),
@@ -459,17 +704,21 @@ async def search_news_articles(
             )
         
         # Use news service to search for real articles in user's country
-        search_results = await news_service.search_news(q, max_articles, user_country)
+        search_results = await news_service.search_news(
+            q, max_articles, user_country,
+            quota=QuotaContext(route="news_search", priority=PRIORITY_USER),
+            budget=LatencyBudget(REQUEST_BUDGET_SECONDS, name="news_search")
+        )
         
         logger.info(f"✅ Search completed: {len(search_results)} results for '{q}' in {user_country}")
         
         # **NEW: Update search cache with search results**
         cache_updated = update_search_cache_safely(search_results, 'search', user_country, f"search_{q}")
         
-        # search_news returns dictionaries, so no conversion needed
+        # FastAPI automatically converts ProcessedArticle objects to JSON
         return {
             "success": True,
-            "articles": search_results,                     # Already in dictionary format
+            "articles": search_results,                     # Auto-converted to JSON
             "query": q,                                     # User's search query
             "count": len(search_results),                   # Number of results found
             "country": user_country,                        # User's current country preference
@@ -549,6 +798,177 @@ async def get_available_categories():
             detail="Failed to fetch available categories and countries"
         )
 
+# Declared after the static /news/* routes so "all", "breaking", "search" and
+# "categories" are not captured as a category name
+@router.get("/news/{category}")
+async def get_news_by_category(
+    category: str,
+    max_articles: Optional[int] = Query(18, ge=1, le=MAX_ARTICLES_PER_CATEGORY),  # 🎯 INCREASED: le=50
+    since: Optional[str] = Query(None, description="Cursor from a previous response - return only the changes"),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Get news articles for a specific category using user's country preference
+    🎯 ENHANCED: Now supports up to 50 articles per category (increased from 18)
+    
+    Requires authentication - user must be logged in with a valid country preference.
+    News is automatically localized to the user's selected country.
+    Perfect for category-specific pages and priority content loading.
+    
+    Every response carries a `cursor`. Passing it back as `since` returns only
+    the added, updated and removed articles - a poll with no changes is a few
+    hundred bytes instead of the whole feed.
+    
+    Args:
+        category: News category (politics, sports, health, etc.)
+        max_articles: Maximum articles to return (1-50, increased from 1-18)
+        since: Cursor from a previous response (optional)
+        credentials: Required user authentication (country extracted from user settings)
+        
+    Returns:
+        JSON response with articles from the specified category and user's country
+        (or just the changes since the cursor)
+    """
+    try:
+        # Get user's country preference dynamically (required)
+        user_country = get_user_country(credentials)
+        check_since_cursor(since)
+        
+        logger.info(f"📰 API Request: {category} news for country {user_country} (max: {max_articles})")
+        
+        # Validate the requested category
+        validate_category(category)
+        
+        # Serve the background-materialized feed from memory when it covers the request
+        articles = feed_materializer.get_feed(category, user_country, max_articles)
+        materialized = articles is not None
+        
+        if not materialized:
+            # Not materialized yet (or too few articles) - fetch in the request path
+            articles = await news_service.get_news_for_category(
+                category, max_articles, user_country,
+                quota=QuotaContext(route="news_category", priority=PRIORITY_USER),
+                budget=LatencyBudget(REQUEST_BUDGET_SECONDS, name="news_category")
+            )
+        
+        logger.info(f"✅ Retrieved {len(articles)} real {category} articles for {user_country}")
+        
+        # **NEW: Update search cache with fetched articles**
+        cache_updated = update_search_cache_safely(articles, category, user_country, f"{category}_category")
+        
+        # Remember what this response serves so the client can poll for changes
+        # (per max_articles - a shorter list is not a feed with articles removed)
+        feed_delta_tracker.record(category, user_country, articles, max_articles)
+        
+        if since is not None:
+            delta = feed_delta_tracker.changes_since(category, user_country, since, max_articles)
+            return {
+                "success": True,
+                **delta_to_response(delta),
+                "since": since,                                 # Cursor the changes are relative to
+                "cursor": delta.cursor,                         # Pass as `since` on the next poll
+                "category": category.title(),
+                "count": len(articles),                         # Articles in the full feed now
+                "country": user_country,
+                "materialized": materialized,
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        # FastAPI automatically converts ProcessedArticle dataclass objects to JSON
+        return {
+            "success": True,
+            "cursor": feed_delta_tracker.cursor(),          # Pass as `since` to poll for changes
+            "articles": articles,                           # Auto-converted to JSON
+            "category": category.title(),                   # Formatted category name
+            "count": len(articles),                         # Number of articles returned
+            "country": user_country,                        # User's country preference
+            "materialized": materialized,                   # Served from the background-refreshed feed
+            "search_cache_updated": cache_updated,          # Indicate if cache was updated
+            "timestamp": datetime.now().isoformat()        # When this response was generated
+        }
+        
+    except HTTPException:
+        # Re-raise HTTP exceptions (400, 401, 404, etc.) without modification
+        raise
+    except Exception as general_error:
+        # Log and convert unexpected errors to 500 responses
+        logger.error(f"❌ Unexpected error fetching {category} news: {general_error}")
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Failed to fetch {category} news. Please try again later."
+        )
+
+@router.get("/news/{category}/recent")
+async def get_recent_news_by_category(
+    category: str,
+    max_articles: Optional[int] = Query(18, ge=1, le=MAX_ARTICLES_PER_CATEGORY),
+    hours: Optional[float] = Query(None, gt=0, description="Only articles published in the last N hours"),
+    start: Optional[int] = Query(None, ge=0, description="Published at or after (epoch seconds)"),
+    end: Optional[int] = Query(None, ge=0, description="Published before (epoch seconds)"),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Get a category's articles newest first by publish time, optionally within a time window
+    
+    Served from the feed's recency index (every article the feed has seen
+    recently, not just its latest refresh). The feed is fetched first only if
+    it has never been loaded.
+    
+    Args:
+        category: News category (politics, sports, health, etc.)
+        max_articles: Maximum articles to return (1-50)
+        hours: Freshness filter - only articles from the last N hours
+        start: Earliest publish time in epoch seconds (inclusive)
+        end: Latest publish time in epoch seconds (exclusive)
+        credentials: Required user authentication (country extracted from user settings)
+        
+    Returns:
+        JSON response with articles (each with publishedAt) newest first
+    """
+    try:
+        user_country = get_user_country(credentials)
+        validate_category(category)
+        
+        since = start
+        if hours is not None:
+            fresh_since = int(time.time() - hours * 3600)
+            since = max(since, fresh_since) if since is not None else fresh_since
+        if since is not None and end is not None and since >= end:
+            raise HTTPException(status_code=400, detail="The time window is empty: start must be before end")
+        
+        logger.info(f"🕒 API Request: recent {category} news for {user_country} (since={since}, until={end})")
+        
+        recent = news_service.get_recent_articles(category, user_country, max_articles, since, end)
+        if not recent and not news_service.get_recent_articles(category, user_country, 1):
+            # Feed never loaded in this process - load it, which fills the index
+            await news_service.get_news_for_category(
+                category, max_articles, user_country,
+                quota=QuotaContext(route="news_recent", priority=PRIORITY_USER),
+                budget=LatencyBudget(REQUEST_BUDGET_SECONDS, name="news_recent")
+            )
+            recent = news_service.get_recent_articles(category, user_country, max_articles, since, end)
+        
+        articles = [article for _, article in recent]
+        return {
+            "success": True,
+            "articles": articles,                           # Newest published first
+            "category": category.title(),
+            "count": len(articles),
+            "country": user_country,
+            "published_after": since,                       # Window actually applied (epoch seconds)
+            "published_before": end,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as recent_error:
+        logger.error(f"❌ Error fetching recent {category} news: {recent_error}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch recent {category} news. Please try again later."
+        )
+
 # ADMIN/DEBUG endpoint to manually override country (optional)
 @router.get("/news/{category}/country/{country_override}")
 async def get_news_by_category_with_country_override(
@@ -584,7 +1004,11 @@ async def get_news_by_category_with_country_override(
             )
         
         # Fetch news with manual country override
-        articles = await news_service.get_news_for_category(category, max_articles, country_override)
+        # Debug calls get the lowest quota priority so they can never starve real users
+        articles = await news_service.get_news_for_category(
+            category, max_articles, country_override,
+            quota=QuotaContext(route="news_debug_override", priority=PRIORITY_DEBUG)
+        )
         
         logger.info(f"✅ DEBUG: Retrieved {len(articles)} {category} articles for {country_override}")
         
@@ -4,7 +4,7 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
 import re
@@ -12,6 +12,8 @@ from urllib.parse import quote_plus
 import json
 import os
 
+from app.services.news_service import ProcessedArticle
+
 # Set up router and logging
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -32,45 +34,93 @@ class SearchResult(BaseModel):
     web_search_suggestion: Optional[Dict[str, str]] = None
     timestamp: str
 
-# Simple in-memory cache for processed articles
-processed_articles_cache: List[Dict[str, Any]] = []
+# Simple in-memory cache for processed articles: article ID -> shared record,
+# oldest first. Records are the same immutable objects the news routes return.
+processed_articles_cache: Dict[str, ProcessedArticle] = {}
+
+# Per-article cache context (cached_at, category, country_code), kept beside the
+# records so caching never has to copy or modify them
+article_cache_context: Dict[str, Dict[str, Optional[str]]] = {}
+
+# Keep cache size reasonable - keep only the last 1000 articles
+MAX_CACHED_ARTICLES = 1000
 
-def update_articles_cache(articles: List[Dict[str, Any]]) -> None:
+def update_articles_cache(
+    articles: List[Any],
+    category: Optional[str] = None,
+    country_code: Optional[str] = None
+) -> int:
     """
     Update the in-memory cache with new processed articles
     
+    Article IDs are derived from the canonical source URL, so the same story
+    fetched again (for another category, country or worker) replaces its cached
+    record instead of being added twice. ProcessedArticle objects are stored by
+    reference; dictionaries (e.g. posted to /cache/update) are converted once,
+    and dictionaries without an 'id' or 'sourceUrl' are skipped.
+    
     Args:
-        articles: List of processed article dictionaries to add to cache
+        articles: ProcessedArticle objects or article dictionaries to add to cache
+        category: Feed the articles were fetched for (cache context)
+        country_code: Country the articles were fetched for (cache context)
+        
+    Returns:
+        Number of articles cached (new or refreshed)
     """
-    global processed_articles_cache
+    cached_at = datetime.now().isoformat()
+    new_count = 0
+    refreshed_count = 0
+    skipped_count = 0
     
-    # Add timestamp to articles if not present
     for article in articles:
-        if 'cached_at' not in article:
-            article['cached_at'] = datetime.now().isoformat()
-    
-    # Add new articles to cache (avoiding duplicates by ID)
-    existing_ids = {article.get('id') for article in processed_articles_cache}
-    new_articles = [article for article in articles if article.get('id') not in existing_ids]
-    
-    processed_articles_cache.extend(new_articles)
+        if isinstance(article, ProcessedArticle):
+            record = article
+        else:
+            try:
+                record = ProcessedArticle.from_dict(article)
+            except ValueError as e:
+                skipped_count += 1
+                logger.warning(f"⚠️ Skipping article without identity: {e}")
+                continue
+        
+        # A story we already hold is replaced by its fresh record and moves to
+        # the newest end, so re-fetched stories are not trimmed first
+        if processed_articles_cache.pop(record.id, None) is None:
+            new_count += 1
+        else:
+            refreshed_count += 1
+        processed_articles_cache[record.id] = record
+        article_cache_context[record.id] = {
+            'cached_at': cached_at,
+            'category': category,
+            'country_code': country_code
+        }
     
-    # Keep cache size reasonable - keep only last 1000 articles
-    if len(processed_articles_cache) > 1000:
-        processed_articles_cache = processed_articles_cache[-1000:]
+    # Drop the oldest records beyond the size limit
+    while len(processed_articles_cache) > MAX_CACHED_ARTICLES:
+        oldest_id = next(iter(processed_articles_cache))
+        del processed_articles_cache[oldest_id]
+        article_cache_context.pop(oldest_id, None)
     
-    logger.info(f"📦 Cache updated: {len(new_articles)} new articles, {len(processed_articles_cache)} total")
+    logger.info(
+        f"📦 Cache updated: {new_count} new articles, {refreshed_count} refreshed, "
+        f"{skipped_count} skipped, {len(processed_articles_cache)} total"
+    )
+    return new_count + refreshed_count
 
 def search_cached_articles(query: str, max_results: int = 20) -> List[Dict[str, Any]]:
     """
     Search through cached processed articles for matching content
     
+    Scores are collected beside the shared records; only the returned top
+    results are serialized.
+    
     Args:
         query: Search query string
         max_results: Maximum number of results to return
         
     Returns:
-        List of matching articles from cache
+        List of matching article dictionaries (with search_score), best first
     """
     if not processed_articles_cache:
         logger.info("📦 No articles in cache to search")
@@ -78,43 +128,41 @@ def search_cached_articles(query: str, max_results: int = 20) -> List[Dict[str,
     
     # Convert query to lowercase for case-insensitive search
     search_terms = query.lower().split()
-    matching_articles = []
+    scored: List[Tuple[int, ProcessedArticle]] = []
     
     logger.info(f"🔍 Searching {len(processed_articles_cache)} cached articles for: '{query}'")
     
     # Search through each cached article
-    for article in processed_articles_cache:
+    for article in processed_articles_cache.values():
         score = 0
         
         # Search in title (higher weight)
-        title = article.get('title', '').lower()
+        title = (article.title or '').lower()
         for term in search_terms:
             if term in title:
                 score += 3  # Title matches get higher score
         
         # Search in summary/content (medium weight)
-        summary = article.get('summary', '').lower()
+        summary = (article.summary or '').lower()
         for term in search_terms:
             if term in summary:
                 score += 2  # Summary matches get medium score
         
         # Search in category (lower weight)
-        category = article.get('category', '').lower()
+        category = (article.category or '').lower()
         for term in search_terms:
             if term in category:
                 score += 1  # Category matches get lower score
         
-        # If we found any matches, add to results
+        # If we found any matches, remember the score next to the record
         if score > 0:
-            article_copy = article.copy()
-            article_copy['search_score'] = score
-            matching_articles.append(article_copy)
+            scored.append((score, article))
     
-    # Sort by relevance score (highest first)
-    matching_articles.sort(key=lambda x: x['search_score'], reverse=True)
+    # Sort by relevance score (highest first); the sort is stable, so ties keep cache order
+    scored.sort(key=lambda match: match[0], reverse=True)
     
     # Return top results
-    results = matching_articles[:max_results]
+    results = [article.to_dict(search_score=score) for score, article in scored[:max_results]]
     logger.info(f"✅ Found {len(results)} cached articles matching '{query}'")
     
     return results
@@ -284,13 +332,15 @@ async def update_search_cache(
     """
     try:
         # Update the cache with new articles
-        update_articles_cache(articles)
+        cached_count = update_articles_cache(articles)
+        skipped_count = len(articles) - cached_count
         
-        logger.info(f"📦 Cache updated: {len(articles)} articles added")
+        logger.info(f"📦 Cache updated: {cached_count} articles added, {skipped_count} skipped")
         
         return {
             "success": True,
-            "message": f"Successfully added {len(articles)} articles to search cache",
+            "message": f"Successfully added {cached_count} articles to search cache",
+            "skipped_articles": skipped_count,
             "total_cached_articles": len(processed_articles_cache),
             "timestamp": datetime.now().isoformat()
         }
@@ -316,12 +366,12 @@ async def get_cache_statistics():
         categories = {}
         
         # Count articles by category
-        for article in processed_articles_cache:
-            category = article.get('category', 'Unknown')
+        for article in processed_articles_cache.values():
+            category = article.category or 'Unknown'
             categories[category] = categories.get(category, 0) + 1
         
         # Find newest and oldest articles
-        timestamps = [article.get('cached_at') for article in processed_articles_cache if article.get('cached_at')]
+        timestamps = [context['cached_at'] for context in article_cache_context.values() if context.get('cached_at')]
         newest = max(timestamps) if timestamps else None
         oldest = min(timestamps) if timestamps else None
         
@@ -334,7 +384,7 @@ async def get_cache_statistics():
                 "categories": categories,
                 "newest_article": newest,
                 "oldest_article": oldest,
-                "cache_size_mb": len(str(processed_articles_cache)) / (1024 * 1024)  # Rough estimate
+                "cache_size_mb": len(str(list(processed_articles_cache.values()))) / (1024 * 1024)  # Rough estimate
             },
             "timestamp": datetime.now().isoformat()
         }
@@ -0,0 +1,102 @@
+# Backend/app/services/article_identity.py
+"""
+Article Identity
+Canonical URLs and stable, content-derived article IDs. The same story gets the
+same ID on every fetch, in every category, country and worker process, so the
+caches can deduplicate across requests.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid', 'yclid', '_ga', '_gl',
+    'ref', 'ref_src', 'ref_url', 'referrer', 'cmpid', 'cmp', 'ocid', 'ito',
+    'spm', 'sharetype', 'smid', 'sr_share', 'at_medium', 'at_campaign', 'guccounter'
+}
+TRACKING_PREFIXES = ('utm_', 'mkt_', 'pk_', 'hmb_', 'oly_')
+
+# Host prefixes that serve the same page as the bare domain
+MIRROR_HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+# Second-level labels of country-code suffixes (co.zw, com.gh, or.ke, ...) - a
+# prefix is never stripped when only such a suffix would be left
+SECOND_LEVEL_LABELS = {'co', 'com', 'org', 'net', 'gov', 'ac', 'edu', 'or', 'go', 'ne', 'info'}
+
+# Hex digits of the SHA-1 kept in an article ID (64 bits)
+ARTICLE_ID_LENGTH = 16
+
+_SLASHES_RE = re.compile(r'/{2,}')
+
+def _is_tracking_param(name: str) -> bool:
+    """Whether a query parameter only tracks the click"""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+def _is_public_suffix(host: str) -> bool:
+    """Whether a host is only a country-code suffix such as co.zw"""
+    labels = host.split('.')
+    return len(labels) == 2 and labels[0] in SECOND_LEVEL_LABELS and len(labels[1]) == 2
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL so that different links to the same page compare equal
+
+    - http and https are treated alike; host is lowercased, default port and
+      www./m./amp. prefixes are dropped (unless only a suffix like co.zw would remain)
+    - Tracking parameters (utm_*, fbclid, ...) and the fragment are removed,
+      remaining parameters are sorted
+    - Duplicate and trailing slashes and a trailing /amp are removed
+
+    Args:
+        url: Article URL as found in search results or feeds
+
+    Returns:
+        Canonical URL (the stripped input if it cannot be parsed)
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or '').lower().rstrip('.')
+        port = parts.port
+    except ValueError:
+        return url
+    if not host:
+        return url
+
+    for prefix in MIRROR_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count('.') > 1:
+            if not _is_public_suffix(host[len(prefix):]):
+                host = host[len(prefix):]
+            break
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = _SLASHES_RE.sub('/', parts.path or '/')
+    if path.endswith('/amp') or path.endswith('/amp/'):
+        path = path[:path.rindex('/amp')] or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    params = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name) and name.lower() != 'amp'
+    )
+
+    return urlunsplit(('https', host, path, urlencode(params), ''))
+
+def article_id_for_url(url: str) -> str:
+    """
+    Stable article ID: a truncated SHA-1 of the canonical URL
+
+    Unlike hash(), this is the same in every process and on every run.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        16-character hexadecimal ID
+    """
+    return hashlib.sha1(canonicalize_url(url).encode('utf-8')).hexdigest()[:ARTICLE_ID_LENGTH]
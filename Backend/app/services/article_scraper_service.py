@@ -14,6 +14,12 @@ from urllib.parse import urlparse
 import logging
 from datetime import datetime
 
+from app.services.rate_limiter import rate_limiters
+from app.services.circuit_breaker import CircuitBreaker, circuit_breakers, is_failure_status, CircuitOpenError, UpstreamError
+from app.services.latency_budget import LatencyBudget, LatencyBudgetExceeded, hedged_call, latency_trackers
+from app.services.http_cache import http_cache
+from app.services.http_session_pool import PooledClientSession
+
 # Set up logging for debugging and monitoring
 logger = logging.getLogger(__name__)
 
@@ -91,13 +97,22 @@ class ArticleScraperService:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
+        
+        # Kept-alive connections shared by all article fetches (a hedged
+        # duplicate reuses the warm connection instead of a new handshake)
+        self.http_pool = PooledClientSession(name="article_scraper", limit=50, limit_per_host=4)
+    
+    async def close(self) -> None:
+        """Release the pooled connections - called from the FastAPI shutdown hook"""
+        await self.http_pool.close()
     
-    async def scrape_article(self, url: str) -> Dict[str, any]:
+    async def scrape_article(self, url: str, budget: Optional[LatencyBudget] = None) -> Dict[str, any]:
         """
         Main function to scrape an article from a given URL.
         
         Args:
             url: The URL of the article to scrape
+            budget: Latency budget of the calling request (None = 15 second fetch timeout)
             
         Returns:
             Dictionary containing:
@@ -112,7 +127,7 @@ class ArticleScraperService:
             logger.info(f"🔍 Starting to scrape article from: {url}")
             
             # Fetch the HTML content from the URL
-            html_content = await self._fetch_html(url)
+            html_content = await self._fetch_html(url, budget)
             if not html_content:
                 # If we couldn't fetch the HTML, return an error
                 return {
@@ -150,39 +165,113 @@ class ArticleScraperService:
                 'content': None
             }
     
-    async def _fetch_html(self, url: str) -> Optional[str]:
+    async def _fetch_html(self, url: str, budget: Optional[LatencyBudget] = None) -> Optional[str]:
         """
         Fetch HTML content from a URL with proper error handling.
+        A fetch slower than the usual p95 gets one hedged duplicate; when the
+        latency budget runs out we give up so the caller can use the snippet.
+        
+        The attempts raise on timeouts, connection errors and 429/5xx, so a fast
+        failure never wins the hedge race; this is the one place where errors
+        become None and count once against the host's circuit breaker.
         
         Args:
             url: The URL to fetch
+            budget: Latency budget of the calling request
             
         Returns:
             HTML content as string, or None if fetch failed
         """
+        host = urlparse(url).netloc.lower()
+        breaker = circuit_breakers.get(f"scraper:{host}")
+        is_probe = False
+        
         try:
-            # Create an async HTTP session for making requests
-            async with aiohttp.ClientSession() as session:
-                # Make the request with a timeout to avoid hanging
-                async with session.get(
-                    url, 
-                    headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=15)  # 15 second timeout
-                ) as response:
-                    # Check if request was successful
-                    if response.status == 200:
-                        # Return the HTML text
-                        return await response.text()
-                    else:
-                        logger.error(f"❌ HTTP {response.status} error fetching {url}")
-                        return None
-                        
+            # Skip hosts that keep failing - callers fall back to cached content or the snippet
+            is_probe = breaker.before_call()
+            
+            # The hedge clock starts once the page holds its per-host token
+            admitted = asyncio.Event()
+            return await hedged_call(
+                lambda: self._get_html(url, host, breaker, budget, admitted),
+                latency_trackers.get('scraper'),
+                budget,
+                admitted=admitted
+            )
+        
+        except CircuitOpenError as open_error:
+            logger.warning(f"⚡ Not fetching {url}: {open_error}")
+            return None
+        except LatencyBudgetExceeded as budget_error:
+            # Out of our time, not the host's fault - no breaker outcome
+            logger.warning(f"⏱️ Gave up fetching {url}: {budget_error}")
+            return None
         except asyncio.TimeoutError:
+            breaker.record_failure()
             logger.error(f"⏱️ Timeout fetching {url}")
             return None
         except Exception as e:
+            breaker.record_failure()
             logger.error(f"❌ Error fetching HTML from {url}: {str(e)}")
             return None
+        finally:
+            # A probe served from the HTTP cache or cut off by the budget recorded nothing
+            if is_probe:
+                breaker.release_probe()
+    
+    async def _get_html(self, url: str, host: str, breaker: CircuitBreaker, budget: Optional[LatencyBudget], admitted: Optional[asyncio.Event] = None) -> Optional[str]:
+        """
+        Send one GET request for an article page
+        
+        Args:
+            url: The URL to fetch
+            host: Host name (selects the per-host rate limiter)
+            breaker: Circuit breaker for the host (successes are recorded here,
+                failures once by _fetch_html)
+            budget: Latency budget of the calling request
+            admitted: Set once the request holds its per-host rate-limit token
+            
+        Returns:
+            HTML content as string, or None if the page is unavailable (e.g. 403/404)
+            
+        Raises:
+            UpstreamError: If the host answers 429 or 5xx
+            asyncio.TimeoutError, aiohttp.ClientError: If the request fails
+        """
+        # Never wait longer than 15 seconds, or than the request has left
+        timeout = budget.client_timeout(cap=15) if budget else aiohttp.ClientTimeout(total=15)
+        
+        # Go through the shared HTTP cache over the pooled session: a page the
+        # publisher marked fresh is served from disk, a stale one is revalidated
+        # with a conditional GET on a kept-alive connection. Only network
+        # requests wait on the per-host token bucket.
+        async def before_network() -> None:
+            await rate_limiters.acquire(f"scraper:{host}")
+            if admitted is not None:
+                admitted.set()
+        
+        response = await http_cache.get(
+            self.http_pool.get_session(),
+            url,
+            headers=self.headers,
+            timeout=timeout,
+            before_network=before_network
+        )
+        
+        # 429/5xx mean the host is in trouble - raise so a hedged attempt can still win
+        if is_failure_status(response.status):
+            raise UpstreamError(f"scraper:{host}", response.status, response.text()[:200])
+        
+        if response.from_network:
+            breaker.record_success()
+        
+        if response.status != 200:
+            # 403/404 just mean this page is unavailable - the host itself is fine
+            logger.error(f"❌ HTTP {response.status} error fetching {url}")
+            return None
+        
+        # Return the HTML text
+        return response.text()
     
     def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
         """
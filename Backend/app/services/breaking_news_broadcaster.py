@@ -0,0 +1,274 @@
+# Backend/app/services/breaking_news_broadcaster.py
+"""
+Breaking News Broadcaster
+Pushes breaking stories to connected Server-Sent Events readers as soon as
+the ingestion path detects them. Each country has one channel: an event is
+encoded once when it is published and the same frame is handed to every
+subscriber's bounded queue, so one upstream detection serves any number of
+readers. A short history of recent events lets reconnecting clients resume
+from their Last-Event-ID.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Queued in place of an event when a subscriber is dropped for falling behind
+_CLOSED = None
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    One connected reader of a country channel
+    """
+    country: str
+    queue: asyncio.Queue                                # Encoded SSE frames (None = closed by the broadcaster)
+    replay: List[str] = field(default_factory=list)     # Frames missed since the client's Last-Event-ID
+    reset: bool = False                                 # Last-Event-ID could not be resumed exactly
+    connected_at: float = field(default_factory=time.time)
+    closed: bool = False
+
+class _Channel:
+    """Per-country state: subscribers, recent event history and published article IDs"""
+
+    def __init__(self, history_size: int, dedupe_size: int):
+        self.subscribers: Set[Subscription] = set()
+        self.history: Deque[Tuple[int, str]] = deque(maxlen=history_size)   # (sequence, frame), oldest first
+        self.published: 'OrderedDict[str, None]' = OrderedDict()            # Article IDs already pushed
+        self.trimmed_through = 0                                            # Sequence of the newest evicted event
+        self.dedupe_size = dedupe_size
+
+    def mark_published(self, article_id: str) -> bool:
+        """Remember an article ID; False if it was already pushed"""
+        if article_id in self.published:
+            return False
+        self.published[article_id] = None
+        if len(self.published) > self.dedupe_size:
+            self.published.popitem(last=False)
+        return True
+
+class BreakingNewsBroadcaster:
+    """
+    Per-country fan-out of breaking news over SSE.
+
+    - publish() is called by NewsService with the breaking articles it has just
+      processed; each article is pushed once per country, however many times
+      later refreshes see it again
+    - Every subscriber has a queue of at most `buffer_size` frames; a reader
+      that falls that far behind is disconnected rather than slowing the
+      channel down or growing memory, and resumes from history on reconnect
+    - Event IDs are "{epoch}.{sequence}"; the last `history_size` events per
+      country are kept for Last-Event-ID resumes (an ID from another process,
+      or older than the history, replays everything still held)
+    - Must be used from the event loop thread (asyncio queues are not thread-safe)
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 100,
+        history_size: int = 200,
+        heartbeat_interval: float = 15,
+        max_subscribers: int = 10000,
+        max_age_hours: float = 48
+    ):
+        """
+        Args:
+            buffer_size: Frames queued per subscriber before it is dropped
+            history_size: Recent events kept per country for resumes
+            heartbeat_interval: Seconds of silence before a heartbeat comment is sent
+            max_subscribers: Most concurrent subscribers over all countries
+            max_age_hours: Articles published longer ago than this are not pushed
+        """
+        self.buffer_size = max(1, buffer_size)
+        self.history_size = max(1, history_size)
+        self.heartbeat_interval = heartbeat_interval
+        self.max_subscribers = max_subscribers
+        self.max_age_seconds = max_age_hours * 3600
+        self.epoch = secrets.token_hex(4)
+
+        self._sequence = 0
+        self._channels: Dict[str, _Channel] = {}
+
+        # Statistics
+        self._stats = {
+            'published': 0,
+            'duplicates_skipped': 0,
+            'stale_skipped': 0,
+            'frames_delivered': 0,
+            'subscribers_total': 0,
+            'subscribers_dropped': 0,
+            'subscribers_rejected': 0,
+            'resumes': 0,
+            'resume_resets': 0
+        }
+
+    def _channel(self, country: str) -> _Channel:
+        """Get (or create) the channel of a country"""
+        channel = self._channels.get(country)
+        if channel is None:
+            channel = self._channels[country] = _Channel(self.history_size, self.history_size * 10)
+        return channel
+
+    def _subscriber_count(self) -> int:
+        return sum(len(channel.subscribers) for channel in self._channels.values())
+
+    # ===== PUBLISHING =====
+
+    def publish(self, country: str, articles: List[Any]) -> int:
+        """
+        Push newly detected breaking articles to a country's subscribers
+
+        Args:
+            country: Country code the articles were fetched for
+            articles: ProcessedArticle records flagged as breaking
+
+        Returns:
+            Number of events published
+        """
+        if not articles:
+            return 0
+        channel = self._channel(country)
+        oldest_allowed = time.time() - self.max_age_seconds
+        published = 0
+
+        for article in articles:
+            if article.publishedAt is not None and article.publishedAt < oldest_allowed:
+                self._stats['stale_skipped'] += 1
+                continue
+            if not channel.mark_published(article.id):
+                self._stats['duplicates_skipped'] += 1
+                continue
+
+            # Encode once; every subscriber gets the same frame
+            self._sequence += 1
+            event_id = f"{self.epoch}.{self._sequence}"
+            data = json.dumps(article.to_dict(country=country), ensure_ascii=False, separators=(',', ':'))
+            frame = f"id: {event_id}\nevent: breaking\ndata: {data}\n\n"
+            if len(channel.history) == channel.history.maxlen:
+                channel.trimmed_through = channel.history[0][0]
+            channel.history.append((self._sequence, frame))
+            published += 1
+
+            for subscription in list(channel.subscribers):
+                self._deliver(channel, subscription, frame)
+
+        if published:
+            self._stats['published'] += published
+            logger.info(
+                f"📡 Pushed {published} breaking articles for {country} "
+                f"to {len(channel.subscribers)} subscribers"
+            )
+        return published
+
+    def _deliver(self, channel: _Channel, subscription: Subscription, frame: str) -> None:
+        """Queue a frame for one subscriber, dropping the subscriber if its buffer is full"""
+        try:
+            subscription.queue.put_nowait(frame)
+            self._stats['frames_delivered'] += 1
+        except asyncio.QueueFull:
+            # Free the buffer and wake the reader with the close marker; the client
+            # reconnects with its Last-Event-ID and catches up from history
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+            subscription.queue.put_nowait(_CLOSED)
+            subscription.closed = True
+            channel.subscribers.discard(subscription)
+            self._stats['subscribers_dropped'] += 1
+            logger.warning(f"⚠️ Dropped slow breaking news subscriber for {subscription.country}")
+
+    # ===== SUBSCRIBING =====
+
+    def subscribe(self, country: str, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Register a reader of a country channel
+
+        Args:
+            country: Country code
+            last_event_id: ID of the last event the client received, to resume after it
+
+        Returns:
+            Subscription with any missed frames in `replay`
+
+        Raises:
+            OverflowError: If the broadcaster already has max_subscribers readers
+        """
+        if self._subscriber_count() >= self.max_subscribers:
+            self._stats['subscribers_rejected'] += 1
+            raise OverflowError("too many breaking news subscribers")
+
+        channel = self._channel(country)
+        subscription = Subscription(country=country, queue=asyncio.Queue(maxsize=self.buffer_size))
+
+        if last_event_id:
+            self._stats['resumes'] += 1
+            subscription.replay, subscription.reset = self._replay_after(channel, last_event_id)
+            if subscription.reset:
+                self._stats['resume_resets'] += 1
+
+        channel.subscribers.add(subscription)
+        self._stats['subscribers_total'] += 1
+        logger.debug(f"📡 New breaking news subscriber for {country} ({len(channel.subscribers)} connected)")
+        return subscription
+
+    def _replay_after(self, channel: _Channel, last_event_id: str) -> Tuple[List[str], bool]:
+        """
+        Frames a resuming client missed
+
+        Returns:
+            (frames, reset) - reset is True when the ID could not be placed in the
+            history and every retained frame is replayed instead
+        """
+        epoch, _, sequence = last_event_id.strip().partition('.')
+        history = list(channel.history)
+        if epoch == self.epoch and sequence.isdigit():
+            last_sequence = int(sequence)
+            # Exact resume unless events after the client's ID were already evicted
+            if channel.trimmed_through <= last_sequence <= self._sequence:
+                return [frame for event_sequence, frame in history if event_sequence > last_sequence], False
+        return [frame for _, frame in history], True
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a reader (safe to call for an already dropped subscriber)"""
+        channel = self._channels.get(subscription.country)
+        if channel is not None:
+            channel.subscribers.discard(subscription)
+        subscription.closed = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get channel sizes and delivery counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        return {
+            'epoch': self.epoch,
+            'sequence': self._sequence,
+            'subscribers': {
+                country: len(channel.subscribers)
+                for country, channel in self._channels.items()
+                if channel.subscribers
+            },
+            'buffer_size': self.buffer_size,
+            'history_size': self.history_size,
+            'heartbeat_interval': self.heartbeat_interval,
+            **self._stats
+        }
+
+# Global instance shared by NewsService (publisher) and the news routes (subscribers)
+breaking_news_broadcaster = BreakingNewsBroadcaster(
+    buffer_size=int(os.getenv("BREAKING_STREAM_BUFFER_SIZE", "100")),
+    history_size=int(os.getenv("BREAKING_STREAM_HISTORY_SIZE", "200")),
+    heartbeat_interval=float(os.getenv("BREAKING_STREAM_HEARTBEAT_SECONDS", "15")),
+    max_subscribers=int(os.getenv("BREAKING_STREAM_MAX_SUBSCRIBERS", "10000")),
+    max_age_hours=float(os.getenv("NEWS_BREAKING_MAX_AGE_HOURS", "48"))
+)
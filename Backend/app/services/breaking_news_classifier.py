@@ -0,0 +1,217 @@
+# Backend/app/services/breaking_news_classifier.py
+"""
+Breaking News Classifier
+Flags breaking stories using a configurable phrase rule set (global plus
+per-country phrases) compiled into one case-insensitive, word-bounded regex
+per country. Whole batches are classified in a single scan, and the rules
+file is reloaded automatically when it changes on disk.
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Default rule set shipped with the app (override with BREAKING_NEWS_RULES_PATH;
+# breaking_news_rules.example.json next to it is a broader, opt-in set of phrases)
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'breaking_news_rules.json')
+
+# Joins batch texts for the single scan (no phrase can match across it)
+_BATCH_SEPARATOR = '\n\x00\n'
+
+def compile_phrases(phrases: List[str]) -> Optional[Pattern]:
+    """
+    Compile phrases into one alternation that only matches whole words
+
+    Longer phrases come first so the most specific phrase wins; any run of
+    whitespace inside a phrase matches any whitespace in the text.
+
+    Args:
+        phrases: Keywords or phrases (case-insensitive)
+
+    Returns:
+        Compiled pattern, or None if there are no phrases
+    """
+    cleaned = sorted({' '.join(phrase.split()).lower() for phrase in phrases if phrase and phrase.strip()},
+                     key=len, reverse=True)
+    if not cleaned:
+        return None
+    alternation = '|'.join(r'\s+'.join(re.escape(word) for word in phrase.split(' ')) for phrase in cleaned)
+    return re.compile(r'(?<!\w)(?:' + alternation + r')(?!\w)', re.IGNORECASE)
+
+class BreakingNewsClassifier:
+    """
+    Decides which stories are breaking news.
+
+    - Rules live in a JSON file: {"global": [...], "countries": {"ZW": [...], ...}}
+    - Each country gets one compiled pattern (global + its own phrases), so the
+      cost per article stays flat as the phrase list grows
+    - classify_batch scans a whole batch of texts in one regex pass
+    - The file's modification time is checked at most every `reload_interval`
+      seconds; a changed file is reloaded, a broken one keeps the previous rules
+    """
+
+    def __init__(self, rules_path: str = DEFAULT_RULES_PATH, reload_interval: float = 30):
+        """
+        Args:
+            rules_path: Path to the JSON rule set
+            reload_interval: Seconds between checks for a changed rules file
+        """
+        self.rules_path = rules_path
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        self._patterns: Dict[str, Optional[Pattern]] = {}
+        self._global_pattern: Optional[Pattern] = None
+        self._country_phrases: Dict[str, List[str]] = {}
+        self._global_phrases: List[str] = []
+        self._loaded_mtime: Optional[float] = None
+        self._checked_at = 0.0
+
+        # Statistics
+        self._stats = {
+            'classified': 0,
+            'breaking': 0,
+            'reloads': 0,
+            'reload_errors': 0
+        }
+
+        self._load(force=True)
+
+    # ===== RULES =====
+
+    def _load(self, force: bool = False) -> None:
+        """Load (or reload) the rules file if it changed since the last load"""
+        try:
+            mtime = os.path.getmtime(self.rules_path)
+        except OSError as e:
+            if force:
+                logger.warning(f"⚠️ Breaking news rules not found at {self.rules_path}: {e}")
+            return
+        if not force and mtime == self._loaded_mtime:
+            return
+
+        try:
+            with open(self.rules_path, 'r', encoding='utf-8') as rules_file:
+                rules = json.load(rules_file)
+            global_phrases = [str(phrase) for phrase in rules.get('global', [])]
+            country_phrases = {
+                country.upper(): [str(phrase) for phrase in phrases]
+                for country, phrases in rules.get('countries', {}).items()
+            }
+            global_pattern = compile_phrases(global_phrases)
+            patterns = {
+                country: compile_phrases(global_phrases + phrases)
+                for country, phrases in country_phrases.items()
+            }
+        except (OSError, ValueError, AttributeError, re.error) as e:
+            self._stats['reload_errors'] += 1
+            self._loaded_mtime = mtime      # Do not retry a broken file until it changes again
+            logger.error(f"❌ Invalid breaking news rules in {self.rules_path} - keeping previous rules: {e}")
+            return
+
+        with self._lock:
+            self._global_phrases = global_phrases
+            self._country_phrases = country_phrases
+            self._global_pattern = global_pattern
+            self._patterns = patterns
+            self._loaded_mtime = mtime
+        if not force:
+            self._stats['reloads'] += 1
+        logger.info(
+            f"🚨 Loaded breaking news rules: {len(global_phrases)} global phrases, "
+            f"{sum(len(p) for p in country_phrases.values())} country phrases for {len(country_phrases)} countries"
+        )
+
+    def _maybe_reload(self) -> None:
+        """Check the rules file for changes, at most every reload_interval seconds"""
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        self._load()
+
+    def _pattern_for(self, country_code: Optional[str]) -> Optional[Pattern]:
+        """Compiled pattern for a country (global phrases only for unknown countries)"""
+        with self._lock:
+            if country_code and country_code.upper() in self._patterns:
+                return self._patterns[country_code.upper()]
+            return self._global_pattern
+
+    # ===== CLASSIFICATION =====
+
+    def classify(self, title: str, snippet: str, country_code: Optional[str] = None) -> bool:
+        """
+        Decide whether one story is breaking news
+
+        Args:
+            title: Article title
+            snippet: Article snippet/description
+            country_code: Country the story was fetched for (adds its phrases)
+
+        Returns:
+            True if any rule phrase appears in the title or snippet
+        """
+        return self.classify_batch([(title, snippet)], country_code)[0]
+
+    def classify_batch(self, items: List[Tuple[str, str]], country_code: Optional[str] = None) -> List[bool]:
+        """
+        Classify a batch of stories in one regex pass
+
+        Args:
+            items: (title, snippet) per story
+            country_code: Country the stories were fetched for
+
+        Returns:
+            One flag per story, in order
+        """
+        self._maybe_reload()
+        flags = [False] * len(items)
+        pattern = self._pattern_for(country_code)
+        if pattern is None or not items:
+            return flags
+
+        # One combined text; each story's start offset maps matches back to it
+        texts = []
+        starts = []
+        offset = 0
+        for title, snippet in items:
+            text = f"{title if isinstance(title, str) else ''} {snippet if isinstance(snippet, str) else ''}"
+            starts.append(offset)
+            texts.append(text)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+
+        for match in pattern.finditer(_BATCH_SEPARATOR.join(texts)):
+            flags[bisect.bisect_right(starts, match.start()) - 1] = True
+
+        self._stats['classified'] += len(items)
+        self._stats['breaking'] += sum(flags)
+        return flags
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get rule counts and classification counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        with self._lock:
+            return {
+                'rules_path': self.rules_path,
+                'global_phrases': len(self._global_phrases),
+                'countries': sorted(self._country_phrases),
+                **self._stats
+            }
+
+# Global instance used by NewsService
+breaking_news_classifier = BreakingNewsClassifier(
+    rules_path=os.getenv("BREAKING_NEWS_RULES_PATH", DEFAULT_RULES_PATH),
+    reload_interval=float(os.getenv("BREAKING_NEWS_RULES_RELOAD_SECONDS", "30"))
+)
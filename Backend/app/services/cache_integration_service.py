@@ -3,7 +3,6 @@
 
 import logging
 from typing import List, Dict, Any
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +23,7 @@ class CacheIntegrationService:
         This should be called by news_service after processing articles
         
         Args:
-            processed_articles: List of ProcessedArticle objects from news_service
+            processed_articles: ProcessedArticle objects (or article dictionaries) from news_service
             category: News category that was processed
             country_code: Country code for the articles
             
@@ -38,41 +37,13 @@ class CacheIntegrationService:
             # Import the search cache update function
             from app.routes.search_routes import update_articles_cache
             
-            # Convert ProcessedArticle objects to dictionaries for cache storage
-            articles_for_cache = []
-            
-            for article in processed_articles:
-                if hasattr(article, '__dict__'):  # ProcessedArticle object
-                    article_dict = {
-                        'id': article.id,
-                        'title': article.title,
-                        'summary': article.summary,
-                        'category': article.category,
-                        'timestamp': article.timestamp,
-                        'readTime': article.readTime,
-                        'isBreaking': article.isBreaking,
-                        'imageUrl': article.imageUrl,
-                        'sourceUrl': article.sourceUrl,
-                        'source': article.source,
-                        'linked_sources': article.linked_sources,
-                        'country_code': country_code,  # Add country context for better search
-                        'processed_at': datetime.now().isoformat(),
-                        'search_enabled': True  # Flag for search eligibility
-                    }
-                    articles_for_cache.append(article_dict)
-                elif isinstance(article, dict):  # Already a dictionary
-                    # Add missing fields if needed
-                    article_copy = article.copy()
-                    article_copy.update({
-                        'country_code': country_code,
-                        'processed_at': datetime.now().isoformat(),
-                        'search_enabled': True
-                    })
-                    articles_for_cache.append(article_copy)
+            # The cache stores the records themselves; category and country are
+            # kept beside them as cache context
+            articles_for_cache = list(processed_articles)
             
             # Update the search cache
             if articles_for_cache:
-                update_articles_cache(articles_for_cache)
+                update_articles_cache(articles_for_cache, category, country_code)
                 
                 logger.info(
                     f"✅ Search cache updated: {len(articles_for_cache)} {category} "
@@ -0,0 +1,320 @@
+# Backend/app/services/circuit_breaker.py
+"""
+Circuit Breaker
+Per-upstream closed/open/half-open breaker with jittered exponential backoff.
+When an upstream keeps failing (429/5xx/timeouts), callers fail fast and can serve
+cached data immediately instead of hammering the API or waiting for timeouts.
+"""
+
+import logging
+import os
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Breaker states
+STATE_CLOSED = 'closed'         # Normal operation - calls go through
+STATE_OPEN = 'open'             # Failing - calls are rejected until the cool-down ends
+STATE_HALF_OPEN = 'half_open'   # Cool-down over - one probe call decides what happens next
+
+# Default thresholds - overridable via environment
+FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+BASE_OPEN_SECONDS = float(os.getenv("CIRCUIT_BASE_OPEN_SECONDS", "5"))
+MAX_OPEN_SECONDS = float(os.getenv("CIRCUIT_MAX_OPEN_SECONDS", "300"))
+
+# Maximum number of per-host breakers kept for scraped sites and RSS feed hosts
+MAX_HOST_BREAKERS = 500
+
+# Name prefixes of per-host breakers ('<prefix>:<host>'), summarised in get_stats
+HOST_BREAKER_PREFIXES = ('scraper', 'rss')
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an upstream whose circuit is open
+    """
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"Circuit for {upstream} is open (retry in {retry_after:.1f}s)")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+class UpstreamError(Exception):
+    """
+    Raised when an upstream (Google CSE, OpenAI, a scraped site, ...) returns an error response
+    """
+    def __init__(self, upstream: str, status: int, message: str = ""):
+        super().__init__(f"{upstream} returned HTTP {status}: {message}")
+        self.upstream = upstream      # Which API failed (e.g. 'google_cse')
+        self.status = status          # HTTP status code returned
+        self.message = message        # Short excerpt of the error body
+
+def is_failure_status(status: int) -> bool:
+    """
+    Whether an HTTP status means the upstream itself is in trouble
+
+    429 (rate limited) and 5xx count as failures. Other 4xx responses mean
+    the upstream is up and answering, so they do not trip the breaker.
+
+    Args:
+        status: HTTP status code
+
+    Returns:
+        True if the status should count against the breaker
+    """
+    return status == 429 or status >= 500
+
+# Client exceptions (by class name, so the OpenAI SDK stays an optional import)
+# that mean the upstream could not be reached or did not answer in time
+_UNREACHABLE_ERROR_NAMES = {'APIConnectionError', 'APITimeoutError', 'Timeout', 'ClientConnectionError'}
+
+def is_failure_exception(error: BaseException) -> bool:
+    """
+    Whether an exception raised by an upstream client means the upstream is in trouble
+
+    Errors carrying an HTTP status (OpenAI's status_code, the legacy client's
+    http_status, UpstreamError's status) go through is_failure_status; timeouts and
+    connection errors count as failures; anything else (bad request, auth, our own
+    bugs) does not trip the breaker.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        True if the exception should count against the breaker
+    """
+    for attribute in ('status_code', 'http_status', 'status'):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return is_failure_status(status)
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in _UNREACHABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+def backoff_delay(attempt: int, base: float = BASE_OPEN_SECONDS, cap: float = MAX_OPEN_SECONDS) -> float:
+    """
+    Exponential backoff with jitter: base * 2^attempt, capped, then scaled by a
+    random factor in [0.5, 1.0] so many workers don't all retry at the same instant
+
+    Args:
+        attempt: 0 for the first backoff, 1 for the second, ...
+        base: Delay for the first attempt in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(cap, base * (2 ** attempt))
+    return delay * random.uniform(0.5, 1.0)
+
+class CircuitBreaker:
+    """
+    Breaker for one upstream.
+
+    - closed: calls pass; `failure_threshold` consecutive failures open the circuit
+    - open: calls raise CircuitOpenError until the jittered backoff expires
+    - half-open: a single probe call is let through; success closes the circuit,
+      failure re-opens it with a longer backoff; a probe that ends without an
+      outcome (cache hit, quota denial, cancellation) is released so the next
+      call can probe
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        base_open_seconds: float = BASE_OPEN_SECONDS,
+        max_open_seconds: float = MAX_OPEN_SECONDS,
+        probe_timeout: float = 30.0
+    ):
+        """
+        Args:
+            name: Upstream name (e.g. 'google_cse', 'openai', 'scraper:herald.co.zw')
+            failure_threshold: Consecutive failures that open the circuit
+            base_open_seconds: First open period (doubles on each re-open)
+            max_open_seconds: Longest open period
+            probe_timeout: Seconds after which an unanswered probe is abandoned
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_open_seconds = base_open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.probe_timeout = probe_timeout
+
+        self.state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._trips = 0                      # Consecutive openings without a successful probe
+        self._open_until = 0.0
+        self._probe_started_at: Optional[float] = None
+
+        # Statistics
+        self._total_failures = 0
+        self._total_successes = 0
+        self._rejected = 0
+        self._last_failure_at: Optional[str] = None
+        self._last_state_change: Optional[str] = None
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            logger.warning(f"⚡ Circuit '{self.name}': {self.state} -> {state}")
+            self.state = state
+            self._last_state_change = datetime.now().isoformat()
+
+    def before_call(self) -> bool:
+        """
+        Check whether a call may proceed - call this before contacting the upstream
+
+        Returns:
+            True if this call is the half-open probe (see release_probe)
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe already in flight
+        """
+        now = time.monotonic()
+
+        if self.state == STATE_OPEN:
+            if now < self._open_until:
+                self._rejected += 1
+                raise CircuitOpenError(self.name, self._open_until - now)
+            self._set_state(STATE_HALF_OPEN)
+            self._probe_started_at = None
+
+        if self.state == STATE_HALF_OPEN:
+            probe_alive = (
+                self._probe_started_at is not None
+                and now - self._probe_started_at < self.probe_timeout
+            )
+            if probe_alive:
+                self._rejected += 1
+                raise CircuitOpenError(self.name, self.probe_timeout - (now - self._probe_started_at))
+            # This caller becomes the probe
+            self._probe_started_at = now
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """
+        Give up the half-open probe without an outcome - call this when the probe
+        call ended without reaching the upstream (served from a cache, denied by
+        the quota, cancelled). The circuit stays half-open and the next call
+        becomes the probe instead of every call being rejected until probe_timeout.
+        Does nothing once the probe's success or failure has been recorded.
+        """
+        if self.state == STATE_HALF_OPEN:
+            self._probe_started_at = None
+
+    def record_success(self) -> None:
+        """Record a successful call (closes a half-open circuit)"""
+        self._total_successes += 1
+        self._consecutive_failures = 0
+        if self.state != STATE_CLOSED:
+            self._trips = 0
+            self._probe_started_at = None
+            self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call (may open the circuit)"""
+        self._total_failures += 1
+        self._consecutive_failures += 1
+        self._last_failure_at = datetime.now().isoformat()
+
+        if self.state == STATE_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the circuit for a jittered, exponentially growing period"""
+        open_seconds = backoff_delay(self._trips, self.base_open_seconds, self.max_open_seconds)
+        self._trips += 1
+        self._open_until = time.monotonic() + open_seconds
+        self._probe_started_at = None
+        self._set_state(STATE_OPEN)
+        logger.warning(f"⚡ Circuit '{self.name}' open for {open_seconds:.1f}s (trip #{self._trips})")
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get the breaker's current state for health endpoints
+
+        Returns:
+            Dictionary with state, counters and time until the next probe
+        """
+        retry_in = max(0.0, self._open_until - time.monotonic()) if self.state == STATE_OPEN else 0.0
+        return {
+            'state': self.state,
+            'consecutive_failures': self._consecutive_failures,
+            'trips': self._trips,
+            'retry_in_seconds': round(retry_in, 1),
+            'total_failures': self._total_failures,
+            'total_successes': self._total_successes,
+            'rejected_calls': self._rejected,
+            'last_failure_at': self._last_failure_at,
+            'last_state_change': self._last_state_change
+        }
+
+class CircuitBreakerRegistry:
+    """
+    Holds one breaker per upstream; 'scraper:<host>' and 'rss:<host>' names get one breaker per host
+    """
+
+    def __init__(self):
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+
+    def get(self, upstream: str) -> CircuitBreaker:
+        """
+        Get (or create) the breaker for an upstream
+
+        Args:
+            upstream: Upstream name, or 'scraper:<host>' for a scraped site
+
+        Returns:
+            The CircuitBreaker for that upstream
+        """
+        breaker = self._breakers.get(upstream)
+        if breaker is not None:
+            self._breakers.move_to_end(upstream)
+            return breaker
+
+        breaker = CircuitBreaker(upstream)
+        self._breakers[upstream] = breaker
+
+        # Forget the least recently used closed host breakers so the registry stays bounded
+        if len(self._breakers) > MAX_HOST_BREAKERS:
+            for name in list(self._breakers.keys()):
+                if len(self._breakers) <= MAX_HOST_BREAKERS:
+                    break
+                if ':' in name and self._breakers[name].state == STATE_CLOSED:
+                    del self._breakers[name]
+
+        return breaker
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the state of every breaker, with scraped hosts summarised
+
+        Returns:
+            Dictionary of upstream name to breaker state
+        """
+        stats = {}
+        host_breakers: Dict[str, List[CircuitBreaker]] = {prefix: [] for prefix in HOST_BREAKER_PREFIXES}
+        for name, breaker in self._breakers.items():
+            prefix = name.split(':', 1)[0]
+            if prefix in host_breakers:
+                host_breakers[prefix].append(breaker)
+            else:
+                stats[name] = breaker.get_state()
+
+        # Per-host breakers (scraped sites, RSS feed hosts) are summarised per kind
+        for prefix, breakers in host_breakers.items():
+            stats[f'{prefix}_hosts'] = {
+                'tracked_hosts': len(breakers),
+                'open': {
+                    b.name.split(':', 1)[1]: b.get_state()
+                    for b in breakers if b.state != STATE_CLOSED
+                }
+            }
+        return stats
+
+# Global instance shared by NewsService, article routes and the scraper
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,226 @@
+# Backend/app/services/feed_delta_tracker.py
+"""
+Feed Delta Tracking
+Remembers recent versions of every served (category, country) feed so polling
+clients can ask "what changed since my last response?" with an opaque cursor
+and receive only the added, updated and removed articles instead of the whole
+feed.
+"""
+
+import logging
+import os
+import secrets
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# (category, country, limit) - one versioned feed
+FeedKey = Tuple[str, str, Optional[int]]
+
+@dataclass
+class FeedDelta:
+    """
+    Changes to one feed between a client's cursor and now
+    """
+    cursor: str                                         # Cursor for the client's next poll
+    reset: bool                                         # Cursor unknown/expired - `added` is the full feed
+    added: List[Any] = field(default_factory=list)      # Articles the client has not seen, in feed order
+    updated: List[Any] = field(default_factory=list)    # Articles whose content changed since the cursor
+    removed: List[str] = field(default_factory=list)    # IDs of articles no longer in the feed
+
+class FeedDeltaTracker:
+    """
+    Versioned history of served feeds.
+
+    - One global sequence number counts every change to any feed; a cursor is
+      that number plus a per-process epoch, so a single cursor covers every
+      feed a response contained (e.g. all categories of /news/all)
+    - record() stores the served article list as a new version only when it
+      differs from the feed's latest version, so a cursor always points at
+      exactly the list its client received
+    - A feed is a (category, country, limit) triple: clients asking for
+      different numbers of articles get separate histories, so a 6-article
+      dashboard and an 18-article category page never look like additions and
+      removals to each other
+    - Each feed keeps its last `history_size` versions; an older cursor (or one
+      from another worker or before a restart) gets a reset with the full feed
+    - Versions hold references to the shared immutable article records, so
+      history costs a tuple of pointers per version
+    """
+
+    def __init__(self, history_size: int = 64):
+        """
+        Args:
+            history_size: Versions kept per feed
+        """
+        self.history_size = max(1, history_size)
+        self.epoch = secrets.token_hex(4)
+
+        self._lock = threading.Lock()
+        self._sequence = 0
+        # (category, country, limit) -> [(sequence, articles), ...] oldest first
+        self._versions: Dict[FeedKey, List[Tuple[int, Tuple[Any, ...]]]] = {}
+        # Feeds whose oldest versions were trimmed (older cursors cannot be answered)
+        self._trimmed: Set[FeedKey] = set()
+
+        # Statistics
+        self._stats = {
+            'versions': 0,
+            'deltas': 0,
+            'resets': 0,
+            'added': 0,
+            'updated': 0,
+            'removed': 0
+        }
+
+    # ===== CURSORS =====
+
+    def cursor(self) -> str:
+        """
+        Cursor describing every feed as recorded so far
+
+        Returns:
+            Opaque cursor string
+        """
+        with self._lock:
+            return f"{self.epoch}.{self._sequence}"
+
+    def check_cursor(self, cursor: str) -> None:
+        """
+        Validate a client-supplied cursor before doing any work for it
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        self._parse_cursor(cursor)
+
+    def _parse_cursor(self, cursor: str) -> Optional[int]:
+        """
+        Sequence number of a cursor issued by this process
+
+        Raises:
+            ValueError: If the cursor is not a cursor at all
+
+        Returns:
+            Sequence number, or None if the cursor came from another epoch
+        """
+        epoch, _, sequence = (cursor or '').partition('.')
+        if not epoch or not sequence.isdigit():
+            raise ValueError(f"malformed cursor '{cursor}'")
+        if epoch != self.epoch:
+            return None
+        return int(sequence)
+
+    # ===== RECORDING =====
+
+    def record(self, category: str, country: str, articles: List[Any], limit: Optional[int] = None) -> None:
+        """
+        Record the article list served for a feed
+
+        Args:
+            category: News category
+            country: Country code
+            articles: Articles exactly as served (objects with an `id`)
+            limit: Number of articles the client asked for (the list is cut to it)
+        """
+        key = (category, country, limit)
+        snapshot = tuple(articles)
+        with self._lock:
+            versions = self._versions.setdefault(key, [])
+            if versions and self._same(versions[-1][1], snapshot):
+                return
+            self._sequence += 1
+            versions.append((self._sequence, snapshot))
+            self._stats['versions'] += 1
+            if len(versions) > self.history_size:
+                versions.pop(0)
+                self._trimmed.add(key)
+
+    @staticmethod
+    def _same(first: Tuple[Any, ...], second: Tuple[Any, ...]) -> bool:
+        """Whether two versions hold the same articles in the same order"""
+        return len(first) == len(second) and all(a is b or a == b for a, b in zip(first, second))
+
+    # ===== DELTAS =====
+
+    def changes_since(self, category: str, country: str, since: str, limit: Optional[int] = None) -> FeedDelta:
+        """
+        Work out what changed in a feed since a cursor
+
+        Call after record() for the current response, so the feed's latest
+        version is what the client would get in full.
+
+        Args:
+            category: News category
+            country: Country code
+            since: Cursor from the client's previous response
+            limit: Number of articles the client asks for (as passed to record())
+
+        Returns:
+            FeedDelta relative to the cursor (a reset with the full feed if the
+            cursor cannot be answered)
+
+        Raises:
+            ValueError: If `since` is malformed
+        """
+        sequence = self._parse_cursor(since)
+        key = (category, country, limit)
+
+        with self._lock:
+            versions = list(self._versions.get(key, []))
+            trimmed = key in self._trimmed
+            latest_sequence = self._sequence
+        next_cursor = f"{self.epoch}.{latest_sequence}"
+        current = versions[-1][1] if versions else ()
+
+        # Cursors from another epoch, from the future or older than the kept history are reset
+        base: Optional[Tuple[Any, ...]] = None
+        if sequence is not None and sequence <= latest_sequence:
+            if not trimmed or sequence >= versions[0][0]:
+                # Latest version the client could have been served at its cursor
+                base = ()
+                for version_sequence, articles in versions:
+                    if version_sequence > sequence:
+                        break
+                    base = articles
+
+        if base is None:
+            self._stats['resets'] += 1
+            return FeedDelta(cursor=next_cursor, reset=True, added=list(current))
+
+        previous = {article.id: article for article in base}
+        current_ids = {article.id for article in current}
+        added = [article for article in current if article.id not in previous]
+        updated = [
+            article for article in current
+            if article.id in previous and not (previous[article.id] is article or previous[article.id] == article)
+        ]
+        removed = [article_id for article_id in previous if article_id not in current_ids]
+
+        self._stats['deltas'] += 1
+        self._stats['added'] += len(added)
+        self._stats['updated'] += len(updated)
+        self._stats['removed'] += len(removed)
+        return FeedDelta(cursor=next_cursor, reset=False, added=added, updated=updated, removed=removed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get version and delta counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        with self._lock:
+            return {
+                'epoch': self.epoch,
+                'sequence': self._sequence,
+                'feeds': len(self._versions),
+                'history_size': self.history_size,
+                **self._stats
+            }
+
+# Global instance shared by the news routes
+feed_delta_tracker = FeedDeltaTracker(history_size=int(os.getenv("FEED_DELTA_HISTORY_SIZE", "64")))
@@ -0,0 +1,442 @@
+# Backend/app/services/feed_ingestion_service.py
+"""
+RSS/Atom Feed Ingestion
+Quota-free second news source: polls a per-country registry of publisher feeds
+through the shared HTTP cache (conditional GET), parses them in a worker pool and
+keeps the newest entries per country, tagged with our news categories.
+"""
+
+import asyncio
+import calendar
+import html
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from app.services.http_session_pool import PooledClientSession
+from app.services.rate_limiter import rate_limiters
+from app.services.circuit_breaker import circuit_breakers, is_failure_status, CircuitOpenError
+from app.services.latency_budget import LatencyBudget
+from app.services.http_cache import http_cache, CACHE_MISS
+from app.services.article_identity import canonicalize_url
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Default registry shipped with the app (override with RSS_FEED_REGISTRY_PATH,
+# e.g. to point at fixture feeds served from a local HTTP stand-in)
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'rss_feeds.json')
+
+# Keywords used to file feed entries under our categories (matched on whole words
+# in the entry's tags, title and summary). Entries that match nothing are local news.
+CATEGORY_KEYWORDS = {
+    'politics': ['politics', 'political', 'parliament', 'minister', 'ministry', 'election', 'elections',
+                 'president', 'government', 'policy', 'senate', 'cabinet', 'opposition', 'mp', 'mps', 'party'],
+    'sports': ['sport', 'sports', 'football', 'soccer', 'cricket', 'rugby', 'athletics', 'match', 'league',
+               'coach', 'tournament', 'fifa', 'caf', 'afcon', 'olympics', 'marathon', 'striker'],
+    'health': ['health', 'hospital', 'hospitals', 'clinic', 'clinics', 'disease', 'cholera', 'malaria', 'hiv',
+               'aids', 'vaccine', 'vaccination', 'medical', 'doctors', 'nurses', 'patients', 'outbreak', 'mpox'],
+    'business': ['business', 'economy', 'economic', 'market', 'markets', 'bank', 'banks', 'trade', 'investment',
+                 'inflation', 'mining', 'stock', 'currency', 'revenue', 'tax', 'budget', 'exports', 'gdp'],
+    'technology': ['technology', 'tech', 'digital', 'internet', 'startup', 'startups', 'software', 'mobile',
+                   'ai', 'innovation', 'ict', 'telecom', 'fintech', 'cyber', 'broadband', 'satellite'],
+    'weather': ['weather', 'rain', 'rains', 'rainfall', 'drought', 'flood', 'floods', 'cyclone', 'forecast',
+                'climate', 'temperature', 'temperatures', 'storm', 'heatwave', 'el nino'],
+    'entertainment': ['entertainment', 'music', 'musician', 'film', 'movie', 'celebrity', 'artist', 'concert',
+                      'festival', 'album', 'actor', 'actress', 'showbiz', 'comedy', 'award', 'awards'],
+    'education': ['education', 'school', 'schools', 'university', 'universities', 'student', 'students',
+                  'teacher', 'teachers', 'exam', 'exams', 'college', 'learners', 'zimsec', 'kcse', 'matric'],
+    'local-trends': ['social media', 'viral', 'trending', 'community', 'culture', 'lifestyle', 'tiktok']
+}
+
+# Category for entries no keyword matched
+DEFAULT_CATEGORY = 'local-trends'
+
+_CATEGORY_PATTERNS = {
+    category: re.compile(r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b', re.IGNORECASE)
+    for category, words in CATEGORY_KEYWORDS.items()
+}
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+def _clean_summary(raw: str, limit: int = 300) -> str:
+    """Strip markup and entities from a feed summary and shorten it"""
+    text = _SPACE_RE.sub(' ', html.unescape(_TAG_RE.sub(' ', raw or ''))).strip()
+    if len(text) > limit:
+        text = text[:limit].rsplit(' ', 1)[0] + '...'
+    return text
+
+def categorize_entry(title: str, summary: str, tags: List[str]) -> List[str]:
+    """
+    Work out which of our categories a feed entry belongs to
+
+    Args:
+        title: Entry headline
+        summary: Entry summary (plain text)
+        tags: Publisher tags/categories on the entry
+
+    Returns:
+        Matching category names (DEFAULT_CATEGORY if nothing matched)
+    """
+    text = ' '.join([title, summary, ' '.join(tags)])
+    categories = [category for category, pattern in _CATEGORY_PATTERNS.items() if pattern.search(text)]
+    return categories or [DEFAULT_CATEGORY]
+
+def parse_feed_document(content: bytes, feed_name: str, max_entries: int) -> List[Dict[str, Any]]:
+    """
+    Parse an RSS/Atom document into normalized entry dictionaries
+
+    Runs in a worker pool, so it only takes and returns plain (picklable) data.
+    Entry dictionaries carry the NewsSource fields plus 'categories' and 'published_ts'.
+
+    Args:
+        content: Raw feed bytes
+        feed_name: Publisher name used as the source name
+        max_entries: Maximum entries to keep (newest first, as published)
+
+    Returns:
+        List of entry dictionaries
+    """
+    import feedparser
+
+    parsed = feedparser.parse(content)
+    entries = []
+    for item in parsed.entries[:max_entries]:
+        url = (item.get('link') or '').strip()
+        title = _clean_summary(item.get('title', ''), limit=200)
+        if not url.startswith('http') or not title:
+            continue
+
+        summary = _clean_summary(item.get('summary', '') or item.get('description', ''))
+        tags = [tag.get('term', '') for tag in item.get('tags', []) if tag.get('term')]
+
+        published_struct = item.get('published_parsed') or item.get('updated_parsed')
+        published_ts = calendar.timegm(published_struct) if published_struct else None
+        published_date = (
+            datetime.fromtimestamp(published_ts, tz=timezone.utc).isoformat() if published_ts else None
+        )
+
+        entries.append({
+            'url': url,
+            'title': title,
+            'snippet': summary or title,
+            'source_name': feed_name,
+            'published_date': published_date,
+            'published_ts': published_ts,
+            'categories': categorize_entry(title, summary, tags)
+        })
+    return entries
+
+@dataclass
+class FeedState:
+    """
+    Polling state and latest entries for one publisher feed
+    """
+    name: str
+    url: str
+    country: str
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    fetched_at: Optional[float] = None       # Last successful fetch
+    fetches: int = 0                         # Changed documents (downloaded and parsed)
+    not_modified: int = 0                    # Unchanged documents (cache hit or 304, not re-parsed)
+    errors: int = 0
+    last_error: Optional[str] = None
+
+class FeedIngestionService:
+    """
+    Polls publisher RSS/Atom feeds per country and serves their entries by category.
+
+    - Feeds are fetched concurrently over a pooled session, politely queued on
+      the per-host scraper rate limiter and guarded by per-host circuit breakers
+    - Requests go through the shared HTTP cache: feeds still fresh per their
+      Cache-Control are not requested at all, and stale ones are revalidated with
+      ETag / Last-Modified so unchanged feeds cost no download or parsing
+    - Parsing runs in a worker pool so it never blocks the event loop
+    - A country's feeds are refreshed at most every `refresh_interval` seconds,
+      and concurrent requests share a single refresh
+    """
+
+    def __init__(
+        self,
+        registry_path: str = DEFAULT_REGISTRY_PATH,
+        refresh_interval: float = 600,
+        concurrency: int = 8,
+        request_timeout: float = 10,
+        max_entries_per_feed: int = 50,
+        parse_workers: int = 2,
+        parse_executor: str = 'process'
+    ):
+        """
+        Args:
+            registry_path: JSON file mapping country code to [{"name", "url"}, ...]
+            refresh_interval: Minimum seconds between refreshes of one country's feeds
+            concurrency: Feeds downloaded at the same time
+            request_timeout: Timeout for one feed download in seconds
+            max_entries_per_feed: Newest entries kept per feed
+            parse_workers: Size of the parsing worker pool
+            parse_executor: 'process' (parallel parsing) or 'thread'
+        """
+        self.registry_path = registry_path
+        self.refresh_interval = refresh_interval
+        self.concurrency = concurrency
+        self.request_timeout = request_timeout
+        self.max_entries_per_feed = max_entries_per_feed
+        self.parse_workers = parse_workers
+        self.parse_executor = parse_executor
+
+        self.http_pool = PooledClientSession(
+            name="rss_feeds",
+            limit=concurrency * 2,
+            limit_per_host=2,
+            headers={'User-Agent': 'TeaCupNews/2.0 (+feed reader)'}
+        )
+        self._executor: Optional[Executor] = None
+        self._feeds: Dict[str, List[FeedState]] = self._load_registry()
+        self._refreshed_at: Dict[str, float] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+
+    def _load_registry(self) -> Dict[str, List[FeedState]]:
+        """
+        Read the feed registry from disk
+
+        Returns:
+            Country code -> list of FeedState (empty if the file is missing or invalid)
+        """
+        try:
+            with open(self.registry_path, 'r', encoding='utf-8') as registry_file:
+                registry = json.load(registry_file)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Could not load RSS feed registry {self.registry_path}: {e}")
+            return {}
+
+        feeds = {}
+        for country, entries in registry.items():
+            feeds[country.upper()] = [
+                FeedState(name=entry['name'], url=entry['url'], country=country.upper())
+                for entry in entries if entry.get('url')
+            ]
+        logger.info(f"📻 Loaded {sum(len(f) for f in feeds.values())} RSS feeds for {len(feeds)} countries")
+        return feeds
+
+    # ===== LIFECYCLE =====
+
+    async def start(self) -> None:
+        """Open the HTTP pool and the parsing worker pool"""
+        await self.http_pool.start()
+        self._get_executor()
+
+    async def close(self) -> None:
+        """Cancel refreshes and release the HTTP and worker pools"""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        await self.http_pool.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        """
+        Get the parsing pool, creating it on first use
+
+        Falls back to threads where worker processes are unavailable.
+        """
+        if self._executor is None:
+            if self.parse_executor == 'process':
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"⚠️ Process pool unavailable for feed parsing ({e}) - using threads")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix="rss-parse")
+        return self._executor
+
+    # ===== FETCHING =====
+
+    async def refresh_country(self, country_code: str, force: bool = False) -> None:
+        """
+        Refresh all feeds of a country unless they were refreshed recently
+
+        Concurrent callers share the same refresh.
+
+        Args:
+            country_code: Country whose feeds to refresh
+            force: Refresh even if the interval has not passed
+        """
+        country = country_code.upper()
+        if not self._feeds.get(country):
+            return
+
+        last = self._refreshed_at.get(country)
+        if not force and last is not None and time.time() - last < self.refresh_interval:
+            return
+
+        task = self._refresh_tasks.get(country)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh_feeds(country))
+            self._refresh_tasks[country] = task
+            task.add_done_callback(lambda _task: self._refresh_tasks.pop(country, None))
+        await asyncio.shield(task)
+
+    async def _refresh_feeds(self, country: str) -> None:
+        """Fetch every feed of a country concurrently"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_with_limit(feed: FeedState) -> None:
+            async with semaphore:
+                await self._fetch_feed(feed)
+
+        started = time.time()
+        await asyncio.gather(*[fetch_with_limit(feed) for feed in self._feeds[country]])
+        self._refreshed_at[country] = time.time()
+        logger.info(f"📻 Refreshed {len(self._feeds[country])} RSS feeds for {country} in {time.time() - started:.2f}s")
+
+    async def _fetch_feed(self, feed: FeedState) -> None:
+        """
+        Download one feed through the HTTP cache and re-parse it if it changed
+
+        Errors are recorded on the feed; its previous entries are kept.
+        """
+        host = urlparse(feed.url).netloc.lower()
+        breaker = circuit_breakers.get(f"rss:{host}")
+        is_probe = False
+
+        try:
+            is_probe = breaker.before_call()
+
+            response = await http_cache.get(
+                self.http_pool.get_session(),
+                feed.url,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                before_network=lambda: rate_limiters.acquire(f"scraper:{host}")
+            )
+
+            if response.status != 200:
+                if is_failure_status(response.status):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                raise RuntimeError(f"HTTP {response.status}")
+
+            if response.from_network:
+                breaker.record_success()
+
+            # Served from the store (fresh or confirmed by a 304) - nothing to re-parse
+            if response.cache_status != CACHE_MISS and feed.entries:
+                feed.not_modified += 1
+                feed.fetched_at = time.time()
+                feed.last_error = None
+                return
+
+            loop = asyncio.get_running_loop()
+            entries = await loop.run_in_executor(
+                self._get_executor(), parse_feed_document, response.body, feed.name, self.max_entries_per_feed
+            )
+
+            feed.entries = entries
+            feed.fetches += 1
+            feed.fetched_at = time.time()
+            feed.last_error = None
+            logger.debug(f"📻 {feed.name}: {len(entries)} entries")
+
+        except CircuitOpenError as open_error:
+            feed.last_error = str(open_error)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            breaker.record_failure()
+            feed.errors += 1
+            feed.last_error = str(e) or type(e).__name__
+            logger.warning(f"⚠️ RSS feed {feed.name} failed: {feed.last_error}")
+        except Exception as e:
+            feed.errors += 1
+            feed.last_error = str(e)
+            logger.warning(f"⚠️ RSS feed {feed.name} failed: {e}")
+        finally:
+            # A probe answered from the HTTP cache recorded no outcome
+            if is_probe:
+                breaker.release_probe()
+
+    # ===== READING =====
+
+    async def get_entries(
+        self,
+        category: str,
+        country_code: str,
+        limit: int,
+        budget: Optional[LatencyBudget] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the newest feed entries for a category and country
+
+        Refreshes the country's feeds first if they are due, but never waits
+        past the latency budget - late refreshes finish in the background.
+
+        Args:
+            category: Our category name (e.g. 'politics')
+            country_code: Country code
+            limit: Maximum entries to return
+            budget: Latency budget of the calling request
+
+        Returns:
+            Entry dictionaries (NewsSource fields plus 'categories'), newest first
+        """
+        country = country_code.upper()
+        refresh = asyncio.ensure_future(self.refresh_country(country))
+        refresh.add_done_callback(lambda task: task.cancelled() or task.exception())
+        try:
+            await asyncio.wait_for(asyncio.shield(refresh), timeout=budget.remaining() if budget else None)
+        except asyncio.TimeoutError:
+            logger.debug(f"⏱️ RSS refresh for {country} still running - serving current entries")
+        except Exception as e:
+            logger.warning(f"⚠️ RSS refresh for {country} failed: {e}")
+
+        matches = []
+        seen_urls = set()
+        for feed in self._feeds.get(country, []):
+            for entry in feed.entries:
+                url_key = canonicalize_url(entry['url'])
+                if category in entry['categories'] and url_key not in seen_urls:
+                    seen_urls.add(url_key)
+                    matches.append(entry)
+
+        matches.sort(key=lambda entry: entry.get('published_ts') or 0, reverse=True)
+        return matches[:limit]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-feed polling statistics
+
+        Returns:
+            Dictionary with totals and one entry per feed
+        """
+        feeds = {}
+        totals = {'fetches': 0, 'not_modified': 0, 'errors': 0, 'entries': 0}
+        for country, country_feeds in self._feeds.items():
+            for feed in country_feeds:
+                feeds[f"{country}/{feed.name}"] = {
+                    'entries': len(feed.entries),
+                    'fetches': feed.fetches,
+                    'not_modified': feed.not_modified,
+                    'errors': feed.errors,
+                    'age_seconds': round(time.time() - feed.fetched_at, 1) if feed.fetched_at else None,
+                    'last_error': feed.last_error
+                }
+                totals['fetches'] += feed.fetches
+                totals['not_modified'] += feed.not_modified
+                totals['errors'] += feed.errors
+                totals['entries'] += len(feed.entries)
+
+        return {
+            'registry_path': self.registry_path,
+            'refresh_interval_seconds': self.refresh_interval,
+            'parse_executor': type(self._executor).__name__ if self._executor else None,
+            **totals,
+            'feeds': feeds
+        }
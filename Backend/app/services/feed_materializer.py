@@ -0,0 +1,490 @@
+# Backend/app/services/feed_materializer.py
+"""
+Feed Materializer
+Background asyncio scheduler that refreshes the category x country feeds readers
+have asked for recently and keeps the processed articles in memory, so category
+requests are answered from memory instead of searching and summarizing inside
+the request. The refresh cadence is derived from the background share of the
+daily Google CSE quota, and a cycle stops when that share runs out.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.news_service import NewsService, ProcessedArticle, news_service
+from app.services.quota_manager import QuotaContext, PRIORITY_BACKGROUND
+
+# Seconds in a quota day (the cadence spreads the background share over it)
+SECONDS_PER_DAY = 24 * 3600
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+@dataclass
+class MaterializedFeed:
+    """
+    The latest processed articles for one (category, country) feed
+    """
+    articles: List[ProcessedArticle]        # Processed articles, newest refresh
+    requested: int                          # How many articles the refresh asked for
+    refreshed_at: float                     # Unix time of the last successful refresh
+    refresh_seconds: float                  # How long that refresh took
+    last_error: Optional[str] = None        # Error from the most recent failed refresh
+    failures: int = 0                       # Consecutive failed refreshes
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last successful refresh"""
+        return time.time() - self.refreshed_at
+
+    def covers(self, count: int) -> bool:
+        """Whether this feed can answer a request for `count` articles"""
+        return self.requested >= count or len(self.articles) < self.requested
+
+@dataclass
+class RefreshCycle:
+    """
+    Timing of one pass over all feeds
+    """
+    started_at: float
+    finished_at: Optional[float] = None
+    refreshed: int = 0
+    failed: int = 0
+    skipped_for_quota: int = 0              # Feeds not refreshed because the background quota ran out
+    errors: List[str] = field(default_factory=list)
+
+class FeedMaterializer:
+    """
+    Refreshes the recently requested (category, country) feeds in the background.
+
+    - Only feeds read through get_feed() within the last `demand_window`
+      seconds are refreshed, most recently requested first
+    - One cycle per interval refreshes them, at most `concurrency` at a time,
+      charging quota at background priority. Unless a fixed `interval` is
+      configured, the interval is derived from the quota: the background
+      share of the daily budget (split over `workers` processes) divided by
+      the units one cycle can spend, bounded by [min_interval, one day]
+    - Before each feed the remaining background share (shared by all workers)
+      is checked; once it cannot cover the feed the rest of the cycle is
+      skipped instead of failing feed by feed
+    - Each feed asks for as many articles as the largest request seen for it
+      (at least `default_articles`, at most `max_articles`)
+    - A failed or empty refresh keeps the previous articles, but a feed that
+      has not been refreshed for two intervals is no longer served
+    """
+
+    def __init__(
+        self,
+        service: NewsService,
+        interval: Optional[float] = None,
+        concurrency: int = 4,
+        default_articles: int = 18,
+        max_articles: int = 50,
+        initial_delay: float = 5.0,
+        min_interval: float = 900,
+        demand_window: float = 6 * 3600,
+        workers: int = 1
+    ):
+        """
+        Args:
+            service: NewsService used to build each feed
+            interval: Fixed seconds between the starts of two refresh cycles
+                (None = derive from the daily quota)
+            concurrency: Feeds refreshed at the same time
+            default_articles: Articles fetched per feed until a larger request is seen
+            max_articles: Upper bound on articles fetched per feed
+            initial_delay: Seconds to wait after startup before the first cycle
+            min_interval: Shortest derived interval
+            demand_window: Feeds not requested for this many seconds stop being refreshed
+            workers: Worker processes sharing the quota, each running a materializer
+        """
+        self.service = service
+        self.interval = interval
+        self.concurrency = concurrency
+        self.default_articles = default_articles
+        self.max_articles = max_articles
+        self.initial_delay = initial_delay
+        self.min_interval = min_interval
+        self.demand_window = demand_window
+        self.workers = max(1, workers)
+
+        self.categories: List[str] = []
+        self.countries: List[str] = []
+
+        self._feeds: Dict[Tuple[str, str], MaterializedFeed] = {}
+        self._wanted: Dict[Tuple[str, str], int] = {}
+        self._requested_at: Dict[Tuple[str, str], float] = {}     # Last get_feed() per feed
+        self._current_interval = interval if interval is not None else min_interval
+        self._task: Optional[asyncio.Task] = None
+        self._current_cycle: Optional[RefreshCycle] = None
+        self._last_cycle: Optional[RefreshCycle] = None
+        self._next_cycle_at: Optional[float] = None
+
+        # Statistics
+        self._cycles = 0
+        self._hits = 0
+        self._misses = 0
+        self._stale_misses = 0
+        self._quota_stopped_cycles = 0
+
+    # ===== LIFECYCLE =====
+
+    def start(self, categories: List[str], countries: List[str]) -> None:
+        """
+        Start the background refresh loop - called from the FastAPI lifespan
+
+        Args:
+            categories: Category names to materialize
+            countries: Country codes to materialize
+        """
+        if self._task is not None and not self._task.done():
+            return
+
+        self.categories = list(categories)
+        self.countries = list(countries)
+        self._task = asyncio.ensure_future(self._run())
+        logger.info(
+            f"🗂️ Feed materializer started: {len(self.categories)} categories x "
+            f"{len(self.countries)} countries on demand, "
+            + (f"every {self.interval:.0f}s" if self.interval is not None else "interval derived from the CSE quota")
+            + f" (concurrency {self.concurrency})"
+        )
+
+    async def stop(self) -> None:
+        """
+        Cancel the background loop and wait for it to finish
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🛑 Feed materializer stopped")
+
+    async def _run(self) -> None:
+        """
+        Refresh loop: one cycle per interval, measured start to start
+        """
+        self._next_cycle_at = time.time() + self.initial_delay
+        while True:
+            await asyncio.sleep(max(0.0, self._next_cycle_at - time.time()))
+            cycle_started = time.time()
+            try:
+                await self.refresh_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Feed refresh cycle failed: {e}")
+            self._current_interval = self.cycle_interval()
+            self._next_cycle_at = cycle_started + self._current_interval
+
+    # ===== SCHEDULING =====
+
+    def demanded_feeds(self) -> List[Tuple[str, str]]:
+        """
+        Feeds requested within the demand window, most recently requested first
+
+        Returns:
+            (category, country) keys
+        """
+        cutoff = time.time() - self.demand_window
+        recent = [
+            (requested_at, key) for key, requested_at in self._requested_at.items()
+            if requested_at >= cutoff and key[0] in self.categories and key[1] in self.countries
+        ]
+        return [key for _, key in sorted(recent, reverse=True)]
+
+    def _feed_units(self, key: Tuple[str, str]) -> int:
+        """CSE units one refresh of a feed may spend"""
+        return self.service.estimate_category_units(self._wanted.get(key, self.default_articles))
+
+    def cycle_interval(self) -> float:
+        """
+        Seconds until the next cycle
+
+        A fixed interval is used as configured. Otherwise the background share
+        of the daily budget, split over the workers, is spread evenly over the
+        day: interval = day * workers * units per cycle / background share.
+
+        Returns:
+            Interval in seconds
+        """
+        if self.interval is not None:
+            return self.interval
+
+        units_per_cycle = sum(self._feed_units(key) for key in self.demanded_feeds())
+        share = self.service.quota_manager.limit_for(PRIORITY_BACKGROUND)
+        if units_per_cycle == 0:
+            return self.min_interval
+        if share <= 0:
+            return SECONDS_PER_DAY
+        derived = SECONDS_PER_DAY * self.workers * units_per_cycle / share
+        return min(SECONDS_PER_DAY, max(self.min_interval, derived))
+
+    async def _remaining_background_units(self) -> Optional[int]:
+        """
+        Units background work may still spend today, across all workers
+
+        Returns:
+            Remaining units, or None when refreshes spend no quota (or usage is unreadable)
+        """
+        if not self.service.spends_search_quota():
+            return None
+        try:
+            return await asyncio.to_thread(self.service.quota_manager.remaining, PRIORITY_BACKGROUND)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read remaining CSE quota: {e}")
+            return None
+
+    # ===== REFRESHING =====
+
+    async def refresh_all(self) -> RefreshCycle:
+        """
+        Refresh every recently requested feed once, with bounded concurrency,
+        for as long as the background quota share lasts
+
+        Returns:
+            RefreshCycle with timing, success and quota-skip counts
+        """
+        cycle = RefreshCycle(started_at=time.time())
+        feeds = self.demanded_feeds()
+        self._current_cycle = cycle
+        semaphore = asyncio.Semaphore(self.concurrency)
+        reserved = 0                # Units of the feeds being refreshed right now
+        quota_exhausted = False
+
+        async def refresh_with_limit(category: str, country: str) -> None:
+            nonlocal reserved, quota_exhausted
+            async with semaphore:
+                units = self._feed_units((category, country))
+                if units:
+                    # Re-read the shared usage: other workers spend from the same share
+                    remaining = None if quota_exhausted else await self._remaining_background_units()
+                    if quota_exhausted or (remaining is not None and remaining - reserved < units):
+                        quota_exhausted = True
+                        cycle.skipped_for_quota += 1
+                        return
+                reserved += units
+                try:
+                    if await self.refresh_feed(category, country):
+                        cycle.refreshed += 1
+                    else:
+                        cycle.failed += 1
+                finally:
+                    reserved -= units
+
+        try:
+            remaining = await self._remaining_background_units()
+            if feeds and remaining is not None and remaining < min(self._feed_units(key) for key in feeds):
+                # Nothing left to spend - don't start feeds that could only fail
+                cycle.skipped_for_quota = len(feeds)
+            else:
+                await asyncio.gather(*[refresh_with_limit(category, country) for category, country in feeds])
+        finally:
+            cycle.finished_at = time.time()
+            self._current_cycle = None
+            self._last_cycle = cycle
+            self._cycles += 1
+
+        if cycle.skipped_for_quota:
+            self._quota_stopped_cycles += 1
+            logger.warning(
+                f"🪫 Feed refresh cycle stopped by the background CSE quota: "
+                f"{cycle.skipped_for_quota} of {len(feeds)} feeds skipped"
+            )
+        logger.info(
+            f"🗂️ Feed refresh cycle done: {cycle.refreshed} refreshed, {cycle.failed} failed "
+            f"of {len(feeds)} requested feeds in {cycle.finished_at - cycle.started_at:.1f}s"
+        )
+        return cycle
+
+    async def refresh_feed(self, category: str, country: str) -> bool:
+        """
+        Rebuild one feed and store it if the refresh produced articles
+
+        Args:
+            category: News category
+            country: Country code
+
+        Returns:
+            True if the feed was refreshed
+        """
+        key = (category, country)
+        count = self._wanted.get(key, self.default_articles)
+        started = time.time()
+
+        try:
+            articles = await self.service.get_news_for_category(
+                category, count, country,
+                quota=QuotaContext(route="feed_materializer", priority=PRIORITY_BACKGROUND)
+            )
+        except Exception as e:
+            articles = []
+            error = str(e)
+        else:
+            error = None if articles else "refresh returned no articles"
+
+        if error is not None:
+            # Keep serving the previous articles - stale is better than empty
+            previous = self._feeds.get(key)
+            if previous is not None:
+                previous.last_error = error
+                previous.failures += 1
+            logger.warning(f"⚠️ Feed {category}/{country} not refreshed: {error}")
+            return False
+
+        self._feeds[key] = MaterializedFeed(
+            articles=articles,
+            requested=count,
+            refreshed_at=time.time(),
+            refresh_seconds=time.time() - started
+        )
+        return True
+
+    # ===== READING =====
+
+    def mark_requested(self, category: str, country: str) -> None:
+        """
+        Keep a feed refreshed without reading it (e.g. for live subscribers)
+
+        Args:
+            category: News category
+            country: Country code
+        """
+        self._requested_at[(category, country)] = time.time()
+
+    def get_feed(self, category: str, country: str, max_articles: int) -> Optional[List[ProcessedArticle]]:
+        """
+        Read a materialized feed without touching any upstream
+
+        Every read marks the feed as wanted, so the following cycles keep it
+        refreshed; a miss also records the requested size so the next cycle
+        fetches enough articles to answer it from memory. A feed that has not
+        been refreshed for two intervals counts as a miss.
+
+        Args:
+            category: News category
+            country: Country code
+            max_articles: Number of articles wanted
+
+        Returns:
+            Up to `max_articles` articles, or None if the feed cannot answer the request
+        """
+        key = (category, country)
+        feed = self._feeds.get(key)
+        self._requested_at[key] = time.time()
+
+        if feed is not None and feed.age > 2 * self._current_interval:
+            self._stale_misses += 1
+            feed = None
+
+        if feed is not None and feed.covers(max_articles):
+            self._hits += 1
+            return feed.articles[:max_articles]
+
+        self._misses += 1
+        wanted = min(self.max_articles, max(max_articles, self._wanted.get(key, self.default_articles)))
+        self._wanted[key] = wanted
+        return None
+
+    # ===== MONITORING =====
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get refresh lag and per-feed age for health endpoints
+
+        Lag is how far the oldest requested feed is behind its refresh
+        schedule (0 while every such feed is younger than one interval).
+
+        Returns:
+            Dictionary with scheduler state, lag and one entry per feed
+        """
+        now = time.time()
+        demanded = self.demanded_feeds()
+        ages = [self._feeds[key].age for key in demanded if key in self._feeds]
+        oldest_age = max(ages) if ages else None
+        expected = len(self.categories) * len(self.countries)
+        demanded_set = set(demanded)
+
+        feeds = {}
+        for country in self.countries:
+            for category in self.categories:
+                feed = self._feeds.get((category, country))
+                if feed is None:
+                    feeds[f"{country}/{category}"] = {
+                        'materialized': False,
+                        'requested': (category, country) in demanded_set
+                    }
+                    continue
+                feeds[f"{country}/{category}"] = {
+                    'materialized': True,
+                    'requested': (category, country) in demanded_set,
+                    'articles': len(feed.articles),
+                    'articles_requested': feed.requested,
+                    'age_seconds': round(feed.age, 1),
+                    'refreshed_at': datetime.fromtimestamp(feed.refreshed_at).isoformat(),
+                    'refresh_seconds': round(feed.refresh_seconds, 2),
+                    'consecutive_failures': feed.failures,
+                    'last_error': feed.last_error
+                }
+
+        last_cycle = None
+        if self._last_cycle is not None:
+            last_cycle = {
+                'started_at': datetime.fromtimestamp(self._last_cycle.started_at).isoformat(),
+                'duration_seconds': round(self._last_cycle.finished_at - self._last_cycle.started_at, 2),
+                'refreshed': self._last_cycle.refreshed,
+                'failed': self._last_cycle.failed,
+                'skipped_for_quota': self._last_cycle.skipped_for_quota
+            }
+
+        lookups = self._hits + self._misses
+        return {
+            'running': self._task is not None and not self._task.done(),
+            'interval_seconds': round(self._current_interval, 1),
+            'interval_derived_from_quota': self.interval is None,
+            'min_interval_seconds': self.min_interval,
+            'workers': self.workers,
+            'concurrency': self.concurrency,
+            'demand_window_seconds': self.demand_window,
+            'feeds_requested': len(demanded),
+            'units_per_cycle': sum(self._feed_units(key) for key in demanded),
+            'cycles_stopped_by_quota': self._quota_stopped_cycles,
+            'cycles_completed': self._cycles,
+            'cycle_in_progress': self._current_cycle is not None,
+            'next_cycle_in_seconds': round(max(0.0, self._next_cycle_at - now), 1) if self._next_cycle_at else None,
+            'last_cycle': last_cycle,
+            'feeds_expected': expected,
+            'feeds_materialized': len(self._feeds),
+            'oldest_feed_age_seconds': round(oldest_age, 1) if oldest_age is not None else None,
+            'refresh_lag_seconds': round(max(0.0, oldest_age - self._current_interval), 1) if oldest_age is not None else None,
+            'hits': self._hits,
+            'misses': self._misses,
+            'stale_misses': self._stale_misses,
+            'hit_ratio': round(self._hits / lookups, 3) if lookups else 0.0,
+            'feeds': feeds
+        }
+
+# Global instance - started from the app lifespan in main.py
+# (FEED_REFRESH_INTERVAL_SECONDS unset = cadence derived from the CSE quota;
+# WEB_CONCURRENCY is the number of uvicorn/gunicorn workers sharing that quota)
+feed_materializer = FeedMaterializer(
+    news_service,
+    interval=float(os.environ["FEED_REFRESH_INTERVAL_SECONDS"]) if os.getenv("FEED_REFRESH_INTERVAL_SECONDS") else None,
+    concurrency=int(os.getenv("FEED_REFRESH_CONCURRENCY", "4")),
+    default_articles=int(os.getenv("FEED_MATERIALIZE_DEFAULT_ARTICLES", "18")),
+    max_articles=int(os.getenv("FEED_MATERIALIZE_MAX_ARTICLES", "50")),
+    initial_delay=float(os.getenv("FEED_REFRESH_INITIAL_DELAY_SECONDS", "5")),
+    min_interval=float(os.getenv("FEED_REFRESH_MIN_INTERVAL_SECONDS", "900")),
+    demand_window=float(os.getenv("FEED_MATERIALIZE_DEMAND_WINDOW_SECONDS", "21600")),
+    workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+)
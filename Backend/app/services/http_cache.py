@@ -0,0 +1,435 @@
+# Backend/app/services/http_cache.py
+"""
+HTTP Cache
+Private HTTP cache (RFC 9111) in front of outbound GET requests. Fresh responses
+are served from disk, stale ones are revalidated with If-None-Match /
+If-Modified-Since so unchanged pages come back as 304s, and the on-disk store is
+bounded with least-recently-used eviction.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Cache outcomes reported on every response
+CACHE_HIT = 'hit'                   # Fresh stored response, no network
+CACHE_REVALIDATED = 'revalidated'   # Stale stored response confirmed by a 304
+CACHE_MISS = 'miss'                 # Full response downloaded
+
+# Statuses we store (successful responses only)
+CACHEABLE_STATUSES = {200, 203}
+
+# Heuristic freshness (no explicit lifetime): 10% of the time since Last-Modified, capped
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_SECONDS = 86400
+
+_DIRECTIVE_RE = re.compile(r'\s*([a-zA-Z-]+)\s*(?:=\s*("[^"]*"|[^,]*))?\s*(?:,|$)')
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header into lowercase directives
+
+    Args:
+        value: Header value (e.g. 'public, max-age=300')
+
+    Returns:
+        Directive name -> argument (None for directives without one)
+    """
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for match in _DIRECTIVE_RE.finditer(value):
+        name, argument = match.group(1), match.group(2)
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP date header into a Unix timestamp (None if missing/invalid)"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+def _seconds(value: Optional[str]) -> Optional[int]:
+    """Parse a delta-seconds value (None if missing/invalid)"""
+    try:
+        return max(0, int(value)) if value is not None else None
+    except ValueError:
+        return None
+
+@dataclass
+class CachedResponse:
+    """
+    An HTTP response served through the cache
+    """
+    status: int
+    headers: Dict[str, str]             # Lowercased header names
+    body: bytes
+    cache_status: str                   # CACHE_HIT, CACHE_REVALIDATED or CACHE_MISS
+
+    @property
+    def from_network(self) -> bool:
+        """Whether the upstream was contacted for this response"""
+        return self.cache_status != CACHE_HIT
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        """Decode the body using the Content-Type charset (UTF-8 by default)"""
+        if encoding is None:
+            match = re.search(r'charset=([\w-]+)', self.headers.get('content-type', ''), re.IGNORECASE)
+            encoding = match.group(1) if match else 'utf-8'
+        return self.body.decode(encoding, errors='replace')
+
+    def json(self) -> Any:
+        """Decode the body as JSON"""
+        return json.loads(self.body)
+
+@dataclass
+class _StoredEntry:
+    """A response as kept on disk, with what freshness calculations need"""
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    vary: Dict[str, str]
+    request_time: float
+    response_time: float
+
+    def freshness_lifetime(self) -> float:
+        """Seconds the response is fresh for (RFC 9111 section 4.2.1)"""
+        directives = parse_cache_control(self.headers.get('cache-control'))
+        if 'no-cache' in directives:
+            return 0.0
+        max_age = _seconds(directives.get('max-age'))
+        if max_age is not None:
+            return float(max_age)
+
+        date = _parse_http_date(self.headers.get('date')) or self.response_time
+        expires = _parse_http_date(self.headers.get('expires'))
+        if 'expires' in self.headers:
+            return max(0.0, expires - date) if expires is not None else 0.0
+
+        last_modified = _parse_http_date(self.headers.get('last-modified'))
+        if last_modified is not None and last_modified < date:
+            return min(HEURISTIC_MAX_SECONDS, (date - last_modified) * HEURISTIC_FRACTION)
+        return 0.0
+
+    def current_age(self, now: float) -> float:
+        """Seconds since the origin generated the response (RFC 9111 section 4.2.3)"""
+        date = _parse_http_date(self.headers.get('date')) or self.response_time
+        apparent_age = max(0.0, self.response_time - date)
+        age_value = _seconds(self.headers.get('age')) or 0
+        response_delay = self.response_time - self.request_time
+        corrected_initial_age = max(apparent_age, age_value + response_delay)
+        return corrected_initial_age + (now - self.response_time)
+
+    def is_fresh(self, now: float) -> bool:
+        return self.current_age(now) < self.freshness_lifetime()
+
+    def has_validators(self) -> bool:
+        return 'etag' in self.headers or 'last-modified' in self.headers
+
+class HttpCache:
+    """
+    Shared private HTTP cache for outbound GETs, stored in SQLite.
+
+    - Honours Cache-Control (no-store, no-cache, max-age), Expires, Date, Age and Vary
+    - Stale entries are revalidated with If-None-Match / If-Modified-Since; a 304
+      refreshes the stored headers and serves the stored body
+    - The store is bounded by total body size; least recently used entries go first
+    - URLs are stored only as hashes, so API keys in query strings never hit disk
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            max_bytes: Maximum total size of stored bodies
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._initialized = False
+
+        # Statistics
+        self._stats = {
+            'hits': 0,
+            'revalidated': 0,
+            'revalidated_changed': 0,
+            'misses': 0,
+            'stored': 0,
+            'not_stored': 0,
+            'evictions': 0,
+            'store_errors': 0
+        }
+
+    # ===== STORAGE =====
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection configured for multi-process use
+
+        Returns:
+            sqlite3.Connection with WAL journaling and a busy timeout
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=10000")
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    cache_key      TEXT    PRIMARY KEY,
+                    status         INTEGER NOT NULL,
+                    headers        TEXT    NOT NULL,
+                    vary           TEXT    NOT NULL,
+                    body           BLOB    NOT NULL,
+                    size           INTEGER NOT NULL,
+                    request_time   REAL    NOT NULL,
+                    response_time  REAL    NOT NULL,
+                    last_access    REAL    NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_access ON http_cache (last_access)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _load(self, cache_key: str) -> Optional[_StoredEntry]:
+        """Read a stored response and mark it as recently used"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT status, headers, vary, body, request_time, response_time FROM http_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with conn:
+                conn.execute("UPDATE http_cache SET last_access = ? WHERE cache_key = ?", (time.time(), cache_key))
+        finally:
+            conn.close()
+
+        status, headers, vary, body, request_time, response_time = row
+        return _StoredEntry(status, json.loads(headers), bytes(body), json.loads(vary), request_time, response_time)
+
+    def _save(self, cache_key: str, entry: _StoredEntry) -> None:
+        """Write a response and evict least recently used entries beyond max_bytes"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (cache_key, entry.status, json.dumps(entry.headers), json.dumps(entry.vary),
+                     entry.body, len(entry.body), entry.request_time, entry.response_time, time.time())
+                )
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+                if total > self.max_bytes:
+                    # Trim to 90% so we are not evicting on every write
+                    target = int(self.max_bytes * 0.9)
+                    for key, size in conn.execute(
+                        "SELECT cache_key, size FROM http_cache ORDER BY last_access ASC"
+                    ).fetchall():
+                        if total <= target:
+                            break
+                        conn.execute("DELETE FROM http_cache WHERE cache_key = ?", (key,))
+                        total -= size
+                        self._stats['evictions'] += 1
+        finally:
+            conn.close()
+
+    def _update_after_304(self, cache_key: str, entry: _StoredEntry) -> None:
+        """Persist headers and timestamps refreshed by a 304"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE http_cache SET headers = ?, request_time = ?, response_time = ?, last_access = ? WHERE cache_key = ?",
+                    (json.dumps(entry.headers), entry.request_time, entry.response_time, time.time(), cache_key)
+                )
+        finally:
+            conn.close()
+
+    # ===== REQUESTS =====
+
+    @staticmethod
+    def _full_url(url: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return url
+        return f"{url}{'&' if '?' in url else '?'}{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+    @staticmethod
+    def _cache_key(full_url: str) -> str:
+        return hashlib.sha256(full_url.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _vary_values(vary_header: Optional[str], request_headers: Dict[str, str]) -> Dict[str, str]:
+        """Request header values a response varies on (lowercased names)"""
+        lowered = {k.lower(): v for k, v in request_headers.items()}
+        names = [name.strip().lower() for name in (vary_header or '').split(',') if name.strip()]
+        return {name: lowered.get(name, '') for name in names}
+
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        before_network: Optional[Callable[[], Awaitable[Any]]] = None
+    ) -> CachedResponse:
+        """
+        GET a URL through the cache
+
+        Args:
+            session: aiohttp session used for network requests
+            url: URL to fetch
+            params: Query parameters (part of the cache key)
+            headers: Request headers
+            timeout: Timeout for the network request
+            before_network: Awaited right before the upstream is contacted (miss or
+                revalidation) - e.g. to take a rate-limit token or spend quota,
+                so fresh hits cost neither
+
+        Returns:
+            CachedResponse (any status - callers check .status)
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: If the network request fails
+        """
+        headers = dict(headers or {})
+        full_url = self._full_url(url, params)
+        cache_key = self._cache_key(full_url)
+
+        try:
+            stored = await asyncio.to_thread(self._load, cache_key)
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP cache read failed: {e}")
+            stored = None
+
+        if stored is not None and stored.vary != self._vary_values(stored.headers.get('vary'), headers):
+            stored = None
+
+        now = time.time()
+        if stored is not None and stored.is_fresh(now):
+            self._stats['hits'] += 1
+            return CachedResponse(stored.status, stored.headers, stored.body, CACHE_HIT)
+
+        # Stale (or missing) - ask the origin, conditionally if we can
+        conditional = stored is not None and stored.has_validators()
+        if conditional:
+            if 'etag' in stored.headers:
+                headers['If-None-Match'] = stored.headers['etag']
+            if 'last-modified' in stored.headers:
+                headers['If-Modified-Since'] = stored.headers['last-modified']
+
+        if before_network is not None:
+            await before_network()
+
+        request_time = time.time()
+        request_kwargs = {'headers': headers}
+        if timeout is not None:
+            request_kwargs['timeout'] = timeout
+        async with session.get(full_url, **request_kwargs) as response:
+            status = response.status
+            response_headers = {k.lower(): v for k, v in response.headers.items()}
+            body = b'' if status == 304 else await response.read()
+        response_time = time.time()
+
+        if status == 304 and conditional:
+            self._stats['revalidated'] += 1
+            for name, value in response_headers.items():
+                if name not in ('content-length', 'content-encoding', 'transfer-encoding'):
+                    stored.headers[name] = value
+            stored.request_time = request_time
+            stored.response_time = response_time
+            await self._safe(self._update_after_304, cache_key, stored)
+            return CachedResponse(stored.status, stored.headers, stored.body, CACHE_REVALIDATED)
+
+        if conditional:
+            self._stats['revalidated_changed'] += 1
+        else:
+            self._stats['misses'] += 1
+
+        entry = _StoredEntry(
+            status, response_headers, body,
+            self._vary_values(response_headers.get('vary'), headers),
+            request_time, response_time
+        )
+        if self._is_storable(entry):
+            self._stats['stored'] += 1
+            await self._safe(self._save, cache_key, entry)
+        else:
+            self._stats['not_stored'] += 1
+
+        return CachedResponse(status, response_headers, body, CACHE_MISS)
+
+    def _is_storable(self, entry: _StoredEntry) -> bool:
+        """Whether a response may and should be stored (RFC 9111 section 3)"""
+        if entry.status not in CACHEABLE_STATUSES:
+            return False
+        if 'no-store' in parse_cache_control(entry.headers.get('cache-control')):
+            return False
+        if entry.headers.get('vary', '').strip() == '*':
+            return False
+        if len(entry.body) > self.max_bytes // 10:
+            return False
+        # Only worth keeping if it can be served fresh or revalidated later
+        return entry.freshness_lifetime() > 0 or entry.has_validators()
+
+    async def _safe(self, write: Callable[..., None], *args) -> None:
+        """Run a store write in a thread; a failing cache must never fail the request"""
+        try:
+            await asyncio.to_thread(write, *args)
+        except Exception as e:
+            self._stats['store_errors'] += 1
+            logger.warning(f"⚠️ HTTP cache write failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/revalidate/miss counters and store size
+
+        Queries SQLite - call it from a worker thread (asyncio.to_thread), not the event loop.
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        try:
+            conn = self._connect()
+            try:
+                entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+            finally:
+                conn.close()
+        except Exception as e:
+            entries, size = None, None
+            logger.debug(f"HTTP cache stats unavailable: {e}")
+
+        lookups = self._stats['hits'] + self._stats['revalidated'] + self._stats['revalidated_changed'] + self._stats['misses']
+        served_from_store = self._stats['hits'] + self._stats['revalidated']
+        return {
+            'entries': entries,
+            'size_bytes': size,
+            'max_bytes': self.max_bytes,
+            **self._stats,
+            'served_from_store_ratio': round(served_from_store / lookups, 3) if lookups else 0.0
+        }
+
+# Global instance shared by the CSE client, article scraper and RSS ingestion
+http_cache = HttpCache(
+    db_path=os.getenv("HTTP_CACHE_PATH", "http_cache.sqlite3"),
+    max_bytes=int(os.getenv("HTTP_CACHE_MAX_MB", "100")) * 1024 * 1024
+)
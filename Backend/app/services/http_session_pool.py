@@ -0,0 +1,171 @@
+# Backend/app/services/http_session_pool.py
+"""
+Pooled HTTP Session
+Long-lived aiohttp session with keep-alive, DNS caching and connection limits.
+Tracks connection-reuse metrics so we can see how many handshakes we avoid.
+"""
+
+import aiohttp
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+class PooledClientSession:
+    """
+    Owns a single aiohttp.ClientSession (and its TCPConnector) for the lifetime
+    of the application, instead of opening a new session for every request.
+
+    The session is created in the FastAPI startup hook and closed on shutdown.
+    If a request arrives before startup (e.g. in a script), the session is
+    created lazily on first use.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        total_timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Configure the pool - nothing is opened until start() or first use
+
+        Args:
+            name: Label used in logs and metrics (e.g. 'google_cse')
+            limit: Maximum simultaneous connections across all hosts
+            limit_per_host: Maximum simultaneous connections to a single host
+            dns_cache_ttl: Seconds to keep resolved DNS entries
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            total_timeout: Default total timeout per request (None = no default)
+            headers: Default headers sent with every request
+        """
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.total_timeout = total_timeout
+        self.headers = headers or {}
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._started_at: Optional[str] = None
+
+        # Connection-reuse counters, filled in by aiohttp trace hooks
+        self._metrics = {
+            'requests': 0,                # Requests sent through the pool
+            'connections_created': 0,     # New TCP(+TLS) connections opened
+            'connections_reused': 0,      # Requests served on a kept-alive connection
+            'dns_lookups': 0,             # Actual DNS resolutions performed
+            'dns_cache_hits': 0,          # Lookups answered from the DNS cache
+            'sessions_opened': 0          # Times the underlying session was (re)created
+        }
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build an aiohttp TraceConfig that increments our connection counters
+
+        Returns:
+            TraceConfig to attach to the session
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self._metrics['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self._metrics['connections_created'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self._metrics['connections_reused'] += 1
+
+        async def on_dns_resolvehost_end(session, context, params):
+            self._metrics['dns_lookups'] += 1
+
+        async def on_dns_cache_hit(session, context, params):
+            self._metrics['dns_cache_hits'] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace_config
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the pooled session and its connector
+
+        Returns:
+            A new aiohttp.ClientSession
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=self.total_timeout)
+
+        self._metrics['sessions_opened'] += 1
+        self._started_at = datetime.now().isoformat()
+        logger.info(f"🔌 Opening pooled HTTP session '{self.name}' (limit={self.limit}, per_host={self.limit_per_host})")
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=self.headers,
+            trace_configs=[self._build_trace_config()]
+        )
+
+    async def start(self) -> None:
+        """Open the pooled session (called from the app startup hook)"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+    async def close(self) -> None:
+        """Close the pooled session and release all kept-alive connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info(f"🔌 Closed pooled HTTP session '{self.name}'")
+        self._session = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creating it lazily if startup has not run
+
+        Must be called from inside a running event loop.
+
+        Returns:
+            The shared aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection-reuse metrics for monitoring
+
+        Returns:
+            Dictionary of counters plus the derived reuse ratio
+        """
+        connections = self._metrics['connections_created'] + self._metrics['connections_reused']
+        reuse_ratio = self._metrics['connections_reused'] / connections if connections else 0.0
+
+        return {
+            'name': self.name,
+            'open': self._session is not None and not self._session.closed,
+            'started_at': self._started_at,
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            **self._metrics,
+            'connection_reuse_ratio': round(reuse_ratio, 3)
+        }
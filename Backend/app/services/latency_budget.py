@@ -0,0 +1,307 @@
+# Backend/app/services/latency_budget.py
+"""
+Latency Budgets and Hedged Requests
+A per-request time budget that is passed from the route down to every upstream
+call, rolling latency percentiles per upstream, and a helper that sends a
+duplicate ("hedged") request when the first one is slower than usual.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import aiohttp
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Hedging configuration - overridable via environment
+HEDGE_PERCENTILE = float(os.getenv("LATENCY_HEDGE_PERCENTILE", "0.95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("LATENCY_HEDGE_MIN_SAMPLES", "20"))
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("LATENCY_HEDGE_MIN_DELAY_SECONDS", "0.2"))
+
+class LatencyBudgetExceeded(Exception):
+    """
+    Raised when a request's latency budget runs out before an upstream answers
+    """
+    def __init__(self, name: str, budget_seconds: float):
+        super().__init__(f"Latency budget for {name} ({budget_seconds:.1f}s) exhausted")
+        self.name = name
+        self.budget_seconds = budget_seconds
+
+class LatencyBudget:
+    """
+    Wall-clock budget for one incoming request.
+
+    Created by the route and handed down to services, which size their
+    timeouts from what is left instead of using flat per-call timeouts.
+    """
+
+    def __init__(self, seconds: float, name: str = 'request'):
+        """
+        Args:
+            seconds: Total time the request may spend
+            name: Label used in logs (usually the route)
+        """
+        self.name = name
+        self.total = seconds
+        self._deadline = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left in the budget (never negative)"""
+        return max(0.0, self._deadline - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the budget is used up"""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """
+        Timeout for one upstream call: what is left, optionally capped
+
+        Args:
+            cap: Longest timeout this call should ever get
+
+        Returns:
+            Timeout in seconds
+        """
+        remaining = self.remaining()
+        return min(remaining, cap) if cap is not None else remaining
+
+    def client_timeout(self, cap: Optional[float] = None) -> aiohttp.ClientTimeout:
+        """
+        aiohttp timeout for one upstream call, sized from the remaining budget
+
+        Args:
+            cap: Longest timeout this call should ever get
+
+        Returns:
+            aiohttp.ClientTimeout with the total set
+        """
+        return aiohttp.ClientTimeout(total=max(0.001, self.timeout(cap)))
+
+class LatencyTracker:
+    """
+    Rolling window of recent call latencies for one upstream
+    """
+
+    def __init__(self, name: str, window: int = 200, default_hedge_delay: float = 1.0):
+        """
+        Args:
+            name: Upstream name (e.g. 'google_cse', 'scraper')
+            window: Number of recent samples kept
+            default_hedge_delay: Hedge delay used until enough samples exist
+        """
+        self.name = name
+        self.default_hedge_delay = default_hedge_delay
+        self._samples: Deque[float] = deque(maxlen=window)
+
+        # Statistics
+        self._hedges_sent = 0
+        self._hedge_wins = 0
+        self._budget_expired = 0
+
+    def record(self, seconds: float, hedge_won: bool = False) -> None:
+        """
+        Add one completed call's latency
+
+        Args:
+            seconds: Time from the primary call's start until the winning answer
+            hedge_won: Whether the hedged duplicate answered first
+        """
+        self._samples.append(seconds)
+        if hedge_won:
+            self._hedge_wins += 1
+
+    def record_hedge(self) -> None:
+        """Count a hedged duplicate being sent"""
+        self._hedges_sent += 1
+
+    def record_budget_expired(self) -> None:
+        """Count a call abandoned because the request budget ran out"""
+        self._budget_expired += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        Latency at a percentile of the current window
+
+        Args:
+            fraction: Percentile as a fraction (0.95 for p95)
+
+        Returns:
+            Latency in seconds, or None if there are no samples
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return ordered[index]
+
+    def hedge_delay(self) -> float:
+        """
+        How long to wait for the primary call before sending a hedge
+
+        Returns:
+            The p95 latency once enough samples exist, otherwise the default
+        """
+        if len(self._samples) < HEDGE_MIN_SAMPLES:
+            return self.default_hedge_delay
+        return max(HEDGE_MIN_DELAY_SECONDS, self.percentile(HEDGE_PERCENTILE))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get latency percentiles and hedging counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 3) if value is not None else None
+
+        return {
+            'samples': len(self._samples),
+            'p50_seconds': rounded(self.percentile(0.5)),
+            'p95_seconds': rounded(self.percentile(0.95)),
+            'p99_seconds': rounded(self.percentile(0.99)),
+            'hedge_delay_seconds': round(self.hedge_delay(), 3),
+            'hedges_sent': self._hedges_sent,
+            'hedge_wins': self._hedge_wins,
+            'budget_expired': self._budget_expired
+        }
+
+class LatencyTrackerRegistry:
+    """
+    Holds one LatencyTracker per upstream
+    """
+
+    # Hedge delays used before an upstream has enough samples
+    DEFAULT_HEDGE_DELAYS = {
+        'google_cse': 1.0,
+        'scraper': 3.0
+    }
+
+    def __init__(self):
+        self._trackers: Dict[str, LatencyTracker] = {}
+
+    def get(self, upstream: str) -> LatencyTracker:
+        """
+        Get (or create) the tracker for an upstream
+
+        Args:
+            upstream: Upstream name
+
+        Returns:
+            The LatencyTracker for that upstream
+        """
+        tracker = self._trackers.get(upstream)
+        if tracker is None:
+            tracker = LatencyTracker(upstream, default_hedge_delay=self.DEFAULT_HEDGE_DELAYS.get(upstream, 1.0))
+            self._trackers[upstream] = tracker
+        return tracker
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get latency stats for every upstream
+
+        Returns:
+            Dictionary of upstream name to tracker stats
+        """
+        return {name: tracker.get_stats() for name, tracker in self._trackers.items()}
+
+async def hedged_call(
+    make_call: Callable[[], Awaitable[Any]],
+    tracker: LatencyTracker,
+    budget: Optional[LatencyBudget] = None,
+    hedge: bool = True,
+    admitted: Optional[asyncio.Event] = None
+) -> Any:
+    """
+    Run an upstream call, sending one duplicate if it is slower than usual
+
+    The primary call starts immediately. If it has not answered after the
+    tracker's p95 latency, a second identical call is started and whichever
+    succeeds first wins; the other is cancelled. If the first call to finish
+    fails, the other one is still awaited.
+
+    When `admitted` is given, the call sets it right before contacting the
+    upstream (after its rate-limit token and quota unit). The hedge delay and
+    the latency sample start only then, so time queued behind a limiter is
+    never mistaken for a slow upstream; a call that finishes without setting
+    it (served from a cache) is neither hedged nor sampled.
+
+    Args:
+        make_call: Zero-argument coroutine function performing the call
+        tracker: Latency tracker for the upstream (supplies the hedge delay)
+        budget: Request latency budget (None = no overall limit)
+        hedge: False to run only the primary call (e.g. for background work)
+        admitted: Event the call sets once admitted to the network (None = from the start)
+
+    Returns:
+        The result of the first successful call
+
+    Raises:
+        LatencyBudgetExceeded: If the budget runs out before any call succeeds
+        Exception: Whatever the calls raised, if they all failed
+    """
+    def time_left() -> Optional[float]:
+        return budget.remaining() if budget is not None else None
+
+    if budget is not None and budget.expired():
+        tracker.record_budget_expired()
+        raise LatencyBudgetExceeded(budget.name, budget.total)
+
+    started = time.monotonic()
+    primary = asyncio.ensure_future(make_call())
+    calls = {primary}
+    hedge_task: Optional[asyncio.Task] = None
+    last_error: Optional[BaseException] = None
+
+    try:
+        if admitted is not None:
+            # Phase 0: wait for admission - queueing is not upstream latency
+            admission = asyncio.ensure_future(admitted.wait())
+            try:
+                await asyncio.wait({primary, admission}, timeout=time_left(), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                admission.cancel()
+            started = time.monotonic()
+            hedge = hedge and admitted.is_set()
+
+        # Phase 1: give the primary call until the hedge delay
+        delay = tracker.hedge_delay()
+        remaining = time_left()
+        if hedge and (remaining is None or delay < remaining):
+            done, _ = await asyncio.wait(calls, timeout=delay)
+            if not done:
+                tracker.record_hedge()
+                logger.debug(f"🪃 Hedging slow {tracker.name} call after {delay:.2f}s")
+                hedge_task = asyncio.ensure_future(make_call())
+                calls.add(hedge_task)
+
+        # Phase 2: first success wins, within whatever budget is left
+        pending = set(calls)
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=time_left(), return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                tracker.record_budget_expired()
+                raise LatencyBudgetExceeded(budget.name, budget.total)
+
+            for task in done:
+                if task.exception() is not None:
+                    last_error = task.exception()
+                    continue
+                if admitted is None or admitted.is_set():
+                    tracker.record(time.monotonic() - started, hedge_won=task is hedge_task)
+                return task.result()
+
+        raise last_error
+    finally:
+        for task in calls:
+            if not task.done():
+                task.cancel()
+
+# Global instance shared by NewsService and the article scraper
+latency_trackers = LatencyTrackerRegistry()
@@ -0,0 +1,181 @@
+# Backend/app/services/near_duplicate_detector.py
+"""
+Near-Duplicate Story Detection
+MinHash signatures with an LSH banding index. Syndicated stories that several
+outlets publish with near-identical headlines and snippets are grouped into one
+cluster, so they are summarized, cached and shown once with all their links.
+"""
+
+import hashlib
+import random
+import re
+from typing import Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Signature length and its split into LSH bands (BANDS * ROWS_PER_BAND = NUM_PERMUTATIONS).
+# 16 bands of 4 rows make pairs above ~0.5 similarity likely candidates.
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+
+# Default: stories sharing at least 60% of their word pairs are the same story
+DEFAULT_SIMILARITY_THRESHOLD = 0.6
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 61) - 1
+
+# Fixed permutation coefficients - signatures are comparable across processes and runs
+_rng = random.Random(0x7EAC0)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Very common words carry no signal about which story a text is
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'will', 'with'
+}
+
+def shingles(text: str) -> Set[str]:
+    """
+    Word bigrams of the normalized text (single words for very short texts)
+
+    Args:
+        text: Text to shingle (e.g. headline plus snippet)
+
+    Returns:
+        Set of shingles
+    """
+    words = [word for word in _WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+    if len(words) < 3:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+def _shingle_hash(shingle: str) -> int:
+    """Stable 61-bit hash of one shingle (the same in every process)"""
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big') & _MAX_HASH
+
+def minhash_signature(text: str) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a text
+
+    The share of equal positions in two signatures estimates the Jaccard
+    similarity of the texts' shingle sets.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        Tuple of NUM_PERMUTATIONS minimum hash values (all maximal for empty texts)
+    """
+    hashes = [_shingle_hash(shingle) for shingle in shingles(text)]
+    if not hashes:
+        return tuple([_MAX_HASH] * NUM_PERMUTATIONS)
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+def estimated_similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERMUTATIONS
+
+class NearDuplicateIndex(Generic[T]):
+    """
+    Streaming MinHash index with LSH banding.
+
+    Each signature is cut into BANDS bands; items whose signatures agree on a
+    whole band land in the same bucket and only those are compared, so each add
+    costs roughly constant time instead of a scan over everything seen so far.
+    Candidates are confirmed against the similarity threshold before joining.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        """
+        Args:
+            threshold: Smallest estimated similarity still treated as the same story
+        """
+        self.threshold = threshold
+
+        # (band number, band values) -> indexes of cluster leaders
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._leaders: List[Tuple[Tuple[int, ...], T]] = []      # (signature, item)
+        self._members: List[List[T]] = []                        # Near duplicates per leader
+
+    @staticmethod
+    def _band_keys(signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """Bucket keys of a signature, one per band"""
+        return [
+            (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+            for band in range(BANDS)
+        ]
+
+    def add(self, item: T, text: str) -> Optional[T]:
+        """
+        Add one item, joining an existing cluster if it is a near duplicate
+
+        Args:
+            item: The item (kept as cluster leader or member)
+            text: Text used for the signature
+
+        Returns:
+            The cluster leader the item was added to, or None if it leads a new cluster
+        """
+        signature = minhash_signature(text)
+        band_keys = self._band_keys(signature)
+
+        best_index, best_similarity = None, self.threshold
+        checked = set()
+        for key in band_keys:
+            for leader_index in self._buckets.get(key, ()):
+                if leader_index in checked:
+                    continue
+                checked.add(leader_index)
+                similarity = estimated_similarity(signature, self._leaders[leader_index][0])
+                if similarity >= best_similarity:
+                    best_index, best_similarity = leader_index, similarity
+
+        if best_index is not None:
+            self._members[best_index].append(item)
+            return self._leaders[best_index][1]
+
+        leader_index = len(self._leaders)
+        self._leaders.append((signature, item))
+        self._members.append([])
+        for key in band_keys:
+            self._buckets.setdefault(key, []).append(leader_index)
+        return None
+
+    def clusters(self) -> List[Tuple[T, List[T]]]:
+        """
+        Get every cluster in the order its leader was added
+
+        Returns:
+            List of (leader, near duplicates of the leader)
+        """
+        return [(leader, members) for (_, leader), members in zip(self._leaders, self._members)]
+
+def cluster_near_duplicates(
+    items: List[T],
+    text_of: Callable[[T], str],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+) -> List[Tuple[T, List[T]]]:
+    """
+    Group near-duplicate items, keeping the first (best ranked) one of each group
+
+    Args:
+        items: Items in rank order
+        text_of: Returns the text to compare for an item
+        threshold: Smallest estimated similarity still treated as the same story
+
+    Returns:
+        List of (leader, near duplicates) in the leaders' original order
+    """
+    index: NearDuplicateIndex[T] = NearDuplicateIndex(threshold)
+    for item in items:
+        index.add(item, text_of(item))
+    return index.clusters()
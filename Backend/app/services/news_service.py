@@ -734,14 +734,36 @@ import asyncio
 import aiohttp
 import time
 import hashlib
+import math
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields, replace
+from itertools import zip_longest
 from urllib.parse import urlparse
 import os
 from dotenv import load_dotenv
 
+from app.services.http_session_pool import PooledClientSession
+from app.services.rate_limiter import rate_limiters
+from app.services.single_flight import SingleFlight
+from app.services.search_result_cache import StaleWhileRevalidateCache
+from app.services.persistent_store import SearchResultStore
+from app.services.quota_manager import QuotaManager, QuotaContext, QuotaExceededError, PRIORITY_USER, PRIORITY_BACKGROUND
+from app.services.circuit_breaker import CircuitBreaker, circuit_breakers, is_failure_status, UpstreamError
+from app.services.latency_budget import LatencyBudget, hedged_call, latency_trackers
+from app.services.feed_ingestion_service import FeedIngestionService, DEFAULT_REGISTRY_PATH
+from app.services.http_cache import http_cache
+from app.services.synthetic_news_provider import SyntheticNewsProvider
+from app.services.article_identity import canonicalize_url, article_id_for_url
+from app.services.near_duplicate_detector import cluster_near_duplicates
+from app.services.summarization_service import SummarizationService
+from app.services.summary_cache import summary_cache
+from app.services.breaking_news_classifier import breaking_news_classifier
+from app.services.query_planner import query_planner, reciprocal_rank_fusion
+from app.services.recency_index import RecencyIndex, dayfirst_for_country, parse_publish_time
+from app.services.breaking_news_broadcaster import breaking_news_broadcaster
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -749,6 +771,31 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Google Custom Search paging limits
+CSE_PAGE_SIZE = 10      # Results per request (API maximum)
+CSE_MAX_RESULTS = 100   # CSE never returns results beyond start=91
+
+# Extra time a multi-category fan-out waits after its deadline so categories
+# can return the partial/cached results they fall back to when their budget ends
+FANOUT_GRACE_SECONDS = 0.5
+
+# Mock stories are stamped with the start of the current hour, so they only look
+# new (and get reprocessed) once an hour instead of on every request
+MOCK_PUBLISH_ANCHOR_SECONDS = 3600
+
+# Country-focused search terms per category ({country} is the full country name)
+CATEGORY_SEARCH_TERMS = {
+    'politics': '{country} politics government parliament election policy minister president',
+    'sports': '{country} sports cricket rugby football soccer national team league',
+    'health': '{country} health medical healthcare hospitals clinics ministry wellness',
+    'business': '{country} business economy stock exchange mining agriculture trade investment',
+    'technology': '{country} technology innovation digital transformation ICT startups internet',
+    'local-trends': '{country} trending social media local news events culture lifestyle',
+    'weather': '{country} weather climate forecast rain season agriculture farming',
+    'entertainment': '{country} entertainment music movies celebrities arts culture festivals',
+    'education': '{country} education schools universities students academic results ministry'
+}
+
 @dataclass
 class NewsSource:
     """
@@ -760,12 +807,18 @@ class NewsSource:
     snippet: str                        # Short preview/description
     source_name: str                    # Name of the news website/organization
     published_date: Optional[str] = None # When the article was published (if available)
+    published_ts: Optional[int] = None  # published_date normalized to epoch seconds at ingestion
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessedArticle:
     """
     Data structure for a fully processed news article
     This matches what the frontend expects to receive
+    
+    Immutable and slotted: the same record is shared by API responses, the
+    materialized feeds and the search cache instead of being copied into dicts.
+    Per-context data (when it was cached, for which country, search scores)
+    lives next to the record, never on it.
     """
     id: str                             # Unique identifier for the article
     title: str                          # Article headline
@@ -777,7 +830,78 @@ class ProcessedArticle:
     imageUrl: Optional[str]             # URL to article image (if available)
     sourceUrl: str                      # Original article URL
     source: str                         # Name of the news source
-    linked_sources: List[str]           # List of related source URLs
+    linked_sources: Tuple[str, ...]     # Related source URLs
+    publishedAt: Optional[int] = None   # Publish time in epoch seconds (None if unknown)
+    
+    def to_dict(self, **extra: Any) -> Dict[str, Any]:
+        """
+        Serialize for a response that needs a plain dictionary
+        
+        Args:
+            extra: Per-context fields to include (e.g. search_score)
+            
+        Returns:
+            Dictionary with every article field plus `extra`
+        """
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        data['linked_sources'] = list(self.linked_sources)
+        data.update(extra)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ProcessedArticle':
+        """
+        Build a record from an article dictionary (e.g. posted to the search cache)
+        
+        Missing fields get neutral defaults; unknown keys are ignored.
+        
+        Args:
+            data: Article dictionary in the frontend format
+            
+        Returns:
+            ProcessedArticle for the same story
+            
+        Raises:
+            ValueError: If the dictionary has neither an 'id' nor a 'sourceUrl'
+        """
+        source_url = data.get('sourceUrl') or ''
+        if not data.get('id') and not source_url:
+            # Every such article would share article_id_for_url('') and overwrite the others
+            raise ValueError("article has neither 'id' nor 'sourceUrl'")
+        return cls(
+            id=data.get('id') or article_id_for_url(source_url),
+            title=data.get('title') or '',
+            summary=data.get('summary') or '',
+            category=data.get('category') or 'General',
+            timestamp=data.get('timestamp') or datetime.now().isoformat(),
+            readTime=data.get('readTime') or '1 min read',
+            isBreaking=bool(data.get('isBreaking', False)),
+            imageUrl=data.get('imageUrl'),
+            sourceUrl=source_url,
+            source=data.get('source') or '',
+            linked_sources=tuple(data.get('linked_sources') or ([source_url] if source_url else [])),
+            publishedAt=parse_publish_time(data.get('publishedAt'))
+        )
+
+@dataclass
+class CategoryFanOutResult:
+    """
+    Result of fetching several categories at once under a deadline
+    """
+    news_by_category: Dict[str, List[ProcessedArticle]]   # Categories that finished in time
+    category_status: Dict[str, str]                       # 'ok', 'empty', 'error' or 'timeout' per category
+    elapsed_seconds: float                                # Wall time of the whole fan-out
+    deadline_hit: bool                                    # True if the deadline cut anything short
+
+@dataclass
+class CategoryOutcome:
+    """
+    One category's result as soon as its fetch finished (or was cut off)
+    """
+    category: str                                         # Category key (e.g. 'politics')
+    articles: List[ProcessedArticle]                      # Articles (empty unless status is 'ok')
+    status: str                                           # 'ok', 'empty', 'error' or 'timeout'
+    elapsed_seconds: float                                # Time since the fan-out started
 
 class NewsService:
     """
@@ -804,12 +928,109 @@ class NewsService:
         # Google Custom Search API endpoint
         self.google_search_url = "https://www.googleapis.com/customsearch/v1"
         
-        # Rate limiting to avoid hitting API limits
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # Minimum time between requests (100ms)
+        # Search provider: 'google' (live CSE) or 'synthetic' (seeded fake corpus with
+        # simulated latency and errors, for load and capacity testing without network)
+        self.news_provider = os.getenv("NEWS_PROVIDER", "google").lower()
+        self.synthetic_provider: Optional[SyntheticNewsProvider] = None
+        if self.news_provider == "synthetic":
+            self.synthetic_provider = SyntheticNewsProvider(
+                seed=int(os.getenv("NEWS_SYNTHETIC_SEED", "1")),
+                profile=os.getenv("NEWS_SYNTHETIC_PROFILE", "typical"),
+                error_rate=float(os.environ["NEWS_SYNTHETIC_ERROR_RATE"]) if os.getenv("NEWS_SYNTHETIC_ERROR_RATE") else None,
+                timeout_rate=float(os.environ["NEWS_SYNTHETIC_TIMEOUT_RATE"]) if os.getenv("NEWS_SYNTHETIC_TIMEOUT_RATE") else None,
+                latency_scale=float(os.getenv("NEWS_SYNTHETIC_LATENCY_SCALE", "1.0")),
+                duplicate_rate=float(os.getenv("NEWS_SYNTHETIC_DUPLICATE_RATE", "0.1"))
+            )
+        
+        # Long-lived pooled session for Google CSE calls (opened on app startup)
+        # Reuses kept-alive connections instead of a new TCP+TLS handshake per search
+        self.http_pool = PooledClientSession(
+            name="google_cse",
+            limit=int(os.getenv("NEWS_HTTP_POOL_LIMIT", "50")),
+            limit_per_host=int(os.getenv("NEWS_HTTP_POOL_LIMIT_PER_HOST", "20")),
+            dns_cache_ttl=int(os.getenv("NEWS_HTTP_DNS_CACHE_TTL", "300")),
+            keepalive_timeout=float(os.getenv("NEWS_HTTP_KEEPALIVE_SECONDS", "60"))
+        )
+        
+        # Coalesces identical concurrent searches into one upstream request
+        self.search_flight = SingleFlight("google_cse")
+        
+        # Search result cache: fresh TTL, then stale-while-revalidate window
+        self.search_cache = StaleWhileRevalidateCache(
+            name="google_cse",
+            fresh_ttl=float(os.getenv("NEWS_CACHE_FRESH_TTL_SECONDS", "300")),
+            stale_ttl=float(os.getenv("NEWS_CACHE_STALE_TTL_SECONDS", "1800")),
+            stale_if_error_ttl=float(os.getenv("NEWS_CACHE_STALE_IF_ERROR_SECONDS", "86400")),
+            max_entries=int(os.getenv("NEWS_CACHE_MAX_ENTRIES", "1000"))
+        )
+        
+        # On-disk copy of fetched batches so restarts begin with a warm cache
+        # (SQLite in WAL mode - safe to share between uvicorn workers on one host)
+        self.result_store = SearchResultStore(
+            db_path=os.getenv("NEWS_STORE_PATH", "news_store.sqlite3"),
+            max_batches_per_key=int(os.getenv("NEWS_STORE_BATCHES_PER_KEY", "3"))
+        )
+        
+        # Hard timeout for a single CSE page request, and whether slow user-facing
+        # pages get a hedged duplicate after the p95 latency
+        self.cse_request_timeout = float(os.getenv("NEWS_CSE_TIMEOUT_SECONDS", "10"))
+        self.hedge_requests = os.getenv("NEWS_HEDGE_REQUESTS", "true").lower() == "true"
+        
+        # Pages collected so far by in-flight fetches, keyed like the cache -
+        # lets a caller whose latency budget runs out return partial results
+        self._fetch_progress: Dict[Tuple[str, str], Dict[int, List[NewsSource]]] = {}
+        
+        # Publisher RSS/Atom feeds - a second, quota-free source merged into category results
+        self.rss_enabled = os.getenv("RSS_INGESTION_ENABLED", "true").lower() == "true"
+        self.feed_ingestion = FeedIngestionService(
+            registry_path=os.getenv("RSS_FEED_REGISTRY_PATH", DEFAULT_REGISTRY_PATH),
+            refresh_interval=float(os.getenv("RSS_REFRESH_INTERVAL_SECONDS", "600")),
+            concurrency=int(os.getenv("RSS_FETCH_CONCURRENCY", "8")),
+            request_timeout=float(os.getenv("RSS_REQUEST_TIMEOUT_SECONDS", "10")),
+            parse_workers=int(os.getenv("RSS_PARSE_WORKERS", "2")),
+            parse_executor=os.getenv("RSS_PARSE_EXECUTOR", "process")
+        )
+        
+        # Near-duplicate (syndicated) stories are collapsed into one article before processing
+        self.near_duplicate_enabled = os.getenv("NEWS_NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+        self.near_duplicate_threshold = float(os.getenv("NEWS_NEAR_DUPLICATE_THRESHOLD", "0.6"))
+        self._near_duplicate_stats = {'batches': 0, 'sources': 0, 'collapsed': 0}
+        
+        # Category searches run as a plan of focused sub-queries (see query_planner),
+        # one CSE page each - as many as the request needs pages, at most
+        # `query_plan_max_queries` - merged by reciprocal-rank fusion
+        self.query_plan_enabled = os.getenv("NEWS_QUERY_PLAN_ENABLED", "true").lower() == "true"
+        self.query_plan_max_queries = int(os.getenv("NEWS_QUERY_PLAN_MAX_QUERIES", "4"))
+        self.query_plan_overfetch = float(os.getenv("NEWS_QUERY_PLAN_OVERFETCH", "1"))
+        self.rrf_k = int(os.getenv("NEWS_RRF_K", "60"))
+        self._query_plan_stats = {'plans': 0, 'sub_queries': 0, 'failed_sub_queries': 0, 'results': 0, 'unique_results': 0}
+        
+        # Stories each (category, country) feed has already processed, keyed by
+        # (article ID, publish time) - a refresh only processes what is new
+        self.seen_articles_per_feed = int(os.getenv("NEWS_SEEN_ARTICLES_PER_FEED", "200"))
+        self._seen_articles: Dict[Tuple[str, str], Dict[Tuple[str, Optional[int]], ProcessedArticle]] = {}
+        self._incremental_stats = {'refreshes': 0, 'processed': 0, 'reused': 0}
+        
+        # Per-feed index of articles sorted by publish time (recency ordering,
+        # freshness filters and date ranges are binary searches)
+        self.recency_index_size = int(os.getenv("NEWS_RECENCY_INDEX_SIZE", "500"))
+        self._recency_indexes: Dict[Tuple[str, str], RecencyIndex[ProcessedArticle]] = {}
+        
+        # Multi-category fan-out: categories fetched at once, and the overall deadline
+        self.fanout_concurrency = int(os.getenv("NEWS_ALL_CATEGORIES_CONCURRENCY", "4"))
+        self.fanout_deadline = float(os.getenv("NEWS_ALL_CATEGORIES_DEADLINE_SECONDS", "8"))
+        
+        # Daily CSE quota accountant, shared across workers through SQLite
+        # (default budget matches the free tier: 100 queries/day)
+        self.quota_manager = QuotaManager(
+            db_path=os.getenv("NEWS_QUOTA_DB_PATH", os.getenv("NEWS_STORE_PATH", "news_store.sqlite3")),
+            daily_budget=int(os.getenv("GOOGLE_CSE_DAILY_QUOTA", "100"))
+        )
         
         #initialize Google API availability
-        if not self.google_api_key or not self.google_cse_id:
+        if self.synthetic_provider is not None:
+            logger.info("🧪 Using the synthetic news provider instead of Google Search")
+        elif not self.google_api_key or not self.google_cse_id:
             logger.warning("⚠️  Google Search API not configured - using mock data")
         else:
             logger.info("✅ Google Search API configured")
@@ -827,6 +1048,257 @@ class NewsService:
         else:
             logger.info("ℹ️  OpenAI API key not provided - using basic summaries")
             self.openai_available = False
+        
+        # Summarization stage: several sources per LLM call, a few calls at a time,
+        # basic summaries for anything not done in time (off unless NEWS_AI_SUMMARIES_ENABLED).
+        # Summaries persist in the shared summary cache, so unchanged stories are never re-summarized
+        self.summarizer = SummarizationService(
+            fallback=self._create_basic_summary,
+            cache=summary_cache,
+            api_key=self.openai_api_key,
+            enabled=self.openai_available and os.getenv("NEWS_AI_SUMMARIES_ENABLED", "false").lower() == "true",
+            model=os.getenv("NEWS_SUMMARY_MODEL", "gpt-5"),
+            batch_size=int(os.getenv("NEWS_SUMMARY_BATCH_SIZE", "8")),
+            max_concurrency=int(os.getenv("NEWS_SUMMARY_CONCURRENCY", "3")),
+            stage_timeout=float(os.getenv("NEWS_SUMMARY_STAGE_TIMEOUT_SECONDS", "6"))
+        )
+
+    async def startup(self) -> None:
+        """
+        Open long-lived resources - called from the FastAPI startup hook
+        """
+        await self.http_pool.start()
+        if self.rss_enabled:
+            await self.feed_ingestion.start()
+        await self._warm_cache_from_store()
+        logger.info("✅ News service started")
+
+    async def shutdown(self) -> None:
+        """
+        Release long-lived resources - called from the FastAPI shutdown hook
+        """
+        await self.http_pool.close()
+        await self.feed_ingestion.close()
+        logger.info("🛑 News service stopped")
+
+    async def _warm_cache_from_store(self) -> int:
+        """
+        Load persisted search batches into the in-memory cache
+        Batches keep their original fetch time, so old ones are served as stale
+        and refreshed in the background rather than treated as fresh
+        
+        Returns:
+            Number of batches loaded
+        """
+        batches = await self.result_store.aload_latest(self.search_cache.stale_if_error_ttl)
+        
+        loaded = 0
+        for batch in batches:
+            if not batch['items']:
+                continue  # An empty batch would hide live results until it expired
+            try:
+                sources = [self._news_source_from_dict(item, batch['country']) for item in batch['items']]
+                key = (batch['query_key'], batch['country'])
+                self.search_cache.set(key, sources, batch['requested'], fetched_at=batch['fetched_at'])
+                loaded += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Skipping persisted batch {batch.get('query_key')}: {e}")
+        
+        if loaded:
+            logger.info(f"💾 Warmed search cache with {loaded} persisted batches")
+        return loaded
+
+    def _news_source_from_dict(self, data: Dict[str, Any], country_code: Optional[str] = None) -> NewsSource:
+        """
+        Rebuild a NewsSource from its stored dictionary form
+        Unknown keys are ignored so older/newer rows still load
+        
+        Args:
+            data: Dictionary produced by dataclasses.asdict(NewsSource)
+            country_code: Country the source was found for (decides day/month order of numeric dates)
+            
+        Returns:
+            NewsSource object
+        """
+        known_fields = {f.name for f in fields(NewsSource)}
+        source = NewsSource(**{k: v for k, v in data.items() if k in known_fields})
+        if source.published_ts is None and source.published_date:
+            # Rows stored before publish times were normalized
+            source.published_ts = parse_publish_time(source.published_date, dayfirst_for_country(country_code))
+        return source
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get connection-reuse metrics for the upstream HTTP pool
+        
+        Returns:
+            Dictionary with request, connection and DNS counters
+        """
+        return self.http_pool.get_stats()
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get single-flight statistics for identical concurrent searches
+        
+        Returns:
+            Dictionary with upstream vs. coalesced call counts
+        """
+        return self.search_flight.get_stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get search result cache statistics
+        
+        Returns:
+            Dictionary with hit/stale/miss counters and cache size
+        """
+        stats = self.search_cache.get_stats()
+        stats['persistent_store'] = self.result_store.get_stats()
+        return stats
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """
+        Get rolling upstream latency percentiles and hedging counters
+        
+        Returns:
+            Dictionary of upstream name to latency stats
+        """
+        return latency_trackers.get_stats()
+
+    def get_near_duplicate_stats(self) -> Dict[str, Any]:
+        """
+        Get how many syndicated copies were collapsed before processing
+        
+        Returns:
+            Dictionary with batch, source and collapsed counters
+        """
+        sources = self._near_duplicate_stats['sources']
+        return {
+            'enabled': self.near_duplicate_enabled,
+            'threshold': self.near_duplicate_threshold,
+            **self._near_duplicate_stats,
+            'collapsed_ratio': round(self._near_duplicate_stats['collapsed'] / sources, 3) if sources else 0.0
+        }
+
+    def get_query_plan_stats(self) -> Dict[str, Any]:
+        """
+        Get how many sub-queries category searches ran and how much fusion deduplicated
+        
+        Returns:
+            Dictionary with plan settings, counters and the planner's own stats
+        """
+        results = self._query_plan_stats['results']
+        return {
+            'enabled': self.query_plan_enabled,
+            'max_queries': self.query_plan_max_queries,
+            'overfetch': self.query_plan_overfetch,
+            'rrf_k': self.rrf_k,
+            **self._query_plan_stats,
+            'unique_ratio': round(self._query_plan_stats['unique_results'] / results, 3) if results else 0.0,
+            'planner': query_planner.get_stats()
+        }
+
+    def get_incremental_stats(self) -> Dict[str, Any]:
+        """
+        Get how many stories category refreshes processed versus reused
+        
+        Returns:
+            Dictionary with refresh, processed and reused counters
+        """
+        handled = self._incremental_stats['processed'] + self._incremental_stats['reused']
+        return {
+            'feeds': len(self._seen_articles),
+            'seen_per_feed_limit': self.seen_articles_per_feed,
+            **self._incremental_stats,
+            'reused_ratio': round(self._incremental_stats['reused'] / handled, 3) if handled else 0.0
+        }
+
+    def get_feed_stats(self) -> Dict[str, Any]:
+        """
+        Get RSS/Atom feed polling statistics
+        
+        Returns:
+            Dictionary with 200/304/error counts per feed
+        """
+        stats = self.feed_ingestion.get_stats()
+        stats['enabled'] = self.rss_enabled
+        return stats
+
+    def get_provider_stats(self) -> Dict[str, Any]:
+        """
+        Get which search provider is active (and the synthetic provider's counters)
+        
+        Returns:
+            Dictionary with the provider name and, for 'synthetic', its injection stats
+        """
+        if self.synthetic_provider is not None:
+            return self.synthetic_provider.get_stats()
+        return {'provider': 'google', 'configured': self._search_configured()}
+    
+    def _search_configured(self) -> bool:
+        """Whether searches go to a real (or synthetic) provider rather than mock data"""
+        return self.synthetic_provider is not None or bool(self.google_api_key and self.google_cse_id)
+    
+    def spends_search_quota(self) -> bool:
+        """Whether searches are charged to the Google CSE daily quota (not mock or synthetic data)"""
+        return self.synthetic_provider is None and self._search_configured()
+    
+    def estimate_category_units(self, max_articles: int) -> int:
+        """
+        CSE units one uncached get_news_for_category call spends at most
+        
+        Args:
+            max_articles: Articles the call asks for
+            
+        Returns:
+            Query units (0 when searches spend no quota)
+        """
+        if not self.spends_search_quota():
+            return 0
+        if self.query_plan_enabled:
+            return self._query_plan_pages(max_articles)
+        return len(self._plan_cse_pages(max_articles))
+    
+    def _query_plan_pages(self, max_articles: int, affordable: Optional[int] = None) -> int:
+        """
+        CSE pages (one unit each) a category's query plan fetches
+        
+        Args:
+            max_articles: Articles the caller wants
+            affordable: Units the caller may still spend today (None = no limit)
+            
+        Returns:
+            Number of pages, at least 1
+        """
+        wanted = max(1, math.ceil(max_articles * self.query_plan_overfetch))
+        pages = min(math.ceil(wanted / CSE_PAGE_SIZE), CSE_MAX_RESULTS // CSE_PAGE_SIZE)
+        if affordable is not None:
+            pages = min(pages, affordable)
+        return max(1, pages)
+    
+    async def _affordable_search_units(self, quota: Optional[QuotaContext]) -> Optional[int]:
+        """
+        Units the caller's priority may still spend today
+        
+        Returns:
+            Remaining units, or None when searches spend no quota (or usage is unreadable)
+        """
+        if not self.spends_search_quota():
+            return None
+        try:
+            return await asyncio.to_thread(self.quota_manager.remaining, (quota or QuotaContext()).priority)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read remaining CSE quota: {e}")
+            return None
+    
+    def get_quota_stats(self) -> Dict[str, Any]:
+        """
+        Get today's CSE quota usage by country, route and priority
+        
+        Returns:
+            Dictionary with budget, usage breakdown and admission counters
+        """
+        return self.quota_manager.get_stats()
 
     def _get_country_name(self, country_code: str) -> str:
         """
@@ -858,20 +1330,15 @@ class NewsService:
         }
         return country_map.get(country_code.upper(), country_code)
 
-    def _wait_for_rate_limit(self):
-        """
-        Simple rate limiting to prevent API abuse
-        Ensures minimum time between API requests
+    async def _wait_for_rate_limit(self, upstream: str = 'google_cse') -> None:
         """
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        Wait for the upstream's token bucket without blocking the event loop
+        Other users' requests keep running while this one is queued
         
-        # If we made a request too recently, wait
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        Args:
+            upstream: Rate limiter name (see rate_limiter.DEFAULT_LIMITS)
+        """
+        await rate_limiters.acquire(upstream)
 
     def _extract_domain(self, url: str) -> str:
         """
@@ -902,123 +1369,584 @@ class NewsService:
             logger.warning(f"Error parsing domain from {url}: {e}")
             return "News Source"
 
-    async def search_google_news(self, query: str, num_results: int = 10, country_code: str = 'ZW') -> List[NewsSource]:
+    def _normalize_search_key(self, query: str, country_code: str) -> Tuple[str, str]:
+        """
+        Build the key used to recognise identical searches
+        
+        Args:
+            query: Search terms
+            country_code: Country the search is focused on
+            
+        Returns:
+            (lowercased whitespace-collapsed query, uppercased country code)
+        """
+        return (' '.join(query.lower().split()), country_code.upper())
+
+    async def search_google_news(self, query: str, num_results: int = 10, country_code: str = 'ZW', quota: Optional[QuotaContext] = None, budget: Optional[LatencyBudget] = None) -> List[NewsSource]:
         """
         FIXED VERSION: Search Google for news articles using the Custom Search API
         Properly handles Google API response format without parsing errors
         
+        Results are layered for speed and quota:
+        1. Cache - fresh hits return from memory, stale hits return immediately
+           while one background task refreshes them
+        2. Single-flight - identical concurrent searches share one upstream request,
+           and smaller requests slice a larger in-flight one
+        3. Upstream - paged CSE fetch (see _fetch_google_news)
+        
+        Upstream errors - and requests denied by the daily quota - are answered
+        from stale cached data when we have it, and only fall back to mock data
+        when we have nothing.
+        
+        If the latency budget runs out first, the caller gets cached results or the
+        pages fetched so far (possibly none); the fetch itself keeps running and
+        fills the cache for the next request.
+        
         Args:
             query: Search terms to look for
             num_results: Maximum number of results to return
             country_code: Country to focus the search on
+            quota: Route and priority charged for any upstream calls
+            budget: Latency budget of the calling request (None = wait for the fetch)
             
         Returns:
             List of NewsSource objects with raw search results
         """
+        country_name = self._get_country_name(country_code)
+        logger.info(f"🔍 Searching Google for: '{query}' in {country_name} (wanting {num_results} results)")
+        
+        # Check if Google API (or the synthetic provider) is configured
+        if not self._search_configured():
+            logger.warning("⚠️  Google Search API not configured - using mock data")
+            return await self._generate_mock_news_sources(query, num_results, country_name)
+        
         try:
-            country_name = self._get_country_name(country_code)
-            logger.info(f"🔍 Searching Google for: '{query}' in {country_name} (wanting {num_results} results)")
-            
-            # Check if Google API is configured
-            if not self.google_api_key or not self.google_cse_id:
-                logger.warning("⚠️  Google Search API not configured - using mock data")
-                return await self._generate_mock_news_sources(query, num_results, country_name)
-            
-            # Build search parameters for country-focused news
-            params = {
-                'key': self.google_api_key,
-                'cx': self.google_cse_id,
-                'q': f"{query} {country_name} news",  # Include country in search
-                'num': min(num_results, 10),          # Google allows max 10 per request
-                'dateRestrict': 'd7',                 # Last 7 days for fresh content
-                'sort': 'date',                       # Sort by most recent
-                'lr': 'lang_en',                      # English language results
-                'gl': country_code.lower(),           # Geographic location
-                'cr': f'country{country_code.upper()}', # Country restriction
-            }
-            
-            # Apply rate limiting
-            self._wait_for_rate_limit()
-            
-            # Make the API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.google_search_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Debug: Log the raw response structure to understand what we're getting
-                        logger.debug(f"Google API response keys: {list(data.keys())}")
-                        
-                        # Check if we got results
-                        if 'items' not in data:
-                            logger.warning(f"⚠️  No Google search results found for '{query}' in {country_name}")
-                            logger.debug(f"Response data: {data}")
-                            return await self._generate_mock_news_sources(query, num_results, country_name)
-                        
-                        # Convert Google results to our NewsSource format
-                        sources = []
-                        for i, item in enumerate(data['items']):
-                            try:
-                                # CRITICAL FIX: Validate that item is a dictionary before processing
-                                if not isinstance(item, dict):
-                                    logger.warning(f"⚠️  Skipping non-dictionary item {i}: {type(item)} - {item}")
-                                    continue
-                                
-                                # FIXED: Safe extraction of values with proper defaults
-                                title = item.get('title', 'Untitled Article')
-                                link = item.get('link', '')
-                                snippet = item.get('snippet', 'No description available')
-                                
-                                # Validate that we got the essential fields
-                                if not title or not link:
-                                    logger.warning(f"⚠️  Skipping item {i}: missing title or link")
-                                    continue
-                                
-                                # Clean up the title (remove site name suffix if present)
-                                domain = self._extract_domain(link)
-                                if title.endswith(f' - {domain}'):
-                                    title = title[:-len(f' - {domain}')]
-                                
-                                # FIXED: Proper handling of published date
-                                # Google API might have publishedTime in different locations
-                                published_date = None
-                                if 'pagemap' in item and isinstance(item['pagemap'], dict):
-                                    # Check for date in pagemap structure
-                                    metatags = item['pagemap'].get('metatags', [])
-                                    if metatags and isinstance(metatags[0], dict):
-                                        published_date = metatags[0].get('article:published_time') or metatags[0].get('date')
-                                
-                                # Create the NewsSource object with validated data
-                                source = NewsSource(
-                                    url=link,
-                                    title=title,
-                                    snippet=snippet,
-                                    source_name=domain,
-                                    published_date=published_date  # Now properly extracted or None
-                                )
-                                sources.append(source)
-                                logger.debug(f"✅ Processed item {i+1}: {title[:50]}...")
-                                
-                            except Exception as e:
-                                logger.error(f"❌ Error parsing Google search result {i}: {str(e)}")
-                                # Log the problematic item for debugging
-                                logger.debug(f"Problematic item: {item}")
-                                continue  # Skip this item and continue with others
-                        
-                        logger.info(f"✅ Found {len(sources)} Google news sources for '{query}' in {country_name}")
-                        return sources
-                    
-                    else:
-                        logger.error(f"❌ Google Search API error: {response.status}")
-                        error_text = await response.text()
-                        logger.debug(f"API error response: {error_text}")
-                        return await self._generate_mock_news_sources(query, num_results, country_name)
-                        
+            sources = await self._search_sources(query, num_results, country_code, quota, budget)
         except Exception as e:
             logger.error(f"❌ Error searching Google for '{query}': {str(e)}")
             import traceback
             logger.debug(f"Full traceback: {traceback.format_exc()}")
             return await self._generate_mock_news_sources(query, num_results, country_name)
+        
+        # Check if we got results
+        if not sources:
+            logger.warning(f"⚠️  No Google search results found for '{query}' in {country_name}")
+            return await self._generate_mock_news_sources(query, num_results, country_name)
+        
+        logger.info(f"✅ Found {len(sources)} Google news sources for '{query}' in {country_name}")
+        return sources
+
+    async def _search_sources(self, query: str, num_results: int, country_code: str, quota: Optional[QuotaContext] = None, budget: Optional[LatencyBudget] = None) -> List[NewsSource]:
+        """
+        Search through the cache, single-flight and upstream layers - never mock data
+        
+        Used by search_google_news and by each sub-query of a category plan, where
+        an empty or failed sub-query must stay empty rather than be filled with
+        made-up stories.
+        
+        Args:
+            query: Search terms to look for
+            num_results: Maximum number of results to return
+            country_code: Country to focus the search on
+            quota: Route and priority charged for any upstream calls
+            budget: Latency budget of the calling request (None = wait for the fetch)
+            
+        Returns:
+            Search results (possibly empty), or the partial/cached results if the
+            latency budget ran out
+            
+        Raises:
+            UpstreamError, QuotaExceededError, ...: If the search failed and there
+            is no stale cached data to answer with
+        """
+        key = self._normalize_search_key(query, country_code)
+        quota = quota or QuotaContext()
+        
+        # Background revalidation of stale entries is charged at background priority
+        refresh_quota = QuotaContext(route=f"{quota.route}:refresh", priority=max(quota.priority, PRIORITY_BACKGROUND))
+        
+        lookup = asyncio.ensure_future(self.search_cache.get_or_fetch(
+            key,
+            num_results,
+            lambda count: self._coalesced_fetch(key, query, count, country_code, quota),
+            refresh_fetch=lambda count: self._coalesced_fetch(key, query, count, country_code, refresh_quota)
+        ))
+        
+        if budget is not None:
+            await asyncio.wait({lookup}, timeout=budget.remaining())
+            if not lookup.done():
+                # Out of time - answer with what we have and let the fetch finish in the background
+                lookup.add_done_callback(lambda task: task.cancelled() or task.exception())
+                partial = self._partial_search_results(key, num_results)
+                logger.warning(
+                    f"⏱️ Latency budget '{budget.name}' ({budget.total:.1f}s) ran out searching "
+                    f"'{query}' - returning {len(partial)} partial/cached results"
+                )
+                return partial
+        return await lookup
+
+    async def _coalesced_fetch(self, key: Tuple[str, str], query: str, num_results: int, country_code: str, quota: QuotaContext) -> List[NewsSource]:
+        """
+        Fetch through the single-flight layer, retrying on our own quota if needed
+        
+        A caller that joined an in-flight fetch started at a lower priority (a
+        background refresh, a debug call) shares that fetch's quota admission. If
+        the lower share was used up, the caller fetches again as leader under its
+        own priority, so a user request can still spend the user reserve.
+        
+        Args:
+            key: Normalized (query, country) search key
+            query: Search terms to look for
+            num_results: Maximum number of results to return
+            country_code: Country to focus the search on
+            quota: Route and priority charged for the CSE calls
+            
+        Returns:
+            List of NewsSource objects
+            
+        Raises:
+            QuotaExceededError: If the daily budget does not admit the caller's own priority
+        """
+        try:
+            return await self.search_flight.do(
+                key,
+                num_results,
+                lambda flight_count: self._fetch_and_persist(key, query, flight_count, country_code, quota)
+            )
+        except QuotaExceededError as denied:
+            if denied.priority <= quota.priority:
+                raise
+            logger.info(f"🎟️ Shared fetch for '{query}' was denied at lower priority - retrying on our own quota")
+            # Keyed by priority so we cannot join another lower-priority fetch
+            return await self.search_flight.do(
+                key + (quota.priority,),
+                num_results,
+                lambda flight_count: self._fetch_and_persist(key, query, flight_count, country_code, quota)
+            )
+
+    def _partial_search_results(self, key: Tuple[str, str], num_results: int) -> List[NewsSource]:
+        """
+        Best results available right now for a search that is still being fetched
+        
+        Args:
+            key: Normalized (query, country) search key
+            num_results: Maximum number of results to return
+            
+        Returns:
+            Cached results (any age within stale-if-error), else the pages fetched
+            so far by the in-flight request, else an empty list
+        """
+        entry = self.search_cache.get(key)
+        if entry is not None and entry.age < self.search_cache.stale_if_error_ttl and entry.value:
+            return entry.value[:num_results]
+        
+        progress = self._fetch_progress.get(key)
+        if progress:
+            return self._merge_cse_pages(dict(progress))[:num_results]
+        return []
+
+    async def _fetch_and_persist(self, key: Tuple[str, str], query: str, num_results: int, country_code: str, quota: QuotaContext) -> List[NewsSource]:
+        """
+        Fetch from Google and write the parsed batch through to the persistent store
+        
+        Args:
+            key: Normalized (query, country) search key
+            query: Search terms to look for
+            num_results: Maximum number of results to return
+            country_code: Country to focus the search on
+            quota: Route and priority charged for the CSE calls
+            
+        Returns:
+            List of NewsSource objects
+        """
+        # Publish pages as they arrive so budget-limited callers can use them
+        progress: Dict[int, List[NewsSource]] = {}
+        self._fetch_progress[key] = progress
+        try:
+            sources = await self._fetch_google_news(query, num_results, country_code, quota, progress)
+        finally:
+            if self._fetch_progress.get(key) is progress:
+                del self._fetch_progress[key]
+        
+        # An empty batch would be served as a warm hit after a restart and hide the
+        # live source until it expired - only persist batches with results
+        if not sources:
+            logger.debug(f"💾 Not persisting empty batch for '{query}' ({country_code})")
+            return sources
+        
+        query_key, country = key
+        await self.result_store.asave_batch(
+            country,
+            query_key,
+            num_results,
+            [asdict(source) for source in sources]
+        )
+        return sources
+
+    async def _fetch_google_news(self, query: str, num_results: int, country_code: str, quota: QuotaContext, progress: Optional[Dict[int, List[NewsSource]]] = None) -> List[NewsSource]:
+        """
+        Fetch results straight from the Custom Search API (no cache, no coalescing)
+        
+        CSE returns at most 10 results per request, so larger requests are split
+        into pages (start=1, 11, 21, ...) that are fetched concurrently.
+        
+        Args:
+            query: Search terms to look for
+            num_results: Maximum number of results to return
+            country_code: Country to focus the search on
+            quota: Route and priority charged for the CSE calls
+            progress: Optional dict filled with each page's results as it arrives
+            
+        Returns:
+            List of NewsSource objects (empty if Google found nothing)
+            
+        Raises:
+            UpstreamError: If the Google API returns an error
+            QuotaExceededError: If the daily budget does not admit the first page
+        """
+        country_name = self._get_country_name(country_code)
+        
+        # Build search parameters for country-focused news
+        # ('num' and 'start' are filled in per page by _fetch_cse_pages)
+        params = {
+            'key': self.google_api_key,
+            'cx': self.google_cse_id,
+            'q': f"{query} {country_name} news",  # Include country in search
+            'dateRestrict': 'd7',                 # Last 7 days for fresh content
+            'sort': 'date',                       # Sort by most recent
+            'lr': 'lang_en',                      # English language results
+            'gl': country_code.lower(),           # Geographic location
+            'cr': f'country{country_code.upper()}', # Country restriction
+        }
+        
+        return await self._fetch_cse_pages(params, num_results, country_code, quota, progress)
+
+    def _plan_cse_pages(self, num_results: int) -> List[Tuple[int, int]]:
+        """
+        Work out which CSE pages are needed for a request
+        
+        Args:
+            num_results: Number of results wanted
+            
+        Returns:
+            List of (start, num) pairs, e.g. 25 -> [(1, 10), (11, 10), (21, 5)]
+        """
+        wanted = max(1, min(num_results, CSE_MAX_RESULTS))
+        pages = []
+        for start in range(1, wanted + 1, CSE_PAGE_SIZE):
+            pages.append((start, min(CSE_PAGE_SIZE, wanted - start + 1)))
+        return pages
+
+    async def _fetch_cse_pages(self, params: Dict[str, Any], num_results: int, country_code: str, quota: QuotaContext, progress: Optional[Dict[int, List[NewsSource]]] = None) -> List[NewsSource]:
+        """
+        Fetch all planned CSE pages concurrently and merge them in rank order
+        
+        Pages queue on the CSE rate limiter, so once enough unique results have
+        arrived the pages still waiting are cancelled before they spend quota.
+        A short page means Google has no more results, so later pages are dropped too.
+        
+        Args:
+            params: Base CSE query parameters (without 'start'/'num')
+            num_results: Number of unique results wanted
+            country_code: Country the quota units are charged to
+            quota: Route and priority charged for each page
+            progress: Optional dict filled with each page's results as it arrives
+            
+        Returns:
+            Deduplicated NewsSource list in page order (at most num_results)
+            
+        Raises:
+            UpstreamError: If the first page fails (nothing to fall back on)
+        """
+        pages = self._plan_cse_pages(num_results)
+        tasks = {
+            asyncio.ensure_future(self._fetch_cse_page(params, start, num, country_code, quota)): start
+            for start, num in pages
+        }
+        results_by_start: Dict[int, List[NewsSource]] = progress if progress is not None else {}
+        last_start = pages[-1][0]
+        
+        try:
+            pending = set(tasks.keys())
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start = tasks[task]
+                    try:
+                        page_sources = task.result()
+                    except Exception as page_error:
+                        # The first page is essential - later pages are best effort
+                        if start == 1:
+                            raise
+                        logger.warning(f"⚠️  CSE page start={start} failed: {page_error}")
+                        continue
+                    
+                    results_by_start[start] = page_sources
+                    
+                    # A short page is the end of Google's result list
+                    expected = dict(pages)[start]
+                    if len(page_sources) < expected:
+                        last_start = min(last_start, start)
+                
+                # Drop pages beyond the end of the result list
+                for task in list(pending):
+                    if tasks[task] > last_start:
+                        task.cancel()
+                        pending.discard(task)
+                
+                # Stop early once the completed pages cover the request
+                if len(self._merge_cse_pages(results_by_start)) >= num_results:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        merged = self._merge_cse_pages(results_by_start)
+        logger.debug(f"📄 CSE pages fetched: {sorted(results_by_start.keys())} -> {len(merged)} unique results")
+        return merged[:num_results]
+
+    def _merge_cse_pages(self, results_by_start: Dict[int, List[NewsSource]]) -> List[NewsSource]:
+        """
+        Merge fetched pages in rank order, dropping duplicate URLs
+        
+        URLs are compared in canonical form, so tracking-parameter and
+        www./mobile variants of the same page count as duplicates.
+        
+        Args:
+            results_by_start: Page results keyed by their CSE start offset
+            
+        Returns:
+            Deduplicated list of NewsSource objects
+        """
+        merged = []
+        seen_urls = set()
+        for start in sorted(results_by_start.keys()):
+            for source in results_by_start[start]:
+                url_key = canonicalize_url(source.url)
+                if url_key in seen_urls:
+                    continue
+                seen_urls.add(url_key)
+                merged.append(source)
+        return merged
+
+    async def _fetch_cse_page(self, params: Dict[str, Any], start: int, num: int, country_code: str, quota: QuotaContext) -> List[NewsSource]:
+        """
+        Fetch and parse a single page of CSE results
+        
+        Args:
+            params: Base CSE query parameters
+            start: 1-based index of the first result on this page
+            num: Number of results on this page (max 10)
+            country_code: Country the quota unit is charged to
+            quota: Route and priority charged for this page
+            
+        Returns:
+            Parsed NewsSource objects for this page (empty if Google has no items)
+            
+        Raises:
+            UpstreamError: If Google returns a non-200 status
+            QuotaExceededError: If the daily budget does not admit this page
+            CircuitOpenError: If Google has been failing and the circuit is open
+        """
+        # Fail fast while Google is failing - the cache answers with stale data
+        breaker = circuit_breakers.get('google_cse')
+        is_probe = breaker.before_call()
+        
+        page_params = dict(params)
+        page_params['num'] = num        # Google allows max 10 per request
+        page_params['start'] = start    # 1-based offset of this page
+        
+        # User-facing pages that are slower than our p95 get one hedged duplicate
+        # (costs one more quota unit, so background work never hedges). The hedge
+        # clock starts once the page holds its rate-limit token and quota unit, so
+        # a page that is only queued behind the limiter is never hedged.
+        admitted = asyncio.Event()
+        try:
+            data = await hedged_call(
+                lambda: self._request_cse_page(page_params, country_code, quota, breaker, admitted),
+                latency_trackers.get('google_cse'),
+                hedge=self.hedge_requests and quota.priority == PRIORITY_USER,
+                admitted=admitted
+            )
+        finally:
+            # A probe answered from the HTTP cache, denied by the quota or cancelled by
+            # the latency budget recorded no outcome - let the next request probe
+            if is_probe:
+                breaker.release_probe()
+        
+        # Debug: Log the raw response structure to understand what we're getting
+        logger.debug(f"Google API response keys (start={start}): {list(data.keys())}")
+        
+        if 'items' not in data:
+            logger.debug(f"Response data: {data}")
+            return []
+        
+        return self._parse_cse_items(data['items'], country_code)
+
+    async def _request_cse_page(self, page_params: Dict[str, Any], country_code: str, quota: QuotaContext, breaker: CircuitBreaker, admitted: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """
+        Send one CSE request and return its decoded JSON body
+        
+        Args:
+            page_params: Complete query parameters for this page
+            country_code: Country the quota unit is charged to
+            quota: Route and priority charged for this request
+            breaker: The google_cse circuit breaker to report the outcome to
+            admitted: Set once the request holds its rate-limit token and quota unit
+            
+        Returns:
+            Decoded CSE response
+            
+        Raises:
+            UpstreamError: If Google returns a non-200 status
+            QuotaExceededError: If the daily budget does not admit this request
+        """
+        if self.synthetic_provider is not None:
+            return await self._request_synthetic_page(page_params, breaker, admitted)
+        
+        async def before_network() -> None:
+            # Apply rate limiting (async token bucket - never blocks the event loop)
+            await self._wait_for_rate_limit('google_cse')
+            
+            # Spend one unit of today's CSE budget (only after the rate limiter,
+            # so pages cancelled while queued never cost quota)
+            await self.quota_manager.acquire(1, country_code, quota)
+            if admitted is not None:
+                admitted.set()
+        
+        # Make the API request over the shared pooled session, through the HTTP cache
+        # (a response Google marks as still fresh costs neither a token nor quota)
+        session = self.http_pool.get_session()
+        try:
+            response = await http_cache.get(
+                session,
+                self.google_search_url,
+                params=page_params,
+                timeout=aiohttp.ClientTimeout(total=self.cse_request_timeout),
+                before_network=before_network
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            breaker.record_failure()
+            raise
+        
+        if response.status != 200:
+            logger.error(f"❌ Google Search API error: {response.status}")
+            error_text = response.text()
+            logger.debug(f"API error response: {error_text}")
+            # Only 429/5xx mean Google is in trouble; other 4xx are our request
+            if is_failure_status(response.status):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise UpstreamError('google_cse', response.status, error_text[:200])
+        
+        if response.from_network:
+            breaker.record_success()
+        return response.json()
+
+    async def _request_synthetic_page(self, page_params: Dict[str, Any], breaker: CircuitBreaker, admitted: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """
+        Answer one CSE page from the synthetic provider
+        
+        Goes through the same rate limiter, circuit breaker and error handling as a
+        real request, but spends no Google quota and bypasses the HTTP cache.
+        
+        Args:
+            page_params: Complete query parameters for this page
+            breaker: The google_cse circuit breaker to report the outcome to
+            admitted: Set once the request holds its rate-limit token
+            
+        Returns:
+            Decoded CSE-shaped response
+            
+        Raises:
+            UpstreamError: If the provider injects an error status
+        """
+        await self._wait_for_rate_limit('google_cse')
+        if admitted is not None:
+            admitted.set()
+        
+        try:
+            status, data = await self.synthetic_provider.search(page_params, timeout=self.cse_request_timeout)
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            raise
+        
+        if status != 200:
+            logger.error(f"❌ Synthetic search provider error: {status}")
+            if is_failure_status(status):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise UpstreamError('google_cse', status, str(data.get('error', {}).get('message', ''))[:200])
+        
+        breaker.record_success()
+        return data
+
+    def _parse_cse_items(self, items: List[Any], country_code: Optional[str] = None) -> List[NewsSource]:
+        """
+        Convert raw CSE result items into NewsSource objects
+        
+        Args:
+            items: The 'items' list from a CSE response
+            country_code: Country the search was focused on (decides day/month order of numeric dates)
+            
+        Returns:
+            List of valid NewsSource objects (bad items are skipped)
+        """
+        dayfirst = dayfirst_for_country(country_code)
+        sources = []
+        for i, item in enumerate(items):
+            try:
+                # CRITICAL FIX: Validate that item is a dictionary before processing
+                if not isinstance(item, dict):
+                    logger.warning(f"⚠️  Skipping non-dictionary item {i}: {type(item)} - {item}")
+                    continue
+                
+                # FIXED: Safe extraction of values with proper defaults
+                title = item.get('title', 'Untitled Article')
+                link = item.get('link', '')
+                snippet = item.get('snippet', 'No description available')
+                
+                # Validate that we got the essential fields
+                if not title or not link:
+                    logger.warning(f"⚠️  Skipping item {i}: missing title or link")
+                    continue
+                
+                # Clean up the title (remove site name suffix if present)
+                domain = self._extract_domain(link)
+                if title.endswith(f' - {domain}'):
+                    title = title[:-len(f' - {domain}')]
+                
+                # FIXED: Proper handling of published date
+                # Google API might have publishedTime in different locations
+                published_date = None
+                if 'pagemap' in item and isinstance(item['pagemap'], dict):
+                    # Check for date in pagemap structure
+                    metatags = item['pagemap'].get('metatags', [])
+                    if metatags and isinstance(metatags[0], dict):
+                        published_date = metatags[0].get('article:published_time') or metatags[0].get('date')
+                
+                # Create the NewsSource object with validated data
+                source = NewsSource(
+                    url=link,
+                    title=title,
+                    snippet=snippet,
+                    source_name=domain,
+                    published_date=published_date,  # Now properly extracted or None
+                    published_ts=parse_publish_time(published_date, dayfirst)  # Normalized once, here
+                )
+                sources.append(source)
+                logger.debug(f"✅ Processed item {i+1}: {title[:50]}...")
+                
+            except Exception as e:
+                logger.error(f"❌ Error parsing Google search result {i}: {str(e)}")
+                # Log the problematic item for debugging
+                logger.debug(f"Problematic item: {item}")
+                continue  # Skip this item and continue with others
+        
+        return sources
 
     async def _generate_mock_news_sources(self, query: str, num_results: int, country_name: str) -> List[NewsSource]:
         """
@@ -1042,25 +1970,54 @@ class NewsService:
                 'National Gazette', 'Express News', 'Observer Daily', 'Standard Times'
             ]
             
+            # One angle per outlet, so mock stories stay distinct and are not
+            # clustered together as near-duplicates of one syndicated story
+            mock_angles = [
+                ("{country}: Latest Developments in {topic}",
+                 "Recent updates on {query} in {country} with significant implications for local communities and policy development."),
+                ("Officials Respond to Questions Over {topic} in {country}",
+                 "Government spokespeople addressed reporters on Tuesday, promising a detailed statement within the week."),
+                ("Residents Weigh In: What {topic} Means for Families",
+                 "Households interviewed across several provinces described rising costs and uncertainty about the months ahead."),
+                ("Analysis - Five Numbers That Explain {topic}",
+                 "Economists point to inflation, employment and regional trade figures when explaining where the trend is heading."),
+                ("Opposition Demands Inquiry as {topic} Debate Heats Up",
+                 "Critics told parliament an independent review was needed before any further decisions are taken."),
+                ("Regional Leaders Meet to Discuss {topic}",
+                 "Neighbouring governments sent delegations to a two-day summit hosted in the capital this weekend."),
+                ("Timeline: How {topic} Unfolded Over the Past Year",
+                 "From early warnings last spring to this month's announcements, we trace each turning point of the story."),
+                ("Experts Urge Caution on {topic} Forecasts",
+                 "University researchers warn that early projections often change once complete data becomes available.")
+            ]
+            
+            # Stable publish times (the top of the current hour, a few minutes apart per
+            # story) so unchanged mock stories keep their seen keys and delta identity
+            # instead of looking new on every request
+            anchor_ts = int(time.time()) // MOCK_PUBLISH_ANCHOR_SECONDS * MOCK_PUBLISH_ANCHOR_SECONDS
+            
             sources = []
             for i in range(min(num_results, 8)):  # Limit to 8 mock sources
                 try:
                     source_name = mock_sources[i % len(mock_sources)]
                     
                     # Create realistic titles and snippets based on query and country
-                    title = f"{country_name} {query.title()}: Latest Developments Reported"
-                    snippet = f"Recent updates on {query} in {country_name} with significant implications for local communities and policy development. Full coverage and analysis available."
+                    title_template, snippet_template = mock_angles[i % len(mock_angles)]
+                    title = title_template.format(country=country_name, topic=query.title())
+                    snippet = snippet_template.format(country=country_name, query=query)
                     
                     # Generate a realistic mock URL
                     clean_query = query.lower().replace(' ', '-')
                     url = f"https://{source_name.lower().replace(' ', '')}.com/{clean_query}-{country_name.lower()}-{i+1}"
                     
+                    published_ts = anchor_ts - i * 300
                     source = NewsSource(
                         url=url,
                         title=title,
                         snippet=snippet,
                         source_name=source_name,
-                        published_date=datetime.now().isoformat()
+                        published_date=datetime.fromtimestamp(published_ts).isoformat(),
+                        published_ts=published_ts
                     )
                     sources.append(source)
                     
@@ -1080,6 +2037,9 @@ class NewsService:
         Create an enhanced summary using OpenAI GPT
         Falls back to basic summary if AI is not available
         
+        Single-article shortcut into the batched summarization stage
+        (see SummarizationService); article lists should call it directly.
+        
         Args:
             source: The news source to summarize
             category: The news category for context
@@ -1087,53 +2047,8 @@ class NewsService:
         Returns:
             Enhanced summary text with embedded links
         """
-        # try:
-        #     if not self.openai_available:
-        #         return self._create_basic_summary(source)
-            
-        #     # Import OpenAI here to avoid import errors if not installed
-        #     import openai
-            
-        #     # Create a prompt for GPT to enhance the summary
-        #     prompt = f"""
-        #     Create an engaging news summary for this article:
-            
-        #     Title: {source.title}
-        #     Snippet: {source.snippet}
-        #     Source: {source.source_name}
-        #     Category: {category}
-            
-        #     Requirements:
-        #     1. Write 2-3 informative sentences (80-120 words)
-        #     2. Make it engaging and newsworthy
-        #     3. Include key facts from the snippet
-        #     4. End with: "Clic) the card to learn more about this story and have a discussion with Mam'gobozi"
-        #     5. Focus on what readers need to know
-            
-        #     Write the summary now:
-        #     """
-            
-            # Call OpenAI API
-            # response = await asyncio.get_event_loop().run_in_executor(
-            #     None,  # Use default executor
-            #     lambda: openai.ChatCompletion.create(
-            #         model="gpt-3.5-turbo",
-            #         messages=[
-            #             {"role": "system", "content": "You are a professional news editor. Create clear, engaging summaries that make one want to know more about the news article, kind of like newspaper fromnt page summaries."},
-            #             {"role": "user", "content": prompt}
-            #         ],
-            #         max_tokens=150,
-            #         temperature=0.7
-            #     )
-            # )
-            
-            # enhanced_summary = response.choices[0].message.content.strip()
-            # logger.debug(f"✅ AI-enhanced summary created for: {source.title}")
-            # return enhanced_summary
-            
-        # except Exception as e:
-        #     logger.warning(f"⚠️  AI enhancement failed for '{source.title}': {e}")
-        return self._create_basic_summary(source)
+        summaries = await self.summarizer.summarize([source], category)
+        return summaries[0]
 
     def _create_basic_summary(self, source: NewsSource) -> str:
         """
@@ -1176,31 +2091,39 @@ class NewsService:
         minutes = max(1, round(words / 200))  # Minimum 1 minute
         return f"{minutes} min read"
 
-    def _detect_breaking_news(self, title: str, snippet: str) -> bool:
+    def _detect_breaking_news(self, title: str, snippet: str, country_code: Optional[str] = None) -> bool:
         """
         Detect if news should be marked as breaking based on keywords
         
+        Rules (global and per-country phrases) come from the breaking news
+        classifier's hot-reloadable rule file; lists of articles should use
+        _detect_breaking_news_batch instead.
+        
         Args:
             title: Article title
             snippet: Article snippet/description
+            country_code: Country the article was fetched for
             
         Returns:
             True if article appears to be breaking news
         """
-        # Validate inputs
-        if not isinstance(title, str):
-            title = ""
-        if not isinstance(snippet, str):
-            snippet = ""
-        
-        # Keywords that indicate breaking news
-        breaking_keywords = [
-            'breaking news', 'Blessd Geza', 'Army'
-        ]
+        return breaking_news_classifier.classify(title, snippet, country_code)
+    
+    def _detect_breaking_news_batch(self, sources: List[NewsSource], country_code: Optional[str] = None) -> List[bool]:
+        """
+        Flag breaking news for a whole list of sources in one pass
         
-        # Check both title and snippet for breaking news indicators
-        text_to_check = (title + ' ' + snippet).lower()
-        return any(keyword in text_to_check for keyword in breaking_keywords)
+        Args:
+            sources: Sources to classify
+            country_code: Country the sources were fetched for
+            
+        Returns:
+            One breaking flag per source, in order
+        """
+        return breaking_news_classifier.classify_batch(
+            [(source.title, source.snippet) for source in sources],
+            country_code
+        )
 
     def _format_category_for_frontend(self, category: str) -> str:
         """
@@ -1229,7 +2152,7 @@ class NewsService:
         
         return category_mapping.get(category.lower(), category.title())
 
-    async def get_news_for_category(self, category: str, max_articles: int = 12, country_code: str = 'ZW') -> List[ProcessedArticle]:
+    async def get_news_for_category(self, category: str, max_articles: int = 12, country_code: str = 'ZW', quota: Optional[QuotaContext] = None, budget: Optional[LatencyBudget] = None) -> List[ProcessedArticle]:
         """
         Get processed news articles for a specific category
         Creates individual articles for each news source found
@@ -1238,6 +2161,8 @@ class NewsService:
             category: News category (politics, sports, etc.)
             max_articles: Maximum number of articles to return
             country_code: Country code for localized news
+            quota: Route and priority charged for Google searches
+            budget: Latency budget of the calling request (partial/cached results when it runs out)
             
         Returns:
             List of ProcessedArticle objects ready for the frontend
@@ -1246,43 +2171,56 @@ class NewsService:
             country_name = self._get_country_name(country_code)
             logger.info(f"📡 Getting {category} news for {country_name} (max: {max_articles})")
             
-            # Country-focused search queries for better local relevance
-            search_queries = {
-                'politics': f'{country_name} politics government parliament election policy minister president',
-                'sports': f'{country_name} sports cricket rugby football soccer national team league',
-                'health': f'{country_name} health medical healthcare hospitals clinics ministry wellness',
-                'business': f'{country_name} business economy stock exchange mining agriculture trade investment',
-                'technology': f'{country_name} technology innovation digital transformation ICT startups internet',
-                'local-trends': f'{country_name} trending social media local news events culture lifestyle',
-                'weather': f'{country_name} weather climate forecast rain season agriculture farming',
-                'entertainment': f'{country_name} entertainment music movies celebrities arts culture festivals',
-                'education': f'{country_name} education schools universities students academic results ministry'
-            }
-            
-            # Get the appropriate search query, with fallback
-            query = search_queries.get(category, f'{country_name} {category} news')
-            
-            # Search for news sources using Google
-            sources = await self.search_google_news(query, max_articles * 2, country_code)
+            if self.query_plan_enabled and self._search_configured():
+                # Several focused sub-queries, fused by rank
+                search = self._search_with_query_plan(category, max_articles, country_code, quota, budget)
+            else:
+                # Country-focused search query for better local relevance, with fallback
+                terms = CATEGORY_SEARCH_TERMS.get(category, '{country} ' + category + ' news')
+                query = terms.format(country=country_name)
+                search = self.search_google_news(query, max_articles, country_code, quota, budget)
+            
+            # Search Google (paged beyond CSE's 10-result cap) and read publisher feeds at the same time
+            search_sources, feed_sources = await asyncio.gather(
+                search,
+                self._get_feed_sources(category, country_code, max_articles, budget)
+            )
+            
+            # Without Google configured, search results are mock data - real feed entries replace them
+            if feed_sources and not self._search_configured():
+                search_sources = []
+            
+            sources = self._interleave_sources(search_sources, feed_sources)
             
             if not sources:
                 logger.warning(f"⚠️  No sources found for {category} in {country_name}")
                 return []
             
-            # Process each source into a complete article
-            processed_articles = []
+            # One article per story: syndicated copies become its linked sources
+            clusters = self._collapse_near_duplicates(sources)
+            
+            clusters = clusters[:max_articles]  # Limit to requested number
+            
+            # Stories this feed has already processed (same URL and publish date) are reused as-is
+            seen = self._seen_articles.setdefault((category, country_code), {})
+            keys = [(article_id_for_url(source.url), source.published_ts) for source, _ in clusters]
+            new_clusters = [(key, cluster) for key, cluster in zip(keys, clusters) if key not in seen]
             
-            for i, source in enumerate(sources[:max_articles]):  # Limit to requested number
+            # Summarize every new story at once (batched AI calls, basic summaries as fallback)
+            leaders = [source for _, (source, _) in new_clusters]
+            summaries = await self.summarizer.summarize(leaders, category, budget)
+            
+            # Detect breaking news for all new stories in one pass
+            breaking_flags = self._detect_breaking_news_batch(leaders, country_code)
+            
+            # Process each new story into a complete article
+            fresh_articles: Dict[Tuple[str, Optional[int]], ProcessedArticle] = {}
+            
+            for i, ((key, (source, duplicates)), summary, is_breaking) in enumerate(zip(new_clusters, summaries, breaking_flags)):
                 try:
-                    # Detect if this is breaking news
-                    is_breaking = self._detect_breaking_news(source.title, source.snippet)
-                    
-                    # Create enhanced summary (with AI if available)
-                    summary = await self._create_enhanced_summary_with_ai(source, category)
-                    
                     # Create the processed article object
                     processed_article = ProcessedArticle(
-                        id=f"{category}_{country_code}_{i}_{int(time.time())}",  # Unique ID
+                        id=article_id_for_url(source.url),                       # Stable ID from the canonical URL
                         title=source.title,                                      # Original news title
                         summary=summary,                                         # Enhanced summary
                         category=self._format_category_for_frontend(category),  # Frontend-friendly category
@@ -1292,16 +2230,30 @@ class NewsService:
                         imageUrl=None,                                          # Could be enhanced with image extraction
                         sourceUrl=source.url,                                   # Original article URL
                         source=source.source_name,                             # News source name
-                        linked_sources=[source.url]                            # List of related URLs
+                        linked_sources=(source.url, *(d.url for d in duplicates)),  # This story from every outlet
+                        publishedAt=source.published_ts                         # Publish time (epoch seconds)
                     )
                     
-                    processed_articles.append(processed_article)
+                    fresh_articles[key] = processed_article
                     logger.debug(f"✅ Processed article {i+1}: {source.title[:50]}...")
                     
                 except Exception as e:
                     logger.error(f"❌ Error processing article {i} for {category}: {str(e)}")
                     continue  # Skip this article and continue with others
             
+            processed_articles = self._assemble_feed(seen, keys, clusters, fresh_articles)
+            self._incremental_stats['refreshes'] += 1
+            self._incremental_stats['processed'] += len(fresh_articles)
+            self._incremental_stats['reused'] += len(processed_articles) - len(fresh_articles)
+            self._index_by_recency(category, country_code, processed_articles)
+            
+            # Push newly detected breaking stories to the country's live subscribers
+            fresh_ids = {article.id for article in fresh_articles.values()}
+            breaking_news_broadcaster.publish(
+                country_code,
+                [article for article in processed_articles if article.isBreaking and article.id in fresh_ids]
+            )
+            
             logger.info(f"✅ Successfully processed {len(processed_articles)} {category} articles for {country_name}")
             return processed_articles
             
@@ -1309,17 +2261,397 @@ class NewsService:
             logger.error(f"❌ Error getting {category} news for {country_code}: {str(e)}")
             return []
 
-    async def search_news(self, query: str, max_articles: int = 20, country_code: str = 'ZW') -> List[Dict[str, Any]]:
+    async def get_all_categories_news(
+        self,
+        max_per_category: int = 6,
+        country_code: str = 'ZW',
+        categories: Optional[List[str]] = None,
+        deadline_seconds: Optional[float] = None,
+        quota: Optional[QuotaContext] = None,
+        budget: Optional[LatencyBudget] = None
+    ) -> CategoryFanOutResult:
         """
-        Search for news articles by keyword and return as dictionaries
+        Get news for several categories concurrently, bounded by a semaphore and an overall deadline
+        Every category shares a latency budget that ends at the deadline, so slow searches return
+        cached or partial results; categories still running shortly after are cancelled and reported
+        as 'timeout'. Their upstream searches keep running and land in the cache for next time
+        
+        Args:
+            max_per_category: Maximum articles per category
+            country_code: Country code for localized news
+            categories: Categories to fetch (defaults to every category in CATEGORY_SEARCH_TERMS)
+            deadline_seconds: Overall time budget (defaults to NEWS_ALL_CATEGORIES_DEADLINE_SECONDS)
+            quota: Route and priority charged for Google searches
+            budget: Latency budget of the calling request (the deadline never exceeds it)
+            
+        Returns:
+            CategoryFanOutResult with the categories that finished and a status for every category
+        """
+        categories = list(categories) if categories is not None else list(CATEGORY_SEARCH_TERMS.keys())
+        deadline = self._fanout_deadline(deadline_seconds, budget)
+        news_by_category: Dict[str, List[ProcessedArticle]] = {}
+        category_status: Dict[str, str] = {}
+        started = time.time()
+        
+        async for outcome in self.iter_categories_news(
+            max_per_category, country_code, categories, deadline, quota
+        ):
+            category_status[outcome.category] = outcome.status
+            if outcome.status in ('ok', 'empty'):
+                news_by_category[outcome.category] = outcome.articles
+        
+        elapsed = time.time() - started
+        timed_out = [c for c, status in category_status.items() if status == 'timeout']
+        if timed_out:
+            logger.warning(f"⏱️ Multi-category deadline ({deadline:.1f}s) cut off: {', '.join(timed_out)}")
+        logger.info(
+            f"📊 Multi-category fetch for {country_code}: {len(news_by_category)}/{len(categories)} "
+            f"categories in {elapsed:.2f}s"
+        )
+        
+        return CategoryFanOutResult(
+            news_by_category={c: news_by_category[c] for c in categories if c in news_by_category},
+            category_status={c: category_status[c] for c in categories},
+            elapsed_seconds=elapsed,
+            deadline_hit=bool(timed_out) or elapsed >= deadline
+        )
+
+    def _fanout_deadline(self, deadline_seconds: Optional[float], budget: Optional[LatencyBudget]) -> float:
+        """Overall deadline of a fan-out (never longer than the caller's latency budget)"""
+        deadline = deadline_seconds if deadline_seconds is not None else self.fanout_deadline
+        if budget is not None:
+            deadline = min(deadline, budget.remaining())
+        return deadline
+
+    async def iter_categories_news(
+        self,
+        max_per_category: int = 6,
+        country_code: str = 'ZW',
+        categories: Optional[List[str]] = None,
+        deadline_seconds: Optional[float] = None,
+        quota: Optional[QuotaContext] = None,
+        budget: Optional[LatencyBudget] = None
+    ) -> AsyncIterator[CategoryOutcome]:
+        """
+        Fetch several categories concurrently and yield each one the moment it finishes
+        
+        Same semaphore, shared latency budget and deadline as get_all_categories_news;
+        categories still running at the cut-off are cancelled and yielded last with
+        status 'timeout'. Closing the iterator early (e.g. a client disconnecting
+        from a stream) cancels whatever is still running.
+        
+        Args:
+            max_per_category: Maximum articles per category
+            country_code: Country code for localized news
+            categories: Categories to fetch (defaults to every category in CATEGORY_SEARCH_TERMS)
+            deadline_seconds: Overall time budget (defaults to NEWS_ALL_CATEGORIES_DEADLINE_SECONDS)
+            quota: Route and priority charged for Google searches
+            budget: Latency budget of the calling request (the deadline never exceeds it)
+            
+        Yields:
+            CategoryOutcome per category, in completion order
+        """
+        categories = list(categories) if categories is not None else list(CATEGORY_SEARCH_TERMS.keys())
+        deadline = self._fanout_deadline(deadline_seconds, budget)
+        category_budget = LatencyBudget(deadline, name=f"all_categories:{country_code}")
+        semaphore = asyncio.Semaphore(self.fanout_concurrency)
+        started = time.time()
+        
+        async def fetch_category(category: str) -> List[ProcessedArticle]:
+            async with semaphore:
+                return await self.get_news_for_category(category, max_per_category, country_code, quota, category_budget)
+        
+        tasks = {asyncio.ensure_future(fetch_category(category)): category for category in categories}
+        order = {category: position for position, category in enumerate(categories)}
+        pending = set(tasks)
+        cutoff = started + deadline + FANOUT_GRACE_SECONDS
+        
+        try:
+            while pending:
+                remaining = cutoff - time.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda task: order[tasks[task]]):
+                    category = tasks[task]
+                    if task.exception() is not None:
+                        logger.warning(f"⚠️ {category} failed in multi-category fetch: {task.exception()}")
+                        yield CategoryOutcome(category, [], 'error', time.time() - started)
+                        continue
+                    articles = task.result()
+                    yield CategoryOutcome(category, articles, 'ok' if articles else 'empty', time.time() - started)
+            
+            # Cut off whatever is still running - the dashboard gets what finished in time
+            for task in sorted(pending, key=lambda task: order[tasks[task]]):
+                task.cancel()
+                yield CategoryOutcome(tasks[task], [], 'timeout', time.time() - started)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _search_with_query_plan(self, category: str, max_articles: int, country_code: str, quota: Optional[QuotaContext] = None, budget: Optional[LatencyBudget] = None) -> List[NewsSource]:
+        """
+        Search a category with its query plan and fuse the results
+        
+        One sub-query runs per CSE page the request needs (`max_articles` times
+        `query_plan_overfetch`, up to `query_plan_max_queries`), so a plan costs
+        the same quota as the single paged search it replaces - and fewer
+        sub-queries run when the caller's share of today's quota is nearly spent.
+        Pages that do not divide evenly go to the first (broadest) sub-queries, so
+        the plan fetches exactly the pages it was sized for.
+        
+        They run concurrently, each through the cache, single-flight and upstream
+        layers - so every one is cached, coalesced, rate limited and charged to the
+        quota like any other search. An empty or failed sub-query contributes
+        nothing; mock data is only used when every sub-query came back empty.
+        
+        Args:
+            category: News category
+            max_articles: Articles the caller wants
+            country_code: Country code for localized results
+            quota: Route and priority charged for the searches
+            budget: Latency budget of the calling request
+            
+        Returns:
+            NewsSource objects ranked by reciprocal-rank fusion, each URL once
+        """
+        country_name = self._get_country_name(country_code)
+        pages = self._query_plan_pages(max_articles, await self._affordable_search_units(quota))
+        sub_queries = query_planner.plan(category, country_code, country_name, min(self.query_plan_max_queries, pages))
+        base_pages, extra_pages = divmod(pages, len(sub_queries))
+        
+        results = await asyncio.gather(
+            *(
+                self._search_sources(
+                    sub_query.query,
+                    CSE_PAGE_SIZE * max(1, base_pages + (1 if position < extra_pages else 0)),
+                    country_code, quota, budget
+                )
+                for position, sub_query in enumerate(sub_queries)
+            ),
+            return_exceptions=True
+        )
+        
+        ranked_lists = []
+        for sub_query, result in zip(sub_queries, results):
+            if isinstance(result, Exception):
+                self._query_plan_stats['failed_sub_queries'] += 1
+                logger.warning(f"⚠️ Sub-query '{sub_query.query}' failed: {result}")
+                continue
+            ranked_lists.append(result)
+        
+        fused = reciprocal_rank_fusion(ranked_lists, key=lambda source: canonicalize_url(source.url), k=self.rrf_k)
+        
+        total = sum(len(ranked) for ranked in ranked_lists)
+        self._query_plan_stats['plans'] += 1
+        self._query_plan_stats['sub_queries'] += len(sub_queries)
+        self._query_plan_stats['results'] += total
+        self._query_plan_stats['unique_results'] += len(fused)
+        logger.info(
+            f"🧭 {category}/{country_code}: {len(sub_queries)} sub-queries -> "
+            f"{total} results, {len(fused)} unique after fusion"
+        )
+        
+        if not fused:
+            # Nothing real from any sub-query - same fallback as a single search
+            logger.warning(f"⚠️  No search results for any {category} sub-query in {country_name}")
+            return await self._generate_mock_news_sources(sub_queries[0].query, max_articles, country_name)
+        return fused
+
+    def _assemble_feed(
+        self,
+        seen: Dict[Tuple[str, Optional[int]], ProcessedArticle],
+        keys: List[Tuple[str, Optional[int]]],
+        clusters: List[Tuple[NewsSource, List[NewsSource]]],
+        fresh_articles: Dict[Tuple[str, Optional[int]], ProcessedArticle]
+    ) -> List[ProcessedArticle]:
+        """
+        Put a feed together from newly processed and previously seen articles
+        
+        Reused articles keep their record; only a changed set of linked sources
+        produces a (cheap) copy. Newly processed articles are remembered unless
+        they only got the basic summary while AI summaries are on - those are
+        processed again next time, when the AI summary may be cached.
+        
+        Args:
+            seen: The feed's previously processed articles (updated in place)
+            keys: (article ID, publish time) per cluster
+            clusters: (leader, near duplicates) in feed order
+            fresh_articles: Articles processed in this refresh, by key
+            
+        Returns:
+            Articles in feed order
+        """
+        articles = []
+        for key, (source, duplicates) in zip(keys, clusters):
+            article = fresh_articles.get(key) or seen.get(key)
+            if article is None:
+                continue
+            linked_sources = (source.url, *(d.url for d in duplicates))
+            if article.linked_sources != linked_sources:
+                # More (or fewer) outlets carry the story - same article otherwise
+                article = replace(article, linked_sources=linked_sources)
+            articles.append(article)
+            
+            if key in fresh_articles and self.summarizer.enabled and article.summary == self._create_basic_summary(source):
+                continue
+            # Move to the newest end so stories still in the feed are trimmed last
+            seen.pop(key, None)
+            seen[key] = article
+        
+        while len(seen) > self.seen_articles_per_feed:
+            del seen[next(iter(seen))]
+        return articles
+
+    @staticmethod
+    def _recency_key(article: ProcessedArticle) -> int:
+        """Publish time of an article, or when we first processed it if unknown"""
+        if article.publishedAt is not None:
+            return article.publishedAt
+        try:
+            return int(datetime.fromisoformat(article.timestamp).timestamp())
+        except (TypeError, ValueError):
+            return 0
+
+    def _index_by_recency(self, category: str, country_code: str, articles: List[ProcessedArticle]) -> None:
+        """Add a feed's articles to its recency index (replacing older records of the same story)"""
+        index = self._recency_indexes.get((category, country_code))
+        if index is None:
+            index = self._recency_indexes[(category, country_code)] = RecencyIndex(self.recency_index_size)
+        for article in articles:
+            index.add(article.id, self._recency_key(article), article)
+
+    def get_recent_articles(
+        self,
+        category: str,
+        country_code: str,
+        limit: Optional[int] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        breaking_only: bool = False
+    ) -> List[Tuple[int, ProcessedArticle]]:
+        """
+        Articles a feed has seen, newest published first
+        
+        Reads the feed's recency index only - it does not fetch. Articles with
+        no known publish time are placed at the time they were first processed.
+        
+        Args:
+            category: News category
+            country_code: Country code
+            limit: Most articles to return (None = all matching)
+            since: Earliest publish time in epoch seconds, inclusive
+            until: Latest publish time in epoch seconds, exclusive
+            breaking_only: Only articles flagged as breaking news
+            
+        Returns:
+            List of (publish time, ProcessedArticle), newest first
+        """
+        index = self._recency_indexes.get((category, country_code))
+        if index is None:
+            return []
+        predicate = (lambda article: article.isBreaking) if breaking_only else None
+        return index.between(since, until, limit, predicate)
+
+    def get_recency_stats(self) -> Dict[str, Any]:
+        """
+        Get the size of the per-feed recency indexes
+        
+        Returns:
+            Dictionary with feed count, per-feed limit and total indexed articles
+        """
+        return {
+            'feeds': len(self._recency_indexes),
+            'max_per_feed': self.recency_index_size,
+            'indexed_articles': sum(len(index) for index in self._recency_indexes.values())
+        }
+
+    async def _get_feed_sources(self, category: str, country_code: str, limit: int, budget: Optional[LatencyBudget] = None) -> List[NewsSource]:
+        """
+        Get the newest publisher feed entries for a category as NewsSource objects
+        
+        Args:
+            category: News category
+            country_code: Country code
+            limit: Maximum sources to return
+            budget: Latency budget of the calling request
+            
+        Returns:
+            List of NewsSource objects (empty if RSS ingestion is disabled or fails)
+        """
+        if not self.rss_enabled:
+            return []
+        try:
+            entries = await self.feed_ingestion.get_entries(category, country_code, limit, budget)
+            return [self._news_source_from_dict(entry, country_code) for entry in entries]
+        except Exception as e:
+            logger.warning(f"⚠️ RSS feeds unavailable for {category}/{country_code}: {e}")
+            return []
+
+    def _interleave_sources(self, *source_lists: List[NewsSource]) -> List[NewsSource]:
+        """
+        Merge ranked source lists by taking one from each in turn, dropping duplicate URLs
+        
+        Args:
+            source_lists: Ranked lists (e.g. Google results, feed entries)
+            
+        Returns:
+            Combined list with each URL once (compared in canonical form)
+        """
+        merged = []
+        seen_urls = set()
+        for round_sources in zip_longest(*source_lists):
+            for source in round_sources:
+                if source is None:
+                    continue
+                url_key = canonicalize_url(source.url)
+                if url_key in seen_urls:
+                    continue
+                seen_urls.add(url_key)
+                merged.append(source)
+        return merged
+
+    def _collapse_near_duplicates(self, sources: List[NewsSource]) -> List[Tuple[NewsSource, List[NewsSource]]]:
+        """
+        Group syndicated copies of the same story (MinHash over headline and snippet)
+        
+        Args:
+            sources: Sources in rank order (already deduplicated by URL)
+            
+        Returns:
+            List of (best-ranked source, its near duplicates) in rank order
+        """
+        if not self.near_duplicate_enabled:
+            return [(source, []) for source in sources]
+        
+        clusters = cluster_near_duplicates(
+            sources,
+            lambda source: f"{source.title} {source.snippet}",
+            self.near_duplicate_threshold
+        )
+        
+        collapsed = len(sources) - len(clusters)
+        self._near_duplicate_stats['batches'] += 1
+        self._near_duplicate_stats['sources'] += len(sources)
+        self._near_duplicate_stats['collapsed'] += collapsed
+        if collapsed:
+            logger.info(f"🧬 Collapsed {collapsed} near-duplicate sources into {len(clusters)} stories")
+        return clusters
+
+    async def search_news(self, query: str, max_articles: int = 20, country_code: str = 'ZW', quota: Optional[QuotaContext] = None, budget: Optional[LatencyBudget] = None) -> List[ProcessedArticle]:
+        """
+        Search for news articles by keyword
         
         Args:
             query: Search query string
             max_articles: Maximum number of articles to return
             country_code: Country code for localized results
+            quota: Route and priority charged for Google searches
+            budget: Latency budget of the calling request
             
         Returns:
-            List of article dictionaries (converted from ProcessedArticle objects)
+            List of ProcessedArticle objects (category 'Search Results')
         """
         try:
             country_name = self._get_country_name(country_code)
@@ -1329,28 +2661,34 @@ class NewsService:
             enhanced_query = f'{country_name} {query} news'
             
             # Search for sources
-            sources = await self.search_google_news(enhanced_query, max_articles, country_code)
+            sources = await self.search_google_news(enhanced_query, max_articles, country_code, quota, budget)
             articles = []
             
-            for i, source in enumerate(sources):
+            clusters = self._collapse_near_duplicates(sources)
+            
+            # Summarize all results at once (batched AI calls, basic summaries as fallback)
+            leaders = [source for source, _ in clusters]
+            summaries = await self.summarizer.summarize(leaders, 'search', budget)
+            breaking_flags = self._detect_breaking_news_batch(leaders, country_code)
+            
+            for i, ((source, duplicates), summary, is_breaking) in enumerate(zip(clusters, summaries, breaking_flags)):
                 try:
-                    # Create enhanced summary
-                    summary = await self._create_enhanced_summary_with_ai(source, 'search')
                     
-                    # Convert to dictionary format for search results
-                    article = {
-                        'id': f"search_{country_code}_{abs(hash(query))}_{i}_{int(time.time())}",
-                        'title': source.title,
-                        'summary': summary,
-                        'category': 'Search Results',
-                        'timestamp': datetime.now().isoformat(),
-                        'readTime': self._calculate_reading_time(summary),
-                        'isBreaking': self._detect_breaking_news(source.title, source.snippet),
-                        'imageUrl': None,
-                        'sourceUrl': source.url,
-                        'source': source.source_name,
-                        'linked_sources': [source.url]
-                    }
+                    # Same record type as category feeds, so the search cache can share it
+                    article = ProcessedArticle(
+                        id=article_id_for_url(source.url),
+                        title=source.title,
+                        summary=summary,
+                        category='Search Results',
+                        timestamp=datetime.now().isoformat(),
+                        readTime=self._calculate_reading_time(summary),
+                        isBreaking=is_breaking,
+                        imageUrl=None,
+                        sourceUrl=source.url,
+                        source=source.source_name,
+                        linked_sources=(source.url, *(d.url for d in duplicates)),
+                        publishedAt=source.published_ts
+                    )
                     articles.append(article)
                     
                 except Exception as e:
@@ -0,0 +1,196 @@
+# Backend/app/services/persistent_store.py
+"""
+Persistent Search Result Store
+SQLite-backed store of parsed upstream search batches so a restart or deploy
+starts with a warm cache instead of a burst of CSE calls.
+Safe to share between several uvicorn workers on one host (WAL mode + busy timeout).
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+class SearchResultStore:
+    """
+    Stores batches of search results keyed by (country, query key, fetch time).
+
+    Every method opens its own short-lived connection, so calls are safe from
+    worker threads (asyncio.to_thread) and from separate worker processes.
+    SQLite's WAL journal lets readers run while another process writes.
+    """
+
+    def __init__(self, db_path: str, max_batches_per_key: int = 3):
+        """
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            max_batches_per_key: How many past batches to keep per (country, query)
+        """
+        self.db_path = db_path
+        self.max_batches_per_key = max_batches_per_key
+        self._initialized = False
+
+        # Statistics
+        self._writes = 0
+        self._write_failures = 0
+        self._loaded = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection configured for multi-process use
+
+        Returns:
+            sqlite3.Connection with WAL journaling and a busy timeout
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=10000")
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the table and index if this is a new database"""
+        if self._initialized:
+            return
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_batches (
+                country     TEXT    NOT NULL,
+                query_key   TEXT    NOT NULL,
+                fetched_at  REAL    NOT NULL,
+                requested   INTEGER NOT NULL,
+                payload     TEXT    NOT NULL,
+                PRIMARY KEY (country, query_key, fetched_at)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_search_batches_recent
+            ON search_batches (country, query_key, fetched_at DESC)
+        """)
+        conn.commit()
+        self._initialized = True
+
+    def save_batch(
+        self,
+        country: str,
+        query_key: str,
+        requested: int,
+        items: List[Dict[str, Any]],
+        fetched_at: Optional[float] = None
+    ) -> bool:
+        """
+        Write one batch of results and prune older batches for the same key
+
+        Args:
+            country: Country code (e.g. 'ZW')
+            query_key: Normalized query string
+            requested: How many results were asked for
+            items: Results as plain dictionaries (JSON-serializable)
+            fetched_at: Unix time of the fetch (defaults to now)
+
+        Returns:
+            True if the batch was written
+        """
+        fetched_at = fetched_at or time.time()
+        try:
+            conn = self._connect()
+            try:
+                self._ensure_schema(conn)
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO search_batches VALUES (?, ?, ?, ?, ?)",
+                        (country, query_key, fetched_at, requested, json.dumps(items))
+                    )
+                    # Keep only the newest few batches per key
+                    conn.execute("""
+                        DELETE FROM search_batches
+                        WHERE country = ? AND query_key = ? AND fetched_at NOT IN (
+                            SELECT fetched_at FROM search_batches
+                            WHERE country = ? AND query_key = ?
+                            ORDER BY fetched_at DESC LIMIT ?
+                        )
+                    """, (country, query_key, country, query_key, self.max_batches_per_key))
+            finally:
+                conn.close()
+            self._writes += 1
+            return True
+        except Exception as e:
+            self._write_failures += 1
+            logger.warning(f"⚠️ Failed to persist search batch for {country}/{query_key}: {e}")
+            return False
+
+    def load_latest(self, max_age_seconds: float) -> List[Dict[str, Any]]:
+        """
+        Load the newest batch for every key that is younger than max_age_seconds
+
+        Args:
+            max_age_seconds: Ignore batches older than this
+
+        Returns:
+            List of dicts with country, query_key, fetched_at, requested and items
+        """
+        cutoff = time.time() - max_age_seconds
+        try:
+            conn = self._connect()
+            try:
+                self._ensure_schema(conn)
+                rows = conn.execute("""
+                    SELECT b.country, b.query_key, b.fetched_at, b.requested, b.payload
+                    FROM search_batches b
+                    JOIN (
+                        SELECT country, query_key, MAX(fetched_at) AS newest
+                        FROM search_batches
+                        GROUP BY country, query_key
+                    ) latest
+                    ON b.country = latest.country
+                    AND b.query_key = latest.query_key
+                    AND b.fetched_at = latest.newest
+                    WHERE b.fetched_at >= ?
+                """, (cutoff,)).fetchall()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load persisted search batches: {e}")
+            return []
+
+        batches = []
+        for country, query_key, fetched_at, requested, payload in rows:
+            try:
+                batches.append({
+                    'country': country,
+                    'query_key': query_key,
+                    'fetched_at': fetched_at,
+                    'requested': requested,
+                    'items': json.loads(payload)
+                })
+            except json.JSONDecodeError as e:
+                logger.warning(f"⚠️ Skipping corrupt batch for {country}/{query_key}: {e}")
+
+        self._loaded += len(batches)
+        return batches
+
+    async def asave_batch(self, *args, **kwargs) -> bool:
+        """Async wrapper around save_batch (runs in a worker thread)"""
+        return await asyncio.to_thread(self.save_batch, *args, **kwargs)
+
+    async def aload_latest(self, max_age_seconds: float) -> List[Dict[str, Any]]:
+        """Async wrapper around load_latest (runs in a worker thread)"""
+        return await asyncio.to_thread(self.load_latest, max_age_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics
+
+        Returns:
+            Dictionary with path and read/write counters
+        """
+        return {
+            'db_path': self.db_path,
+            'batches_written': self._writes,
+            'write_failures': self._write_failures,
+            'batches_loaded_at_startup': self._loaded
+        }
@@ -0,0 +1,189 @@
+# Backend/app/services/query_planner.py
+"""
+Search Query Planning
+Turns a (country, category) feed into a few short, focused search queries plus
+a site-restricted variant over the country's main publishers, instead of one
+long keyword string that matches little. The plans are declarative (a JSON
+file), and the ranked result lists of the sub-queries are merged with
+reciprocal-rank fusion.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, TypeVar
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Default plan file shipped with the app (override with QUERY_PLANS_PATH)
+DEFAULT_PLANS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'query_plans.json')
+
+# Standard RRF constant: damps the advantage of the very top ranks so that an item
+# found by several sub-queries beats one ranked first by a single sub-query
+DEFAULT_RRF_K = 60
+
+# Sub-query kinds
+KIND_TOPIC = 'topic'        # "{country} parliament"
+KIND_COUNTRY = 'country'    # Country-specific phrasing ("ZANU-PF", "KCSE results")
+KIND_SITE = 'site'          # Category term restricted to the country's publishers
+
+@dataclass(frozen=True)
+class SubQuery:
+    """
+    One search in a query plan
+    """
+    query: str                          # Search string sent to the provider
+    kind: str                           # KIND_TOPIC, KIND_COUNTRY or KIND_SITE
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[T]],
+    key: Callable[[T], Hashable],
+    k: int = DEFAULT_RRF_K
+) -> List[T]:
+    """
+    Merge ranked lists with reciprocal-rank fusion
+
+    Every item scores sum(1 / (k + rank)) over the lists it appears in (rank
+    starting at 1). Items are compared by `key`; the first occurrence seen is
+    the one returned.
+
+    Args:
+        ranked_lists: Result lists, each best first
+        key: Identity of an item (e.g. its canonical URL)
+        k: RRF constant
+
+    Returns:
+        Unique items, highest fused score first (ties keep first-seen order)
+    """
+    scores: Dict[Hashable, float] = {}
+    items: Dict[Hashable, T] = {}
+    for ranked in ranked_lists:
+        seen_in_list = set()
+        for rank, item in enumerate(ranked, start=1):
+            item_key = key(item)
+            if item_key in seen_in_list:
+                continue
+            seen_in_list.add(item_key)
+            scores[item_key] = scores.get(item_key, 0.0) + 1.0 / (k + rank)
+            items.setdefault(item_key, item)
+    # sorted() is stable and dicts keep insertion order, so ties stay in first-seen order
+    return [items[item_key] for item_key in sorted(scores, key=scores.get, reverse=True)]
+
+class QueryPlanner:
+    """
+    Builds the sub-queries for a (country, category) feed.
+
+    The plan file has three parts:
+    - "categories": per category, focused "queries" ("{country}" is replaced by
+      the country's name) and a "site_query" term for the site-restricted variant
+    - "sites": per country, the publisher domains for site-restricted variants
+    - "countries": optional extra country-specific queries per category
+
+    A plan is ordered most useful first - the first topic query, the
+    site-restricted variant, the country-specific queries, then the remaining
+    topic queries - so a caller that can only afford a few sub-queries runs
+    the best ones.
+    """
+
+    def __init__(self, plans_path: str = DEFAULT_PLANS_PATH):
+        """
+        Args:
+            plans_path: Path to the JSON query plans
+        """
+        self.plans_path = plans_path
+        self._categories: Dict[str, Dict[str, Any]] = {}
+        self._sites: Dict[str, List[str]] = {}
+        self._countries: Dict[str, Dict[str, List[str]]] = {}
+
+        # Statistics
+        self._stats = {
+            'plans': 0,
+            'fallback_plans': 0,
+            'sub_queries': 0
+        }
+
+        self._load()
+
+    def _load(self) -> None:
+        """Read the plan file (an unreadable file leaves every category on the fallback plan)"""
+        try:
+            with open(self.plans_path, 'r', encoding='utf-8') as plans_file:
+                plans = json.load(plans_file)
+            self._categories = dict(plans.get('categories', {}))
+            self._sites = {country.upper(): list(sites) for country, sites in plans.get('sites', {}).items()}
+            self._countries = {
+                country.upper(): dict(extra) for country, extra in plans.get('countries', {}).items()
+            }
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            logger.error(f"❌ Could not load query plans from {self.plans_path}: {e}")
+            return
+        logger.info(
+            f"🧭 Loaded query plans for {len(self._categories)} categories, "
+            f"site lists for {len(self._sites)} countries"
+        )
+
+    def plan(self, category: str, country_code: str, country_name: str, max_queries: Optional[int] = None) -> List[SubQuery]:
+        """
+        Build the sub-queries for one feed
+
+        Args:
+            category: News category (politics, sports, ...)
+            country_code: Country code (selects site list and extra queries)
+            country_name: Country name substituted for "{country}"
+            max_queries: Keep only the first this many sub-queries (None = all)
+
+        Returns:
+            Sub-queries, most useful first (never empty)
+        """
+        category_plan = self._categories.get(category)
+        if not category_plan:
+            self._stats['fallback_plans'] += 1
+            sub_queries = [SubQuery(f"{country_name} {category} news", KIND_TOPIC)]
+        else:
+            topics = [
+                SubQuery(query.format(country=country_name), KIND_TOPIC)
+                for query in category_plan.get('queries', [])
+            ]
+            extras = [
+                SubQuery(query, KIND_COUNTRY)
+                for query in self._countries.get(country_code.upper(), {}).get(category, [])
+            ]
+            sites = self._sites.get(country_code.upper(), [])
+            site_term = category_plan.get('site_query')
+            site_variants = []
+            if sites and site_term:
+                restriction = ' OR '.join(f"site:{domain}" for domain in sites)
+                site_variants.append(SubQuery(f"{site_term} {restriction}", KIND_SITE))
+
+            sub_queries = topics[:1] + site_variants + extras + topics[1:]
+            if not sub_queries:
+                self._stats['fallback_plans'] += 1
+                sub_queries = [SubQuery(f"{country_name} {category} news", KIND_TOPIC)]
+
+        if max_queries is not None:
+            sub_queries = sub_queries[:max(1, max_queries)]
+
+        self._stats['plans'] += 1
+        self._stats['sub_queries'] += len(sub_queries)
+        return sub_queries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get plan coverage and counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        return {
+            'plans_path': self.plans_path,
+            'categories': sorted(self._categories),
+            'site_countries': sorted(self._sites),
+            **self._stats
+        }
+
+# Global instance used by NewsService
+query_planner = QueryPlanner(plans_path=os.getenv("QUERY_PLANS_PATH", DEFAULT_PLANS_PATH))
@@ -0,0 +1,273 @@
+# Backend/app/services/quota_manager.py
+"""
+Google CSE Quota Manager
+Tracks daily query units spent per country and per route, shared across worker
+processes through SQLite, and admits requests by priority as the budget runs low.
+"""
+
+import asyncio
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Admission priorities (lower number = more important)
+PRIORITY_USER = 0           # User-facing category/search loads
+PRIORITY_BACKGROUND = 1     # Background refreshes (cache revalidation, feed materializer)
+PRIORITY_DEBUG = 2          # Debug/admin override endpoints
+
+PRIORITY_NAMES = {
+    PRIORITY_USER: 'user',
+    PRIORITY_BACKGROUND: 'background',
+    PRIORITY_DEBUG: 'debug'
+}
+
+# Share of the daily budget each priority may spend up to.
+# Background work stops at 80% so the last 20% is kept for real users,
+# and debug calls stop at half so they can never starve the app.
+PRIORITY_BUDGET_FRACTION = {
+    PRIORITY_USER: 1.0,
+    PRIORITY_BACKGROUND: 0.8,
+    PRIORITY_DEBUG: 0.5
+}
+
+class QuotaExceededError(Exception):
+    """
+    Raised when a request is not admitted because the daily budget
+    (or its share for that priority) is used up
+    """
+    def __init__(self, route: str, priority: int, used: int, limit: int):
+        super().__init__(
+            f"CSE quota exhausted for {PRIORITY_NAMES.get(priority, priority)} "
+            f"priority ({used}/{limit} units used today, route={route})"
+        )
+        self.route = route
+        self.priority = priority
+        self.used = used
+        self.limit = limit
+
+@dataclass
+class QuotaContext:
+    """
+    Who is spending quota - passed from the route down to each upstream call
+    """
+    route: str = 'unknown'              # Route or job name for accounting
+    priority: int = PRIORITY_USER       # Admission priority
+
+def _quota_day() -> str:
+    """
+    Current quota day as YYYY-MM-DD
+
+    Google resets the CSE quota at midnight Pacific time, so days are counted
+    in that zone (falls back to UTC if the timezone database is unavailable).
+    """
+    try:
+        from zoneinfo import ZoneInfo
+        return datetime.now(ZoneInfo("America/Los_Angeles")).strftime('%Y-%m-%d')
+    except Exception:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+class QuotaManager:
+    """
+    Daily quota accountant for one upstream API.
+
+    Spending is recorded in SQLite inside an IMMEDIATE transaction, so the
+    check-and-spend is atomic even when several uvicorn workers share the file.
+    """
+
+    def __init__(self, db_path: str, daily_budget: int, upstream: str = 'google_cse'):
+        """
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            daily_budget: Units available per quota day
+            upstream: Name of the API being accounted (one budget per upstream)
+        """
+        self.db_path = db_path
+        self.daily_budget = daily_budget
+        self.upstream = upstream
+        self._initialized = False
+
+        # Statistics for this process
+        self._admitted = 0
+        self._denied = {name: 0 for name in PRIORITY_NAMES.values()}
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection configured for multi-process use
+
+        Returns:
+            sqlite3.Connection in autocommit mode (transactions are explicit)
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=10000")
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS quota_usage (
+                    upstream  TEXT    NOT NULL,
+                    day       TEXT    NOT NULL,
+                    country   TEXT    NOT NULL,
+                    route     TEXT    NOT NULL,
+                    priority  INTEGER NOT NULL,
+                    units     INTEGER NOT NULL,
+                    PRIMARY KEY (upstream, day, country, route, priority)
+                )
+            """)
+            self._initialized = True
+        return conn
+
+    def limit_for(self, priority: int) -> int:
+        """Units this priority may spend today"""
+        return int(self.daily_budget * PRIORITY_BUDGET_FRACTION.get(priority, 0.5))
+
+    def try_consume(self, units: int, country: str, route: str, priority: int) -> bool:
+        """
+        Atomically spend units if the priority's share of the budget allows it
+
+        Args:
+            units: Query units to spend (1 per CSE request)
+            country: Country code the request is for
+            route: Route or job name for accounting
+            priority: Admission priority (PRIORITY_* constant)
+
+        Returns:
+            True if admitted and recorded
+
+        Raises:
+            QuotaExceededError: If the priority's share of today's budget is used up
+        """
+        day = _quota_day()
+        limit = self.limit_for(priority)
+
+        conn = self._connect()
+        try:
+            # IMMEDIATE takes the write lock up front so no other worker can
+            # spend between our read and our write
+            conn.execute("BEGIN IMMEDIATE")
+            used = conn.execute(
+                "SELECT COALESCE(SUM(units), 0) FROM quota_usage WHERE upstream = ? AND day = ?",
+                (self.upstream, day)
+            ).fetchone()[0]
+
+            if used + units > limit:
+                conn.execute("ROLLBACK")
+                self._denied[PRIORITY_NAMES.get(priority, 'debug')] += 1
+                raise QuotaExceededError(route, priority, used, limit)
+
+            conn.execute("""
+                INSERT INTO quota_usage (upstream, day, country, route, priority, units)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (upstream, day, country, route, priority)
+                DO UPDATE SET units = units + excluded.units
+            """, (self.upstream, day, country.upper(), route, priority, units))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        self._admitted += 1
+        return True
+
+    def remaining(self, priority: int = PRIORITY_USER) -> int:
+        """
+        Units a priority may still spend today (shared by all workers)
+
+        Args:
+            priority: Admission priority (PRIORITY_* constant)
+
+        Returns:
+            Units left in the priority's share of today's budget
+        """
+        conn = self._connect()
+        try:
+            used = conn.execute(
+                "SELECT COALESCE(SUM(units), 0) FROM quota_usage WHERE upstream = ? AND day = ?",
+                (self.upstream, _quota_day())
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        return max(0, self.limit_for(priority) - used)
+
+    async def acquire(self, units: int, country: str, quota: Optional[QuotaContext] = None) -> None:
+        """
+        Spend units for an upstream call, or raise if the budget does not allow it
+
+        Args:
+            units: Query units to spend
+            country: Country code the request is for
+            quota: Route and priority of the caller (defaults to an unnamed user request)
+
+        Raises:
+            QuotaExceededError: If the request is not admitted
+        """
+        quota = quota or QuotaContext()
+        try:
+            await asyncio.to_thread(self.try_consume, units, country, quota.route, quota.priority)
+        except QuotaExceededError as denied:
+            logger.warning(f"🪫 {denied}")
+            raise
+
+    def get_usage(self, day: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get units spent on a day, broken down by country, route and priority
+
+        Args:
+            day: Quota day (YYYY-MM-DD), defaults to today
+
+        Returns:
+            Dictionary with totals and breakdowns
+        """
+        day = day or _quota_day()
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT country, route, priority, units FROM quota_usage WHERE upstream = ? AND day = ?",
+                (self.upstream, day)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        by_country: Dict[str, int] = {}
+        by_route: Dict[str, int] = {}
+        by_priority: Dict[str, int] = {}
+        for country, route, priority, units in rows:
+            by_country[country] = by_country.get(country, 0) + units
+            by_route[route] = by_route.get(route, 0) + units
+            name = PRIORITY_NAMES.get(priority, str(priority))
+            by_priority[name] = by_priority.get(name, 0) + units
+
+        used = sum(by_country.values())
+        return {
+            'day': day,
+            'used': used,
+            'remaining': max(0, self.daily_budget - used),
+            'by_country': by_country,
+            'by_route': by_route,
+            'by_priority': by_priority
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get today's usage plus admission counters and per-priority limits
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        try:
+            usage = self.get_usage()
+        except Exception as e:
+            usage = {'error': str(e)}
+
+        return {
+            'upstream': self.upstream,
+            'daily_budget': self.daily_budget,
+            'priority_limits': {
+                PRIORITY_NAMES[p]: self.limit_for(p) for p in PRIORITY_NAMES
+            },
+            'today': usage,
+            'admitted_this_process': self._admitted,
+            'denied_this_process': dict(self._denied)
+        }
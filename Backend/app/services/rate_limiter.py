@@ -0,0 +1,235 @@
+# Backend/app/services/rate_limiter.py
+"""
+Async Rate Limiter
+Non-blocking token-bucket limiter for upstream APIs (Google CSE, OpenAI, scraped hosts).
+Waiters queue in FIFO order on the event loop instead of freezing it with time.sleep().
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Default (rate per second, burst size) for each upstream - overridable via environment
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    'google_cse': (
+        float(os.getenv("GOOGLE_CSE_RATE_PER_SECOND", "10")),
+        float(os.getenv("GOOGLE_CSE_RATE_BURST", "2"))
+    ),
+    'openai': (
+        float(os.getenv("OPENAI_RATE_PER_SECOND", "3")),
+        float(os.getenv("OPENAI_RATE_BURST", "5"))
+    ),
+    'scraper': (
+        float(os.getenv("SCRAPER_HOST_RATE_PER_SECOND", "1")),
+        float(os.getenv("SCRAPER_HOST_RATE_BURST", "3"))
+    ),
+}
+
+# Maximum number of per-host buckets kept for scraped sites
+MAX_HOST_BUCKETS = 500
+
+class AsyncTokenBucket:
+    """
+    Token bucket that refills continuously at `rate` tokens per second,
+    holding at most `burst` tokens.
+
+    Callers wait on an asyncio.Lock, which wakes waiters in FIFO order,
+    so requests are admitted fairly in arrival order without blocking the loop.
+    """
+
+    def __init__(self, name: str, rate: float, burst: float):
+        """
+        Args:
+            name: Label used in logs and stats (e.g. 'google_cse')
+            rate: Tokens added per second (sustained requests per second)
+            burst: Maximum tokens stored (requests allowed back-to-back)
+        """
+        self.name = name
+        self.rate = max(rate, 0.001)
+        self.burst = max(burst, 1.0)
+
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        # Statistics for monitoring queue pressure
+        self._waiting = 0
+        self._max_queue_depth = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill, capped at burst"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait (without blocking the event loop) until `tokens` are available
+
+        Args:
+            tokens: Number of tokens to take (clamped to the burst size)
+
+        Returns:
+            Seconds spent waiting for admission
+        """
+        tokens = min(tokens, self.burst)
+        start = time.monotonic()
+
+        self._waiting += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._waiting)
+        try:
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        break
+                    # Sleep just long enough for the missing tokens to accrue
+                    await asyncio.sleep((tokens - self._tokens) / self.rate)
+        finally:
+            self._waiting -= 1
+
+        waited = time.monotonic() - start
+        self._acquired += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        if waited > 0.001:
+            self._delayed += 1
+            logger.debug(f"⏳ Rate limiter '{self.name}' delayed request by {waited * 1000:.0f}ms")
+        return waited
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token"""
+        return self._waiting
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and wait-time statistics
+
+        Returns:
+            Dictionary with configuration and counters for this bucket
+        """
+        self._refill()
+        return {
+            'rate_per_second': self.rate,
+            'burst': self.burst,
+            'available_tokens': round(self._tokens, 2),
+            'queue_depth': self._waiting,
+            'max_queue_depth': self._max_queue_depth,
+            'acquired': self._acquired,
+            'delayed': self._delayed,
+            'avg_wait_ms': round(self._total_wait / self._acquired * 1000, 2) if self._acquired else 0.0,
+            'max_wait_ms': round(self._max_wait * 1000, 2)
+        }
+
+class RateLimiterRegistry:
+    """
+    Holds one token bucket per upstream.
+
+    Upstream names map to DEFAULT_LIMITS; names of the form 'scraper:<host>'
+    get their own bucket per host using the 'scraper' limits.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]] = None):
+        """
+        Args:
+            limits: Mapping of upstream name to (rate per second, burst)
+        """
+        self.limits = dict(limits or DEFAULT_LIMITS)
+        self._buckets: "OrderedDict[str, AsyncTokenBucket]" = OrderedDict()
+
+    def configure(self, upstream: str, rate: float, burst: float) -> None:
+        """
+        Change the limits for an upstream (replaces any existing bucket)
+
+        Args:
+            upstream: Upstream name (e.g. 'google_cse')
+            rate: Tokens added per second
+            burst: Maximum tokens stored
+        """
+        self.limits[upstream] = (rate, burst)
+        self._buckets.pop(upstream, None)
+
+    def get(self, upstream: str) -> AsyncTokenBucket:
+        """
+        Get (or create) the bucket for an upstream
+
+        Args:
+            upstream: Upstream name, or 'scraper:<host>' for a scraped site
+
+        Returns:
+            The AsyncTokenBucket for that upstream
+        """
+        bucket = self._buckets.get(upstream)
+        if bucket is not None:
+            self._buckets.move_to_end(upstream)
+            return bucket
+
+        base_name = upstream.split(':', 1)[0]
+        rate, burst = self.limits.get(upstream) or self.limits.get(base_name) or (1.0, 1.0)
+        bucket = AsyncTokenBucket(upstream, rate, burst)
+        self._buckets[upstream] = bucket
+
+        # Drop the least recently used idle host buckets so the registry stays bounded
+        if len(self._buckets) > MAX_HOST_BUCKETS:
+            for name in list(self._buckets.keys()):
+                if len(self._buckets) <= MAX_HOST_BUCKETS:
+                    break
+                if ':' in name and self._buckets[name].queue_depth == 0:
+                    del self._buckets[name]
+
+        return bucket
+
+    async def acquire(self, upstream: str, tokens: float = 1.0) -> float:
+        """
+        Wait for admission to an upstream
+
+        Args:
+            upstream: Upstream name
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        return await self.get(upstream).acquire(tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for every upstream bucket
+
+        Returns:
+            Dictionary of upstream name to bucket stats, with scraped hosts summarised
+        """
+        stats = {}
+        host_buckets = []
+        for name, bucket in self._buckets.items():
+            if name.startswith('scraper:'):
+                host_buckets.append(bucket)
+            else:
+                stats[name] = bucket.get_stats()
+
+        stats['scraper_hosts'] = {
+            'tracked_hosts': len(host_buckets),
+            'queue_depth': sum(b.queue_depth for b in host_buckets),
+            'busiest': sorted(
+                ({'host': b.name.split(':', 1)[1], **b.get_stats()} for b in host_buckets),
+                key=lambda s: s['max_queue_depth'],
+                reverse=True
+            )[:5]
+        }
+        return stats
+
+# Global instance shared by NewsService, article routes and the scraper
+rate_limiters = RateLimiterRegistry()
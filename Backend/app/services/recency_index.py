@@ -0,0 +1,201 @@
+# Backend/app/services/recency_index.py
+"""
+Publish Times and Recency Index
+Publish times arrive as free-form strings (ISO 8601 from CSE metatags, RFC 822
+from feeds, "Oct 3, 2025" from some sites). They are parsed once at ingestion
+into integer epoch seconds, and each feed keeps its articles in a list sorted
+by that number - newest-first listings, freshness filters and date ranges are
+binary searches instead of repeated string sorts.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from dateutil import parser as date_parser
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Publish times outside this window are treated as garbage (a year-1970 default,
+# a misparsed day/month, a timestamp in milliseconds, ...)
+EARLIEST_PUBLISH_TS = 946684800          # 2000-01-01
+FUTURE_TOLERANCE_SECONDS = 24 * 3600     # Time zone slips make slightly-future stamps common
+
+# Countries whose sites write numeric dates month-first (03/10/2025 = 10 March);
+# everywhere else - including every country this app covers - writes day-first
+MONTH_FIRST_COUNTRIES = {'US', 'PH', 'FM', 'MH', 'PW'}
+
+def dayfirst_for_country(country_code: Optional[str]) -> bool:
+    """
+    Whether ambiguous numeric dates from a country's sites are day-first
+
+    Args:
+        country_code: Two-letter country code (None = unknown, taken as month-first)
+
+    Returns:
+        True if '03/10/2025' means 3 October for this country
+    """
+    return bool(country_code) and country_code.upper() not in MONTH_FIRST_COUNTRIES
+
+def _parse_date_string(text: str, dayfirst: bool) -> datetime:
+    """Parse a date string - ISO 8601 exactly as written, anything else with dateutil"""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        # dayfirst would also swap month and day of an ISO date, so it only applies here
+        return date_parser.parse(text, dayfirst=dayfirst)
+
+def parse_publish_time(value, dayfirst: bool = False) -> Optional[int]:
+    """
+    Normalize a publish time to integer epoch seconds (UTC)
+
+    Accepts ISO 8601 / RFC 822 / human-readable date strings (naive times are
+    taken as UTC), epoch numbers in seconds or milliseconds, and datetimes.
+    Ambiguous numeric dates such as '03/10/2025' are read month-first unless
+    `dayfirst` is set (see dayfirst_for_country); ISO dates are never ambiguous.
+
+    Args:
+        value: Publish time as found in search results or feeds
+        dayfirst: Read ambiguous numeric dates as day/month/year
+
+    Returns:
+        Epoch seconds, or None if missing, unparseable or implausible
+    """
+    if value is None or value == '':
+        return None
+    try:
+        if isinstance(value, (int, float)) or (isinstance(value, str) and value.strip().isdigit()):
+            timestamp = float(value)
+            if timestamp > 1e11:
+                timestamp /= 1000  # Milliseconds
+        else:
+            parsed = value if hasattr(value, 'timestamp') else _parse_date_string(str(value).strip(), dayfirst)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            timestamp = parsed.timestamp()
+    except (ValueError, OverflowError, TypeError) as e:
+        logger.debug(f"Unparseable publish time {value!r}: {e}")
+        return None
+
+    if timestamp < EARLIEST_PUBLISH_TS or timestamp > time.time() + FUTURE_TOLERANCE_SECONDS:
+        return None
+    return int(timestamp)
+
+class RecencyIndex(Generic[T]):
+    """
+    Items of one feed, kept sorted by publish time.
+
+    - add() inserts with a binary search (replacing an item with the same ID)
+    - newest() and between() find their range with a binary search and read
+      only the items they return
+    - Bounded: beyond `max_items` the oldest-published items are dropped
+    """
+
+    def __init__(self, max_items: int = 500):
+        """
+        Args:
+            max_items: Most items kept in the index
+        """
+        self.max_items = max(1, max_items)
+        self._lock = threading.Lock()
+        self._keys: List[Tuple[int, str]] = []      # (publish time, item ID), ascending
+        self._items: List[T] = []                   # Parallel to _keys
+        self._times: Dict[str, int] = {}            # Item ID -> publish time
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, item_id: str, published_ts: int, item: T) -> None:
+        """
+        Insert or replace one item
+
+        Args:
+            item_id: Stable item ID (e.g. article ID)
+            published_ts: Publish time in epoch seconds
+            item: The item itself
+        """
+        with self._lock:
+            self._remove_locked(item_id)
+            key = (published_ts, item_id)
+            position = bisect.bisect_left(self._keys, key)
+            self._keys.insert(position, key)
+            self._items.insert(position, item)
+            self._times[item_id] = published_ts
+
+            if len(self._keys) > self.max_items:
+                excess = len(self._keys) - self.max_items
+                for _, dropped_id in self._keys[:excess]:
+                    del self._times[dropped_id]
+                del self._keys[:excess]
+                del self._items[:excess]
+
+    def remove(self, item_id: str) -> None:
+        """Remove one item if present"""
+        with self._lock:
+            self._remove_locked(item_id)
+
+    def _remove_locked(self, item_id: str) -> None:
+        """Remove an item by ID (caller holds the lock)"""
+        published_ts = self._times.pop(item_id, None)
+        if published_ts is None:
+            return
+        position = bisect.bisect_left(self._keys, (published_ts, item_id))
+        del self._keys[position]
+        del self._items[position]
+
+    def newest(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[int] = None,
+        predicate: Optional[Callable[[T], bool]] = None
+    ) -> List[Tuple[int, T]]:
+        """
+        Newest items first, optionally only those published at or after `since`
+
+        Args:
+            limit: Most items to return (None = all matching)
+            since: Earliest publish time in epoch seconds (freshness filter)
+            predicate: Extra filter applied while reading (e.g. breaking only)
+
+        Returns:
+            List of (publish time, item), newest first
+        """
+        return self.between(since, None, limit, predicate)
+
+    def between(
+        self,
+        start: Optional[int],
+        end: Optional[int],
+        limit: Optional[int] = None,
+        predicate: Optional[Callable[[T], bool]] = None
+    ) -> List[Tuple[int, T]]:
+        """
+        Items published in [start, end), newest first
+
+        Args:
+            start: Earliest publish time, inclusive (None = no lower bound)
+            end: Latest publish time, exclusive (None = no upper bound)
+            limit: Most items to return (None = all matching)
+            predicate: Extra filter applied while reading
+
+        Returns:
+            List of (publish time, item), newest first
+        """
+        with self._lock:
+            low = bisect.bisect_left(self._keys, (start,)) if start is not None else 0
+            high = bisect.bisect_left(self._keys, (end,)) if end is not None else len(self._keys)
+            result = []
+            for position in range(high - 1, low - 1, -1):
+                item = self._items[position]
+                if predicate is not None and not predicate(item):
+                    continue
+                result.append((self._keys[position][0], item))
+                if limit is not None and len(result) >= limit:
+                    break
+            return result
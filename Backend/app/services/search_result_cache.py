@@ -0,0 +1,236 @@
+# Backend/app/services/search_result_cache.py
+"""
+Search Result Cache
+In-memory TTL cache with stale-while-revalidate for upstream search results.
+Fresh hits are served from memory; stale hits are served immediately while a
+single background task refreshes them; upstream errors fall back to stale data.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CacheEntry:
+    """
+    A cached list of results for one search key
+    """
+    value: List[Any]        # Cached results (e.g. NewsSource objects)
+    requested: int          # How many results were asked for when fetched
+    fetched_at: float       # Unix time the results were fetched
+
+    @property
+    def age(self) -> float:
+        """Seconds since the results were fetched"""
+        return time.time() - self.fetched_at
+
+    def covers(self, count: int) -> bool:
+        """
+        Whether this entry can answer a request for `count` results
+
+        True if we fetched at least that many, or if upstream ran out of
+        results (fewer came back than were asked for).
+        """
+        return self.requested >= count or len(self.value) < self.requested
+
+class StaleWhileRevalidateCache:
+    """
+    LRU cache of search results with three age bands:
+
+    - fresh (age < fresh_ttl): served directly
+    - stale (age < fresh_ttl + stale_ttl): served directly, refreshed in the background
+    - expired: refetched; only served if the upstream call fails (stale-if-error)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fresh_ttl: float = 300,
+        stale_ttl: float = 1800,
+        stale_if_error_ttl: float = 86400,
+        max_entries: int = 1000
+    ):
+        """
+        Args:
+            name: Label used in logs and stats
+            fresh_ttl: Seconds an entry is served without revalidation
+            stale_ttl: Extra seconds an entry is served while being refreshed
+            stale_if_error_ttl: Max age of data served when upstream is failing
+            max_entries: Maximum keys kept (least recently used are evicted)
+        """
+        self.name = name
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.stale_if_error_ttl = stale_if_error_ttl
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._refresh_tasks: Dict[Hashable, asyncio.Task] = {}
+
+        # Statistics
+        self._stats = {
+            'fresh_hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'background_refreshes': 0,
+            'refresh_failures': 0,
+            'served_stale_on_error': 0,
+            'evictions': 0
+        }
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry without fetching
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The CacheEntry, or None if not cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, value: List[Any], requested: int, fetched_at: Optional[float] = None) -> CacheEntry:
+        """
+        Store results for a key
+
+        Args:
+            key: Cache key
+            value: Results to cache
+            requested: How many results were asked for
+            fetched_at: When the results were fetched (defaults to now)
+
+        Returns:
+            The stored CacheEntry
+        """
+        entry = CacheEntry(value=list(value), requested=requested, fetched_at=fetched_at or time.time())
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+        return entry
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age < self.fresh_ttl
+
+    def _is_servable_stale(self, entry: CacheEntry) -> bool:
+        return entry.age < self.fresh_ttl + self.stale_ttl
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        count: int,
+        fetch: Callable[[int], Awaitable[List[Any]]],
+        refresh_fetch: Optional[Callable[[int], Awaitable[List[Any]]]] = None
+    ) -> List[Any]:
+        """
+        Serve `count` results for a key from cache, fetching when needed
+
+        Args:
+            key: Cache key
+            count: Number of results wanted
+            fetch: Coroutine function fetching `n` results from upstream (raises on failure)
+            refresh_fetch: Fetch used for background revalidation (defaults to `fetch`)
+
+        Returns:
+            List of at most `count` results
+
+        Raises:
+            Exception: Whatever `fetch` raised, if there is no stale data to fall back on
+        """
+        entry = self.get(key)
+
+        if entry is not None and entry.covers(count):
+            if self._is_fresh(entry):
+                self._stats['fresh_hits'] += 1
+                return entry.value[:count]
+
+            if self._is_servable_stale(entry):
+                # Serve immediately and let one background task refresh the entry
+                self._stats['stale_hits'] += 1
+                self._schedule_refresh(key, max(count, entry.requested), refresh_fetch or fetch)
+                return entry.value[:count]
+
+        # Miss (or not enough results cached) - fetch in the request path
+        self._stats['misses'] += 1
+        fetch_count = max(count, entry.requested) if entry is not None else count
+        try:
+            value = await fetch(fetch_count)
+        except Exception as fetch_error:
+            if entry is not None and entry.age < self.stale_if_error_ttl:
+                self._stats['served_stale_on_error'] += 1
+                logger.warning(
+                    f"♻️ Cache '{self.name}': upstream failed ({fetch_error}), "
+                    f"serving stale results ({entry.age:.0f}s old) for {key}"
+                )
+                return entry.value[:count]
+            raise
+
+        self.set(key, value, fetch_count)
+        return list(value[:count])
+
+    def _schedule_refresh(
+        self,
+        key: Hashable,
+        count: int,
+        fetch: Callable[[int], Awaitable[List[Any]]]
+    ) -> None:
+        """
+        Start a background refresh for a key unless one is already running
+
+        Args:
+            key: Cache key
+            count: Number of results to refetch
+            fetch: Coroutine function fetching results from upstream
+        """
+        if key in self._refresh_tasks:
+            return
+
+        async def _refresh() -> None:
+            try:
+                value = await fetch(count)
+                self.set(key, value, count)
+                logger.debug(f"🔄 Cache '{self.name}': refreshed {key}")
+            except Exception as refresh_error:
+                self._stats['refresh_failures'] += 1
+                logger.warning(f"⚠️ Cache '{self.name}': background refresh failed for {key}: {refresh_error}")
+
+        self._stats['background_refreshes'] += 1
+        task = asyncio.ensure_future(_refresh())
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _task: self._refresh_tasks.pop(key, None))
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with configuration, size and hit/miss counters
+        """
+        lookups = self._stats['fresh_hits'] + self._stats['stale_hits'] + self._stats['misses']
+        hits = self._stats['fresh_hits'] + self._stats['stale_hits']
+        return {
+            'name': self.name,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'fresh_ttl_seconds': self.fresh_ttl,
+            'stale_ttl_seconds': self.stale_ttl,
+            'refreshes_in_flight': len(self._refresh_tasks),
+            **self._stats,
+            'hit_ratio': round(hits / lookups, 3) if lookups else 0.0
+        }
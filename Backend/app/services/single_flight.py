@@ -0,0 +1,104 @@
+# Backend/app/services/single_flight.py
+"""
+Single-Flight Request Coalescing
+Concurrent callers asking for the same upstream data share one in-flight request
+instead of each hitting the upstream API.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """
+    Coalesces concurrent list-returning fetches by key.
+
+    The first caller for a key becomes the leader and starts the upstream fetch.
+    Later callers with the same key await the leader's result instead. A caller
+    asking for fewer items than an in-flight fetch is served by slicing that
+    larger result, so a request for 10 can ride along with a request for 20.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Label used in logs and stats (e.g. 'google_cse')
+        """
+        self.name = name
+
+        # key -> list of (requested count, shared task) currently in flight
+        self._in_flight: Dict[Hashable, List[Tuple[int, asyncio.Task]]] = {}
+
+        # Statistics
+        self._leaders = 0       # Calls that actually hit the upstream
+        self._followers = 0     # Calls that joined an in-flight fetch
+        self._sliced = 0        # Followers served from a larger in-flight fetch
+
+    async def do(
+        self,
+        key: Hashable,
+        count: int,
+        fetch: Callable[[int], Awaitable[List[Any]]]
+    ) -> List[Any]:
+        """
+        Run `fetch(count)` once per key, sharing the result with concurrent callers
+
+        Args:
+            key: Normalized request key (callers with equal keys are coalesced)
+            count: Number of items this caller wants
+            fetch: Coroutine function that fetches `count` items from upstream
+
+        Returns:
+            List of at most `count` items
+        """
+        # Join any in-flight fetch for this key that asked for at least as many items
+        for in_flight_count, task in self._in_flight.get(key, []):
+            if in_flight_count >= count:
+                self._followers += 1
+                if in_flight_count > count:
+                    self._sliced += 1
+                logger.debug(f"🔗 Single-flight '{self.name}': joined in-flight fetch for {key} ({count}/{in_flight_count})")
+                # shield() so a cancelled follower never cancels the shared fetch
+                result = await asyncio.shield(task)
+                return list(result[:count])
+
+        # Become the leader: start the upstream fetch as its own task
+        self._leaders += 1
+        task = asyncio.ensure_future(fetch(count))
+        entry = (count, task)
+        self._in_flight.setdefault(key, []).append(entry)
+
+        def _forget(_task: asyncio.Task) -> None:
+            entries = self._in_flight.get(key, [])
+            if entry in entries:
+                entries.remove(entry)
+            if not entries:
+                self._in_flight.pop(key, None)
+            # Every waiter may have been cancelled (e.g. a deadline) - retrieve the
+            # exception here so an abandoned fetch does not log "never retrieved"
+            if not _task.cancelled() and _task.exception() is not None:
+                logger.debug(f"⚠️ Single-flight '{self.name}': fetch for {key} failed: {_task.exception()}")
+
+        task.add_done_callback(_forget)
+
+        result = await asyncio.shield(task)
+        return list(result[:count])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dictionary with leader/follower counts and in-flight keys
+        """
+        total = self._leaders + self._followers
+        return {
+            'in_flight_keys': len(self._in_flight),
+            'upstream_calls': self._leaders,
+            'coalesced_calls': self._followers,
+            'served_by_slicing': self._sliced,
+            'coalesce_ratio': round(self._followers / total, 3) if total else 0.0
+        }
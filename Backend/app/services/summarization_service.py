@@ -0,0 +1,353 @@
+# Backend/app/services/summarization_service.py
+"""
+Batched AI Summarization
+Summarizes many news sources with a few structured LLM calls instead of one
+round trip per article: sources are packed into batches, batches run
+concurrently under a semaphore, and every item falls back to the basic
+summary if its batch fails or is still running when the stage deadline hits.
+Generated summaries are kept in the persistent summary cache, so an unchanged
+story is only ever summarized once.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services.rate_limiter import rate_limiters
+from app.services.circuit_breaker import circuit_breakers, is_failure_exception
+from app.services.latency_budget import LatencyBudget
+from app.services.summary_cache import SummaryCache, content_hash
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Bump whenever the prompts below change - cached summaries are keyed by it
+PROMPT_VERSION = 'feed-batch-v1'
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a professional news editor. Create clear, engaging summaries that make one want "
+    "to know more about the news article, like newspaper front page summaries. "
+    "Reply with JSON only."
+)
+
+SUMMARY_BATCH_PROMPT = """Write an engaging news summary for each article below.
+
+Requirements for every summary:
+1. 2-3 informative sentences (60-100 words)
+2. Include the key facts from the snippet and nothing that is not supported by it
+3. Focus on what readers need to know
+
+Category: {category}
+
+Articles (JSON):
+{articles}
+
+Reply with a JSON object of the form {{"summaries": [{{"id": <article id>, "summary": "<text>"}}, ...]}}
+with exactly one entry per article id."""
+
+class SummarizationService:
+    """
+    Summarization stage for NewsService.
+
+    - Up to `batch_size` sources go into one structured (JSON) LLM call
+    - At most `max_concurrency` calls run at once; each waits on the shared
+      OpenAI rate limiter and is guarded by the 'openai' circuit breaker
+    - Whatever has not been summarized when the stage timeout (or the request's
+      latency budget) runs out gets the fallback summary - the feed is never held
+      up by the slowest batch
+    - Any item the model skipped or answered badly falls back on its own
+    - Summaries are looked up in (and written to) the summary cache by content
+      hash, prompt version and model; batches still running at the deadline
+      finish in the background so their output is cached for the next request
+    """
+
+    def __init__(
+        self,
+        fallback: Callable[[Any], str],
+        cache: Optional[SummaryCache] = None,
+        api_key: Optional[str] = None,
+        enabled: bool = False,
+        model: str = 'gpt-5',
+        batch_size: int = 8,
+        max_concurrency: int = 3,
+        stage_timeout: float = 6.0
+    ):
+        """
+        Args:
+            fallback: Builds the non-AI summary for one source
+            cache: Persistent summary cache (None = no caching)
+            api_key: OpenAI API key (AI summaries are off without one)
+            enabled: Whether AI summaries are switched on at all
+            model: Chat model used for summaries
+            batch_size: Sources packed into one LLM call
+            max_concurrency: LLM calls in flight at the same time
+            stage_timeout: Longest the whole stage may take in seconds
+        """
+        self.fallback = fallback
+        self.cache = cache
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.stage_timeout = stage_timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self._client = None
+        self._client_version: Optional[str] = None
+        if enabled and api_key:
+            self._init_client(api_key)
+        self.enabled = self._client_version is not None
+
+        # Statistics
+        self._stats = {
+            'stages': 0,
+            'batches': 0,
+            'batch_failures': 0,
+            'items': 0,
+            'cached_summaries': 0,
+            'ai_summaries': 0,
+            'fallback_summaries': 0,
+            'stage_timeouts': 0
+        }
+
+    def _init_client(self, api_key: str) -> None:
+        """Create the OpenAI client (new 1.0+ client, or the legacy module)"""
+        try:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=api_key)
+            self._client_version = 'new'
+        except ImportError:
+            try:
+                import openai
+                openai.api_key = api_key
+                self._client = openai
+                self._client_version = 'legacy'
+            except ImportError:
+                logger.warning("⚠️ OpenAI library not installed - AI summaries disabled")
+                return
+        logger.info(f"✅ Batched AI summaries enabled ({self.model}, {self.batch_size} per call)")
+
+    # ===== STAGE =====
+
+    async def summarize(
+        self,
+        sources: List[Any],
+        category: str,
+        budget: Optional[LatencyBudget] = None
+    ) -> List[str]:
+        """
+        Summarize sources, in order
+
+        Args:
+            sources: NewsSource objects to summarize
+            category: News category (context for the model)
+            budget: Latency budget of the calling request
+
+        Returns:
+            One summary per source (AI where it arrived in time, fallback otherwise)
+        """
+        self._stats['stages'] += 1
+        self._stats['items'] += len(sources)
+
+        summaries: List[Optional[str]] = [None] * len(sources)
+        cached = [False] * len(sources)
+        if self.enabled and sources:
+            hashes = [self._content_hash(source, category) for source in sources]
+            if self.cache is not None:
+                stored = await self.cache.aget_many('feed', hashes, PROMPT_VERSION, self.model)
+                for index, hash_value in enumerate(hashes):
+                    if hash_value in stored:
+                        summaries[index] = stored[hash_value]['summary']
+                        cached[index] = True
+
+            missing = [index for index, summary in enumerate(summaries) if summary is None]
+            if missing:
+                await self._run_batches(sources, hashes, missing, category, summaries, budget)
+
+        result = []
+        for source, summary, from_cache in zip(sources, summaries, cached):
+            if summary:
+                self._stats['cached_summaries' if from_cache else 'ai_summaries'] += 1
+                result.append(summary)
+            else:
+                self._stats['fallback_summaries'] += 1
+                result.append(self.fallback(source))
+        return result
+
+    @staticmethod
+    def _content_hash(source: Any, category: str) -> str:
+        """Hash of everything the batch prompt says about one source"""
+        return content_hash(source.title, source.snippet, source.source_name, category)
+
+    async def _run_batches(
+        self,
+        sources: List[Any],
+        hashes: List[str],
+        missing: List[int],
+        category: str,
+        summaries: List[Optional[str]],
+        budget: Optional[LatencyBudget]
+    ) -> None:
+        """Run batches for the missing items concurrently, filling `summaries` until the deadline"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        tasks = []
+        for offset in range(0, len(missing), self.batch_size):
+            indexes = missing[offset:offset + self.batch_size]
+            tasks.append(asyncio.ensure_future(self._summarize_batch(sources, hashes, indexes, category, summaries)))
+
+        timeout = budget.timeout(cap=self.stage_timeout) if budget else self.stage_timeout
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        if pending:
+            self._stats['stage_timeouts'] += 1
+            logger.warning(
+                f"⏱️ Summaries: {len(pending)}/{len(tasks)} batches still running after {timeout:.1f}s - "
+                f"using basic summaries for them (results will be cached when they finish)"
+            )
+            # Late results are written to the cache; our copy of `summaries` is already read
+            for task in pending:
+                task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def _summarize_batch(
+        self,
+        sources: List[Any],
+        hashes: List[str],
+        indexes: List[int],
+        category: str,
+        summaries: List[Optional[str]]
+    ) -> None:
+        """Summarize one batch with a single LLM call; failures leave items for the fallback"""
+        async with self._semaphore:
+            self._stats['batches'] += 1
+            articles = [
+                {
+                    'id': index,
+                    'title': sources[index].title,
+                    'snippet': sources[index].snippet,
+                    'source': sources[index].source_name
+                }
+                for index in indexes
+            ]
+            prompt = SUMMARY_BATCH_PROMPT.format(category=category, articles=json.dumps(articles, ensure_ascii=False))
+
+            started = time.time()
+            try:
+                reply = await self._complete(prompt)
+                parsed = self._parse_reply(reply, set(indexes))
+            except Exception as e:
+                self._stats['batch_failures'] += 1
+                logger.warning(f"⚠️ AI summary batch of {len(indexes)} failed: {e}")
+                return
+
+            for index, summary in parsed.items():
+                summaries[index] = summary
+            if self.cache is not None and parsed:
+                await self.cache.aput_many(
+                    'feed',
+                    {hashes[index]: {'summary': summary} for index, summary in parsed.items()},
+                    PROMPT_VERSION,
+                    self.model
+                )
+            logger.debug(f"🤖 Summarized {len(parsed)}/{len(indexes)} articles in {time.time() - started:.2f}s")
+
+    async def _complete(self, prompt: str) -> str:
+        """
+        Send one chat completion request
+
+        Raises:
+            CircuitOpenError: If OpenAI has been failing and the circuit is open
+            Exception: Whatever the OpenAI client raised
+        """
+        breaker = circuit_breakers.get('openai')
+        is_probe = breaker.before_call()
+
+        messages = [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        loop = asyncio.get_running_loop()
+        try:
+            await rate_limiters.acquire('openai')
+            if self._client_version == 'new':
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self._client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        response_format={"type": "json_object"}
+                    )
+                )
+            else:
+                response = await loop.run_in_executor(
+                    None,
+                    lambda: self._client.ChatCompletion.create(model=self.model, messages=messages)
+                )
+            breaker.record_success()
+        except Exception as e:
+            # Only 429/5xx/timeouts count; a rejected request says nothing about OpenAI's health
+            if is_failure_exception(e):
+                breaker.record_failure()
+            raise
+        finally:
+            # The 'openai' breaker is shared with the article routes - a batch cancelled
+            # at shutdown must not leave enhance and chat waiting out probe_timeout
+            if is_probe:
+                breaker.release_probe()
+        return response.choices[0].message.content or ''
+
+    @staticmethod
+    def _parse_reply(reply: str, expected_ids: set) -> Dict[int, str]:
+        """
+        Extract per-article summaries from the model's JSON reply
+
+        Args:
+            reply: Raw model output
+            expected_ids: Article ids sent in the batch
+
+        Returns:
+            Article id -> summary for every usable entry
+
+        Raises:
+            ValueError: If the reply is not the expected JSON shape
+        """
+        text = reply.strip()
+        if text.startswith('```'):
+            text = text.strip('`')
+            text = text[text.find('{'):]
+        data = json.loads(text)
+        entries = data.get('summaries') if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            raise ValueError("reply has no 'summaries' list")
+
+        parsed = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                article_id = int(entry.get('id'))
+            except (TypeError, ValueError):
+                continue
+            summary = entry.get('summary')
+            if article_id in expected_ids and isinstance(summary, str) and summary.strip():
+                parsed[article_id] = summary.strip()
+        return parsed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get summarization counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        return {
+            'enabled': self.enabled,
+            'model': self.model if self.enabled else None,
+            'batch_size': self.batch_size,
+            'max_concurrency': self.max_concurrency,
+            'stage_timeout_seconds': self.stage_timeout,
+            'prompt_version': PROMPT_VERSION,
+            **self._stats
+        }
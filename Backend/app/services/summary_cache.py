@@ -0,0 +1,243 @@
+# Backend/app/services/summary_cache.py
+"""
+Persistent Summary Cache
+Remembers generated summaries (and key points) on disk, keyed by a hash of the
+content that was summarized plus the prompt version and model. An unchanged
+story is summarized once - later feed refreshes, other workers and restarts
+reuse the stored output instead of paying for another LLM call.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+def content_hash(*parts: str) -> str:
+    """
+    Hash the text that goes into a summary prompt
+
+    Whitespace is normalized so reformatting alone does not miss the cache.
+
+    Args:
+        parts: Texts that determine the summary (title, snippet, category, ...)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    normalized = '\x1f'.join(' '.join((part or '').split()) for part in parts)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+class SummaryCache:
+    """
+    SQLite-backed cache of generated summaries.
+
+    - Key: (kind, content hash, prompt version, model) - changing the prompt or
+      the model naturally invalidates old entries
+    - Value: summary text, key points and any extra fields (e.g. reading time)
+    - Bounded by entry count; least recently used entries are evicted first
+    - WAL mode and one connection per call, so every worker shares the file
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 20000):
+        """
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            max_entries: Maximum number of stored summaries
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._initialized = False
+
+        # Statistics
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stored': 0,
+            'evictions': 0,
+            'errors': 0
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection configured for multi-process use
+
+        Returns:
+            sqlite3.Connection with WAL journaling and a busy timeout
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=10000")
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    kind            TEXT    NOT NULL,
+                    content_hash    TEXT    NOT NULL,
+                    prompt_version  TEXT    NOT NULL,
+                    model           TEXT    NOT NULL,
+                    summary         TEXT    NOT NULL,
+                    key_points      TEXT    NOT NULL,
+                    extra           TEXT    NOT NULL,
+                    created_at      REAL    NOT NULL,
+                    last_access     REAL    NOT NULL,
+                    PRIMARY KEY (kind, content_hash, prompt_version, model)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_summary_cache_access ON summary_cache (last_access)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    # ===== SYNCHRONOUS API (runs in a worker thread) =====
+
+    def get_many(self, kind: str, hashes: List[str], prompt_version: str, model: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several summaries at once
+
+        Args:
+            kind: What was summarized (e.g. 'feed', 'enhance')
+            hashes: Content hashes to look up
+            prompt_version: Version of the prompt that produced the summary
+            model: Model that produced the summary
+
+        Returns:
+            Content hash -> {'summary', 'key_points', **extra} for every hit
+        """
+        if not hashes:
+            return {}
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[str, Dict[str, Any]] = {}
+
+        conn = self._connect()
+        try:
+            for offset in range(0, len(unique), 500):
+                chunk = unique[offset:offset + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT content_hash, summary, key_points, extra FROM summary_cache "
+                    f"WHERE kind = ? AND prompt_version = ? AND model = ? AND content_hash IN ({placeholders})",
+                    (kind, prompt_version, model, *chunk)
+                ).fetchall()
+                for hash_value, summary, key_points, extra in rows:
+                    found[hash_value] = {'summary': summary, 'key_points': json.loads(key_points), **json.loads(extra)}
+
+            if found:
+                with conn:
+                    conn.executemany(
+                        "UPDATE summary_cache SET last_access = ? "
+                        "WHERE kind = ? AND content_hash = ? AND prompt_version = ? AND model = ?",
+                        [(time.time(), kind, hash_value, prompt_version, model) for hash_value in found]
+                    )
+        finally:
+            conn.close()
+
+        self._stats['hits'] += len(found)
+        self._stats['misses'] += len(unique) - len(found)
+        return found
+
+    def put_many(self, kind: str, entries: Dict[str, Dict[str, Any]], prompt_version: str, model: str) -> None:
+        """
+        Store several summaries and evict the least recently used beyond max_entries
+
+        Args:
+            kind: What was summarized (e.g. 'feed', 'enhance')
+            entries: Content hash -> {'summary', 'key_points' (optional), **extra}
+            prompt_version: Version of the prompt that produced the summaries
+            model: Model that produced the summaries
+        """
+        if not entries:
+            return
+        now = time.time()
+        rows = []
+        for hash_value, value in entries.items():
+            extra = {k: v for k, v in value.items() if k not in ('summary', 'key_points')}
+            rows.append((
+                kind, hash_value, prompt_version, model, value['summary'],
+                json.dumps(value.get('key_points') or []), json.dumps(extra), now, now
+            ))
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO summary_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                count = conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()[0]
+                if count > self.max_entries:
+                    # Trim to 90% so we are not evicting on every write
+                    excess = count - int(self.max_entries * 0.9)
+                    conn.execute(
+                        "DELETE FROM summary_cache WHERE rowid IN "
+                        "(SELECT rowid FROM summary_cache ORDER BY last_access ASC LIMIT ?)",
+                        (excess,)
+                    )
+                    self._stats['evictions'] += excess
+        finally:
+            conn.close()
+        self._stats['stored'] += len(rows)
+
+    # ===== ASYNC API =====
+
+    async def aget_many(self, kind: str, hashes: List[str], prompt_version: str, model: str) -> Dict[str, Dict[str, Any]]:
+        """Async get_many (SQLite runs in a worker thread); errors count as misses"""
+        try:
+            return await asyncio.to_thread(self.get_many, kind, hashes, prompt_version, model)
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"⚠️ Summary cache read failed: {e}")
+            return {}
+
+    async def aget(self, kind: str, hash_value: str, prompt_version: str, model: str) -> Optional[Dict[str, Any]]:
+        """Async lookup of a single summary (None on a miss)"""
+        found = await self.aget_many(kind, [hash_value], prompt_version, model)
+        return found.get(hash_value)
+
+    async def aput_many(self, kind: str, entries: Dict[str, Dict[str, Any]], prompt_version: str, model: str) -> None:
+        """Async put_many; a failing cache never fails the caller"""
+        try:
+            await asyncio.to_thread(self.put_many, kind, entries, prompt_version, model)
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"⚠️ Summary cache write failed: {e}")
+
+    async def aput(self, kind: str, hash_value: str, value: Dict[str, Any], prompt_version: str, model: str) -> None:
+        """Async store of a single summary"""
+        await self.aput_many(kind, {hash_value: value}, prompt_version, model)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters and store size
+
+        Queries SQLite - call it from a worker thread (asyncio.to_thread), not the event loop.
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        try:
+            conn = self._connect()
+            try:
+                entries = conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()[0]
+            finally:
+                conn.close()
+        except Exception as e:
+            entries = None
+            logger.debug(f"Summary cache stats unavailable: {e}")
+
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            **self._stats,
+            'hit_ratio': round(self._stats['hits'] / lookups, 3) if lookups else 0.0
+        }
+
+# Global instance shared by NewsService and the article routes
+summary_cache = SummaryCache(
+    db_path=os.getenv("SUMMARY_CACHE_PATH", "summary_cache.sqlite3"),
+    max_entries=int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "20000"))
+)
@@ -0,0 +1,402 @@
+# Backend/app/services/synthetic_news_provider.py
+"""
+Synthetic News Provider
+Stand-in for the Google Custom Search API used for load and capacity testing.
+Answers CSE page requests with large, varied and reproducible result sets
+(built combinatorially from a seed) after a realistic latency, and injects
+upstream errors and timeouts at a configurable rate - no network needed.
+"""
+
+import asyncio
+import logging
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Set up logging for debugging and monitoring
+logger = logging.getLogger(__name__)
+
+# Same ceiling as the real API: no results beyond position 100
+SYNTHETIC_MAX_RESULTS = 100
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    How a simulated upstream behaves
+
+    Latencies are log-normal, fitted so that the median and p99 match.
+    """
+    median_seconds: float
+    p99_seconds: float
+    error_rate: float           # Share of requests answered with 429/500/503
+    timeout_rate: float         # Share of requests that never answer
+
+# Built-in profiles, selected with NEWS_SYNTHETIC_PROFILE
+LATENCY_PROFILES = {
+    'instant': LatencyProfile(median_seconds=0.0, p99_seconds=0.0, error_rate=0.0, timeout_rate=0.0),
+    'fast': LatencyProfile(median_seconds=0.05, p99_seconds=0.15, error_rate=0.0, timeout_rate=0.0),
+    'typical': LatencyProfile(median_seconds=0.35, p99_seconds=1.5, error_rate=0.01, timeout_rate=0.002),
+    'degraded': LatencyProfile(median_seconds=1.2, p99_seconds=6.0, error_rate=0.1, timeout_rate=0.03),
+    'outage': LatencyProfile(median_seconds=0.5, p99_seconds=2.0, error_rate=0.9, timeout_rate=0.05)
+}
+
+# Injected error statuses and how often each appears among errors
+ERROR_STATUSES = [(429, 0.5), (500, 0.25), (503, 0.25)]
+
+# Z-score of the 99th percentile of a standard normal distribution
+_Z_P99 = 2.326
+
+# Per-country places and domain suffixes (anything else gets generic values)
+COUNTRY_PROFILES = {
+    'zw': ('Zimbabwe', ['Harare', 'Bulawayo', 'Mutare', 'Gweru', 'Masvingo', 'Chinhoyi', 'Kwekwe', 'Victoria Falls'], 'co.zw'),
+    'ke': ('Kenya', ['Nairobi', 'Mombasa', 'Kisumu', 'Nakuru', 'Eldoret', 'Thika', 'Machakos', 'Nyeri'], 'co.ke'),
+    'gh': ('Ghana', ['Accra', 'Kumasi', 'Tamale', 'Takoradi', 'Cape Coast', 'Ho', 'Koforidua', 'Sunyani'], 'com.gh'),
+    'rw': ('Rwanda', ['Kigali', 'Huye', 'Musanze', 'Rubavu', 'Nyagatare', 'Muhanga', 'Rusizi', 'Rwamagana'], 'rw'),
+    'cd': ('DR Congo', ['Kinshasa', 'Lubumbashi', 'Goma', 'Bukavu', 'Kisangani', 'Mbuji-Mayi', 'Kananga', 'Matadi'], 'cd'),
+    'za': ('South Africa', ['Johannesburg', 'Cape Town', 'Durban', 'Pretoria', 'Gqeberha', 'Bloemfontein', 'Polokwane', 'Soweto'], 'co.za'),
+    'bi': ('Burundi', ['Gitega', 'Bujumbura', 'Ngozi', 'Rumonge', 'Muyinga', 'Kayanza', 'Makamba', 'Bururi'], 'bi')
+}
+_GENERIC_COUNTRY = ('the region', ['the capital', 'the north', 'the south', 'the east', 'the west', 'border towns'], 'com')
+
+# Headline building blocks per category: (subjects, actions, objects)
+CATEGORY_VOCABULARY = {
+    'politics': (
+        ['Parliament', 'The Finance Minister', 'Opposition leaders', 'The electoral commission', 'The President',
+         'Cabinet', 'Local councillors', 'The Speaker', 'Senators', 'Party officials', 'The Attorney General', 'MPs'],
+        ['approves', 'rejects', 'debates', 'delays', 'unveils', 'challenges', 'backs', 'questions', 'reviews', 'revives'],
+        ['new electoral bill', 'budget amendments', 'devolution plan', 'anti-corruption drive', 'constitutional changes',
+         'by-election timetable', 'civil service reforms', 'land policy', 'regional trade pact', 'cabinet reshuffle']
+    ),
+    'sports': (
+        ['The national team', 'League leaders', 'The champions', 'A teenage striker', 'The athletics federation',
+         'Rugby sevens side', 'The cricket board', 'Marathon runners', 'The coach', 'Club supporters', 'The goalkeeper'],
+        ['wins', 'loses', 'draws', 'targets', 'celebrates', 'prepares for', 'secures', 'misses out on', 'dominates', 'qualifies for'],
+        ['AFCON qualifier', 'derby clash', 'continental cup tie', 'season opener', 'title race', 'relegation battle',
+         'Olympic trials', 'World Cup qualifier', 'cup final', 'training camp']
+    ),
+    'health': (
+        ['Health officials', 'Doctors', 'Nurses', 'The health ministry', 'Rural clinics', 'Researchers', 'District hospitals',
+         'Community health workers', 'Pharmacists', 'The WHO office'],
+        ['launch', 'warn about', 'expand', 'report progress on', 'scale up', 'respond to', 'fund', 'investigate', 'track', 'contain'],
+        ['cholera outbreak', 'malaria campaign', 'vaccination drive', 'maternal health programme', 'drug shortages',
+         'HIV prevention', 'mpox cases', 'hospital upgrades', 'mental health services', 'TB screening']
+    ),
+    'business': (
+        ['The central bank', 'Mining firms', 'Small traders', 'Exporters', 'The stock exchange', 'Investors', 'Banks',
+         'Farmers', 'Manufacturers', 'The revenue authority', 'Telecom operators'],
+        ['announce', 'weigh', 'report', 'cut', 'raise', 'expand', 'pause', 'welcome', 'resist', 'forecast'],
+        ['interest rates', 'quarterly profits', 'export volumes', 'fuel prices', 'currency reforms', 'new tax measures',
+         'foreign investment', 'tobacco sales', 'lithium output', 'inflation figures']
+    ),
+    'technology': (
+        ['Startups', 'Mobile operators', 'The ICT ministry', 'Developers', 'Fintech firms', 'Universities', 'A local app',
+         'Tech hubs', 'Internet providers', 'Cybersecurity experts'],
+        ['launch', 'roll out', 'test', 'expand', 'secure funding for', 'pilot', 'upgrade', 'warn about', 'partner on', 'open'],
+        ['mobile money platform', '5G network', 'coding bootcamp', 'satellite internet', 'e-government portal',
+         'AI research lab', 'data centre', 'digital ID system', 'solar-powered kiosks', 'agritech service']
+    ),
+    'weather': (
+        ['Forecasters', 'The met department', 'Farmers', 'Disaster officials', 'Residents', 'Climate scientists',
+         'Water authorities', 'Emergency teams'],
+        ['predict', 'warn of', 'prepare for', 'report', 'brace for', 'monitor', 'assess', 'respond to'],
+        ['heavy rains', 'a heatwave', 'flash floods', 'drought conditions', 'a tropical cyclone', 'early frost',
+         'El Nino effects', 'strong winds', 'late planting rains', 'dam levels']
+    ),
+    'entertainment': (
+        ['Musicians', 'A local film', 'The arts council', 'Comedians', 'A gospel star', 'Festival organisers',
+         'A rising rapper', 'Fashion designers', 'Actors', 'A dance crew'],
+        ['premiere', 'headline', 'win', 'announce', 'celebrate', 'tour', 'release', 'sell out', 'launch', 'host'],
+        ['new album', 'music festival', 'film awards', 'comedy night', 'arts showcase', 'fashion week',
+         'streaming deal', 'reunion concert', 'talent show', 'cultural gala']
+    ),
+    'education': (
+        ['Teachers', 'Students', 'Universities', 'The education ministry', 'School heads', 'Parents', 'Exam boards',
+         'Colleges', 'Learners', 'Lecturers'],
+        ['protest', 'welcome', 'prepare for', 'debate', 'receive', 'demand', 'launch', 'postpone', 'review', 'celebrate'],
+        ['exam results', 'school fees', 'new curriculum', 'bursary scheme', 'classroom shortages', 'STEM programme',
+         'teacher salaries', 'school feeding scheme', 'university intake', 'e-learning rollout']
+    ),
+    'local-trends': (
+        ['Residents', 'Social media users', 'Community groups', 'Youth', 'Vendors', 'Churches', 'Commuters',
+         'Neighbourhood watch groups', 'Influencers', 'Volunteers'],
+        ['rally behind', 'react to', 'organise', 'debate', 'share', 'celebrate', 'complain about', 'clean up', 'support', 'mourn'],
+        ['viral video', 'market revamp', 'street festival', 'water shortages', 'new bus routes', 'charity drive',
+         'trending hashtag', 'local hero', 'rising rents', 'power cuts']
+    )
+}
+
+# Headline shapes - {subject} {action} {object} {place}
+HEADLINE_TEMPLATES = [
+    "{subject} {action} {object} in {place}",
+    "{place}: {subject} {action} {object}",
+    "{subject} {action} {object} as {place} watches",
+    "Why {subject} {action} {object}",
+    "{subject} {action} {object} - what it means for {place}",
+    "{place} latest: {subject} {action} {object}",
+    "Analysis: {subject} {action} {object}",
+    "{subject} {action} {object} after week of debate in {place}"
+]
+
+# Optional headline endings (the empty string keeps the headline as is)
+HEADLINE_QUALIFIERS = ['', '', '', ' amid rising costs', ' ahead of next month\'s deadline', ' despite objections',
+                       ' after public outcry', ' as pressure mounts', ' in surprise move', ' for second time this year',
+                       ' following weekend talks', ' under new rules', ' as deadline looms', ' in landmark decision',
+                       ' after long delays', ' with donor support', ' amid safety concerns', ' as prices climb',
+                       ' in bid to restore confidence', ' ahead of festive season', ' after court ruling',
+                       ' as rains arrive', ' following audit', ' in record time', ' amid mixed reactions']
+
+# Query words that select a category vocabulary when the category name itself is absent
+CATEGORY_QUERY_HINTS = {
+    'local-trends': ['trending', 'local news', 'lifestyle']
+}
+
+SNIPPET_SENTENCES = [
+    "Officials in {place} said the decision follows months of consultation.",
+    "The move is expected to affect thousands of people across {country}.",
+    "Critics argue the {object} raises more questions than it answers.",
+    "Supporters say the {object} could transform the sector within a year.",
+    "Speaking in {place}, a spokesperson promised further details next week.",
+    "Analysts say the timing of the {object} is significant.",
+    "The announcement drew mixed reactions on social media in {country}.",
+    "Figures released on {weekday} show a sharp change from last year.",
+    "Local leaders in {place} called for calm and patience.",
+    "It is the third such development in {country} this month."
+]
+
+DOMAIN_PREFIXES = ['daily', 'the', 'metro', 'national', 'city', 'sunday', 'weekly', 'morning', 'evening', 'free',
+                   'open', 'true', 'new', 'capital', 'pan', 'east', 'south', 'north', 'west', 'rural']
+DOMAIN_STEMS = ['news', 'times', 'herald', 'post', 'mirror', 'voice', 'star', 'chronicle', 'observer', 'express',
+                'gazette', 'tribune', 'standard', 'monitor', 'insider', 'wire', 'report', 'daily', 'bulletin', 'record']
+
+TRACKING_SUFFIXES = ['?utm_source=twitter&utm_medium=social', '?utm_source=newsletter', '?fbclid=synthetic', '#comments']
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+class SyntheticNewsProvider:
+    """
+    Fake Custom Search API for load and capacity testing.
+
+    - Results are a pure function of (seed, query, country, position): the same
+      search always returns the same items, different searches return different
+      ones, and the combinatorial vocabulary yields millions of distinct headlines
+      per country and category
+    - Items look like CSE items (title, link, snippet, pagemap metatags), newest
+      first over the last 7 days, with a share of syndicated duplicates and
+      tracking-parameter URL variants to exercise dedup
+    - Each request sleeps for a latency drawn from the active profile and may be
+      answered with a 429/500/503 or never answered at all (a timeout)
+    """
+
+    def __init__(
+        self,
+        seed: int = 1,
+        profile: str = 'typical',
+        error_rate: Optional[float] = None,
+        timeout_rate: Optional[float] = None,
+        latency_scale: float = 1.0,
+        duplicate_rate: float = 0.1,
+        results_per_query: int = SYNTHETIC_MAX_RESULTS
+    ):
+        """
+        Args:
+            seed: Corpus seed - change it to get a different corpus
+            profile: Name of a LATENCY_PROFILES entry
+            error_rate: Override the profile's error rate (0-1)
+            timeout_rate: Override the profile's timeout rate (0-1)
+            latency_scale: Multiplier applied to every simulated latency
+            duplicate_rate: Share of items that repeat an earlier story from another outlet
+            results_per_query: Results available per query (capped at 100 like CSE)
+        """
+        if profile not in LATENCY_PROFILES:
+            logger.warning(f"⚠️ Unknown synthetic latency profile '{profile}' - using 'typical'")
+            profile = 'typical'
+        base = LATENCY_PROFILES[profile]
+
+        self.seed = seed
+        self.profile_name = profile
+        self.profile = LatencyProfile(
+            median_seconds=base.median_seconds * latency_scale,
+            p99_seconds=base.p99_seconds * latency_scale,
+            error_rate=base.error_rate if error_rate is None else error_rate,
+            timeout_rate=base.timeout_rate if timeout_rate is None else timeout_rate
+        )
+        self.duplicate_rate = duplicate_rate
+        self.results_per_query = max(0, min(results_per_query, SYNTHETIC_MAX_RESULTS))
+
+        # Behaviour draws (latency, errors) vary per request; content does not
+        self._behaviour_rng = random.Random(seed)
+
+        # Statistics
+        self._stats = {
+            'requests': 0,
+            'items_served': 0,
+            'errors_injected': 0,
+            'timeouts_injected': 0,
+            'simulated_latency_seconds': 0.0
+        }
+
+        logger.info(
+            f"🧪 Synthetic news provider enabled (seed={seed}, profile={profile}, "
+            f"error_rate={self.profile.error_rate}, timeout_rate={self.profile.timeout_rate})"
+        )
+
+    # ===== REQUESTS =====
+
+    async def search(self, params: Dict[str, Any], timeout: float) -> Tuple[int, Dict[str, Any]]:
+        """
+        Answer one CSE page request
+
+        Args:
+            params: CSE query parameters ('q', 'gl', 'start', 'num', ...)
+            timeout: Client timeout of the caller in seconds
+
+        Returns:
+            (HTTP status, decoded JSON body) - the body is a CSE error object for non-200
+
+        Raises:
+            asyncio.TimeoutError: When the request is simulated to hang (after `timeout`)
+        """
+        self._stats['requests'] += 1
+        latency = self._draw_latency()
+        roll = self._behaviour_rng.random()
+
+        if roll < self.profile.timeout_rate or latency >= timeout:
+            self._stats['timeouts_injected'] += 1
+            self._stats['simulated_latency_seconds'] += timeout
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+
+        self._stats['simulated_latency_seconds'] += latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        if roll < self.profile.timeout_rate + self.profile.error_rate:
+            self._stats['errors_injected'] += 1
+            status = self._draw_error_status()
+            return status, {'error': {'code': status, 'message': 'Synthetic upstream error', 'status': 'UNAVAILABLE'}}
+
+        start = max(1, int(params.get('start', 1)))
+        num = max(1, min(int(params.get('num', 10)), 10))
+        country = str(params.get('gl', '')).lower()
+        query = str(params.get('q', ''))
+
+        items = self.generate_items(query, country, start, num)
+        self._stats['items_served'] += len(items)
+        return 200, {
+            'kind': 'customsearch#search',
+            'searchInformation': {'totalResults': str(self.results_per_query)},
+            'items': items
+        }
+
+    def _draw_latency(self) -> float:
+        """Draw one request latency from the profile's log-normal distribution"""
+        median = self.profile.median_seconds
+        if median <= 0:
+            return 0.0
+        sigma = math.log(max(self.profile.p99_seconds, median) / median) / _Z_P99
+        return self._behaviour_rng.lognormvariate(math.log(median), sigma)
+
+    def _draw_error_status(self) -> int:
+        """Pick an injected error status according to ERROR_STATUSES"""
+        statuses, weights = zip(*ERROR_STATUSES)
+        return self._behaviour_rng.choices(statuses, weights=weights)[0]
+
+    # ===== CORPUS =====
+
+    def generate_items(self, query: str, country: str, start: int, num: int) -> List[Dict[str, Any]]:
+        """
+        Build CSE items for positions start .. start+num-1 of a query
+
+        Args:
+            query: Search query (selects the category vocabulary)
+            country: Lowercase country code (selects places and domains)
+            start: 1-based position of the first item
+            num: Number of items
+
+        Returns:
+            List of CSE-shaped item dictionaries (shorter past the end of the result set)
+        """
+        end = min(start + num, self.results_per_query + 1)
+        return [self._item(query, country, position) for position in range(start, end)]
+
+    def _item(self, query: str, country: str, position: int) -> Dict[str, Any]:
+        """Build the item at one position (deterministic for the seed)"""
+        rng = random.Random(f"{self.seed}|{query}|{country}|{position}")
+
+        # Syndicated copy: an earlier story republished by another outlet
+        story_position = position
+        if position > 1 and rng.random() < self.duplicate_rate:
+            story_position = rng.randint(1, position - 1)
+        story_rng = random.Random(f"{self.seed}|{query}|{country}|story|{story_position}")
+
+        country_name, places, suffix = COUNTRY_PROFILES.get(country, _GENERIC_COUNTRY)
+        subjects, actions, objects = CATEGORY_VOCABULARY[self._category_for(query, story_rng)]
+        place = story_rng.choice(places)
+        obj = story_rng.choice(objects)
+        title = story_rng.choice(HEADLINE_TEMPLATES).format(
+            subject=story_rng.choice(subjects),
+            action=story_rng.choice(actions),
+            object=obj,
+            place=place
+        )
+        title = title[0].upper() + title[1:] + story_rng.choice(HEADLINE_QUALIFIERS)
+
+        snippet = ' '.join(
+            sentence.format(place=place, country=country_name, object=obj, weekday=story_rng.choice(WEEKDAYS))
+            for sentence in story_rng.sample(SNIPPET_SENTENCES, 2)
+        )
+
+        domain = f"{rng.choice(DOMAIN_PREFIXES)}{rng.choice(DOMAIN_STEMS)}.{suffix}"
+        slug = '-'.join(title.lower().replace(':', '').replace('-', ' ').split()[:8])
+        link = f"https://www.{domain}/news/{story_position}-{slug}"
+        if rng.random() < self.duplicate_rate:
+            link += rng.choice(TRACKING_SUFFIXES)
+
+        # Newest first across the last 7 days, like sort=date&dateRestrict=d7
+        spacing = timedelta(days=7) / max(1, self.results_per_query)
+        published = self._anchor() - spacing * (position - 1) - timedelta(seconds=rng.randint(0, 600))
+
+        return {
+            'kind': 'customsearch#result',
+            'title': f"{title} - {domain}",
+            'link': link,
+            'displayLink': f"www.{domain}",
+            'snippet': snippet,
+            'pagemap': {'metatags': [{'article:published_time': published.isoformat()}]}
+        }
+
+    @staticmethod
+    def _category_for(query: str, rng: random.Random) -> str:
+        """Category vocabulary matching the query (a random one for general queries)"""
+        words = query.lower()
+        for category in CATEGORY_VOCABULARY:
+            hints = [category, category.replace('-', ' ')] + CATEGORY_QUERY_HINTS.get(category, [])
+            if any(hint in words for hint in hints):
+                return category
+        return rng.choice(list(CATEGORY_VOCABULARY))
+
+    @staticmethod
+    def _anchor() -> datetime:
+        """Newest publish time in the corpus (the current hour, so dates stay recent)"""
+        return datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request and injection counters
+
+        Returns:
+            Dictionary suitable for a health endpoint
+        """
+        requests = self._stats['requests']
+        return {
+            'provider': 'synthetic',
+            'seed': self.seed,
+            'profile': self.profile_name,
+            'error_rate': self.profile.error_rate,
+            'timeout_rate': self.profile.timeout_rate,
+            **self._stats,
+            'simulated_latency_seconds': round(self._stats['simulated_latency_seconds'], 3),
+            'mean_latency_seconds': round(self._stats['simulated_latency_seconds'] / requests, 3) if requests else None
+        }
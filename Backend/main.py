@@ -102,23 +102,47 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
+import os
 
 # Import all route modules - INCLUDING search routes
 from app.routes import health_routes, news_routes, auth_routes, article_routes, search_routes
+from app.services.news_service import news_service
+from app.services.feed_materializer import feed_materializer
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Startup/shutdown hooks - open and close long-lived upstream resources
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs once when the server starts (before yield) and once when it stops (after yield)
+    Owns the pooled upstream HTTP sessions so connections are reused across requests,
+    and the background scheduler that keeps the requested category x country feeds materialized
+    """
+    logger.info("🫖 TeaCup News API starting up...")
+    await news_service.startup()
+    if os.getenv("FEED_MATERIALIZER_ENABLED", "true").lower() == "true":
+        feed_materializer.start(news_routes.VALID_CATEGORIES, news_routes.VALID_COUNTRIES)
+    yield
+    logger.info("🫖 TeaCup News API shutting down...")
+    await feed_materializer.stop()
+    if article_routes.scraper_service is not None:
+        await article_routes.scraper_service.close()
+    await news_service.shutdown()
+
 # Create FastAPI application
 app = FastAPI(
     title="TeaCup Multi-Country News API",
     description="News aggregation API with search and authentication",
     version="2.0.0",
     docs_url="/docs",  # Swagger UI available at /docs
-    redoc_url="/redoc"  # ReDoc available at /redoc
+    redoc_url="/redoc",  # ReDoc available at /redoc
+    lifespan=lifespan  # Startup/shutdown of pooled upstream connections
 )
 
 # Configure CORS middleware for frontend communication
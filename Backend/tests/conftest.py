@@ -0,0 +1,21 @@
+# Backend/tests/conftest.py
+"""
+Shared test setup
+
+Service modules create their global instances (and SQLite files) at import
+time, so the environment is pointed at a scratch directory and at offline
+providers before any app module is imported.
+"""
+
+import os
+import tempfile
+
+_scratch = tempfile.mkdtemp(prefix="teacup-tests-")
+
+os.environ.setdefault("NEWS_STORE_PATH", os.path.join(_scratch, "news_store.sqlite3"))
+os.environ.setdefault("HTTP_CACHE_PATH", os.path.join(_scratch, "http_cache.sqlite3"))
+os.environ.setdefault("SUMMARY_CACHE_PATH", os.path.join(_scratch, "summary_cache.sqlite3"))
+os.environ.setdefault("RSS_INGESTION_ENABLED", "false")
+os.environ["NEWS_PROVIDER"] = "google"
+os.environ["GOOGLE_SEARCH_API_KEY"] = ""
+os.environ["GOOGLE_CSE_ID"] = ""
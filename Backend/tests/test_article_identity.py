@@ -0,0 +1,66 @@
+# Backend/tests/test_article_identity.py
+"""
+Tests for canonical article URLs and stable article IDs
+"""
+
+import pytest
+
+from app.services.article_identity import ARTICLE_ID_LENGTH, article_id_for_url, canonicalize_url
+
+@pytest.mark.parametrize('url, canonical', [
+    # Tracking parameters and fragments go, real parameters stay sorted
+    ("https://herald.co.zw/story?utm_source=x&utm_medium=y", "https://herald.co.zw/story"),
+    ("https://herald.co.zw/story?fbclid=abc&id=7#comments", "https://herald.co.zw/story?id=7"),
+    ("https://herald.co.zw/story?b=2&a=1&gclid=z", "https://herald.co.zw/story?a=1&b=2"),
+    ("https://herald.co.zw/story?amp=1&id=7", "https://herald.co.zw/story?id=7"),
+    # Scheme, case, default ports and mirror hosts
+    ("http://HERALD.co.zw/story", "https://herald.co.zw/story"),
+    ("https://herald.co.zw:443/story", "https://herald.co.zw/story"),
+    ("http://herald.co.zw:80/story", "https://herald.co.zw/story"),
+    ("https://herald.co.zw:8080/story", "https://herald.co.zw:8080/story"),
+    ("https://www.herald.co.zw/story", "https://herald.co.zw/story"),
+    ("https://m.nation.africa/story", "https://nation.africa/story"),
+    ("https://amp.theguardian.com/story", "https://theguardian.com/story"),
+    ("https://www.example.com./story", "https://example.com/story"),
+    # A bare domain or country suffix is never stripped further
+    ("https://www.com/story", "https://www.com/story"),
+    ("https://www.co.zw/story", "https://www.co.zw/story"),
+    ("https://m.com.gh/story", "https://m.com.gh/story"),
+    # Paths: duplicate/trailing slashes and AMP suffixes
+    ("https://herald.co.zw//news//story/", "https://herald.co.zw/news/story"),
+    ("https://herald.co.zw/news/story/amp", "https://herald.co.zw/news/story"),
+    ("https://herald.co.zw/news/story/amp/", "https://herald.co.zw/news/story"),
+    ("https://herald.co.zw/amp", "https://herald.co.zw/"),
+    ("https://herald.co.zw", "https://herald.co.zw/"),
+    # Unparseable input is returned stripped
+    ("  not a url  ", "not a url"),
+    ("", ""),
+])
+def test_canonicalize_url(url, canonical):
+    assert canonicalize_url(url) == canonical
+
+@pytest.mark.parametrize('first, second', [
+    ("http://www.herald.co.zw/story/?utm_campaign=x", "https://herald.co.zw/story"),
+    ("https://m.herald.co.zw/story/amp", "https://herald.co.zw/story#top"),
+    ("https://herald.co.zw/story?b=2&a=1", "https://herald.co.zw/story?a=1&b=2"),
+])
+def test_links_to_the_same_page_share_an_id(first, second):
+    assert article_id_for_url(first) == article_id_for_url(second)
+
+@pytest.mark.parametrize('first, second', [
+    ("https://herald.co.zw/story?page=2", "https://herald.co.zw/story?page=3"),
+    ("https://herald.co.zw/story?id=7", "https://herald.co.zw/story"),
+    ("https://herald.co.zw/news/one", "https://herald.co.zw/news/two"),
+    ("https://herald.co.zw/story", "https://newsday.co.zw/story"),
+    ("https://herald.co.zw:8080/story", "https://herald.co.zw/story"),
+    ("https://herald.co.zw/Story", "https://herald.co.zw/story"),
+])
+def test_different_pages_keep_distinct_ids(first, second):
+    assert article_id_for_url(first) != article_id_for_url(second)
+
+def test_ids_are_stable_hex():
+    article_id = article_id_for_url("https://herald.co.zw/story")
+
+    assert len(article_id) == ARTICLE_ID_LENGTH
+    int(article_id, 16)
+    assert article_id == article_id_for_url("https://herald.co.zw/story")
@@ -0,0 +1,117 @@
+# Backend/tests/test_article_scraper.py
+"""
+Tests for article fetching: hedging, circuit breaker accounting and pooled connections
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.article_scraper_service import ArticleScraperService
+from app.services.circuit_breaker import circuit_breakers
+from app.services.latency_budget import latency_trackers
+
+PAGE = "<html><body><article>" + "<p>" + "Story text. " * 40 + "</p>" + "</article></body></html>"
+
+@pytest.fixture
+def fast_hedge(monkeypatch):
+    """Hedge after 50 ms instead of the scraper's default 3 s"""
+    tracker = latency_trackers.get('scraper')
+    monkeypatch.setattr(tracker, 'default_hedge_delay', 0.05)
+    monkeypatch.setattr(tracker, '_samples', type(tracker._samples)(maxlen=tracker._samples.maxlen))
+    return tracker
+
+async def start_server(handler) -> TestServer:
+    app = web.Application()
+    app.router.add_get('/{name}', handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+def breaker_for(server: TestServer):
+    """The scraper's breaker for a test server (look it up before the server closes)"""
+    return circuit_breakers.get(f"scraper:{server.host}:{server.port}")
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_through_to_the_hedge(fast_hedge):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        if len(calls) == 1:
+            await asyncio.sleep(0.2)        # Slow primary that then fails
+            return web.Response(status=503, headers={'Cache-Control': 'no-store'})
+        await asyncio.sleep(0.4)            # Hedge that succeeds after the primary failed
+        return web.Response(text=PAGE, content_type='text/html', headers={'Cache-Control': 'no-store'})
+
+    server = await start_server(handler)
+    breaker = breaker_for(server)
+    scraper = ArticleScraperService()
+    try:
+        html = await scraper._fetch_html(str(server.make_url('/hedged')))
+    finally:
+        await scraper.close()
+        await server.close()
+
+    assert html == PAGE
+    assert len(calls) == 2
+    assert breaker.get_state()['total_failures'] == 0
+
+@pytest.mark.asyncio
+async def test_both_attempts_failing_count_one_failure(fast_hedge):
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return web.Response(status=500, headers={'Cache-Control': 'no-store'})
+
+    server = await start_server(handler)
+    breaker = breaker_for(server)
+    scraper = ArticleScraperService()
+    try:
+        html = await scraper._fetch_html(str(server.make_url('/broken')))
+    finally:
+        await scraper.close()
+        await server.close()
+
+    assert html is None
+    assert breaker.get_state()['total_failures'] == 1
+    assert fast_hedge.percentile(0.95) is None      # Failures are not latency samples
+
+@pytest.mark.asyncio
+async def test_missing_page_is_not_a_host_failure(fast_hedge):
+    async def handler(request):
+        return web.Response(status=404, headers={'Cache-Control': 'no-store'})
+
+    server = await start_server(handler)
+    breaker = breaker_for(server)
+    scraper = ArticleScraperService()
+    try:
+        html = await scraper._fetch_html(str(server.make_url('/gone')))
+    finally:
+        await scraper.close()
+        await server.close()
+
+    assert html is None
+    assert breaker.get_state()['total_failures'] == 0
+
+@pytest.mark.asyncio
+async def test_fetches_reuse_pooled_connections(fast_hedge):
+    async def handler(request):
+        return web.Response(text=PAGE, content_type='text/html', headers={'Cache-Control': 'no-store'})
+
+    server = await start_server(handler)
+    breaker = breaker_for(server)
+    scraper = ArticleScraperService()
+    try:
+        for name in ('one', 'two', 'three'):
+            assert await scraper._fetch_html(str(server.make_url(f'/{name}'))) == PAGE
+        stats = scraper.http_pool.get_stats()
+    finally:
+        await scraper.close()
+        await server.close()
+
+    assert stats['sessions_opened'] == 1
+    assert stats['connections_created'] == 1
+    assert stats['connections_reused'] == 2
+    assert breaker.get_state()['total_successes'] == 3
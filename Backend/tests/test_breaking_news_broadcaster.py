@@ -0,0 +1,103 @@
+# Backend/tests/test_breaking_news_broadcaster.py
+"""
+Tests for breaking news fan-out, Last-Event-ID replay and slow subscribers
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from app.services.breaking_news_broadcaster import BreakingNewsBroadcaster
+
+@dataclass(frozen=True)
+class Article:
+    id: str
+    publishedAt: Optional[int] = None
+
+    def to_dict(self, **extra):
+        return {'id': self.id, **extra}
+
+def event_id(frame: str) -> str:
+    return frame.split('\n', 1)[0][len('id: '):]
+
+def article_id(frame: str) -> str:
+    data = next(line for line in frame.split('\n') if line.startswith('data: '))
+    return json.loads(data[len('data: '):])['id']
+
+@pytest.mark.asyncio
+async def test_each_article_is_pushed_once_to_every_subscriber():
+    broadcaster = BreakingNewsBroadcaster()
+    first = broadcaster.subscribe('ZW')
+    second = broadcaster.subscribe('ZW')
+    other_country = broadcaster.subscribe('KE')
+
+    assert broadcaster.publish('ZW', [Article('a'), Article('b')]) == 2
+    assert broadcaster.publish('ZW', [Article('a')]) == 0          # Seen by a later refresh
+
+    for subscription in (first, second):
+        assert [article_id(subscription.queue.get_nowait()) for _ in range(2)] == ['a', 'b']
+        assert subscription.queue.empty()
+    assert other_country.queue.empty()
+    assert broadcaster.get_stats()['duplicates_skipped'] == 1
+
+@pytest.mark.asyncio
+async def test_stale_articles_are_not_pushed():
+    broadcaster = BreakingNewsBroadcaster(max_age_hours=1)
+    assert broadcaster.publish('ZW', [Article('old', publishedAt=int(time.time()) - 7200)]) == 0
+    assert broadcaster.get_stats()['stale_skipped'] == 1
+
+@pytest.mark.asyncio
+async def test_last_event_id_replays_only_missed_events():
+    broadcaster = BreakingNewsBroadcaster()
+    first = broadcaster.subscribe('ZW')
+    broadcaster.publish('ZW', [Article('a'), Article('b')])
+    last_seen = event_id(first.queue.get_nowait())     # Client received 'a', then disconnected
+    broadcaster.unsubscribe(first)
+    broadcaster.publish('ZW', [Article('c')])
+
+    resumed = broadcaster.subscribe('ZW', last_event_id=last_seen)
+
+    assert not resumed.reset
+    assert [article_id(frame) for frame in resumed.replay] == ['b', 'c']
+
+@pytest.mark.asyncio
+async def test_unplaceable_last_event_id_replays_all_history():
+    broadcaster = BreakingNewsBroadcaster(history_size=2)
+    broadcaster.publish('ZW', [Article('a'), Article('b'), Article('c'), Article('d')])
+
+    # The client saw 'a', but 'b' (the next event it needs) was already evicted
+    evicted = broadcaster.subscribe('ZW', last_event_id=f"{broadcaster.epoch}.1")
+    foreign = broadcaster.subscribe('ZW', last_event_id='cafebabe.2')
+    exact = broadcaster.subscribe('ZW', last_event_id=f"{broadcaster.epoch}.2")
+
+    for subscription in (evicted, foreign):
+        assert subscription.reset
+        assert [article_id(frame) for frame in subscription.replay] == ['c', 'd']
+    assert not exact.reset and [article_id(frame) for frame in exact.replay] == ['c', 'd']
+    assert broadcaster.get_stats()['resume_resets'] == 2
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_dropped_with_a_close_marker():
+    broadcaster = BreakingNewsBroadcaster(buffer_size=2)
+    slow = broadcaster.subscribe('ZW')
+    fast = broadcaster.subscribe('ZW')
+
+    broadcaster.publish('ZW', [Article('a'), Article('b')])
+    fast.queue.get_nowait()
+    fast.queue.get_nowait()
+    broadcaster.publish('ZW', [Article('c')])
+
+    assert slow.closed
+    assert slow.queue.get_nowait() is None
+    assert article_id(fast.queue.get_nowait()) == 'c'
+    assert broadcaster.get_stats()['subscribers'] == {'ZW': 1}
+
+@pytest.mark.asyncio
+async def test_subscriber_limit():
+    broadcaster = BreakingNewsBroadcaster(max_subscribers=1)
+    broadcaster.subscribe('ZW')
+    with pytest.raises(OverflowError):
+        broadcaster.subscribe('KE')
@@ -0,0 +1,37 @@
+# Backend/tests/test_breaking_news_classifier.py
+"""
+Tests for the breaking news rule sets and their classification
+"""
+
+import os
+
+from app.services.breaking_news_classifier import DEFAULT_RULES_PATH, BreakingNewsClassifier
+
+EXAMPLE_RULES_PATH = os.path.join(os.path.dirname(DEFAULT_RULES_PATH), 'breaking_news_rules.example.json')
+
+def test_default_rules_match_only_breaking_phrases():
+    classifier = BreakingNewsClassifier(DEFAULT_RULES_PATH)
+
+    assert classifier.classify("BREAKING NEWS: Cabinet reshuffle", "", 'KE')
+    assert classifier.classify("Soldiers seen in Harare", "Army deployed to the city centre", 'ZW')
+    assert classifier.classify("Blessd Geza addresses supporters", "", 'ZW')
+
+    # Like the original keyword list, 'army' applies to every country - as a whole word
+    assert classifier.classify("Army deployed to the city centre", "", 'KE')
+    assert classifier.classify("Ghana army chief retires", "", 'GH')
+    assert not classifier.classify("Farmers battle fall armyworm outbreak", "", 'ZW')
+
+    # Routine stories that mention an organisation or place are not breaking
+    assert classifier.classify_batch([
+        ("Eskom announces new tariffs for 2027", "The utility published its price schedule."),
+        ("Goma traders reopen markets", "Business returns to normal in the city."),
+        ("Earthquake drill held at schools", "Pupils practised evacuation procedures.")
+    ], 'ZA') == [False, False, False]
+
+def test_example_rules_load_and_need_an_action():
+    classifier = BreakingNewsClassifier(EXAMPLE_RULES_PATH)
+
+    assert classifier.get_stats()['reload_errors'] == 0
+    assert classifier.classify("M23 rebels seize town north of Goma", "", 'CD')
+    assert not classifier.classify("Goma traders reopen markets", "", 'CD')
+    assert not classifier.classify("Eskom announces new tariffs", "", 'ZA')
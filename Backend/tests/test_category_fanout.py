@@ -0,0 +1,122 @@
+# Backend/tests/test_category_fanout.py
+"""
+Tests for fetching several categories at once under a deadline
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import news_service as news_service_module
+from app.services.news_service import NewsService, ProcessedArticle
+
+CATEGORIES = ['politics', 'business', 'sports', 'health', 'weather', 'technology']
+
+def article(category: str) -> ProcessedArticle:
+    return ProcessedArticle.from_dict({'title': f"{category} headline", 'sourceUrl': f"https://herald.co.zw/{category}/1"})
+
+class Categories:
+    """Stub for NewsService.get_news_for_category with per-category delays and failures"""
+
+    def __init__(self, delays=None, failing=(), empty=()):
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.empty = set(empty)
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = []
+        self.budgets = []
+
+    async def fetch(self, category, max_articles, country_code, quota=None, budget=None):
+        self.budgets.append(budget)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(category, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(category)
+            raise
+        finally:
+            self.running -= 1
+        if category in self.failing:
+            raise RuntimeError(f"{category} upstream down")
+        return [] if category in self.empty else [article(category)]
+
+@pytest.fixture(autouse=True)
+def short_grace(monkeypatch):
+    monkeypatch.setattr(news_service_module, 'FANOUT_GRACE_SECONDS', 0.05)
+
+def fanout_service(monkeypatch, categories: Categories, concurrency: int = 4) -> NewsService:
+    service = NewsService()
+    service.fanout_concurrency = concurrency
+    monkeypatch.setattr(service, 'get_news_for_category', categories.fetch)
+    return service
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_by_the_semaphore(monkeypatch):
+    categories = Categories(delays={category: 0.02 for category in CATEGORIES})
+    service = fanout_service(monkeypatch, categories, concurrency=2)
+
+    result = await service.get_all_categories_news(categories=CATEGORIES, deadline_seconds=5)
+
+    assert categories.max_running == 2
+    assert list(result.news_by_category) == CATEGORIES
+    assert set(result.category_status.values()) == {'ok'}
+    assert result.deadline_hit is False
+
+@pytest.mark.asyncio
+async def test_slow_categories_time_out_and_finished_ones_are_kept(monkeypatch):
+    categories = Categories(delays={'sports': 5, 'weather': 5}, failing=['health'], empty=['technology'])
+    service = fanout_service(monkeypatch, categories)
+
+    result = await service.get_all_categories_news(categories=CATEGORIES, deadline_seconds=0.1)
+    await asyncio.sleep(0)
+
+    assert result.category_status == {
+        'politics': 'ok', 'business': 'ok', 'sports': 'timeout',
+        'health': 'error', 'weather': 'timeout', 'technology': 'empty'
+    }
+    assert list(result.news_by_category) == ['politics', 'business', 'technology']
+    assert result.news_by_category['politics'][0].title == "politics headline"
+    assert result.deadline_hit is True
+    assert result.elapsed_seconds < 1
+    assert sorted(categories.cancelled) == ['sports', 'weather']
+
+@pytest.mark.asyncio
+async def test_every_category_shares_one_budget_ending_at_the_deadline(monkeypatch):
+    categories = Categories()
+    service = fanout_service(monkeypatch, categories)
+
+    await service.get_all_categories_news(categories=CATEGORIES, deadline_seconds=2)
+
+    assert len(set(map(id, categories.budgets))) == 1
+    assert categories.budgets[0].remaining() <= 2
+
+@pytest.mark.asyncio
+async def test_iterator_yields_in_completion_order_with_timeouts_last(monkeypatch):
+    categories = Categories(delays={'politics': 0.05, 'business': 0.01, 'sports': 5})
+    service = fanout_service(monkeypatch, categories)
+
+    outcomes = [
+        outcome async for outcome in service.iter_categories_news(
+            categories=['politics', 'business', 'sports'], deadline_seconds=0.1
+        )
+    ]
+
+    assert [(outcome.category, outcome.status) for outcome in outcomes] == [
+        ('business', 'ok'), ('politics', 'ok'), ('sports', 'timeout')
+    ]
+    assert outcomes[0].elapsed_seconds <= outcomes[1].elapsed_seconds
+
+@pytest.mark.asyncio
+async def test_closing_the_iterator_cancels_running_categories(monkeypatch):
+    categories = Categories(delays={'politics': 0.01, 'sports': 5, 'weather': 5})
+    service = fanout_service(monkeypatch, categories)
+
+    outcomes = service.iter_categories_news(categories=['politics', 'sports', 'weather'], deadline_seconds=10)
+    first = await outcomes.__anext__()
+    await outcomes.aclose()
+    await asyncio.sleep(0)
+
+    assert first.category == 'politics'
+    assert sorted(categories.cancelled) == ['sports', 'weather']
@@ -0,0 +1,123 @@
+# Backend/tests/test_circuit_breaker.py
+"""
+Tests for the per-upstream circuit breaker
+"""
+
+import pytest
+
+from app.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    UpstreamError,
+    is_failure_exception,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN
+)
+
+def make_half_open(breaker: CircuitBreaker) -> None:
+    """Trip the breaker and let its cool-down expire"""
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    breaker._open_until = 0.0
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker('test', failure_threshold=3, base_open_seconds=60)
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker('test', failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == STATE_CLOSED
+
+def test_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker('test', failure_threshold=1, base_open_seconds=60)
+    make_half_open(breaker)
+
+    assert breaker.before_call() is True
+    assert breaker.state == STATE_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.before_call() is False
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker('test', failure_threshold=1, base_open_seconds=60)
+    make_half_open(breaker)
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == STATE_OPEN
+
+def test_released_probe_lets_the_next_call_probe():
+    breaker = CircuitBreaker('test', failure_threshold=1, base_open_seconds=60)
+    make_half_open(breaker)
+
+    assert breaker.before_call() is True
+    breaker.release_probe()
+
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.get_state()['total_failures'] == 1
+    assert breaker.before_call() is True
+
+def test_release_after_outcome_does_nothing():
+    breaker = CircuitBreaker('test', failure_threshold=1, base_open_seconds=60)
+    make_half_open(breaker)
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.release_probe()
+
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+class APIStatusError(Exception):
+    """Stand-in for the OpenAI SDK's status error"""
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+class APIConnectionError(Exception):
+    """Stand-in for the OpenAI SDK's connection error"""
+
+class APITimeoutError(APIConnectionError):
+    """Stand-in for the OpenAI SDK's timeout error"""
+
+@pytest.mark.parametrize('error, expected', [
+    (APIStatusError(429), True),
+    (APIStatusError(503), True),
+    (APIStatusError(400), False),
+    (APIStatusError(401), False),
+    (UpstreamError('google_cse', 500), True),
+    (UpstreamError('google_cse', 404), False),
+    (TimeoutError(), True),
+    (ConnectionResetError(), True),
+    (APITimeoutError(), True),
+    (APIConnectionError(), True),
+    (ValueError('bad reply'), False),
+])
+def test_is_failure_exception(error, expected):
+    assert is_failure_exception(error) is expected
+
+def test_registry_reuses_breakers():
+    registry = CircuitBreakerRegistry()
+
+    assert registry.get('google_cse') is registry.get('google_cse')
+    assert registry.get('scraper:a.example') is not registry.get('scraper:b.example')
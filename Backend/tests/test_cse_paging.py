@@ -0,0 +1,136 @@
+# Backend/tests/test_cse_paging.py
+"""
+Tests for splitting CSE requests into pages and merging the pages back
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.circuit_breaker import UpstreamError
+from app.services.news_service import NewsService, NewsSource
+from app.services.quota_manager import PRIORITY_USER, QuotaContext
+
+QUOTA = QuotaContext(route="test", priority=PRIORITY_USER)
+
+def sources(start: int, count: int):
+    return [
+        NewsSource(url=f"https://www.herald.co.zw/story-{start + i}", title=f"Story {start + i}",
+                   snippet="Reported by our correspondent.", source_name="The Herald")
+        for i in range(count)
+    ]
+
+class Pages:
+    """Stub for NewsService._fetch_cse_page answering from a table of pages"""
+
+    def __init__(self, answers=None, delays=None):
+        self.answers = answers or {}
+        self.delays = delays or {}
+        self.requested = []
+        self.cancelled = []
+
+    async def fetch(self, params, start, num, country_code, quota):
+        self.requested.append((start, num))
+        try:
+            await asyncio.sleep(self.delays.get(start, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(start)
+            raise
+        answer = self.answers.get(start, sources(start, num))
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+def paged_service(monkeypatch, pages: Pages) -> NewsService:
+    service = NewsService()
+    monkeypatch.setattr(service, '_fetch_cse_page', pages.fetch)
+    return service
+
+def test_plan_cse_pages():
+    service = NewsService()
+
+    assert service._plan_cse_pages(25) == [(1, 10), (11, 10), (21, 5)]
+    assert service._plan_cse_pages(10) == [(1, 10)]
+    assert service._plan_cse_pages(0) == [(1, 1)]
+    # CSE never serves results past start=91
+    plan = service._plan_cse_pages(250)
+    assert len(plan) == 10 and plan[-1] == (91, 10)
+
+@pytest.mark.asyncio
+async def test_every_planned_page_is_requested_and_merged_in_rank_order(monkeypatch):
+    # Later pages answer first; the merge still follows CSE rank
+    pages = Pages(delays={1: 0.03, 11: 0.02, 21: 0})
+    service = paged_service(monkeypatch, pages)
+
+    merged = await service._fetch_cse_pages({'q': 'zimbabwe'}, 25, 'ZW', QUOTA)
+
+    assert sorted(pages.requested) == [(1, 10), (11, 10), (21, 5)]
+    assert [source.title for source in merged] == [f"Story {i}" for i in range(1, 26)]
+
+@pytest.mark.asyncio
+async def test_duplicates_across_pages_are_dropped(monkeypatch):
+    repeat = NewsSource(url="https://herald.co.zw/story-3?utm_source=twitter", title="Story 3 again",
+                        snippet="Reported by our correspondent.", source_name="The Herald")
+    pages = Pages(answers={11: [repeat] + sources(11, 9)})
+    service = paged_service(monkeypatch, pages)
+
+    merged = await service._fetch_cse_pages({'q': 'zimbabwe'}, 20, 'ZW', QUOTA)
+
+    titles = [source.title for source in merged]
+    assert len(merged) == 19
+    assert "Story 3" in titles and "Story 3 again" not in titles
+
+@pytest.mark.asyncio
+async def test_pages_after_a_short_page_are_cancelled(monkeypatch):
+    # Page 1 has only 4 results: Google has nothing beyond them
+    pages = Pages(answers={1: sources(1, 4)}, delays={11: 1, 21: 1})
+    service = paged_service(monkeypatch, pages)
+
+    merged = await service._fetch_cse_pages({'q': 'zimbabwe'}, 25, 'ZW', QUOTA)
+    await asyncio.sleep(0)
+
+    assert len(merged) == 4
+    assert sorted(pages.cancelled) == [11, 21]
+
+@pytest.mark.asyncio
+async def test_a_short_later_page_keeps_the_pages_before_it(monkeypatch):
+    pages = Pages(answers={11: sources(11, 3)}, delays={1: 0.02, 21: 1})
+    service = paged_service(monkeypatch, pages)
+
+    merged = await service._fetch_cse_pages({'q': 'zimbabwe'}, 25, 'ZW', QUOTA)
+    await asyncio.sleep(0)
+
+    assert len(merged) == 13
+    assert pages.cancelled == [21]
+
+@pytest.mark.asyncio
+async def test_stops_once_enough_unique_results_arrive(monkeypatch):
+    # A page answering more than it was asked for already covers the request
+    pages = Pages(answers={1: sources(1, 25)}, delays={11: 1, 21: 1})
+    service = paged_service(monkeypatch, pages)
+
+    merged = await service._fetch_cse_pages({'q': 'zimbabwe'}, 25, 'ZW', QUOTA)
+    await asyncio.sleep(0)
+
+    assert len(merged) == 25
+    assert sorted(pages.cancelled) == [11, 21]
+
+@pytest.mark.asyncio
+async def test_failed_later_page_is_skipped(monkeypatch):
+    pages = Pages(answers={11: UpstreamError('google_cse', 503)})
+    service = paged_service(monkeypatch, pages)
+
+    merged = await service._fetch_cse_pages({'q': 'zimbabwe'}, 25, 'ZW', QUOTA)
+
+    assert [source.title for source in merged] == [f"Story {i}" for i in list(range(1, 11)) + list(range(21, 26))]
+
+@pytest.mark.asyncio
+async def test_failed_first_page_raises_and_cancels_the_rest(monkeypatch):
+    pages = Pages(answers={1: UpstreamError('google_cse', 503)}, delays={11: 1, 21: 1})
+    service = paged_service(monkeypatch, pages)
+
+    with pytest.raises(UpstreamError):
+        await service._fetch_cse_pages({'q': 'zimbabwe'}, 25, 'ZW', QUOTA)
+    await asyncio.sleep(0)
+
+    assert sorted(pages.cancelled) == [11, 21]
@@ -0,0 +1,98 @@
+# Backend/tests/test_feed_delta_tracker.py
+"""
+Tests for cursor-based feed deltas
+"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from app.services import news_service as news_module
+from app.services.feed_delta_tracker import FeedDeltaTracker
+from app.services.news_service import NewsService
+
+@dataclass(frozen=True)
+class Article:
+    id: str
+    title: str = "Headline"
+
+A, B, C, D = Article('a'), Article('b'), Article('c'), Article('d')
+
+def test_delta_lists_added_updated_and_removed():
+    tracker = FeedDeltaTracker()
+    tracker.record('politics', 'ZW', [A, B, C])
+    cursor = tracker.cursor()
+
+    retitled_b = Article('b', title="Updated headline")
+    tracker.record('politics', 'ZW', [D, A, retitled_b])
+    delta = tracker.changes_since('politics', 'ZW', cursor)
+
+    assert not delta.reset
+    assert delta.added == [D]
+    assert delta.updated == [retitled_b]
+    assert delta.removed == ['c']
+    assert delta.cursor == tracker.cursor()
+
+def test_unchanged_feed_keeps_the_cursor():
+    tracker = FeedDeltaTracker()
+    tracker.record('politics', 'ZW', [A, B])
+    cursor = tracker.cursor()
+    tracker.record('politics', 'ZW', [A, B])
+
+    delta = tracker.changes_since('politics', 'ZW', cursor)
+    assert tracker.cursor() == cursor
+    assert (delta.added, delta.updated, delta.removed) == ([], [], [])
+
+def test_different_limits_are_separate_feeds():
+    tracker = FeedDeltaTracker()
+    tracker.record('politics', 'ZW', [A, B, C, D], 18)
+    cursor_18 = tracker.cursor()
+    tracker.record('politics', 'ZW', [A, B], 6)
+    cursor_6 = tracker.cursor()
+
+    # Alternating limits do not create versions or report phantom removals
+    tracker.record('politics', 'ZW', [A, B, C, D], 18)
+    tracker.record('politics', 'ZW', [A, B], 6)
+    assert tracker.get_stats()['versions'] == 2
+
+    delta_18 = tracker.changes_since('politics', 'ZW', cursor_6, 18)
+    assert (delta_18.added, delta_18.removed) == ([], [])
+    delta_6 = tracker.changes_since('politics', 'ZW', cursor_18, 6)
+    assert delta_6.added == [A, B]      # This limit was first served after the cursor
+
+def test_unknown_cursors_reset_to_the_full_feed():
+    tracker = FeedDeltaTracker(history_size=2)
+    tracker.record('health', 'KE', [A])
+    oldest = tracker.cursor()
+    tracker.record('health', 'KE', [B])
+    tracker.record('health', 'KE', [C])
+
+    trimmed = tracker.changes_since('health', 'KE', oldest)
+    assert trimmed.reset and trimmed.added == [C]
+
+    other_process = tracker.changes_since('health', 'KE', 'deadbeef.1')
+    assert other_process.reset and other_process.added == [C]
+
+    future = tracker.changes_since('health', 'KE', f"{tracker.epoch}.999")
+    assert future.reset
+
+def test_malformed_cursor_is_rejected():
+    tracker = FeedDeltaTracker()
+    with pytest.raises(ValueError):
+        tracker.check_cursor('not-a-cursor')
+    with pytest.raises(ValueError):
+        tracker.changes_since('politics', 'ZW', 'abc.')
+
+@pytest.mark.asyncio
+async def test_unchanged_mock_stories_are_reused(monkeypatch):
+    monkeypatch.setattr(news_module.time, 'time', lambda: 1_700_000_000.0)
+    service = NewsService()
+
+    first = await service.get_news_for_category('politics', 6, 'ZW')
+    monkeypatch.setattr(news_module.time, 'time', lambda: 1_700_000_030.0)
+    second = await service.get_news_for_category('politics', 6, 'ZW')
+
+    stats = service.get_incremental_stats()
+    assert stats['processed'] == len(first)
+    assert stats['reused'] == len(second)
+    assert [article.publishedAt for article in second] == [article.publishedAt for article in first]
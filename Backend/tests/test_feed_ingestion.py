@@ -0,0 +1,155 @@
+# Backend/tests/test_feed_ingestion.py
+"""
+Tests for RSS/Atom ingestion against fixture feeds served by a local aiohttp server
+"""
+
+import json
+import os
+from email.utils import formatdate
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.circuit_breaker import circuit_breakers
+from app.services.feed_ingestion_service import FeedIngestionService
+from app.services.news_service import NewsService, NewsSource
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+LAST_MODIFIED = formatdate(1760550000, usegmt=True)
+
+class FeedServer:
+    """Serves fixture feeds with validators and answers conditional GETs with 304"""
+
+    def __init__(self, validator: str):
+        self.validator = validator          # 'etag' or 'last-modified'
+        self.requests = 0
+        self.not_modified = 0
+        self.failure_status = None          # Answer every request with this status when set
+        self.server = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.failure_status:
+            return web.Response(status=self.failure_status)
+        name = request.match_info['name']
+        headers = {'Cache-Control': 'no-cache'}     # Always revalidate, never serve blind from cache
+        if self.validator == 'etag':
+            headers['ETag'] = f'"{name}-v1"'
+            unchanged = request.headers.get('If-None-Match') == headers['ETag']
+        else:
+            headers['Last-Modified'] = LAST_MODIFIED
+            unchanged = request.headers.get('If-Modified-Since') == LAST_MODIFIED
+
+        if unchanged:
+            self.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        with open(os.path.join(FIXTURES, name), 'rb') as fixture:
+            body = fixture.read()
+        return web.Response(body=body, content_type='application/xml', headers=headers)
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/{name}', self.handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    def url(self, name: str) -> str:
+        return str(self.server.make_url(f'/{name}'))
+
+async def start_ingestion(tmp_path, validator: str):
+    feed_server = FeedServer(validator)
+    await feed_server.start()
+    registry = {"ZW": [
+        {"name": "The Herald", "url": feed_server.url('herald_rss.xml')},
+        {"name": "NewsDay", "url": feed_server.url('newsday_atom.xml')}
+    ]}
+    registry_path = tmp_path / "rss_feeds.json"
+    registry_path.write_text(json.dumps(registry))
+
+    ingestion = FeedIngestionService(registry_path=str(registry_path), parse_executor='thread')
+    await ingestion.start()
+    return feed_server, ingestion
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('validator', ['etag', 'last-modified'])
+async def test_unchanged_feeds_are_revalidated_not_reparsed(tmp_path, validator):
+    feed_server, ingestion = await start_ingestion(tmp_path, validator)
+    try:
+        await ingestion.refresh_country('ZW')
+        first = ingestion.get_stats()
+        await ingestion.refresh_country('ZW', force=True)
+        second = ingestion.get_stats()
+    finally:
+        await ingestion.close()
+        await feed_server.server.close()
+
+    assert first['fetches'] == 2 and first['not_modified'] == 0
+    assert feed_server.requests == 4
+    assert feed_server.not_modified == 2
+    assert second['fetches'] == 2                   # Not downloaded or parsed again
+    assert second['not_modified'] == 2
+    assert second['entries'] == first['entries'] == 4
+    assert second['errors'] == 0
+
+@pytest.mark.asyncio
+async def test_entries_are_categorized_and_deduplicated(tmp_path):
+    feed_server, ingestion = await start_ingestion(tmp_path, 'etag')
+    try:
+        politics = await ingestion.get_entries('politics', 'ZW', 10)
+        sports = await ingestion.get_entries('sports', 'ZW', 10)
+        unknown_country = await ingestion.get_entries('politics', 'KE', 10)
+    finally:
+        await ingestion.close()
+        await feed_server.server.close()
+
+    # Newest first; the syndicated copy of the budget story is dropped
+    assert [entry['title'] for entry in politics] == [
+        "Opposition party calls for electoral reforms",
+        "Parliament passes the 2026 national budget"
+    ]
+    assert [entry['source_name'] for entry in politics] == ["NewsDay", "The Herald"]
+    assert [entry['title'] for entry in sports] == ["Warriors name squad for AFCON qualifier"]
+    assert unknown_country == []
+
+@pytest.mark.asyncio
+async def test_feed_entries_become_news_sources(tmp_path):
+    feed_server, ingestion = await start_ingestion(tmp_path, 'last-modified')
+    service = NewsService()
+    service.rss_enabled = True
+    service.feed_ingestion = ingestion
+    try:
+        sources = await service._get_feed_sources('politics', 'ZW', 10)
+    finally:
+        await ingestion.close()
+        await feed_server.server.close()
+
+    assert all(isinstance(source, NewsSource) for source in sources)
+    budget_story = sources[1]
+    assert budget_story.url == "https://www.herald.co.zw/parliament-passes-2026-budget/?utm_source=rss"
+    assert budget_story.snippet == "Members of parliament approved the finance minister’s budget after a late sitting."
+    assert budget_story.source_name == "The Herald"
+    assert budget_story.published_date == "2026-10-15T18:30:00+00:00"
+    assert budget_story.published_ts == 1792089000
+
+@pytest.mark.asyncio
+async def test_failing_feed_host_keeps_entries_and_trips_its_own_breaker(tmp_path):
+    feed_server, ingestion = await start_ingestion(tmp_path, 'etag')
+    host = f"{feed_server.server.host}:{feed_server.server.port}"
+    breaker = circuit_breakers.get(f"rss:{host}")
+    try:
+        await ingestion.refresh_country('ZW')
+        feed_server.failure_status = 503
+        await ingestion.refresh_country('ZW', force=True)
+        stats = ingestion.get_stats()
+    finally:
+        await ingestion.close()
+        await feed_server.server.close()
+
+    assert stats['errors'] == 2
+    assert stats['entries'] == 4                    # Previous entries are kept
+    assert breaker.get_state()['total_failures'] == 2
+
+    breaker_stats = circuit_breakers.get_stats()
+    assert f"rss:{host}" not in breaker_stats       # Summarised with the other feed hosts
+    assert breaker_stats['rss_hosts']['tracked_hosts'] >= 1
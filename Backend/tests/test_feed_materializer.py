@@ -0,0 +1,106 @@
+# Backend/tests/test_feed_materializer.py
+"""
+Tests for the demand-driven, quota-aware feed materializer
+"""
+
+import pytest
+
+from app.services.feed_materializer import FeedMaterializer, SECONDS_PER_DAY
+from app.services.quota_manager import PRIORITY_BACKGROUND, PRIORITY_BUDGET_FRACTION
+
+class FakeQuota:
+    """Quota manager stand-in: a fixed background share, spent by refreshes"""
+
+    def __init__(self, daily_budget: int):
+        self.daily_budget = daily_budget
+        self.used = 0
+
+    def limit_for(self, priority: int) -> int:
+        return int(self.daily_budget * PRIORITY_BUDGET_FRACTION[priority])
+
+    def remaining(self, priority: int) -> int:
+        return max(0, self.limit_for(priority) - self.used)
+
+class FakeNewsService:
+    """NewsService stand-in: every refresh spends 2 units and returns one article"""
+
+    UNITS = 2
+
+    def __init__(self, daily_budget: int = 100):
+        self.quota_manager = FakeQuota(daily_budget)
+        self.refreshed = []
+
+    def spends_search_quota(self) -> bool:
+        return True
+
+    def estimate_category_units(self, max_articles: int) -> int:
+        return self.UNITS
+
+    async def get_news_for_category(self, category, max_articles, country_code, quota=None):
+        assert quota.priority == PRIORITY_BACKGROUND
+        self.quota_manager.used += self.UNITS
+        self.refreshed.append((category, country_code))
+        return [f"{category}/{country_code}"]
+
+def make_materializer(service: FakeNewsService, **kwargs) -> FeedMaterializer:
+    materializer = FeedMaterializer(service, concurrency=1, **kwargs)
+    materializer.categories = ['politics', 'sports', 'health']
+    materializer.countries = ['ZW', 'KE']
+    return materializer
+
+@pytest.mark.asyncio
+async def test_only_requested_feeds_are_refreshed():
+    service = FakeNewsService()
+    materializer = make_materializer(service)
+
+    assert await materializer.refresh_all() is not None
+    assert service.refreshed == []
+
+    assert materializer.get_feed('politics', 'ZW', 6) is None
+    materializer.mark_requested('health', 'KE')
+    cycle = await materializer.refresh_all()
+
+    assert cycle.refreshed == 2
+    assert sorted(service.refreshed) == [('health', 'KE'), ('politics', 'ZW')]
+    assert materializer.get_feed('politics', 'ZW', 1) == ['politics/ZW']
+
+@pytest.mark.asyncio
+async def test_cycle_stops_when_background_share_runs_out():
+    service = FakeNewsService(daily_budget=5)    # Background share: 4 units = 2 refreshes
+    materializer = make_materializer(service)
+    for category in materializer.categories:
+        materializer.mark_requested(category, 'ZW')
+
+    cycle = await materializer.refresh_all()
+    assert cycle.refreshed == 2
+    assert cycle.skipped_for_quota == 1
+
+    cycle = await materializer.refresh_all()
+    assert cycle.refreshed == 0
+    assert cycle.skipped_for_quota == 3
+    assert service.quota_manager.used == 4
+
+def test_interval_is_derived_from_the_quota():
+    service = FakeNewsService(daily_budget=100)     # Background share: 80 units
+    materializer = make_materializer(service, min_interval=60)
+    assert materializer.cycle_interval() == 60      # Nothing requested yet
+
+    for category in materializer.categories:
+        materializer.mark_requested(category, 'ZW')
+    # 3 feeds x 2 units = 6 units per cycle -> 80 / 6 cycles per day
+    assert materializer.cycle_interval() == pytest.approx(SECONDS_PER_DAY * 6 / 80)
+
+    materializer.workers = 2
+    assert materializer.cycle_interval() == pytest.approx(SECONDS_PER_DAY * 12 / 80)
+
+    assert make_materializer(service, interval=300).cycle_interval() == 300
+
+@pytest.mark.asyncio
+async def test_feeds_not_refreshed_for_two_intervals_are_not_served():
+    service = FakeNewsService()
+    materializer = make_materializer(service, interval=100)
+    materializer.mark_requested('politics', 'ZW')
+    await materializer.refresh_all()
+
+    materializer._feeds[('politics', 'ZW')].refreshed_at -= 250
+    assert materializer.get_feed('politics', 'ZW', 1) is None
@@ -0,0 +1,218 @@
+# Backend/tests/test_http_cache.py
+"""
+Tests for the RFC 9111 HTTP cache: freshness, age, storability, revalidation and eviction
+"""
+
+import time
+from email.utils import formatdate
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.http_cache import (
+    CACHE_HIT, CACHE_MISS, CACHE_REVALIDATED, HEURISTIC_MAX_SECONDS, HttpCache, _StoredEntry, parse_cache_control
+)
+
+NOW = 1_700_000_000.0
+
+def entry(headers: dict, status: int = 200, body: bytes = b"body", request_time: float = NOW, response_time: float = NOW) -> _StoredEntry:
+    return _StoredEntry(status, headers, body, {}, request_time, response_time)
+
+def http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+def test_parse_cache_control():
+    assert parse_cache_control('public, max-age=300, no-cache="set-cookie"') == {
+        'public': None, 'max-age': '300', 'no-cache': 'set-cookie'
+    }
+    assert parse_cache_control(None) == {}
+
+def test_max_age_wins_over_expires():
+    stored = entry({'cache-control': 'max-age=60', 'date': http_date(NOW), 'expires': http_date(NOW + 3600)})
+    assert stored.freshness_lifetime() == 60
+
+def test_expires_is_relative_to_date():
+    stored = entry({'date': http_date(NOW), 'expires': http_date(NOW + 120)})
+    assert stored.freshness_lifetime() == 120
+
+def test_invalid_expires_means_already_stale():
+    assert entry({'date': http_date(NOW), 'expires': '0'}).freshness_lifetime() == 0
+
+def test_no_cache_is_never_fresh():
+    assert entry({'cache-control': 'no-cache, max-age=600'}).freshness_lifetime() == 0
+
+def test_heuristic_freshness_from_last_modified():
+    five_hours = entry({'date': http_date(NOW), 'last-modified': http_date(NOW - 5 * 3600)})
+    assert five_hours.freshness_lifetime() == pytest.approx(1800)
+
+    a_month = entry({'date': http_date(NOW), 'last-modified': http_date(NOW - 30 * 86400)})
+    assert a_month.freshness_lifetime() == HEURISTIC_MAX_SECONDS
+
+    assert entry({'date': http_date(NOW)}).freshness_lifetime() == 0
+
+def test_age_header_and_response_delay_are_added():
+    stored = entry({'date': http_date(NOW), 'age': '30'}, request_time=NOW - 2, response_time=NOW)
+    assert stored.current_age(NOW + 10) == pytest.approx(42)
+
+def test_apparent_age_from_an_old_date():
+    stored = entry({'date': http_date(NOW - 50), 'age': '5', 'cache-control': 'max-age=60'})
+    assert stored.current_age(NOW) == pytest.approx(50)
+    assert stored.is_fresh(NOW + 9)
+    assert not stored.is_fresh(NOW + 10)
+
+@pytest.mark.parametrize('headers, status, storable', [
+    ({'cache-control': 'max-age=60'}, 200, True),
+    ({'etag': '"v1"'}, 200, True),                              # Revalidatable later
+    ({'cache-control': 'no-store, max-age=60'}, 200, False),
+    ({'cache-control': 'max-age=60', 'vary': '*'}, 200, False),
+    ({'cache-control': 'max-age=60'}, 404, False),
+    ({'date': http_date(NOW)}, 200, False),                     # Neither fresh nor revalidatable
+])
+def test_storability(tmp_path, headers, status, storable):
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"))
+    assert cache._is_storable(entry(headers, status=status)) is storable
+
+def test_oversized_bodies_are_not_stored(tmp_path):
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"), max_bytes=1000)
+    assert not cache._is_storable(entry({'cache-control': 'max-age=60'}, body=b"x" * 101))
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"), max_bytes=1000)
+    for key in ('a', 'b', 'c'):
+        cache._save(key, entry({'cache-control': 'max-age=60'}, body=b"x" * 300))
+        time.sleep(0.01)
+    assert cache._load('a') is not None         # 'b' is now the least recently used
+    time.sleep(0.01)
+
+    cache._save('d', entry({'cache-control': 'max-age=60'}, body=b"x" * 300))
+
+    assert cache._load('b') is None
+    assert all(cache._load(key) is not None for key in ('a', 'c', 'd'))
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.get_stats()['size_bytes'] == 900
+
+async def start_server(handler) -> TestServer:
+    app = web.Application()
+    app.router.add_get('/{name}', handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+def age_store(cache: HttpCache, seconds: float) -> None:
+    """Pretend every stored response was received `seconds` ago"""
+    conn = cache._connect()
+    try:
+        with conn:
+            conn.execute(
+                "UPDATE http_cache SET request_time = request_time - ?, response_time = response_time - ?",
+                (seconds, seconds)
+            )
+    finally:
+        conn.close()
+
+@pytest.mark.asyncio
+async def test_fresh_hit_then_304_revalidation(tmp_path):
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304, headers={
+                'ETag': '"v1"', 'Cache-Control': 'max-age=60', 'X-Revision': '2'
+            })
+        return web.Response(text="hello", headers={
+            'ETag': '"v1"', 'Cache-Control': 'max-age=60', 'X-Revision': '1'
+        })
+
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"))
+    server = await start_server(handler)
+    url = str(server.make_url('/page'))
+    network_calls = []
+
+    async def before_network():
+        network_calls.append(True)
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            first = await cache.get(session, url, before_network=before_network)
+            second = await cache.get(session, url, before_network=before_network)
+            age_store(cache, 120)
+            third = await cache.get(session, url, before_network=before_network)
+            fourth = await cache.get(session, url, before_network=before_network)
+    finally:
+        await server.close()
+
+    assert [r.cache_status for r in (first, second, third, fourth)] == [CACHE_MISS, CACHE_HIT, CACHE_REVALIDATED, CACHE_HIT]
+    assert requests == [None, '"v1"']
+    assert len(network_calls) == 2              # Fresh hits cost no token or quota
+    assert third.text() == "hello"
+    assert third.headers['x-revision'] == '2'   # 304 headers merged into the stored ones
+    assert third.headers['content-length'] == '5'
+    assert fourth.headers['x-revision'] == '2'
+
+@pytest.mark.asyncio
+async def test_changed_resource_replaces_the_stored_one(tmp_path):
+    versions = iter(["old", "new"])
+
+    async def handler(request):
+        return web.Response(text=next(versions), headers={'ETag': f'"{request.path}"', 'Cache-Control': 'no-cache'})
+
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"))
+    server = await start_server(handler)
+    try:
+        async with aiohttp.ClientSession() as session:
+            await cache.get(session, str(server.make_url('/page')))
+            changed = await cache.get(session, str(server.make_url('/page')))
+    finally:
+        await server.close()
+
+    assert changed.cache_status == CACHE_MISS
+    assert changed.text() == "new"
+    assert cache.get_stats()['revalidated_changed'] == 1
+
+@pytest.mark.asyncio
+async def test_vary_separates_request_headers(tmp_path):
+    async def handler(request):
+        return web.Response(
+            text=request.headers.get('Accept-Language', ''),
+            headers={'Cache-Control': 'max-age=60', 'Vary': 'Accept-Language'}
+        )
+
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"))
+    server = await start_server(handler)
+    url = str(server.make_url('/page'))
+    try:
+        async with aiohttp.ClientSession() as session:
+            await cache.get(session, url, headers={'Accept-Language': 'en'})
+            same = await cache.get(session, url, headers={'Accept-Language': 'en'})
+            other = await cache.get(session, url, headers={'Accept-Language': 'sn'})
+    finally:
+        await server.close()
+
+    assert same.cache_status == CACHE_HIT
+    assert other.cache_status == CACHE_MISS
+    assert other.text() == 'sn'
+
+@pytest.mark.asyncio
+async def test_no_store_and_vary_star_responses_are_not_kept(tmp_path):
+    async def handler(request):
+        if request.path == '/private':
+            return web.Response(text="secret", headers={'Cache-Control': 'no-store'})
+        return web.Response(text="varies", headers={'Cache-Control': 'max-age=60', 'Vary': '*'})
+
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"))
+    server = await start_server(handler)
+    try:
+        async with aiohttp.ClientSession() as session:
+            for path in ('/private', '/private', '/anything', '/anything'):
+                response = await cache.get(session, str(server.make_url(path)))
+                assert response.cache_status == CACHE_MISS
+    finally:
+        await server.close()
+
+    stats = cache.get_stats()
+    assert stats['not_stored'] == 4
+    assert stats['entries'] == 0
+    assert 'db_path' not in stats
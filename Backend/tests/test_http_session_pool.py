@@ -0,0 +1,98 @@
+# Backend/tests/test_http_session_pool.py
+"""
+Tests for the pooled HTTP session's lifecycle and connection-reuse metrics
+"""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from fastapi.testclient import TestClient
+
+import main
+from app.services.http_session_pool import PooledClientSession
+
+@pytest.mark.asyncio
+async def test_first_use_creates_one_shared_session():
+    pool = PooledClientSession('test')
+    assert pool.get_stats()['open'] is False
+
+    session = pool.get_session()
+    try:
+        assert pool.get_session() is session
+        assert pool.get_stats()['open'] is True
+        assert pool.get_stats()['sessions_opened'] == 1
+    finally:
+        await pool.close()
+
+@pytest.mark.asyncio
+async def test_start_is_idempotent():
+    pool = PooledClientSession('test')
+    await pool.start()
+    session = pool.get_session()
+    await pool.start()
+
+    try:
+        assert pool.get_session() is session
+        assert pool.get_stats()['sessions_opened'] == 1
+    finally:
+        await pool.close()
+
+@pytest.mark.asyncio
+async def test_close_releases_the_session_and_next_use_recreates_it():
+    pool = PooledClientSession('test')
+    first = pool.get_session()
+    await pool.close()
+
+    assert first.closed
+    assert pool.get_stats()['open'] is False
+    await pool.close()  # Closing twice is harmless
+
+    second = pool.get_session()
+    try:
+        assert second is not first and not second.closed
+        assert pool.get_stats()['sessions_opened'] == 2
+    finally:
+        await pool.close()
+
+@pytest.mark.asyncio
+async def test_session_closed_elsewhere_is_replaced():
+    pool = PooledClientSession('test')
+    first = pool.get_session()
+    await first.close()
+
+    try:
+        assert pool.get_session() is not first
+    finally:
+        await pool.close()
+
+@pytest.mark.asyncio
+async def test_kept_alive_connections_are_reused():
+    async def hello(request):
+        return web.Response(text="hello")
+
+    app = web.Application()
+    app.router.add_get('/', hello)
+    server = TestServer(app)
+    await server.start_server()
+    pool = PooledClientSession('test')
+
+    try:
+        for _ in range(3):
+            async with pool.get_session().get(server.make_url('/')) as response:
+                assert await response.text() == "hello"
+
+        stats = pool.get_stats()
+        assert stats['requests'] == 3
+        assert (stats['connections_created'], stats['connections_reused']) == (1, 2)
+        assert stats['connection_reuse_ratio'] == pytest.approx(0.667, abs=0.001)
+    finally:
+        await pool.close()
+        await server.close()
+
+def test_app_lifespan_opens_and_closes_the_news_pool(monkeypatch):
+    monkeypatch.setenv("FEED_MATERIALIZER_ENABLED", "false")
+
+    pool = main.news_service.http_pool
+    with TestClient(main.app):
+        assert pool.get_stats()['open'] is True
+    assert pool.get_stats()['open'] is False
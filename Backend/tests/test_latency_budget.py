@@ -0,0 +1,86 @@
+# Backend/tests/test_latency_budget.py
+"""
+Tests for hedged upstream calls and what counts as upstream latency
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.latency_budget import LatencyTracker, hedged_call, latency_trackers
+from app.services.news_service import NewsService
+from app.services.quota_manager import PRIORITY_USER, QuotaContext
+from app.services.synthetic_news_provider import SyntheticNewsProvider
+
+HEDGE_DELAY = 0.05
+
+class Upstream:
+    """Fake call: queues `queued` seconds for admission, then answers after `latency`"""
+
+    def __init__(self, admitted: asyncio.Event, queued: float = 0.0, latency: float = 0.0):
+        self.admitted = admitted
+        self.queued = queued
+        self.latency = latency
+        self.calls = 0
+
+    async def call(self):
+        self.calls += 1
+        await asyncio.sleep(self.queued)
+        self.admitted.set()
+        await asyncio.sleep(self.latency)
+        return 'answer'
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged():
+    tracker = LatencyTracker('test', default_hedge_delay=HEDGE_DELAY)
+    upstream = Upstream(asyncio.Event(), latency=0.2)
+
+    assert await hedged_call(upstream.call, tracker, admitted=upstream.admitted) == 'answer'
+    assert upstream.calls == 2
+    assert tracker.get_stats()['hedges_sent'] == 1
+
+@pytest.mark.asyncio
+async def test_time_queued_for_admission_is_not_hedged_or_sampled():
+    tracker = LatencyTracker('test', default_hedge_delay=HEDGE_DELAY)
+    upstream = Upstream(asyncio.Event(), queued=0.2)
+
+    assert await hedged_call(upstream.call, tracker, admitted=upstream.admitted) == 'answer'
+    assert upstream.calls == 1
+    assert tracker.get_stats()['hedges_sent'] == 0
+    assert tracker.percentile(0.95) < HEDGE_DELAY
+
+@pytest.mark.asyncio
+async def test_call_answered_without_admission_is_not_sampled():
+    tracker = LatencyTracker('test', default_hedge_delay=HEDGE_DELAY)
+
+    async def cache_hit():
+        await asyncio.sleep(0.1)
+        return 'cached'
+
+    assert await hedged_call(cache_hit, tracker, admitted=asyncio.Event()) == 'cached'
+    assert tracker.get_stats()['samples'] == 0
+    assert tracker.get_stats()['hedges_sent'] == 0
+
+@pytest.mark.asyncio
+async def test_cse_page_waiting_on_the_rate_limiter_is_not_hedged(monkeypatch):
+    tracker = latency_trackers.get('google_cse')
+    monkeypatch.setattr(tracker, 'default_hedge_delay', HEDGE_DELAY)
+    monkeypatch.setattr(tracker, '_samples', type(tracker._samples)(maxlen=tracker._samples.maxlen))
+    hedges_before = tracker.get_stats()['hedges_sent']
+
+    service = NewsService()
+    service.synthetic_provider = SyntheticNewsProvider(seed=1, error_rate=0, timeout_rate=0, latency_scale=0)
+    service.hedge_requests = True
+
+    async def queued_behind_other_pages(upstream='google_cse'):
+        await asyncio.sleep(0.2)
+    monkeypatch.setattr(service, '_wait_for_rate_limit', queued_behind_other_pages)
+
+    sources = await service._fetch_cse_page(
+        {'q': 'zimbabwe politics'}, 1, 10, 'ZW', QuotaContext(route="test", priority=PRIORITY_USER)
+    )
+
+    assert len(sources) == 10
+    assert service.synthetic_provider.get_stats()['requests'] == 1
+    assert tracker.get_stats()['hedges_sent'] == hedges_before
+    assert tracker.percentile(0.95) < HEDGE_DELAY
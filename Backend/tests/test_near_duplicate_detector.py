@@ -0,0 +1,67 @@
+# Backend/tests/test_near_duplicate_detector.py
+"""
+Tests for MinHash near-duplicate clustering of syndicated stories
+"""
+
+import pytest
+
+from app.services.near_duplicate_detector import (
+    NearDuplicateIndex, cluster_near_duplicates, estimated_similarity, minhash_signature, shingles
+)
+from app.services.news_service import NewsService
+
+STORY = (
+    "Parliament passes 2026 national budget after late sitting. "
+    "Members approved the finance minister's spending plan, which raises health and education allocations."
+)
+
+def test_shingles_drop_stopwords_and_case():
+    assert shingles("The Budget is Passed") == {"budget", "passed"}
+    assert shingles("Budget passed by the Parliament today") == {
+        "budget passed", "passed parliament", "parliament today"
+    }
+
+def test_signatures_are_stable_and_estimate_similarity():
+    assert minhash_signature(STORY) == minhash_signature(STORY)
+    assert estimated_similarity(minhash_signature(STORY), minhash_signature(STORY)) == 1.0
+    unrelated = minhash_signature("Warriors name squad for the AFCON qualifier against Kenya next month")
+    assert estimated_similarity(minhash_signature(STORY), unrelated) < 0.2
+
+def test_syndicated_copies_join_the_first_ranked_story():
+    items = [
+        ("herald", STORY),
+        ("sports", "Warriors name squad for the AFCON qualifier against Kenya next month"),
+        ("newsday", STORY + " Reporting by our parliamentary desk."),
+    ]
+
+    clusters = cluster_near_duplicates(items, lambda item: item[1])
+
+    assert [(leader[0], [member[0] for member in members]) for leader, members in clusters] == [
+        ("herald", ["newsday"]),
+        ("sports", [])
+    ]
+
+def test_threshold_controls_how_close_a_copy_must_be():
+    rewritten = STORY.replace("late sitting", "marathon overnight session").replace("raises", "increases")
+    similarity = estimated_similarity(minhash_signature(STORY), minhash_signature(rewritten))
+
+    strict = NearDuplicateIndex(threshold=min(1.0, similarity + 0.05))
+    strict.add("original", STORY)
+    assert strict.add("rewritten", rewritten) is None
+
+    lenient = NearDuplicateIndex(threshold=similarity - 0.05)
+    lenient.add("original", STORY)
+    assert lenient.add("rewritten", rewritten) == "original"
+
+def test_empty_texts_do_not_match_real_stories():
+    index = NearDuplicateIndex()
+    index.add("story", STORY)
+    assert index.add("blank", "") is None
+
+@pytest.mark.asyncio
+async def test_mock_sources_stay_distinct_stories():
+    service = NewsService()
+    sources = await service._generate_mock_news_sources("Zimbabwe politics", 8, "Zimbabwe")
+
+    assert len(sources) == 8
+    assert len(service._collapse_near_duplicates(sources)) == 8
@@ -0,0 +1,112 @@
+# Backend/tests/test_news_stream.py
+"""
+Tests for the streamed multi-category dashboard (/api/news/all/stream)
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routes import news_routes
+from app.routes.news_routes import VALID_CATEGORIES
+from app.services.news_service import ProcessedArticle
+
+SLOW_CATEGORY = 'sports'
+MATERIALIZED_CATEGORY = 'politics'
+EMPTY_CATEGORY = 'weather'
+
+def article(category: str) -> ProcessedArticle:
+    return ProcessedArticle.from_dict({
+        'id': f"{category}-1",
+        'title': f"{category} headline",
+        'sourceUrl': f"https://herald.co.zw/{category}/1"
+    })
+
+@pytest.fixture
+def client(monkeypatch):
+    async def get_news_for_category(category, max_articles, country_code, quota=None, budget=None):
+        await asyncio.sleep(0.2 if category == SLOW_CATEGORY else 0)
+        return [] if category == EMPTY_CATEGORY else [article(category)]
+
+    def get_feed(category, country, max_articles):
+        return [article(category)] if category == MATERIALIZED_CATEGORY else None
+
+    monkeypatch.setattr(news_routes, 'get_user_from_token', lambda token: {'country_of_interest': 'ZW'})
+    monkeypatch.setattr(news_routes, 'update_articles_cache', lambda *args, **kwargs: None)
+    monkeypatch.setattr(news_routes.news_service, 'get_news_for_category', get_news_for_category)
+    monkeypatch.setattr(news_routes.feed_materializer, 'get_feed', get_feed)
+
+    app = FastAPI()
+    app.include_router(news_routes.router, prefix="/api")
+    return TestClient(app)
+
+AUTH = {'Authorization': 'Bearer test-token'}
+
+def parse_ndjson(body: str):
+    return [json.loads(line) for line in body.splitlines() if line]
+
+def parse_sse(body: str):
+    events = []
+    for block in body.split("\n\n"):
+        if not block.strip():
+            continue
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        payload = json.loads(lines['data'])
+        assert payload['type'] == lines['event']
+        events.append(payload)
+    return events
+
+def check_blocks(blocks):
+    """One block per category in completion order, then the summary trailer"""
+    *categories, summary = blocks
+
+    assert [block['type'] for block in categories] == ['category'] * len(VALID_CATEGORIES)
+    assert sorted(block['category'] for block in categories) == sorted(VALID_CATEGORIES)
+    assert categories[0]['category'] == MATERIALIZED_CATEGORY and categories[0]['materialized']
+    assert categories[-1]['category'] == SLOW_CATEGORY and not categories[-1]['materialized']
+
+    by_category = {block['category']: block for block in categories}
+    assert by_category[EMPTY_CATEGORY]['status'] == 'empty'
+    assert by_category['health']['count'] == 1
+    assert by_category['health']['articles'][0]['id'] == 'health-1'
+
+    assert summary['type'] == 'summary'
+    assert summary['cursor']
+    assert summary['total_articles'] == len(VALID_CATEGORIES) - 1
+    assert summary['category_status'][EMPTY_CATEGORY] == 'empty'
+    assert summary['partial'] is False
+
+def test_ndjson_is_the_default(client):
+    response = client.get("/api/news/all/stream", headers=AUTH)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    check_blocks(parse_ndjson(response.text))
+
+def test_accept_header_selects_sse(client):
+    response = client.get("/api/news/all/stream", headers={**AUTH, 'Accept': 'text/event-stream'})
+
+    assert response.headers['content-type'].startswith('text/event-stream')
+    check_blocks(parse_sse(response.text))
+
+def test_format_parameter_overrides_accept(client):
+    response = client.get("/api/news/all/stream?format=ndjson", headers={**AUTH, 'Accept': 'text/event-stream'})
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    check_blocks(parse_ndjson(response.text))
+
+    response = client.get("/api/news/all/stream?format=sse", headers=AUTH)
+    assert response.headers['content-type'].startswith('text/event-stream')
+    check_blocks(parse_sse(response.text))
+
+def test_unknown_format_is_rejected(client):
+    assert client.get("/api/news/all/stream?format=xml", headers=AUTH).status_code == 422
+
+def test_summary_cursor_polls_for_changes(client):
+    summary = parse_ndjson(client.get("/api/news/all/stream", headers=AUTH).text)[-1]
+
+    response = client.get(f"/api/news/all?since={summary['cursor']}", headers=AUTH)
+    assert response.status_code == 200
+    assert response.json()['changes_by_category'][MATERIALIZED_CATEGORY]['added'] == []
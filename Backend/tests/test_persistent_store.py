@@ -0,0 +1,116 @@
+# Backend/tests/test_persistent_store.py
+"""
+Tests for the SQLite search result store and the warm start it feeds
+"""
+
+import time
+from dataclasses import asdict
+
+import pytest
+
+from app.services.news_service import NewsService, NewsSource
+from app.services.persistent_store import SearchResultStore
+
+def items(prefix: str, count: int = 2):
+    return [{'url': f"https://herald.co.zw/{prefix}-{i}", 'title': f"{prefix} {i}"} for i in range(count)]
+
+@pytest.fixture
+def store(tmp_path) -> SearchResultStore:
+    return SearchResultStore(str(tmp_path / "store.sqlite3"), max_batches_per_key=2)
+
+def test_save_and_load_latest_round_trip(store):
+    assert store.save_batch('ZW', 'politics', 10, items('a'), fetched_at=1000.0)
+    assert store.save_batch('KE', 'politics', 20, items('b'))
+
+    batches = {(batch['country'], batch['query_key']): batch for batch in store.load_latest(max_age_seconds=3600)}
+
+    # The ZW batch is older than max_age and is left behind
+    assert list(batches) == [('KE', 'politics')]
+    batch = batches[('KE', 'politics')]
+    assert batch['requested'] == 20
+    assert batch['items'] == items('b')
+    assert store.get_stats()['batches_loaded_at_startup'] == 1
+
+def test_only_the_newest_batch_per_key_is_loaded(store):
+    now = time.time()
+    store.save_batch('ZW', 'politics', 10, items('old'), fetched_at=now - 60)
+    store.save_batch('ZW', 'politics', 10, items('new'), fetched_at=now)
+
+    batches = store.load_latest(max_age_seconds=3600)
+
+    assert [batch['items'] for batch in batches] == [items('new')]
+
+def test_batches_are_pruned_to_max_batches_per_key(store):
+    now = time.time()
+    for age in (40, 30, 20, 10):
+        store.save_batch('ZW', 'politics', 10, items(str(age)), fetched_at=now - age)
+    store.save_batch('ZW', 'sports', 10, items('sports'), fetched_at=now - 50)
+
+    conn = store._connect()
+    try:
+        rows = conn.execute(
+            "SELECT query_key, fetched_at FROM search_batches ORDER BY query_key, fetched_at"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    # Pruning one key leaves the other key's batches alone
+    assert rows == [('politics', now - 20), ('politics', now - 10), ('sports', now - 50)]
+
+def test_unwritable_store_fails_softly(tmp_path):
+    store = SearchResultStore(str(tmp_path / "missing" / "store.sqlite3"))
+
+    assert store.save_batch('ZW', 'politics', 10, items('a')) is False
+    assert store.load_latest(max_age_seconds=3600) == []
+    assert store.get_stats()['write_failures'] == 1
+
+def warm_service(store: SearchResultStore) -> NewsService:
+    service = NewsService()
+    service.result_store = store
+    return service
+
+def stored_sources(count: int = 3):
+    return [
+        asdict(NewsSource(url=f"https://www.herald.co.zw/story-{i}", title=f"Story {i}",
+                          snippet="Reported by our correspondent.", source_name="The Herald"))
+        for i in range(count)
+    ]
+
+@pytest.mark.asyncio
+async def test_warm_start_seeds_the_search_cache(store):
+    service = warm_service(store)
+    fetched_at = time.time() - service.search_cache.fresh_ttl - 10
+    await store.asave_batch('ZW', 'politics', 10, stored_sources(), fetched_at=fetched_at)
+
+    assert await service._warm_cache_from_store() == 1
+
+    entry = service.search_cache.get(('politics', 'ZW'))
+    assert [source.title for source in entry.value] == ["Story 0", "Story 1", "Story 2"]
+    assert all(isinstance(source, NewsSource) for source in entry.value)
+    assert entry.requested == 10
+    # The original fetch time is kept, so the batch is served stale and refreshed
+    assert entry.fetched_at == fetched_at
+
+@pytest.mark.asyncio
+async def test_warm_start_skips_empty_batches(store):
+    service = warm_service(store)
+    await store.asave_batch('ZW', 'politics', 10, [])
+    await store.asave_batch('ZW', 'sports', 10, stored_sources())
+
+    assert await service._warm_cache_from_store() == 1
+    assert service.search_cache.get(('politics', 'ZW')) is None
+    assert service.search_cache.get(('sports', 'ZW')) is not None
+
+@pytest.mark.asyncio
+async def test_empty_fetches_are_not_persisted(store, monkeypatch):
+    service = warm_service(store)
+    answers = {'politics': [], 'sports': [NewsSource(**item) for item in stored_sources()]}
+
+    async def fetch_google_news(query, num_results, country_code, quota, progress=None):
+        return answers[query]
+    monkeypatch.setattr(service, '_fetch_google_news', fetch_google_news)
+
+    for query in answers:
+        await service._fetch_and_persist((query, 'ZW'), query, 10, 'ZW', None)
+
+    assert [batch['query_key'] for batch in store.load_latest(max_age_seconds=3600)] == ['sports']
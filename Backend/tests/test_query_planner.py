@@ -0,0 +1,125 @@
+# Backend/tests/test_query_planner.py
+"""
+Tests for category query plans, rank fusion and plan sizing
+"""
+
+import json
+
+import pytest
+
+from app.services.circuit_breaker import UpstreamError
+from app.services.news_service import NewsService, NewsSource
+from app.services.query_planner import KIND_COUNTRY, KIND_SITE, KIND_TOPIC, QueryPlanner, reciprocal_rank_fusion
+
+def write_plans(tmp_path) -> str:
+    plans = {
+        "sites": {"ZW": ["herald.co.zw", "newsday.co.zw"]},
+        "categories": {
+            "politics": {"queries": ["{country} parliament", "{country} election"], "site_query": "politics"}
+        },
+        "countries": {"ZW": {"politics": ["ZANU-PF"]}}
+    }
+    path = tmp_path / "plans.json"
+    path.write_text(json.dumps(plans))
+    return str(path)
+
+def test_plan_order_and_limit(tmp_path):
+    planner = QueryPlanner(write_plans(tmp_path))
+
+    plan = planner.plan('politics', 'ZW', 'Zimbabwe')
+    assert [sub_query.kind for sub_query in plan] == [KIND_TOPIC, KIND_SITE, KIND_COUNTRY, KIND_TOPIC]
+    assert plan[0].query == "Zimbabwe parliament"
+    assert plan[1].query == "politics site:herald.co.zw OR site:newsday.co.zw"
+
+    assert len(planner.plan('politics', 'ZW', 'Zimbabwe', max_queries=2)) == 2
+
+def test_unknown_category_falls_back(tmp_path):
+    planner = QueryPlanner(write_plans(tmp_path))
+
+    plan = planner.plan('weather', 'KE', 'Kenya')
+    assert [sub_query.query for sub_query in plan] == ["Kenya weather news"]
+
+def test_reciprocal_rank_fusion_prefers_items_found_twice():
+    fused = reciprocal_rank_fusion([['a', 'b', 'c'], ['c', 'd']], key=lambda item: item)
+
+    assert fused[0] == 'c'
+    assert sorted(fused) == ['a', 'b', 'c', 'd']
+
+def test_plan_costs_the_pages_the_request_needs():
+    service = NewsService()
+    service.query_plan_overfetch = 1
+
+    assert service._query_plan_pages(18) == 2
+    assert service._query_plan_pages(5) == 1
+    assert service._query_plan_pages(18, affordable=1) == 1
+    assert service._query_plan_pages(18, affordable=0) == 1
+
+def test_unconfigured_search_spends_no_quota():
+    service = NewsService()
+
+    assert service.spends_search_quota() is False
+    assert service.estimate_category_units(18) == 0
+
+def plan_service(monkeypatch, answer):
+    """NewsService whose sub-queries are answered by `answer(query, num_results)`"""
+    service = NewsService()
+    service.query_plan_overfetch = 1
+    requested = {}
+
+    async def fake_search_sources(query, num_results, country_code, quota=None, budget=None):
+        requested[query] = num_results
+        return answer(query, num_results)
+
+    monkeypatch.setattr(service, '_search_sources', fake_search_sources)
+    return service, requested
+
+def real_sources(query, num_results):
+    slug = abs(hash(query))
+    return [
+        NewsSource(url=f"https://www.herald.co.zw/{slug}-{i}", title=f"Story {i} for {query}",
+                   snippet="Reported by our correspondent.", source_name="The Herald")
+        for i in range(num_results)
+    ]
+
+@pytest.mark.asyncio
+async def test_empty_sub_queries_add_no_mock_sources(monkeypatch):
+    service, requested = plan_service(
+        monkeypatch, lambda query, count: [] if 'site:' in query else real_sources(query, count)
+    )
+
+    sources = await service._search_with_query_plan('politics', 18, 'ZW')
+
+    assert any('site:' in query for query in requested)
+    assert sources and all(source.source_name == "The Herald" for source in sources)
+
+@pytest.mark.asyncio
+async def test_failed_sub_queries_are_counted(monkeypatch):
+    def answer(query, count):
+        if 'site:' in query:
+            raise UpstreamError('google_cse', 503)
+        return real_sources(query, count)
+    service, _ = plan_service(monkeypatch, answer)
+
+    sources = await service._search_with_query_plan('politics', 18, 'ZW')
+
+    assert all(source.source_name == "The Herald" for source in sources)
+    assert service._query_plan_stats['failed_sub_queries'] == 1
+
+@pytest.mark.asyncio
+async def test_mock_sources_only_when_every_sub_query_is_empty(monkeypatch):
+    service, _ = plan_service(monkeypatch, lambda query, count: [])
+
+    sources = await service._search_with_query_plan('politics', 18, 'ZW')
+
+    assert len(sources) == 8
+    assert all(source.source_name != "The Herald" for source in sources)
+
+@pytest.mark.asyncio
+async def test_plan_fetches_exactly_the_pages_it_was_sized_for(monkeypatch):
+    service, requested = plan_service(monkeypatch, real_sources)
+    service.query_plan_max_queries = 4
+
+    await service._search_with_query_plan('politics', 50, 'ZW')
+
+    assert len(requested) == 4
+    assert list(requested.values()) == [20, 10, 10, 10]      # The extra page goes to the first sub-query
@@ -0,0 +1,103 @@
+# Backend/tests/test_quota_manager.py
+"""
+Tests for the shared daily CSE quota and its priority shares
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.news_service import NewsService
+from app.services.quota_manager import (
+    PRIORITY_BACKGROUND, PRIORITY_DEBUG, PRIORITY_USER, QuotaContext, QuotaExceededError, QuotaManager
+)
+
+def make_manager(tmp_path, daily_budget: int = 100) -> QuotaManager:
+    return QuotaManager(str(tmp_path / "quota.sqlite3"), daily_budget)
+
+def test_priority_shares_of_the_budget(tmp_path):
+    manager = make_manager(tmp_path)
+    assert manager.limit_for(PRIORITY_USER) == 100
+    assert manager.limit_for(PRIORITY_BACKGROUND) == 80
+    assert manager.limit_for(PRIORITY_DEBUG) == 50
+
+def test_lower_priorities_stop_first(tmp_path):
+    manager = make_manager(tmp_path)
+    assert manager.try_consume(50, 'ZW', 'news_category', PRIORITY_USER)
+
+    with pytest.raises(QuotaExceededError):
+        manager.try_consume(1, 'ZW', 'debug_refresh', PRIORITY_DEBUG)     # Debug share (50) used up
+
+    assert manager.try_consume(30, 'ZW', 'feed_materializer', PRIORITY_BACKGROUND)
+    with pytest.raises(QuotaExceededError):
+        manager.try_consume(1, 'ZW', 'feed_materializer', PRIORITY_BACKGROUND)
+
+    # The last 20% is kept for users
+    assert manager.remaining(PRIORITY_USER) == 20
+    assert manager.try_consume(20, 'KE', 'news_search', PRIORITY_USER)
+    with pytest.raises(QuotaExceededError):
+        manager.try_consume(1, 'KE', 'news_search', PRIORITY_USER)
+
+    stats = manager.get_stats()
+    assert stats['denied_this_process'] == {'user': 1, 'background': 1, 'debug': 1}
+    assert stats['today']['by_priority'] == {'user': 70, 'background': 30}
+    assert stats['today']['by_country'] == {'ZW': 80, 'KE': 20}
+
+def test_remaining_per_priority(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.try_consume(60, 'ZW', 'news_category', PRIORITY_USER)
+
+    assert manager.remaining(PRIORITY_USER) == 40
+    assert manager.remaining(PRIORITY_BACKGROUND) == 20
+    assert manager.remaining(PRIORITY_DEBUG) == 0
+
+def test_workers_share_one_budget(tmp_path):
+    first_worker = make_manager(tmp_path, daily_budget=10)
+    second_worker = make_manager(tmp_path, daily_budget=10)
+
+    first_worker.try_consume(6, 'ZW', 'news_category', PRIORITY_USER)
+    assert second_worker.remaining(PRIORITY_USER) == 4
+    with pytest.raises(QuotaExceededError):
+        second_worker.try_consume(5, 'ZW', 'news_category', PRIORITY_USER)
+
+@pytest.mark.asyncio
+async def test_acquire_uses_the_callers_priority(tmp_path):
+    manager = make_manager(tmp_path, daily_budget=10)
+    await manager.acquire(5, 'ZW', QuotaContext(route="news_all", priority=PRIORITY_USER))
+
+    with pytest.raises(QuotaExceededError):
+        await manager.acquire(1, 'ZW', QuotaContext(route="debug", priority=PRIORITY_DEBUG))
+    await manager.acquire(3, 'ZW', QuotaContext(route="feed_materializer", priority=PRIORITY_BACKGROUND))
+
+    assert manager.get_usage()['by_route'] == {'news_all': 5, 'feed_materializer': 3}
+
+@pytest.mark.asyncio
+async def test_user_search_retries_when_the_shared_fetch_is_denied_at_lower_priority():
+    service = NewsService()
+    release_background = asyncio.Event()
+    fetched_at = []
+
+    async def fake_fetch(key, query, num_results, country_code, quota):
+        fetched_at.append(quota.priority)
+        if quota.priority == PRIORITY_BACKGROUND:
+            await release_background.wait()
+            raise QuotaExceededError(quota.route, quota.priority, 80, 80)
+        return ['story'] * num_results
+
+    service._fetch_and_persist = fake_fetch
+    key = service._normalize_search_key("zimbabwe news", 'ZW')
+    background = asyncio.ensure_future(service._coalesced_fetch(
+        key, "zimbabwe news", 10, 'ZW', QuotaContext(route="feed_materializer", priority=PRIORITY_BACKGROUND)
+    ))
+    await asyncio.sleep(0)
+    user = asyncio.ensure_future(service._coalesced_fetch(
+        key, "zimbabwe news", 5, 'ZW', QuotaContext(route="news_category", priority=PRIORITY_USER)
+    ))
+    await asyncio.sleep(0)
+    release_background.set()
+
+    with pytest.raises(QuotaExceededError):
+        await background
+    assert await user == ['story'] * 5
+    assert fetched_at == [PRIORITY_BACKGROUND, PRIORITY_USER]
+    assert service.search_flight.get_stats()['coalesced_calls'] == 1
@@ -0,0 +1,140 @@
+# Backend/tests/test_rate_limiter.py
+"""
+Tests for the async token-bucket rate limiter
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.rate_limiter import AsyncTokenBucket, RateLimiterRegistry
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_in_arrival_order():
+    bucket = AsyncTokenBucket('test', rate=100, burst=1)
+    await bucket.acquire()
+    admitted = []
+
+    async def waiter(i: int):
+        await bucket.acquire()
+        admitted.append(i)
+
+    waiters = []
+    for i in range(5):
+        waiters.append(asyncio.ensure_future(waiter(i)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*waiters)
+
+    assert admitted == [0, 1, 2, 3, 4]
+
+@pytest.mark.asyncio
+async def test_burst_is_free_then_requests_are_paced_at_the_rate():
+    bucket = AsyncTokenBucket('test', rate=20, burst=2)
+
+    assert await bucket.acquire() < 0.01
+    assert await bucket.acquire() < 0.01
+    waited = await bucket.acquire()
+    assert 0.03 < waited < 0.1
+
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.15, abs=0.05)
+
+@pytest.mark.asyncio
+async def test_idle_refill_is_capped_at_burst():
+    bucket = AsyncTokenBucket('test', rate=100, burst=2)
+    await bucket.acquire()
+    await bucket.acquire()
+    await asyncio.sleep(0.1)
+
+    assert bucket.get_stats()['available_tokens'] == 2
+
+@pytest.mark.asyncio
+async def test_tokens_are_clamped_to_burst():
+    bucket = AsyncTokenBucket('test', rate=10, burst=2)
+
+    assert await bucket.acquire(tokens=5) < 0.01
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_take_a_token_or_block_the_queue():
+    bucket = AsyncTokenBucket('test', rate=10, burst=1)
+    await bucket.acquire()
+
+    # The head waiter sleeps holding the lock; the next one queues behind it
+    head = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    assert bucket.queue_depth == 2
+
+    head.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await head
+
+    # The next waiter gets the token the cancelled one never took
+    start = time.monotonic()
+    await queued
+    assert time.monotonic() - start < 0.15
+    assert bucket.queue_depth == 0
+    assert bucket.get_stats()['acquired'] == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_waiter_leaves_the_queue():
+    bucket = AsyncTokenBucket('test', rate=20, burst=1)
+    await bucket.acquire()
+
+    head = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    await head
+    assert bucket.queue_depth == 0
+    # Only the head's token was spent: the next one accrues at the normal pace
+    assert await bucket.acquire() < 0.1
+
+@pytest.mark.asyncio
+async def test_queue_depth_and_wait_stats():
+    bucket = AsyncTokenBucket('test', rate=50, burst=1)
+
+    waiters = [asyncio.ensure_future(bucket.acquire()) for _ in range(4)]
+    await asyncio.sleep(0)
+    # The first caller takes the burst token straight away; the rest queue
+    assert bucket.get_stats()['queue_depth'] == 3
+    await asyncio.gather(*waiters)
+
+    stats = bucket.get_stats()
+    assert stats['queue_depth'] == 0
+    assert stats['max_queue_depth'] == 3
+    assert stats['acquired'] == 4
+    assert stats['delayed'] == 3
+    # Waits of roughly 0, 20, 40 and 60ms
+    assert stats['max_wait_ms'] == pytest.approx(60, abs=20)
+    assert stats['avg_wait_ms'] == pytest.approx(30, abs=15)
+
+def test_scraped_hosts_get_their_own_bucket_with_the_scraper_limits():
+    registry = RateLimiterRegistry({'google_cse': (10, 2), 'scraper': (1, 3)})
+
+    herald = registry.get('scraper:herald.co.zw')
+    assert herald is registry.get('scraper:herald.co.zw')
+    assert herald is not registry.get('scraper:newsday.co.zw')
+    assert (herald.rate, herald.burst) == (1, 3)
+    assert (registry.get('google_cse').rate, registry.get('google_cse').burst) == (10, 2)
+
+    stats = registry.get_stats()
+    assert 'google_cse' in stats
+    assert stats['scraper_hosts']['tracked_hosts'] == 2
+
+def test_configure_replaces_the_bucket():
+    registry = RateLimiterRegistry({'openai': (3, 5)})
+    old = registry.get('openai')
+    registry.configure('openai', 1, 1)
+
+    new = registry.get('openai')
+    assert new is not old
+    assert (new.rate, new.burst) == (1, 1)
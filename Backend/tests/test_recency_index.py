@@ -0,0 +1,114 @@
+# Backend/tests/test_recency_index.py
+"""
+Tests for publish-time normalization and the per-feed recency index
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.recency_index import RecencyIndex, dayfirst_for_country, parse_publish_time
+
+OCT_3_2025 = 1759449600          # 2025-10-03T00:00:00Z
+
+@pytest.mark.parametrize('value, expected', [
+    ("2025-10-03T00:00:00Z", OCT_3_2025),
+    ("2025-10-03T02:00:00+02:00", OCT_3_2025),
+    ("2025-10-03T00:00:00", OCT_3_2025),                 # Naive times are UTC
+    ("2025-10-03", OCT_3_2025),
+    ("Fri, 03 Oct 2025 00:00:00 GMT", OCT_3_2025),       # RFC 822 (feeds)
+    ("Fri, 03 Oct 2025 03:00:00 +0300", OCT_3_2025),
+    ("Oct 3, 2025", OCT_3_2025),
+    (OCT_3_2025, OCT_3_2025),
+    (float(OCT_3_2025) + 0.7, OCT_3_2025),
+    (str(OCT_3_2025), OCT_3_2025),
+    (OCT_3_2025 * 1000, OCT_3_2025),                     # Milliseconds
+    (str(OCT_3_2025 * 1000), OCT_3_2025),
+    (datetime(2025, 10, 3, tzinfo=timezone.utc), OCT_3_2025),
+])
+def test_parse_publish_time(value, expected):
+    assert parse_publish_time(value) == expected
+
+@pytest.mark.parametrize('value', [
+    None, '', 'yesterday-ish', 'not a date',
+    0, "1970-01-01T00:00:00Z",                           # Epoch defaults
+    "1999-12-31T23:59:59Z",                              # Before EARLIEST_PUBLISH_TS
+])
+def test_missing_or_implausible_times_are_dropped(value):
+    assert parse_publish_time(value) is None
+
+def test_future_times_beyond_the_tolerance_are_dropped():
+    soon = datetime.now(timezone.utc) + timedelta(hours=2)
+    far = datetime.now(timezone.utc) + timedelta(days=3)
+
+    assert parse_publish_time(soon.isoformat()) == int(soon.timestamp())
+    assert parse_publish_time(far.isoformat()) is None
+
+def test_ambiguous_numeric_dates_follow_the_country():
+    assert parse_publish_time("03/10/2025") == int(datetime(2025, 3, 10, tzinfo=timezone.utc).timestamp())
+    assert parse_publish_time("03/10/2025", dayfirst=True) == OCT_3_2025
+    # ISO dates are never reordered
+    assert parse_publish_time("2025-10-03", dayfirst=True) == OCT_3_2025
+
+    assert dayfirst_for_country('ZW') and dayfirst_for_country('ke')
+    assert not dayfirst_for_country('US')
+    assert not dayfirst_for_country(None)
+
+def make_index(max_items: int = 500) -> RecencyIndex:
+    index = RecencyIndex(max_items)
+    for item_id, published_ts in (('a', 100), ('b', 300), ('c', 200), ('d', 400)):
+        index.add(item_id, published_ts, item_id.upper())
+    return index
+
+def test_newest_first_with_limit_and_since():
+    index = make_index()
+
+    assert index.newest() == [(400, 'D'), (300, 'B'), (200, 'C'), (100, 'A')]
+    assert index.newest(limit=2) == [(400, 'D'), (300, 'B')]
+    assert index.newest(since=200) == [(400, 'D'), (300, 'B'), (200, 'C')]
+    assert index.newest(since=500) == []
+
+def test_between_is_start_inclusive_end_exclusive():
+    index = make_index()
+
+    assert index.between(200, 400) == [(300, 'B'), (200, 'C')]
+    assert index.between(None, 300) == [(200, 'C'), (100, 'A')]
+    assert index.between(201, 299) == []
+
+def test_same_publish_time_keeps_both_items():
+    index = make_index()
+    index.add('e', 300, 'E')
+
+    assert [item for _, item in index.between(300, 301)] == ['E', 'B']
+
+def test_predicate_filters_before_the_limit():
+    index = make_index()
+
+    assert index.newest(limit=2, predicate=lambda item: item in ('A', 'C')) == [(200, 'C'), (100, 'A')]
+
+def test_add_replaces_an_item_with_the_same_id():
+    index = make_index()
+    index.add('a', 500, 'A2')
+
+    assert len(index) == 4
+    assert index.newest(limit=1) == [(500, 'A2')]
+    assert index.between(None, 200) == []
+
+def test_remove():
+    index = make_index()
+    index.remove('b')
+    index.remove('missing')
+
+    assert [item for _, item in index.newest()] == ['D', 'C', 'A']
+
+def test_oldest_published_items_are_trimmed():
+    index = make_index(max_items=3)
+
+    assert len(index) == 3
+    assert [item for _, item in index.newest()] == ['D', 'B', 'C']
+
+    # The trimmed ID can come back without leaving a stale entry behind
+    index.add('a', 50, 'A')
+    assert [item for _, item in index.newest()] == ['D', 'B', 'C']
+    index.add('a', 450, 'A')
+    assert [item for _, item in index.newest()] == ['A', 'D', 'B']
@@ -0,0 +1,154 @@
+# Backend/tests/test_search_result_cache.py
+"""
+Tests for the stale-while-revalidate search result cache
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.search_result_cache import CacheEntry, StaleWhileRevalidateCache
+
+FRESH_TTL, STALE_TTL, STALE_IF_ERROR_TTL = 300, 1800, 86400
+
+def make_cache(**kwargs) -> StaleWhileRevalidateCache:
+    return StaleWhileRevalidateCache('test', FRESH_TTL, STALE_TTL, STALE_IF_ERROR_TTL, **kwargs)
+
+def aged(seconds: float) -> float:
+    """fetched_at for an entry that is `seconds` old"""
+    return time.time() - seconds
+
+class Upstream:
+    """Fake upstream returning `count` numbered results (or raising)"""
+
+    def __init__(self, error: Exception = None, delay: float = 0.0):
+        self.calls = []
+        self.error = error
+        self.delay = delay
+
+    async def fetch(self, count: int):
+        self.calls.append(count)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [f"new-{i}" for i in range(count)]
+
+def test_covers():
+    assert CacheEntry(['a'] * 20, 20, time.time()).covers(10)
+    assert not CacheEntry(['a'] * 10, 10, time.time()).covers(20)
+    # Upstream ran out of results: asking for more would not find any
+    assert CacheEntry(['a'] * 4, 10, time.time()).covers(20)
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_fetching():
+    cache = make_cache()
+    cache.set('key', ['old-0', 'old-1', 'old-2'], 3, fetched_at=aged(FRESH_TTL - 10))
+    upstream = Upstream()
+
+    assert await cache.get_or_fetch('key', 2, upstream.fetch) == ['old-0', 'old-1']
+    assert upstream.calls == []
+    assert cache.get_stats()['fresh_hits'] == 1
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_refreshed_in_the_background():
+    cache = make_cache()
+    cache.set('key', ['old-0', 'old-1'], 2, fetched_at=aged(FRESH_TTL + 10))
+    upstream = Upstream()
+    refresh = Upstream()
+
+    assert await cache.get_or_fetch('key', 2, upstream.fetch, refresh_fetch=refresh.fetch) == ['old-0', 'old-1']
+    await asyncio.sleep(0.01)
+
+    assert upstream.calls == []
+    assert refresh.calls == [2]
+    assert cache.get('key').value == ['new-0', 'new-1']
+    assert cache.get_stats()['stale_hits'] == 1
+
+@pytest.mark.asyncio
+async def test_concurrent_stale_hits_share_one_refresh():
+    cache = make_cache()
+    cache.set('key', ['old-0'], 1, fetched_at=aged(FRESH_TTL + 10))
+    refresh = Upstream(delay=0.02)
+
+    for _ in range(5):
+        assert await cache.get_or_fetch('key', 1, refresh.fetch) == ['old-0']
+    assert cache.get_stats()['refreshes_in_flight'] == 1
+    await asyncio.sleep(0.05)
+
+    assert refresh.calls == [1]
+    assert cache.get_stats()['background_refreshes'] == 1
+    assert cache.get_stats()['refreshes_in_flight'] == 0
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_the_stale_entry():
+    cache = make_cache()
+    cache.set('key', ['old-0'], 1, fetched_at=aged(FRESH_TTL + 10))
+    refresh = Upstream(error=RuntimeError("upstream down"))
+
+    assert await cache.get_or_fetch('key', 1, refresh.fetch) == ['old-0']
+    await asyncio.sleep(0.01)
+
+    assert cache.get('key').value == ['old-0']
+    assert cache.get_stats()['refresh_failures'] == 1
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_refetched_in_the_request_path():
+    cache = make_cache()
+    cache.set('key', ['old-0'], 1, fetched_at=aged(FRESH_TTL + STALE_TTL + 10))
+    upstream = Upstream()
+
+    assert await cache.get_or_fetch('key', 1, upstream.fetch) == ['new-0']
+    assert upstream.calls == [1]
+    assert cache.get_stats()['misses'] == 1
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_served_if_the_upstream_fails():
+    cache = make_cache()
+    cache.set('key', ['old-0'], 1, fetched_at=aged(STALE_IF_ERROR_TTL - 10))
+    upstream = Upstream(error=RuntimeError("upstream down"))
+
+    assert await cache.get_or_fetch('key', 1, upstream.fetch) == ['old-0']
+    assert cache.get_stats()['served_stale_on_error'] == 1
+
+@pytest.mark.asyncio
+async def test_too_old_for_stale_if_error_raises():
+    cache = make_cache()
+    cache.set('key', ['old-0'], 1, fetched_at=aged(STALE_IF_ERROR_TTL + 10))
+    upstream = Upstream(error=RuntimeError("upstream down"))
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch('key', 1, upstream.fetch)
+
+@pytest.mark.asyncio
+async def test_larger_request_refetches_even_when_fresh():
+    cache = make_cache()
+    cache.set('key', ['old-0', 'old-1'], 2)
+    upstream = Upstream()
+
+    assert await cache.get_or_fetch('key', 4, upstream.fetch) == ['new-0', 'new-1', 'new-2', 'new-3']
+    assert upstream.calls == [4]
+    # The larger batch now answers smaller requests too
+    assert await cache.get_or_fetch('key', 3, upstream.fetch) == ['new-0', 'new-1', 'new-2']
+    assert upstream.calls == [4]
+
+@pytest.mark.asyncio
+async def test_refetch_keeps_the_larger_requested_count():
+    cache = make_cache()
+    cache.set('key', ['old-0'] * 10, 10, fetched_at=aged(FRESH_TTL + STALE_TTL + 10))
+    upstream = Upstream()
+
+    assert len(await cache.get_or_fetch('key', 5, upstream.fetch)) == 5
+    assert upstream.calls == [10]
+    assert cache.get('key').requested == 10
+
+def test_least_recently_used_keys_are_evicted():
+    cache = make_cache(max_entries=2)
+    cache.set('a', ['a'], 1)
+    cache.set('b', ['b'], 1)
+    cache.get('a')
+    cache.set('c', ['c'], 1)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.get_stats()['evictions'] == 1
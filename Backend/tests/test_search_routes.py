@@ -0,0 +1,114 @@
+# Backend/tests/test_search_routes.py
+"""
+Tests for the processed-article search cache
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routes import search_routes
+from app.routes.search_routes import search_cached_articles, update_articles_cache
+from app.services.article_identity import article_id_for_url
+from app.services.news_service import ProcessedArticle
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(search_routes, 'processed_articles_cache', {})
+    monkeypatch.setattr(search_routes, 'article_cache_context', {})
+
+def article(slug: str, title: str = '', summary: str = '', category: str = 'Politics') -> ProcessedArticle:
+    return ProcessedArticle.from_dict({
+        'title': title or slug,
+        'summary': summary,
+        'category': category,
+        'sourceUrl': f"https://herald.co.zw/{slug}",
+        'publishedAt': "2025-10-03T00:00:00Z"
+    })
+
+def test_round_trip_through_a_dict():
+    record = article('budget', title="Budget passed", summary="Parliament voted.")
+    data = record.to_dict()
+
+    assert data['id'] == article_id_for_url("https://herald.co.zw/budget")
+    assert data['linked_sources'] == ["https://herald.co.zw/budget"]
+    assert data['publishedAt'] == 1759449600
+    assert ProcessedArticle.from_dict(data) == record
+
+def test_to_dict_extras_do_not_touch_the_record():
+    record = article('budget')
+    data = record.to_dict(search_score=5)
+
+    assert data['search_score'] == 5
+    assert not hasattr(record, 'search_score')
+
+def test_from_dict_needs_an_id_or_source_url():
+    assert ProcessedArticle.from_dict({'id': 'abc', 'title': "No URL"}).id == 'abc'
+    with pytest.raises(ValueError):
+        ProcessedArticle.from_dict({'title': "Nothing to identify it by"})
+
+def test_cached_records_are_shared_not_copied():
+    record = article('budget')
+    update_articles_cache([record], category='politics', country_code='ZW')
+
+    assert search_routes.processed_articles_cache[record.id] is record
+    context = search_routes.article_cache_context[record.id]
+    assert (context['category'], context['country_code']) == ('politics', 'ZW')
+
+def test_same_story_replaces_its_record_and_becomes_newest():
+    update_articles_cache([article('budget'), article('drought')])
+    fresh = article('budget', title="Budget passed (updated)")
+    update_articles_cache([fresh])
+
+    cache = search_routes.processed_articles_cache
+    assert list(cache.values())[-1] is fresh
+    assert len(cache) == 2
+
+def test_dicts_without_identity_are_skipped():
+    cached = update_articles_cache([
+        {'title': "No id"}, {'title': "No id either", 'sourceUrl': ''},
+        {'title': "Keep me", 'sourceUrl': "https://herald.co.zw/keep"}
+    ])
+
+    assert cached == 1
+    assert [record.title for record in search_routes.processed_articles_cache.values()] == ["Keep me"]
+
+def test_eviction_drops_the_oldest_records_and_their_context(monkeypatch):
+    monkeypatch.setattr(search_routes, 'MAX_CACHED_ARTICLES', 3)
+    records = [article(f"story-{i}") for i in range(5)]
+    update_articles_cache(records)
+
+    kept = [record.id for record in records[2:]]
+    assert list(search_routes.processed_articles_cache) == kept
+    assert list(search_routes.article_cache_context) == kept
+
+def test_search_scores_title_over_summary_over_category():
+    update_articles_cache([
+        article('a', title="Weather update", summary="Rain expected", category='Weather'),
+        article('b', title="Drought in the south", summary="No rain for months"),
+        article('c', title="Rain floods Harare", summary="Rain and more rain"),
+        article('d', title="Sports roundup"),
+    ])
+
+    results = search_cached_articles("rain")
+
+    assert [(result['title'], result['search_score']) for result in results] == [
+        ("Rain floods Harare", 5),
+        ("Weather update", 2),
+        ("Drought in the south", 2),
+    ]
+    assert search_cached_articles("rain", max_results=1)[0]['title'] == "Rain floods Harare"
+    assert search_cached_articles("cricket") == []
+
+def test_cache_update_route_reports_skipped_articles():
+    app = FastAPI()
+    app.include_router(search_routes.router, prefix="/api")
+    client = TestClient(app)
+
+    response = client.post("/api/cache/update", json=[
+        {'title': "No id"}, {'title': "Keep me", 'sourceUrl': "https://herald.co.zw/keep"}
+    ])
+
+    assert response.status_code == 200
+    assert response.json()['skipped_articles'] == 1
+    assert response.json()['total_cached_articles'] == 1
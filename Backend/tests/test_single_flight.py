@@ -0,0 +1,156 @@
+# Backend/tests/test_single_flight.py
+"""
+Tests for single-flight coalescing of identical in-flight fetches
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+class Upstream:
+    """Fake upstream that counts calls and answers when released"""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.error = None
+
+    async def fetch(self, count: int):
+        self.calls.append(count)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return list(range(count))
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_fetch():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    callers = [asyncio.ensure_future(flight.do('key', 5, upstream.fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await asyncio.gather(*callers) == [[0, 1, 2, 3, 4]] * 3
+    assert upstream.calls == [5]
+    stats = flight.get_stats()
+    assert (stats['upstream_calls'], stats['coalesced_calls'], stats['in_flight_keys']) == (1, 2, 0)
+
+@pytest.mark.asyncio
+async def test_results_are_copies():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    callers = [asyncio.ensure_future(flight.do('key', 2, upstream.fetch)) for _ in range(2)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    first, second = await asyncio.gather(*callers)
+
+    first.append('mine')
+    assert second == [0, 1]
+
+@pytest.mark.asyncio
+async def test_smaller_request_slices_a_larger_fetch():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    large = asyncio.ensure_future(flight.do('key', 20, upstream.fetch))
+    await asyncio.sleep(0)
+    small = asyncio.ensure_future(flight.do('key', 10, upstream.fetch))
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert len(await large) == 20
+    assert await small == list(range(10))
+    assert upstream.calls == [20]
+    assert flight.get_stats()['served_by_slicing'] == 1
+
+@pytest.mark.asyncio
+async def test_larger_request_does_not_join_a_smaller_fetch():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    small = asyncio.ensure_future(flight.do('key', 10, upstream.fetch))
+    await asyncio.sleep(0)
+    large = asyncio.ensure_future(flight.do('key', 20, upstream.fetch))
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert (len(await small), len(await large)) == (10, 20)
+    assert upstream.calls == [10, 20]
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    callers = [asyncio.ensure_future(flight.do(key, 3, upstream.fetch)) for key in ('a', 'b')]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    await asyncio.gather(*callers)
+
+    assert upstream.calls == [3, 3]
+
+@pytest.mark.asyncio
+async def test_cancelled_follower_does_not_cancel_the_fetch():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    leader = asyncio.ensure_future(flight.do('key', 5, upstream.fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do('key', 5, upstream.fetch))
+    await asyncio.sleep(0)
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+    upstream.release.set()
+
+    assert await leader == [0, 1, 2, 3, 4]
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_leaves_the_fetch_to_its_followers():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+
+    leader = asyncio.ensure_future(flight.do('key', 5, upstream.fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do('key', 5, upstream.fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    upstream.release.set()
+
+    assert await follower == [0, 1, 2, 3, 4]
+    assert upstream.calls == [5]
+
+@pytest.mark.asyncio
+async def test_leader_error_reaches_every_follower():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+    upstream.error = RuntimeError("upstream down")
+
+    callers = [asyncio.ensure_future(flight.do('key', 5, upstream.fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(result is upstream.error for result in results)
+    assert upstream.calls == [5]
+    assert flight.get_stats()['in_flight_keys'] == 0
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_reused():
+    flight = SingleFlight('test')
+    upstream = Upstream()
+    upstream.error = RuntimeError("upstream down")
+    upstream.release.set()
+
+    with pytest.raises(RuntimeError):
+        await flight.do('key', 5, upstream.fetch)
+    upstream.error = None
+
+    assert await flight.do('key', 5, upstream.fetch) == [0, 1, 2, 3, 4]
+    assert upstream.calls == [5, 5]
@@ -0,0 +1,61 @@
+# Backend/tests/test_summarization_service.py
+"""
+Tests for the OpenAI call made by the batched summarization stage
+"""
+
+import asyncio
+import threading
+import types
+
+import pytest
+
+from app.services.circuit_breaker import circuit_breakers, STATE_CLOSED, STATE_HALF_OPEN
+from app.services.summarization_service import SummarizationService
+
+class BadRequestError(Exception):
+    """Stand-in for the OpenAI SDK's 400 error"""
+    status_code = 400
+
+def make_service(create) -> SummarizationService:
+    """A service whose OpenAI client calls `create` (run in the executor)"""
+    service = SummarizationService(fallback=lambda source: "fallback")
+    service._client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    service._client_version = 'new'
+    return service
+
+@pytest.fixture
+def half_open_breaker():
+    breaker = circuit_breakers.get('openai')
+    breaker.state = STATE_HALF_OPEN
+    breaker._probe_started_at = None
+    yield breaker
+    breaker.state = STATE_CLOSED
+    breaker._probe_started_at = None
+    breaker._consecutive_failures = 0
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_is_released(half_open_breaker):
+    release = threading.Event()
+    service = make_service(lambda **kwargs: release.wait(5))
+
+    task = asyncio.create_task(service._complete("prompt"))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    release.set()
+
+    assert half_open_breaker.state == STATE_HALF_OPEN
+    assert half_open_breaker.before_call() is True
+
+@pytest.mark.asyncio
+async def test_rejected_request_does_not_count_as_failure(half_open_breaker):
+    def create(**kwargs):
+        raise BadRequestError("invalid model")
+    service = make_service(create)
+
+    with pytest.raises(BadRequestError):
+        await service._complete("prompt")
+
+    assert half_open_breaker.get_state()['state'] == STATE_HALF_OPEN
+    assert half_open_breaker.before_call() is True
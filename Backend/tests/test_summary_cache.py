@@ -0,0 +1,88 @@
+# Backend/tests/test_summary_cache.py
+"""
+Tests for the persistent summary cache
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import summary_cache as summary_cache_module
+from app.services.summary_cache import SummaryCache, content_hash
+
+PROMPT, MODEL = 'v1', 'gpt-4o-mini'
+
+@pytest.fixture
+def cache(tmp_path) -> SummaryCache:
+    return SummaryCache(str(tmp_path / "summaries.sqlite3"), max_entries=10)
+
+def summary(text: str, **extra):
+    return {'summary': text, 'key_points': [f"{text} point"], **extra}
+
+def test_content_hash_ignores_whitespace_but_not_words():
+    base = content_hash("Budget passed", "Parliament voted on Tuesday.")
+
+    assert content_hash("  Budget   passed\n", "Parliament\tvoted on Tuesday. ") == base
+    assert content_hash("Budget passed", "Parliament voted on Wednesday.") != base
+    # Parts are kept apart: moving a word across the boundary changes the hash
+    assert content_hash("Budget", "passed Parliament voted on Tuesday.") != base
+    assert content_hash(None, "text") == content_hash('', "text")
+
+def test_round_trip_keeps_key_points_and_extra_fields(cache):
+    cache.put_many('enhance', {'h1': summary("First", readTime="2 min read")}, PROMPT, MODEL)
+
+    assert cache.get_many('enhance', ['h1', 'h2'], PROMPT, MODEL) == {
+        'h1': {'summary': "First", 'key_points': ["First point"], 'readTime': "2 min read"}
+    }
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+def test_prompt_version_model_and_kind_are_part_of_the_key(cache):
+    cache.put_many('feed', {'h1': summary("Old prompt")}, 'v1', MODEL)
+    cache.put_many('feed', {'h1': summary("New prompt")}, 'v2', MODEL)
+    cache.put_many('feed', {'h1': summary("Other model")}, 'v1', 'gpt-4o')
+
+    assert cache.get_many('feed', ['h1'], 'v1', MODEL)['h1']['summary'] == "Old prompt"
+    assert cache.get_many('feed', ['h1'], 'v2', MODEL)['h1']['summary'] == "New prompt"
+    assert cache.get_many('feed', ['h1'], 'v1', 'gpt-4o')['h1']['summary'] == "Other model"
+    assert cache.get_many('feed', ['h1'], 'v3', MODEL) == {}
+    assert cache.get_many('enhance', ['h1'], 'v1', MODEL) == {}
+
+def test_least_recently_used_entries_are_trimmed_to_90_percent(cache, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(summary_cache_module, 'time', SimpleNamespace(time=lambda: now[0]))
+
+    for i in range(10):
+        now[0] = float(i)
+        cache.put_many('feed', {f"h{i}": summary(f"Story {i}")}, PROMPT, MODEL)
+
+    # Reading h0 makes it the most recently used
+    now[0] = 10.0
+    assert 'h0' in cache.get_many('feed', ['h0'], PROMPT, MODEL)
+
+    now[0] = 11.0
+    cache.put_many('feed', {'h10': summary("Story 10")}, PROMPT, MODEL)
+
+    kept = cache.get_many('feed', [f"h{i}" for i in range(11)], PROMPT, MODEL)
+    assert sorted(kept, key=lambda h: int(h[1:])) == ['h0'] + [f"h{i}" for i in range(3, 11)]
+    assert cache.get_stats()['evictions'] == 2
+    assert cache.get_stats()['entries'] == 9
+
+@pytest.mark.asyncio
+async def test_async_wrappers(cache):
+    await cache.aput('feed', 'h1', summary("First"), PROMPT, MODEL)
+
+    assert (await cache.aget('feed', 'h1', PROMPT, MODEL))['summary'] == "First"
+    assert await cache.aget('feed', 'h2', PROMPT, MODEL) is None
+
+@pytest.mark.asyncio
+async def test_async_wrappers_swallow_sqlite_errors(tmp_path):
+    broken = SummaryCache(str(tmp_path / "missing" / "summaries.sqlite3"))
+
+    assert await broken.aget('feed', 'h1', PROMPT, MODEL) is None
+    assert await broken.aget_many('feed', ['h1', 'h2'], PROMPT, MODEL) == {}
+    await broken.aput('feed', 'h1', summary("First"), PROMPT, MODEL)
+
+    stats = broken.get_stats()
+    assert stats['errors'] == 3
+    assert stats['entries'] is None
@@ -0,0 +1,109 @@
+# Backend/tests/test_synthetic_news_provider.py
+"""
+Tests for the seeded synthetic search provider used for load testing
+"""
+
+import asyncio
+from urllib.parse import urlparse
+
+import pytest
+
+from app.services.news_service import NewsService
+from app.services.persistent_store import SearchResultStore
+from app.services.synthetic_news_provider import SyntheticNewsProvider
+
+def provider(**kwargs) -> SyntheticNewsProvider:
+    options = {'seed': 1, 'profile': 'instant', 'duplicate_rate': 0.0}
+    options.update(kwargs)
+    return SyntheticNewsProvider(**options)
+
+def titles(items):
+    return [item['title'] for item in items]
+
+def domains(items):
+    return {item['displayLink'] for item in items}
+
+def test_same_seed_gives_the_same_corpus():
+    first = provider(seed=7).generate_items("zimbabwe politics", 'zw', 1, 10)
+
+    assert provider(seed=7).generate_items("zimbabwe politics", 'zw', 1, 10) == first
+    assert titles(provider(seed=8).generate_items("zimbabwe politics", 'zw', 1, 10)) != titles(first)
+
+def test_different_searches_give_distinct_results():
+    corpus = provider()
+    zimbabwe = corpus.generate_items("politics news", 'zw', 1, 10)
+    kenya = corpus.generate_items("politics news", 'ke', 1, 10)
+    sports = corpus.generate_items("sports news", 'zw', 1, 10)
+
+    assert not set(titles(zimbabwe)) & set(titles(kenya))
+    assert not set(titles(zimbabwe)) & set(titles(sports))
+    assert all(domain.endswith('.co.zw') for domain in domains(zimbabwe))
+    assert all(domain.endswith('.co.ke') for domain in domains(kenya))
+    assert len(domains(zimbabwe)) > 1
+
+def test_pages_continue_the_result_list():
+    corpus = provider()
+    first_page = corpus.generate_items("politics news", 'zw', 1, 10)
+    second_page = corpus.generate_items("politics news", 'zw', 11, 10)
+
+    assert corpus.generate_items("politics news", 'zw', 1, 20) == first_page + second_page
+    assert not set(titles(first_page)) & set(titles(second_page))
+    # No results past the end of the result set, like CSE
+    assert len(corpus.generate_items("politics news", 'zw', 95, 10)) == 6
+    assert len(provider(results_per_query=15).generate_items("politics news", 'zw', 11, 10)) == 5
+
+@pytest.mark.asyncio
+async def test_error_and_timeout_rates_are_respected():
+    corpus = provider(error_rate=0.3, timeout_rate=0.1)
+    statuses = []
+    timeouts = 0
+
+    for i in range(1000):
+        try:
+            status, _ = await corpus.search({'q': "politics news", 'gl': 'zw', 'start': 1, 'num': 10}, timeout=0.001)
+            statuses.append(status)
+        except asyncio.TimeoutError:
+            timeouts += 1
+
+    stats = corpus.get_stats()
+    errors = [status for status in statuses if status != 200]
+    assert (stats['requests'], stats['timeouts_injected'], stats['errors_injected']) == (1000, timeouts, len(errors))
+    assert timeouts == pytest.approx(100, abs=35)
+    assert len(errors) == pytest.approx(300, abs=50)
+    assert set(errors) <= {429, 500, 503}
+
+@pytest.mark.asyncio
+async def test_no_injection_when_rates_are_zero():
+    corpus = provider(error_rate=0, timeout_rate=0)
+
+    for _ in range(100):
+        status, body = await corpus.search({'q': "politics news", 'gl': 'zw', 'start': 11, 'num': 10}, timeout=1)
+        assert status == 200 and len(body['items']) == 10
+
+    assert corpus.get_stats()['errors_injected'] == corpus.get_stats()['timeouts_injected'] == 0
+
+@pytest.mark.asyncio
+async def test_latency_beyond_the_client_timeout_is_a_timeout():
+    corpus = provider(profile='fast', error_rate=0, timeout_rate=0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await corpus.search({'q': "politics news", 'gl': 'zw'}, timeout=0.001)
+    assert corpus.get_stats()['timeouts_injected'] == 1
+
+@pytest.mark.asyncio
+async def test_plugs_in_behind_search_google_news(monkeypatch, tmp_path):
+    monkeypatch.setenv("NEWS_PROVIDER", "synthetic")
+    monkeypatch.setenv("NEWS_SYNTHETIC_PROFILE", "instant")
+    monkeypatch.setenv("NEWS_SYNTHETIC_DUPLICATE_RATE", "0")
+    service = NewsService()
+    service.result_store = SearchResultStore(str(tmp_path / "store.sqlite3"))
+
+    sources = await service.search_google_news("zimbabwe politics synthetic", 20, 'ZW')
+
+    assert len(sources) == 20
+    assert all(urlparse(source.url).hostname.endswith('.co.zw') for source in sources)
+    assert all(source.published_ts for source in sources)
+    # Two CSE pages, answered by the provider and charged to no Google quota
+    assert service.synthetic_provider.get_stats()['requests'] == 2
+    assert service.spends_search_quota() is False
+    assert service.get_provider_stats()['provider'] == 'synthetic'